@@ -0,0 +1,160 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from trilogy import Dialects
+from trilogy.constants import CONFIG
+from trilogy.dialect.sql_server import SqlServerDialect
+from trilogy.execution.downsample import POINTS_PER_BUCKET
+from trilogy.rendering.theme import REPORT_LAYOUT
+
+ROWS = 20_000
+
+MODEL = """
+key id int;
+property id.ts datetime;
+property id.val float;
+property id.grp int;
+datasource series (id: id, ts: ts, val: val, grp: grp)
+grain (id) address series;
+"""
+
+
+@pytest.fixture
+def executor():
+    executor = Dialects.DUCK_DB.default_executor()
+    executor.execute_raw_sql(
+        "create table series as select range as id, "
+        "timestamp '2020-01-01' + to_seconds(range) as ts, "
+        "sin(range / 500.0) * 100 + (range % 7) as val, range % 2 as grp "
+        f"from range({ROWS})"
+    )
+    executor.parse_text(MODEL)
+    return executor
+
+
+def test_long_line_is_reduced_in_the_warehouse(executor):
+    result = executor.execute_text("chart layer line ( x_axis <- ts, y_axis <- val );")[
+        -1
+    ]
+    data = result.data[0]
+    assert data.downsampled
+    assert data.source_rows == ROWS
+    assert len(data) <= REPORT_LAYOUT.chart_width * POINTS_PER_BUCKET
+    full = executor.execute_raw_sql("select min(val), max(val) from series").fetchone()
+    # the extremes and both ends of the series survive
+    assert (min(data.columns["val"]), max(data.columns["val"])) == tuple(full)
+    assert data.columns["ts"][0] == min(data.columns["ts"])
+    assert len(data.columns["ts"]) == len(set(data.columns["ts"]))
+    assert result.chart.to_dict()["title"]["subtitle"] == (
+        f"Downsampled: {len(data):,} of {ROWS:,} rows drawn"
+    )
+
+
+def test_series_are_reduced_separately(executor):
+    result = executor.execute_text(
+        "chart layer line ( x_axis <- ts, y_axis <- val, color <- grp );"
+    )[-1]
+    data = result.data[0]
+    assert data.downsampled
+    assert set(data.columns["grp"]) == {0, 1}
+
+
+def test_short_lines_and_bars_are_untouched(executor):
+    short = executor.execute_text(
+        "chart layer line ( x_axis <- ts, y_axis <- val ) limit 100;"
+    )[-1]
+    assert len(short.data[0]) == 100
+    assert not short.data[0].downsampled
+    assert "title" not in short.chart.to_dict()
+
+    bars = executor.execute_text("chart layer bar ( x_axis <- id, y_axis <- val );")[-1]
+    assert len(bars.data[0]) == ROWS
+    assert bars.data[0].source_rows is None
+
+
+def test_downsampling_can_be_disabled(executor, monkeypatch):
+    monkeypatch.setattr(CONFIG.execution, "downsample_charts", False)
+    result = executor.execute_text("chart layer line ( x_axis <- ts, y_axis <- val );")[
+        -1
+    ]
+    assert len(result.data[0]) == ROWS
+    assert not result.data[0].downsampled
+
+
+def test_downsampling_is_on_by_default():
+    assert CONFIG.execution.downsample_charts is True
+
+
+def test_null_values_are_not_kept_as_extremes(executor):
+    # every other row has no value: the kept extremes must still be the
+    # series' real minimum and maximum, including where NULLs sort first
+    executor.execute_raw_sql("set default_null_order = 'nulls_first'")
+    executor.execute_raw_sql(
+        "create or replace table series as select range as id, "
+        "timestamp '2020-01-01' + to_seconds(range) as ts, "
+        "case when range % 2 = 0 then null else sin(range / 500.0) * 100 end "
+        "as val, 0 as grp "
+        f"from range({ROWS})"
+    )
+    data = executor.execute_text("chart layer line ( x_axis <- ts, y_axis <- val );")[
+        -1
+    ].data[0]
+    assert data.downsampled
+    full = executor.execute_raw_sql("select min(val), max(val) from series").fetchone()
+    values = [v for v in data.columns["val"] if v is not None]
+    assert (min(values), max(values)) == tuple(full)
+
+
+def test_buckets_are_equal_spans_of_x(executor):
+    # 10k points packed into the first 1% of the axis, 10k spread over the
+    # rest: equal-count buckets would keep the dense stretch at full detail
+    executor.execute_raw_sql(
+        "create or replace table series as select range as id, "
+        "timestamp '2020-01-01' + to_seconds(case when range < 10000 "
+        "then range else (range - 10000) * 100 + 10000 end) as ts, "
+        "sin(range / 50.0) * 100 as val, 0 as grp "
+        f"from range({ROWS})"
+    )
+    data = executor.execute_text("chart layer line ( x_axis <- ts, y_axis <- val );")[
+        -1
+    ].data[0]
+    assert data.downsampled
+    edge = datetime(2020, 1, 1) + timedelta(seconds=10000)
+    dense = [ts for ts in data.columns["ts"] if ts < edge]
+    # the dense stretch spans about one percent of the pixel columns
+    assert len(dense) <= POINTS_PER_BUCKET * (REPORT_LAYOUT.chart_width // 100 + 2)
+
+
+def test_layer_ordering_is_kept(executor):
+    data = executor.execute_text(
+        "chart layer line ( x_axis <- ts, y_axis <- val ) order by ts desc;"
+    )[-1].data[0]
+    assert data.downsampled
+    assert data.columns["ts"] == sorted(data.columns["ts"], reverse=True)
+
+
+def test_buckets_follow_the_drawn_width(executor, monkeypatch, tmp_path):
+    from trilogy.execution import downsample
+
+    widths: list[int] = []
+    plan = downsample.plan_downsample
+
+    def spy(statement, query, buckets):
+        widths.append(buckets)
+        return plan(statement, query, buckets)
+
+    monkeypatch.setattr(downsample, "plan_downsample", spy)
+    target = (tmp_path / "chart.svg").as_posix()
+    list(
+        executor.execute_text(
+            f"copy into svg '{target}' (width=120) from chart "
+            "layer line ( x_axis <- ts, y_axis <- val );"
+        )
+    )
+    executor.execute_text("chart layer line ( x_axis <- ts, y_axis <- val );")
+    assert widths == [120, REPORT_LAYOUT.chart_width]
+
+
+def test_dialects_without_derived_table_wrapping_opt_out():
+    assert SqlServerDialect.SUPPORTS_DERIVED_TABLE_WRAPPING is False
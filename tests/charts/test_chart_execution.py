@@ -599,3 +599,93 @@ def test_year_trait_headline_formats_as_integer():
     spec = chart_results[0].chart.to_dict()
     number_layer = spec["layer"][0]
     assert number_layer["encoding"]["text"]["format"] == "d"
+
+
+_PARTIAL_SETUP = """
+property category.target int;
+
+datasource chart_targets (
+    cat: category,
+    target: target
+)
+grain (category)
+query '''
+select 'A' as cat, 12 as target
+union all select 'B', 18
+''';
+"""
+
+
+def test_layers_at_same_grain_share_one_query():
+    executor = _executor()
+    result = executor.execute_text(_SETUP + """
+            chart
+              layer bar ( x_axis <- category, y_axis <- value )
+              layer line ( x_axis <- category, y_axis <- value * 2 as doubled );
+            """)[-1]
+    statement = result.statement
+    assert len(statement.queries) == 1
+    assert statement.layers[0].query is statement.layers[1].query
+    assert executor.generator.compile_statement(statement).count("SELECT") == 1
+    bar, line = result.data
+    assert set(bar.columns) == {"category", "value"}
+    assert set(line.columns) == {"category", "doubled"}
+    assert sorted(line.columns["doubled"]) == [20, 40, 60]
+    assert sorted(row["value"] for row in bar) == [10, 20, 30]
+
+
+def test_layers_needing_a_join_run_separately():
+    # fused, the join to the partial targets table would drop category C
+    result = _executor().execute_text(_SETUP + _PARTIAL_SETUP + """
+            chart
+              layer bar ( x_axis <- category, y_axis <- value )
+              layer line ( x_axis <- category, y_axis <- target );
+            """)[-1]
+    assert len(result.statement.queries) == 2
+    bar, line = result.data
+    assert sorted(bar.columns["category"]) == ["A", "B", "C"]
+    assert sorted(line.columns["category"]) == ["A", "B"]
+
+
+def test_layers_needing_a_join_are_planned_once(monkeypatch):
+    from trilogy.core import query_processor
+
+    planned: list[int] = []
+    process_query = query_processor.process_query
+
+    def counting(*args, **kwargs):
+        planned.append(1)
+        return process_query(*args, **kwargs)
+
+    executor = _executor()
+    executor.parse_text(_SETUP + _PARTIAL_SETUP)
+    monkeypatch.setattr(query_processor, "process_query", counting)
+    executor.execute_text("""
+            chart
+              layer bar ( x_axis <- category, y_axis <- value )
+              layer line ( x_axis <- category, y_axis <- target );
+            """)
+    assert len(planned) == 2
+
+
+def test_limited_layers_run_separately():
+    result = _executor().execute_text(_SETUP + """
+            chart
+              layer bar ( x_axis <- category, y_axis <- value )
+              layer line ( x_axis <- category, y_axis <- value ) limit 2;
+            """)[-1]
+    assert len(result.statement.queries) == 2
+    assert [len(layer) for layer in result.data] == [3, 2]
+
+
+def test_layer_fusion_can_be_disabled(monkeypatch):
+    from trilogy.constants import CONFIG
+
+    monkeypatch.setattr(CONFIG.optimizations, "fuse_chart_layers", False)
+    result = _executor().execute_text(_SETUP + """
+            chart
+              layer bar ( x_axis <- category, y_axis <- value )
+              layer line ( x_axis <- category, y_axis <- value );
+            """)[-1]
+    assert len(result.statement.queries) == 2
+    assert result.data[0] == result.data[1]
@@ -0,0 +1,90 @@
+"""Hash-consed build grains and the allocation-free grain-insensitive match."""
+
+from trilogy.core.enums import ComparisonOperator, Purpose
+from trilogy.core.models.build import (
+    DEFAULT_GRAIN,
+    BuildComparison,
+    BuildConcept,
+    BuildGrain,
+    BuildWhereClause,
+)
+from trilogy.core.models.core import DataType
+
+
+def _concept(name: str, purpose: Purpose = Purpose.KEY, grain=None) -> BuildConcept:
+    return BuildConcept(
+        name=name,
+        canonical_name=name,
+        datatype=DataType.INTEGER,
+        purpose=purpose,
+        build_is_aggregate=False,
+        namespace="test",
+        grain=grain if grain is not None else BuildGrain(),
+    )
+
+
+def test_unconditioned_grains_are_shared():
+    first = BuildGrain.interned({"test.a", "test.b"})
+    assert BuildGrain.interned(["test.b", "test.a"]) is first
+    assert BuildGrain.interned(()) is DEFAULT_GRAIN
+    left = BuildGrain.interned({"test.a"})
+    right = BuildGrain.interned({"test.b"})
+    assert left + right is first
+    assert left.union(right) is first
+    assert first - right is left
+    assert first.intersection(left) is left
+
+
+def test_conditioned_grains_are_not_shared():
+    a = _concept("a")
+    where = BuildWhereClause(
+        conditional=BuildComparison(left=a, right=1, operator=ComparisonOperator.EQ)
+    )
+    conditioned = BuildGrain.interned({"test.a"}, where_clause=where)
+    assert conditioned is not BuildGrain.interned({"test.a"}, where_clause=where)
+    assert conditioned.without_condition() is BuildGrain.interned({"test.a"})
+
+
+def test_default_grains_reuse_one_instance():
+    a = _concept("a")
+    b = _concept("b")
+    assert a._with_default_grain.grain is BuildGrain.interned({"test.a"})
+    # the KEY default grain is shared, not rebuilt per call
+    assert a._with_default_grain.grain is a._with_default_grain.grain
+    assert b._with_default_grain.grain is not a._with_default_grain.grain
+
+
+def test_equals_at_grain_matches_with_grain_comparison():
+    grained = _concept("a", grain=BuildGrain.interned({"test.a"}))
+    candidates = [
+        _concept("a"),
+        _concept("a", grain=BuildGrain.interned({"test.z"})),
+        _concept("b"),
+        _concept("a", purpose=Purpose.PROPERTY),
+    ]
+    for column in candidates:
+        for target in (grained, *candidates):
+            assert column.equals_at_grain(target) == (
+                column.with_grain(target.grain) == target
+            )
+
+
+def test_equals_at_grain_with_a_falsy_grain():
+    # with_grain maps a falsy grain to DEFAULT_GRAIN, which a missing grain
+    # does not equal
+    target = _concept("a")
+    target.grain = None
+    for column in (_concept("a"), _concept("a", grain=BuildGrain.interned({"test.a"}))):
+        assert column.with_grain(target.grain).grain == DEFAULT_GRAIN
+        assert column.equals_at_grain(target) == (
+            column.with_grain(target.grain) == target
+        )
+        assert not column.equals_at_grain(target)
+
+
+def test_addresses_are_interned():
+    # each address is formatted fresh at construction
+    first = _concept("interned_name")
+    second = _concept("interned_name")
+    assert first.address is second.address
+    assert first.canonical_address is second.canonical_address
@@ -0,0 +1,191 @@
+"""Columnar tolerant comparison must agree with the row engine on every input."""
+
+from __future__ import annotations
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from trilogy.core.enums import QueryComparison
+from trilogy.core.validation import rows as rows_module
+from trilogy.core.validation.rows import (
+    _tolerant_mismatch_rows,
+    rows_equal_tolerant,
+    rows_mismatch,
+)
+from trilogy.core.validation.rows_columnar import tolerant_mismatch_columnar
+
+pytest.importorskip("numpy")
+
+CASES = [
+    ([[112458735.48859596]], [[Decimal("112458734.70")]], True),
+    ([[12492732.049]], [[Decimal("12492732.00")]], True),
+    ([[45689]], [[45690]], False),
+    ([[107]], [[Decimal(107)]], True),
+    ([["store", 163753.94]], [["store", 165000.00]], False),
+    ([[True]], [[1]], False),
+    ([[float("inf")]], [[float("inf")]], True),
+    ([[float("inf")]], [[1.0]], False),
+    ([[Decimal("NaN")]], [[Decimal("NaN")]], True),
+    ([["a", 1.5]], [["a", 1.5, 2.5]], False),
+    (
+        [["a", 1.0], ["a", 2.0], ["b", 3.0]],
+        [["a", 1.0], ["b", 2.0], ["b", 3.0]],
+        False,
+    ),
+    ([["a", 1.0], ["a", 2.0]], [["a", 2.0], ["a", 1.0]], True),
+    ([["a", 1.5], ["a", 1.5]], [["a", 1.5], ["a", 9.5]], False),
+    (
+        [[1, "a", 10.000001], [2, "b", 20.000001]],
+        [[20.0, "b", 2], ["a", 10.0, 1]],
+        True,
+    ),
+    ([["a", 1.01], ["a", 1.01]], [["a", 1.01], ["b", 1.01]], False),
+    ([[1]], [[1], [1]], False),
+    ([[None, 1.0], [2.0, 3.0]], [[3.0, 2.0], [1.0, None]], True),
+    ([[None, 1.0], [2.0, 3.0]], [[3.0, 2.0], [None, None]], False),
+    ([], [], True),
+]
+
+
+@pytest.mark.parametrize("candidate,reference,expected", CASES)
+def test_engines_agree(candidate, reference, expected):
+    assert (_tolerant_mismatch_rows(candidate, reference) is None) is expected
+    assert (tolerant_mismatch_columnar(candidate, reference) is None) is expected
+
+
+def test_ambiguous_group_falls_back_to_matching():
+    # lexsort pairs (1.0, 5.0) with (1.0, 9.0): the alignment fails, yet the
+    # crosswise assignment matches within tolerance — only the group-level
+    # bipartite fallback can find it
+    candidate = [["k", 1.0, 5.0], ["k", 1.0000001, 9.0]]
+    reference = [["k", 1.0000001, 5.0], ["k", 1.0, 9.0]]
+    assert _tolerant_mismatch_rows(candidate, reference) is None
+    assert tolerant_mismatch_columnar(candidate, reference) is None
+
+
+def test_randomized_agreement():
+    rng = random.Random(7)
+    for _ in range(200):
+        size = rng.randint(1, 12)
+        base = [
+            [
+                rng.choice("abc"),
+                round(rng.uniform(0, 10), rng.randint(0, 6)),
+                rng.randint(0, 3),
+            ]
+            for _ in range(size)
+        ]
+        other = [list(row) for row in base]
+        rng.shuffle(other)
+        if rng.random() < 0.5:
+            row = rng.randrange(size)
+            other[row][1] = other[row][1] * (1 + rng.choice([1e-7, 1e-3]))
+        if rng.random() < 0.2:
+            other[rng.randrange(size)][2] = None
+        assert (_tolerant_mismatch_rows(base, other) is None) == (
+            tolerant_mismatch_columnar(base, other) is None
+        )
+
+
+def test_large_inputs_dispatch_to_columnar(monkeypatch):
+    calls = []
+    from trilogy.core.validation import rows_columnar
+
+    original = rows_columnar.tolerant_mismatch_columnar
+
+    def spy(candidate, reference):
+        calls.append(len(candidate))
+        return original(candidate, reference)
+
+    monkeypatch.setattr(rows_columnar, "tolerant_mismatch_columnar", spy)
+    size = rows_module.COLUMNAR_MIN_ROWS
+    candidate = [(idx % 5, f"k{idx}", idx * 1.5) for idx in range(size)]
+    reference = [
+        (f"k{idx}", Decimal(str(idx * 1.5)), idx % 5) for idx in reversed(range(size))
+    ]
+    assert rows_equal_tolerant(candidate, reference)
+    assert calls == [size]
+
+
+def test_single_numeric_bucket_scales():
+    # every row lands in the same (empty) exact bucket — quadratic for the
+    # row engine, a sort for the columnar one
+    size = 200_000
+    candidate = [(float(idx), idx * 0.25) for idx in range(size)]
+    reference = [(idx * 0.25, float(idx) + 1e-9) for idx in reversed(range(size))]
+    assert tolerant_mismatch_columnar(candidate, reference) is None
+    reference[123] = (0.0, -1.0)
+    assert tolerant_mismatch_columnar(candidate, reference) is not None
+
+
+def test_all_numeric_bucket_is_split_before_matching():
+    # the row engine puts every all-numeric row in one bucket; the matcher
+    # must split it by tolerance gaps rather than compare every pair
+    size = 20_000
+    rng = random.Random(11)
+    candidate = [(float(idx), idx * 0.5) for idx in range(size)]
+    reference = [(idx * 0.5, float(idx) * (1 + 1e-7)) for idx in range(size)]
+    rng.shuffle(reference)
+    assert _tolerant_mismatch_rows(candidate, reference) is None
+    reference[0] = (reference[0][0], reference[0][1] + 0.5)
+    assert _tolerant_mismatch_rows(candidate, reference) is not None
+
+
+def test_tolerance_groups_agree_with_unsplit_matching():
+    rng = random.Random(3)
+
+    def unsplit(candidate, reference):
+        matched: dict[int, int] = {}
+        return all(
+            rows_module._assign(candidate, reference, matched, idx, set())
+            for idx in range(len(reference))
+        )
+
+    for _ in range(100):
+        size = rng.randint(70, 150)
+        base = [
+            tuple(
+                sorted(
+                    rng.choice([-1, 1])
+                    * rng.choice([1e-12, 1.0, 1e5, 1e9])
+                    * rng.randint(1, 30)
+                    for _ in range(2)
+                )
+            )
+            for _ in range(size)
+        ]
+        other = [
+            tuple(sorted(v * (1 + rng.choice([0, 5e-6, -5e-6, 1e-3])) for v in row))
+            for row in base
+        ]
+        rng.shuffle(other)
+        assert rows_module._bucket_matches(base, other) == unsplit(base, other)
+
+
+def test_mismatch_reports_first_differing_rows():
+    candidate = [("a", 1.0), ("b", 2.0), ("c", 3.0)]
+    reference = [("a", 1.0), ("b", 2.5), ("c", 3.0)]
+    for found in (
+        _tolerant_mismatch_rows(candidate, reference),
+        tolerant_mismatch_columnar(candidate, reference),
+    ):
+        assert found is not None
+        assert found.candidate_row == ("b", 2.0)
+        assert found.reference_row == ("b", 2.5)
+        assert "tolerance" in found.describe()
+
+    missing = tolerant_mismatch_columnar([("a", 1.0)], [("z", 1.0)])
+    assert missing is not None
+    assert missing.candidate_row == ("a", 1.0)
+    assert missing.reference_row is None
+
+
+def test_rows_mismatch_dispatch():
+    assert rows_mismatch([(1,)], [(1,)], QueryComparison.EXACT) is None
+    exact = rows_mismatch([(1,), (2,)], [(1,), (3,)], QueryComparison.EXACT)
+    assert exact is not None and exact.candidate_row == (2,)
+    ordered = rows_mismatch([(2,), (1,)], [(1,), (2,)], QueryComparison.ORDERED)
+    assert ordered is not None and "position 0" in ordered.reason
+    assert rows_mismatch([(2, 1)], [(1, 2)]) is None
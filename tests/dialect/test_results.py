@@ -79,3 +79,16 @@ def test_buffered_rows_reads_everything_up_front():
     buffered_rows(COLUMNS, rows, "TestRow")
 
     assert pulled == [1, 2, 3]
+
+
+def test_buffered_reads_interleave_over_a_large_result():
+    rows = [(i, str(i)) for i in range(10_000)]
+    result = buffered_rows(COLUMNS, rows, "TestRow")
+
+    iterator = iter(result)
+    assert [next(iterator) for _ in range(3)] == rows[:3]
+    # stopping early leaves the rest unread
+    assert result.fetchmany(4_000) == rows[3:4_003]
+    assert result.fetchone() == rows[4_003]
+    assert [tuple(r) for r in result] == rows[4_004:]
+    assert result.fetchall() == []
@@ -29,6 +29,7 @@ def external_config(uri: str = "gs://b/p/x.parquet"):
 class FakeJob:
     def __init__(self, rows, schema):
         self.rows = FakeRowIterator(rows, schema)
+        self.total_bytes_processed = 1024 * len(rows)
 
     def result(self):
         return self.rows
@@ -53,6 +54,7 @@ class FakeRowIterator:
     def __init__(self, rows, schema):
         self._rows = rows
         self.schema = schema
+        self.total_rows = len(rows)
         self.pulled: list[object] = []
 
     def __iter__(self):
@@ -180,6 +182,16 @@ def test_execute_does_not_read_the_result_set_up_front():
     assert result.fetchall() == [(2, "b"), (3, "c")]
 
 
+def test_execute_reports_job_statistics():
+    client = FakeClient(
+        rows=[FakeRow((1, "a")), FakeRow((2, "b"))],
+        schema=[FakeField("n"), FakeField("label")],
+    )
+    result = BigQueryConnection(client).execute(text("select 1"))
+    assert result.rowcount == 2
+    assert result.bytes_scanned == 2048
+
+
 def test_execute_buffers_nothing_for_ddl():
     result = BigQueryConnection(FakeClient()).execute(text("create table x"))
     assert result.keys() == []
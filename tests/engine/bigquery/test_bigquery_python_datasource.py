@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import pyarrow as pa
 import pyarrow.parquet as pq
 import pytest
 
@@ -7,6 +8,7 @@ from trilogy.core.enums import AddressType
 from trilogy.core.models.datasource import Address
 from trilogy.core.models.environment import Environment
 from trilogy.core.models.execute import collect_source_addresses
+from trilogy.dialect import python_source
 from trilogy.dialect.bigquery import BigqueryDialect
 from trilogy.dialect.bigquery_engine import BigQueryConnection
 from trilogy.dialect.bigquery_staging import BigQueryPythonStaging
@@ -159,6 +161,59 @@ def test_materialize_creates_the_external_table(tmp_path: Path):
     assert f"uris = ['{uri}']" in ddl
 
 
+def fake_partition_script(script, args, write):
+    """One row per slice, tagged with the day it was asked for."""
+    day = args.rsplit("day=", 1)[-1]
+    table = pa.table({"day": [day]})
+    return 0, write(table.schema, iter(table.to_batches())), "", None
+
+
+def test_partitioned_stage_writes_one_object_per_slice(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(python_source, "_stream_once", fake_partition_script)
+    address = python_address()
+    staging = local_staging(tmp_path, dataset="staging")
+    staging.partitions[address.location] = [
+        {"day": f"2024-01-0{day}"} for day in range(1, 4)
+    ]
+    run_sql = RecordingSql()
+
+    uri = staging.materialize(address, run_sql)
+
+    assert uri is not None
+    assert uri.startswith(staging.partition_root(address))
+    assert uri.endswith("/*.parquet")
+    assert f"uris = ['{uri}']" in run_sql.statements[0]
+    table = pq.read_table(staging.partition_root(address))
+    assert sorted(table.column("day").to_pylist()) == [
+        "2024-01-01",
+        "2024-01-02",
+        "2024-01-03",
+    ]
+    run = Path(uri).parent.name
+    assert Path(staging.partition_uri(address, run, {"day": "2024-01-02"})).exists()
+
+
+def test_restaging_drops_slices_of_earlier_runs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(python_source, "_stream_once", fake_partition_script)
+    address = python_address()
+    staging = local_staging(tmp_path, dataset="staging")
+    staging.partitions[address.location] = [{"day": "1"}, {"day": "2"}]
+    first = staging.materialize(address, RecordingSql())
+    assert first is not None
+
+    # a later run with fewer partitions must not read the old slices back
+    staging.partitions[address.location] = [{"day": "3"}]
+    second = staging.materialize(address, RecordingSql(), force=True)
+    assert second is not None and second != first
+    assert not Path(first).parent.exists()
+    table = pq.read_table(staging.partition_root(address))
+    assert table.column("day").to_pylist() == ["3"]
+
+
 # --- cleanup -----------------------------------------------------------------
 
 
@@ -192,6 +247,20 @@ def test_cleanup_survives_an_already_deleted_object(tmp_path: Path):
     assert staging.staged == {}
 
 
+def test_cleanup_deletes_every_partition_object(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(python_source, "_stream_once", fake_partition_script)
+    address = python_address()
+    staging = local_staging(tmp_path, instance_id="exec-1")
+    staging.partitions[address.location] = [{"day": "1"}, {"day": "2"}]
+    uri = staging.stage(address)
+    assert uri is not None
+
+    assert staging.cleanup() == [uri]
+    assert not list(Path(staging.partition_root(address)).rglob("*.parquet"))
+
+
 def test_dialect_teardown_cleans_up(tmp_path: Path):
     dialect = enabled_dialect()
     dialect._python_staging = local_staging(tmp_path, instance_id="exec-1")
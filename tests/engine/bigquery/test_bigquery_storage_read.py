@@ -0,0 +1,259 @@
+import threading
+
+import pyarrow as pa
+import pytest
+from sqlalchemy import text
+
+from trilogy.dialect.bigquery_engine import BigQueryConnection, BigQueryEngine
+from trilogy.dialect.bigquery_storage_read import (
+    StorageReader,
+    interleave,
+    preserves_order,
+    table_path,
+)
+from trilogy.dialect.config import BigQueryConfig
+
+
+class FakeTableReference:
+    project = "p"
+    dataset_id = "_anon"
+    table_id = "anon_result"
+
+
+class FakeField:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class FakeRow:
+    def __init__(self, values: tuple):
+        self._values = values
+
+    def values(self) -> tuple:
+        return self._values
+
+
+class FakeRowIterator:
+    def __init__(self, rows, schema, total_rows=None):
+        self._rows = rows
+        self.schema = schema
+        self.total_rows = len(rows) if total_rows is None else total_rows
+        self.paged = False
+
+    def __iter__(self):
+        self.paged = True
+        for row in self._rows:
+            yield FakeRow(row)
+
+
+class FakeJob:
+    def __init__(self, rows, schema, total_rows=None, destination=None):
+        self.rows = FakeRowIterator(rows, schema, total_rows)
+        self.destination = destination
+        self.total_bytes_processed = 0
+
+    def result(self):
+        return self.rows
+
+
+class FakeClient:
+    project = "billing"
+
+    def __init__(self, job: FakeJob):
+        self.job = job
+
+    def query(self, sql, job_config=None):
+        return self.job
+
+
+class FakePage:
+    def __init__(self, batch: pa.RecordBatch):
+        self.batch = batch
+
+    def to_arrow(self) -> pa.RecordBatch:
+        return self.batch
+
+
+class FakeStreamRows:
+    def __init__(self, batches):
+        self.pages = [FakePage(batch) for batch in batches]
+
+
+class FakeStreamReader:
+    def __init__(self, batches):
+        self.batches = batches
+
+    def rows(self, session):
+        return FakeStreamRows(self.batches)
+
+
+class FakeStream:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class FakeSession:
+    def __init__(self, streams):
+        self.streams = streams
+
+
+class FakeReadClient:
+    """A read session over ``table``, split round-robin across streams."""
+
+    def __init__(self, table: pa.Table, batch_rows: int = 2):
+        self.batches = table.to_batches(max_chunksize=batch_rows)
+        self.sessions: list[dict] = []
+        self.read_threads: set[str] = set()
+
+    def create_read_session(self, parent, read_session, max_stream_count):
+        self.sessions.append(
+            {
+                "parent": parent,
+                "read_session": read_session,
+                "max_stream_count": max_stream_count,
+            }
+        )
+        count = min(max_stream_count, len(self.batches))
+        return FakeSession([FakeStream(f"stream-{index}") for index in range(count)])
+
+    def read_rows(self, name: str):
+        self.read_threads.add(threading.current_thread().name)
+        index = int(name.rsplit("-", 1)[1])
+        count = self.sessions[-1]["max_stream_count"]
+        count = min(count, len(self.batches))
+        return FakeStreamReader(self.batches[index::count])
+
+
+TABLE = pa.table({"n": list(range(10)), "label": [f"v{i}" for i in range(10)]})
+SCHEMA = [FakeField("n"), FakeField("label")]
+
+
+def rest_rows():
+    return [(i, f"v{i}") for i in range(10)]
+
+
+def test_large_results_read_through_parallel_streams():
+    job = FakeJob(rest_rows(), SCHEMA, destination=FakeTableReference())
+    read_client = FakeReadClient(TABLE)
+    connection = BigQueryConnection(
+        FakeClient(job), StorageReader(read_client, "billing", min_rows=5)
+    )
+
+    result = connection.execute(text("select n, label from t"))
+
+    assert sorted(result.fetchall()) == rest_rows()
+    assert result.rowcount == 10
+    assert not job.rows.paged
+    (session,) = read_client.sessions
+    assert session["parent"] == "projects/billing"
+    assert session["read_session"] == {
+        "table": "projects/p/datasets/_anon/tables/anon_result",
+        "data_format": "ARROW",
+    }
+    assert session["max_stream_count"] == 4
+
+
+def test_ordered_results_read_through_one_stream_in_order():
+    job = FakeJob(rest_rows(), SCHEMA, destination=FakeTableReference())
+    read_client = FakeReadClient(TABLE)
+    connection = BigQueryConnection(
+        FakeClient(job), StorageReader(read_client, "billing", min_rows=5)
+    )
+
+    result = connection.execute(text("select n, label from t order by n"))
+
+    assert result.fetchall() == rest_rows()
+    assert read_client.sessions[0]["max_stream_count"] == 1
+
+
+def test_small_results_stay_on_rest():
+    job = FakeJob(rest_rows(), SCHEMA, destination=FakeTableReference())
+    read_client = FakeReadClient(TABLE)
+    connection = BigQueryConnection(
+        FakeClient(job), StorageReader(read_client, "billing", min_rows=11)
+    )
+
+    assert connection.execute(text("select 1")).fetchall() == rest_rows()
+    assert job.rows.paged
+    assert read_client.sessions == []
+
+
+def test_results_without_a_destination_stay_on_rest():
+    job = FakeJob(rest_rows(), SCHEMA, destination=None)
+    read_client = FakeReadClient(TABLE)
+    connection = BigQueryConnection(
+        FakeClient(job), StorageReader(read_client, "billing", min_rows=1)
+    )
+
+    assert connection.execute(text("select 1")).fetchall() == rest_rows()
+    assert read_client.sessions == []
+
+
+def test_an_empty_session_yields_no_rows():
+    read_client = FakeReadClient(TABLE.slice(0, 0))
+    reader = StorageReader(read_client, "billing", min_rows=0)
+    assert list(reader.rows(FakeTableReference())) == []
+
+
+def test_interleave_surfaces_a_failing_stream():
+    def good():
+        yield from range(3)
+
+    def bad():
+        yield 10
+        raise RuntimeError("stream reset")
+
+    with pytest.raises(RuntimeError, match="stream reset"):
+        list(interleave([good, bad]))
+
+
+def test_interleave_stops_when_closed_early():
+    produced: list[int] = []
+
+    def endless():
+        n = 0
+        while True:
+            produced.append(n)
+            yield n
+            n += 1
+
+    items = interleave([endless, endless])
+    next(items)
+    items.close()
+    # producers hold at most their queue slots plus the item they were putting
+    count = len(produced)
+    threading.Event().wait(0.3)
+    assert len(produced) <= count + 2
+
+
+def test_preserves_order_and_table_path():
+    assert preserves_order("select * from t\nORDER  BY 1")
+    assert not preserves_order("select * from t")
+    assert table_path(FakeTableReference()) == (
+        "projects/p/datasets/_anon/tables/anon_result"
+    )
+
+
+def test_engine_builds_a_reader_only_when_configured():
+    job = FakeJob([], [])
+    engine = BigQueryEngine(BigQueryConfig(client=FakeClient(job), project="p"))
+    assert engine.connect().storage_reader is None
+
+    read_client = FakeReadClient(TABLE)
+    engine = BigQueryEngine(
+        BigQueryConfig(
+            client=FakeClient(job),
+            project="p",
+            storage_read_min_rows=1000,
+            storage_read_streams=8,
+            read_client=read_client,
+        )
+    )
+    reader = engine.connect().storage_reader
+    assert reader is not None
+    assert reader.read_client is read_client
+    assert (reader.min_rows, reader.max_streams, reader.project) == (
+        1000,
+        8,
+        "billing",
+    )
@@ -8,15 +8,19 @@ import pytest
 from trilogy.dialect import python_source
 from trilogy.dialect.python_source import (
     ParquetStreamWriter,
+    PartitionedDatasourceError,
     PythonDatasourceError,
     build_uv_command,
     is_retryable,
     normalize_object_uri,
     open_uri_sink,
     parse_script_error,
+    partition_args,
+    partition_slug,
     retry_delay,
     source_key,
     staged_object_name,
+    stream_partitions,
     stream_script,
 )
 from trilogy.io.errors import ERROR_PREFIX, SCRIPT_ERROR_EXIT_CODE
@@ -203,3 +207,111 @@ def test_stream_script_does_not_retry_real_errors(monkeypatch: pytest.MonkeyPatc
     with pytest.raises(PythonDatasourceError):
         stream_script("script.py", "", lambda schema, batches: 0)
     assert len(attempts) == 1
+
+
+def test_partition_args_appends_one_flag_per_key():
+    assert partition_args("--limit 5", {"region": "us west", "day": "2024-01-01"}) == (
+        "--limit 5 --partition day=2024-01-01 --partition 'region=us west'"
+    )
+    assert build_uv_command("s.py", partition_args("", {"day": "1"}))[-2:] == [
+        "--partition",
+        "day=1",
+    ]
+
+
+def test_partition_slug_is_path_safe():
+    assert partition_slug({"day": "2024-01-01", "region": "us_west"}) == (
+        "day=2024-01-01,region=us_west"
+    )
+    slug = partition_slug({"region": "us/west", "day": "2024-01-01"})
+    assert slug.startswith("day=2024-01-01,region=us_west~")
+    assert "/" not in slug
+
+
+def test_partition_slug_is_collision_free():
+    values = ["us/west", "us_west", "us west", "us~west", "us_west~0"]
+    slugs = {partition_slug({"region": value}) for value in values}
+    assert len(slugs) == len(values)
+
+
+def test_stream_partitions_runs_slices_in_parallel(monkeypatch: pytest.MonkeyPatch):
+    import threading
+
+    lock = threading.Lock()
+    running = [0, 0]  # current, peak
+    barrier = threading.Barrier(3, timeout=10)
+    seen: list[str] = []
+
+    def fake_stream_once(script, args, write):
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+            seen.append(args)
+        # only passes if three slices are in flight at once
+        barrier.wait()
+        with lock:
+            running[0] -= 1
+        return 0, write(None, iter(())), "", None
+
+    monkeypatch.setattr(python_source, "_stream_once", fake_stream_once)
+    partitions = [{"day": str(day)} for day in range(6)]
+
+    rows = stream_partitions(
+        "script.py",
+        "",
+        partitions,
+        lambda index, partition: lambda schema, batches: index * 10,
+        max_workers=3,
+    )
+
+    assert rows == {index: index * 10 for index in range(6)}
+    assert running[1] == 3
+    assert sorted(seen) == [f"--partition day={day}" for day in range(6)]
+
+
+def test_stream_partitions_retries_only_the_failed_slices(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    calls: list[str] = []
+
+    def fake_stream_once(script, args, write):
+        calls.append(args)
+        if args.endswith("day=2") and calls.count(args) == 1:
+            return 1, 0, "upstream timed out", None
+        return 0, 1, "", None
+
+    monkeypatch.setattr(python_source, "_stream_once", fake_stream_once)
+
+    rows = stream_partitions(
+        "script.py",
+        "",
+        [{"day": str(day)} for day in range(4)],
+        lambda index, partition: lambda schema, batches: 0,
+    )
+
+    assert rows == {0: 1, 1: 1, 2: 1, 3: 1}
+    assert len(calls) == 5
+    assert calls.count("--partition day=2") == 2
+
+
+def test_stream_partitions_names_the_slices_that_never_succeeded(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    def fake_stream_once(script, args, write):
+        if args.endswith(("day=1", "day=3")):
+            return 1, 0, "SyntaxError: bad script", None
+        return 0, 2, "", None
+
+    monkeypatch.setattr(python_source, "_stream_once", fake_stream_once)
+
+    with pytest.raises(PartitionedDatasourceError) as info:
+        stream_partitions(
+            "script.py",
+            "",
+            [{"day": str(day)} for day in range(4)],
+            lambda index, partition: lambda schema, batches: 0,
+        )
+
+    assert info.value.failed_partitions == [{"day": "1"}, {"day": "3"}]
+    assert info.value.rows == {0: 2, 2: 2}
+    assert "2 of 4 partitions (day=1, day=3)" in str(info.value)
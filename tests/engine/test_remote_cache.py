@@ -0,0 +1,187 @@
+"""Read-through cache for remote file datasources, against a local HTTP
+server so validation and invalidation run for real."""
+
+import functools
+import os
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from trilogy.core.enums import AddressType
+from trilogy.core.models.datasource import Address
+from trilogy.dialect.config import DuckDBConfig, SQLiteConfig
+from trilogy.dialect.duckdb import DuckDBDialect
+from trilogy.remote_cache import REMOTE_CACHE_DIR, RemoteFileCache, fetch_url
+from trilogy.staging import StagingConfig
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def served(tmp_path: Path):
+    root = tmp_path / "remote"
+    root.mkdir()
+    handler = functools.partial(_QuietHandler, directory=str(root))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield root, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _write_parquet(path: Path, rows: int) -> None:
+    duckdb.sql(
+        f"COPY (SELECT range AS id FROM range({rows})) TO '{path.as_posix()}' "
+        "(FORMAT parquet)"
+    )
+
+
+def _touch_later(path: Path) -> None:
+    # Last-Modified has one-second resolution; force a distinct value
+    stat = path.stat()
+    os.utime(path, (stat.st_atime + 5, stat.st_mtime + 5))
+
+
+def test_fetch_url():
+    assert fetch_url("gs://bucket/a.parquet") == (
+        "https://storage.googleapis.com/bucket/a.parquet"
+    )
+    assert fetch_url("https://host/a.parquet") == "https://host/a.parquet"
+    assert fetch_url("gs://bucket/*.parquet") is None
+    assert fetch_url("/local/a.parquet") is None
+    assert fetch_url("s3://bucket/a.parquet") is None
+
+
+def test_hit_after_first_download(served, tmp_path: Path):
+    root, base = served
+    _write_parquet(root / "a.parquet", 10)
+    cache = RemoteFileCache(tmp_path / "cache")
+    first = cache.get(f"{base}/a.parquet")
+    second = cache.get(f"{base}/a.parquet")
+    assert first is not None and first == second
+    assert first.endswith(".parquet")
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert duckdb.sql(f"SELECT count(*) FROM '{first}'").fetchone() == (10,)
+
+
+def test_changed_object_is_refetched(served, tmp_path: Path):
+    root, base = served
+    target = root / "a.parquet"
+    _write_parquet(target, 10)
+    cache = RemoteFileCache(tmp_path / "cache", revalidate_after=0)
+    cache.get(f"{base}/a.parquet")
+    _write_parquet(target, 25)
+    _touch_later(target)
+    path = cache.get(f"{base}/a.parquet")
+    assert cache.misses == 2
+    assert duckdb.sql(f"SELECT count(*) FROM '{path}'").fetchone() == (25,)
+
+
+def test_recent_validation_skips_the_probe(served, tmp_path: Path):
+    root, base = served
+    target = root / "a.parquet"
+    _write_parquet(target, 10)
+    cache = RemoteFileCache(tmp_path / "cache")
+    first = cache.get(f"{base}/a.parquet")
+    # gone remotely, but validated moments ago: no request is made
+    target.unlink()
+    assert cache.get(f"{base}/a.parquet") == first
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.revalidate_after = 0
+    assert cache.get(f"{base}/a.parquet") is None
+
+
+def test_unreachable_and_oversized_fall_back(served, tmp_path: Path):
+    root, base = served
+    _write_parquet(root / "a.parquet", 1000)
+    cache = RemoteFileCache(tmp_path / "cache", max_file_bytes=16)
+    assert cache.get(f"{base}/a.parquet") is None
+    assert cache.get(f"{base}/missing.parquet") is None
+    assert cache.entries() == []
+
+
+def test_lru_eviction(served, tmp_path: Path):
+    root, base = served
+    for name in ("a", "b", "c"):
+        _write_parquet(root / f"{name}.parquet", 100)
+    size = (root / "a.parquet").stat().st_size
+    cache = RemoteFileCache(tmp_path / "cache", max_bytes=size * 2)
+    cache.get(f"{base}/a.parquet")
+    cache.get(f"{base}/b.parquet")
+    # touch a so b is the least recently used
+    cache.get(f"{base}/a.parquet")
+    cache.get(f"{base}/c.parquet")
+    kept = {Path(entry.url).name for entry in cache.entries()}
+    assert kept == {"a.parquet", "c.parquet"}
+
+
+def test_duckdb_renders_cached_location(served, tmp_path: Path):
+    root, base = served
+    _write_parquet(root / "a.parquet", 10)
+    staging = StagingConfig(path=str(tmp_path / "staging"))
+    dialect = DuckDBDialect(config=DuckDBConfig(remote_cache=True), staging=staging)
+    address = Address(location=f"{base}/a.parquet", type=AddressType.PARQUET)
+    assert dialect.REQUIRES_SOURCE_PREPARATION
+
+    # rendering alone never reaches the network
+    assert base in dialect.render_source(address)
+    assert not (tmp_path / "staging" / REMOTE_CACHE_DIR).exists()
+
+    dialect.prepare_sources([address], executor=None)  # type: ignore[arg-type]
+    rendered = dialect.render_source(address)
+    assert base not in rendered
+    assert REMOTE_CACHE_DIR in rendered
+
+    uncached = DuckDBDialect(config=DuckDBConfig(), staging=staging)
+    assert not uncached.REQUIRES_SOURCE_PREPARATION
+    assert base in uncached.render_source(address)
+
+
+def test_executor_reads_through_cache(served, tmp_path: Path):
+    from trilogy import Dialects
+    from trilogy.core.profile import profiling
+
+    root, base = served
+    _write_parquet(root / "a.parquet", 10)
+    executor = Dialects.DUCK_DB.default_executor(
+        conf=DuckDBConfig(remote_cache=True),
+        staging=StagingConfig(path=str(tmp_path / "staging")),
+    )
+    try:
+        text = f"""key id int;
+datasource remote (id) grain (id) file `{base}/a.parquet`;
+select count(id) -> ids;"""
+        # compiling for display stays off the network
+        executor.generate_sql(text)
+        assert not (tmp_path / "staging" / REMOTE_CACHE_DIR).exists()
+        with profiling() as profiler:
+            assert executor.execute_text(text)[-1].fetchall()[0].ids == 10
+        assert (tmp_path / "staging" / REMOTE_CACHE_DIR).exists()
+        # the download is timed apart from rendering
+        assert "fetch" in profiler.statements[-1].phases
+    finally:
+        executor.close()
+
+
+def test_sqlite_reuses_cached_download(served, tmp_path: Path):
+    import sqlite3
+
+    root, base = served
+    with sqlite3.connect(root / "db.sqlite") as conn:
+        conn.execute("CREATE TABLE t (x int)")
+    staging = str(tmp_path / "staging")
+    first = SQLiteConfig(
+        path=f"{base}/db.sqlite", staging_path=staging, remote_cache=True
+    )
+    second = SQLiteConfig(
+        path=f"{base}/db.sqlite", staging_path=staging, remote_cache=True
+    )
+    assert first.path == second.path
+    assert REMOTE_CACHE_DIR in str(first.path)
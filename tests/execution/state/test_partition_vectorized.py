@@ -0,0 +1,183 @@
+"""The Arrow path for judging many slices must agree with the per-slice rule.
+
+Each case runs the same slices through both paths: with the threshold at its
+default (small inputs take the per-slice loop) and forced to zero.
+"""
+
+import random
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+
+from trilogy.core.models.datasource import UpdateKey, UpdateKeyType
+from trilogy.execution.state import partitions
+from trilogy.execution.state.partitions import (
+    PartitionObservation,
+    paired_slices,
+    partition_verdict,
+    partition_verdicts,
+    stale_slices,
+)
+
+KEY = "local.updated_at"
+
+
+def slice_(values, watermark=None, row_count=None, keys=(KEY,)):
+    return PartitionObservation(
+        values=values,
+        row_count=row_count,
+        keys={
+            key: UpdateKey(
+                concept_name=key, type=UpdateKeyType.UPDATE_TIME, value=watermark
+            )
+            for key in keys
+        },
+    )
+
+
+def both_paths(monkeypatch, fn, *args):
+    scalar = fn(*args)
+    monkeypatch.setattr(partitions, "VECTORIZE_MIN_SLICES", 0)
+    vectorized = fn(*args)
+    monkeypatch.undo()
+    return scalar, vectorized
+
+
+def hourly(start: datetime, hours: int) -> list[datetime]:
+    return [start + timedelta(hours=h) for h in range(hours)]
+
+
+PARTITION_VALUES = {
+    "int": [1, -5, 2**40, None, 7],
+    "str": ["north", "é", "", None, "a/b"],
+    "bool": [True, False, None],
+    "date": [date(2024, 1, 3), date(1999, 12, 31), None],
+    "datetime": [
+        datetime(2024, 1, 3, 5),
+        datetime(2024, 1, 3, 5, 0, 0, 12),
+        datetime(1969, 12, 31, 23, 59, 59, 500000),
+        datetime(999, 1, 1),
+        None,
+    ],
+    "aware": [datetime(2024, 1, 3, tzinfo=UTC), None],
+    "float": [1.0, 2.5, None],
+    "mixed": [1, "1", date(2024, 1, 1), datetime(2024, 1, 1), True, None],
+}
+
+
+@pytest.mark.parametrize("kind", sorted(PARTITION_VALUES))
+def test_ids_render_like_partition_id(kind):
+    observations = [
+        slice_({"region": "north", "day": value}) for value in PARTITION_VALUES[kind]
+    ]
+    rendered = partitions._partition_ids(observations).to_pylist()
+    assert rendered == [obs.id for obs in observations]
+
+
+def test_ids_fall_back_when_columns_differ():
+    observations = [slice_({"a": 1}), slice_({"b": 1}), slice_({})]
+    rendered = partitions._partition_ids(observations).to_pylist()
+    assert rendered == ["a=1", "b=1", ""]
+
+
+def random_sides(seed: int, size: int):
+    rng = random.Random(seed)
+    hours = hourly(datetime(2024, 1, 1), size)
+    expected = [
+        slice_({"hour": h}, watermark=h + timedelta(minutes=rng.choice([0, 30])))
+        for h in hours
+    ]
+    observed = []
+    for h in hours:
+        roll = rng.random()
+        if roll < 0.1:
+            continue  # missing
+        row_count = 0 if roll < 0.15 else 10
+        if roll < 0.3:
+            watermark = None
+        elif roll < 0.5:
+            watermark = h  # behind
+        else:
+            watermark = h + timedelta(minutes=30)
+        observed.append(slice_({"hour": h}, watermark=watermark, row_count=row_count))
+    # present but not expected, and a duplicate id on each side
+    observed.append(slice_({"hour": datetime(2030, 1, 1)}, row_count=3))
+    observed.append(slice_({"hour": hours[0]}, watermark=hours[0], row_count=1))
+    expected.append(slice_({"hour": hours[1]}, watermark=None))
+    return observed, expected
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_stale_slices_match(monkeypatch, seed):
+    observed, expected = random_sides(seed, 300)
+    scalar, vectorized = both_paths(monkeypatch, stale_slices, observed, expected)
+    assert vectorized == scalar
+    assert scalar  # the fixture does produce stale slices
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_paired_slices_and_verdicts_match(monkeypatch, seed):
+    observed, expected = random_sides(seed, 300)
+    scalar, vectorized = both_paths(monkeypatch, paired_slices, observed, expected)
+    assert vectorized == scalar
+
+    pairs = [(obs, exp) for _, obs, exp in scalar]
+    scalar_verdicts, vectorized_verdicts = both_paths(
+        monkeypatch, partition_verdicts, pairs
+    )
+    assert vectorized_verdicts == scalar_verdicts
+    assert scalar_verdicts == [partition_verdict(obs, exp) for obs, exp in pairs]
+
+
+@pytest.mark.parametrize(
+    "current, expected",
+    [
+        ([1, 5, None], [2, 5, 3]),
+        (["b", "a"], ["a", "b"]),
+        # one side an int, the other a float: the scalar rule compares strings
+        ([10, 2.5], [9.5, 3]),
+        (
+            [date(2024, 1, 1), datetime(2024, 1, 2)],
+            [datetime(2024, 1, 1), date(2024, 1, 3)],
+        ),
+    ],
+)
+def test_watermark_comparison_matches(monkeypatch, current, expected):
+    pairs = [
+        (slice_({"p": i}, watermark=c, row_count=1), slice_({"p": i}, watermark=e))
+        for i, (c, e) in enumerate(zip(current, expected))
+    ]
+    scalar, vectorized = both_paths(monkeypatch, partition_verdicts, pairs)
+    assert vectorized == scalar
+
+
+def test_first_failing_key_names_the_reason(monkeypatch):
+    keys = ("a", "b")
+    observed = PartitionObservation(
+        values={"p": 1},
+        row_count=1,
+        keys={
+            "b": UpdateKey(concept_name="b", type=UpdateKeyType.UPDATE_TIME, value=1)
+        },
+    )
+    expected = slice_({"p": 1}, watermark=2, keys=keys)
+    scalar, vectorized = both_paths(
+        monkeypatch, partition_verdicts, [(observed, expected)]
+    )
+    assert vectorized == scalar
+    assert scalar[0].reason == "'a' missing (expected 2)"
+
+
+def test_differing_key_orders_use_the_scalar_rule(monkeypatch):
+    first = slice_({"p": 1}, watermark=2, keys=("a", "b"))
+    second = slice_({"p": 2}, watermark=2, keys=("b", "a"))
+    pairs = [
+        (slice_({"p": 1}, row_count=1, keys=("a", "b")), first),
+        (slice_({"p": 2}, row_count=1, keys=("a", "b")), second),
+    ]
+    scalar, vectorized = both_paths(monkeypatch, partition_verdicts, pairs)
+    assert vectorized == scalar
+    assert [v.reason for v in scalar] == [
+        "'a' missing (expected 2)",
+        "'b' missing (expected 2)",
+    ]
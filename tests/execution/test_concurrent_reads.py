@@ -0,0 +1,109 @@
+import pytest
+
+from trilogy import Dialects
+from trilogy.dialect.config import DuckDBConfig
+from trilogy.dialect.results import ChartResult
+from trilogy.report.document import ErrorBox, Table, parse_markdown
+from trilogy.report.runner import run_document
+
+MODEL = """
+key order_id int;
+key store_id int;
+property order_id.amount float;
+datasource orders (id: order_id, store: store_id, amount: amount)
+grain (order_id) address orders;
+"""
+
+READS = """
+select store_id, sum(amount) -> total order by store_id asc;
+select count(order_id) -> orders;
+chart layer bar ( x_axis <- store_id, y_axis <- sum(amount) as total );
+select max(amount) -> largest;
+"""
+
+
+@pytest.fixture
+def executor(tmp_path, monkeypatch):
+    executor = Dialects.DUCK_DB.default_executor(
+        conf=DuckDBConfig(path=str(tmp_path / "reads.duckdb"))
+    )
+    # an on-disk database shares its data across connections; the dialect
+    # only opts out because of per-connection extension setup
+    monkeypatch.setattr(executor.generator, "SUPPORTS_CONCURRENT_READS", True)
+    executor.execute_write_sql(
+        "create table orders as select range as id, range % 7 as store, "
+        "range * 1.5 as amount from range(1000)"
+    )
+    executor.parse_text(MODEL)
+    yield executor
+    executor.close()
+
+
+def _rows(results):
+    return [
+        result.data if isinstance(result, ChartResult) else result.fetchall()
+        for result in results
+    ]
+
+
+def test_concurrent_results_match_sequential(executor):
+    # one at a time: a sequential run's earlier cursors do not survive the
+    # next statement on the same connection
+    expected = [
+        _rows(executor.execute_text(statement + ";"))[0]
+        for statement in READS.strip().rstrip(";").split(";\n")
+    ]
+    results = executor.execute_text(READS, concurrency=3)
+    assert [type(result) for result in results][2] is ChartResult
+    assert _rows(results) == expected
+    assert executor._readers
+
+
+def test_readers_share_no_state_with_the_writer(executor):
+    results = executor.execute_text(READS, concurrency=4)
+    assert len(results) == 4
+    readers = list(executor._readers)
+    assert readers
+    for reader in readers:
+        assert reader is not executor
+        assert reader.connection is not executor.connection
+        assert reader.generator is not executor.generator
+        assert reader.environment is not executor.environment
+        # readers only run compiled SQL; they never see the writer's model
+        assert "local.amount" not in reader.environment.concepts
+    readers[0].parse_text("const reader_only <- 1;")
+    assert "local.reader_only" not in executor.environment.concepts
+    executor.close()
+    assert not executor._readers
+    assert not any(reader.connected for reader in readers)
+
+
+def test_writes_are_barriers(executor):
+    results = executor.execute_text(
+        "select count(order_id) -> before;"
+        "raw_sql('''insert into orders select 5000, 1, 2.0''');"
+        "select count(order_id) -> after;",
+        concurrency=2,
+    )
+    assert [result.fetchall() for result in results[::2]] == [[(1000,)], [(1001,)]]
+
+
+def test_embedded_dialects_stay_sequential():
+    executor = Dialects.DUCK_DB.default_executor()
+    assert executor.read_concurrency(8) == 1
+    executor.close()
+
+
+def test_report_blocks_run_concurrently_in_order(executor, tmp_path):
+    text = (
+        "# Report\n\n"
+        "```trilogy\nselect count(order_id) -> orders;\n```\n\n"
+        "```trilogy\nselect missing_concept;\n```\n\n"
+        "```trilogy\nselect max(amount) -> largest;\n```\n"
+    )
+    elements = run_document(
+        parse_markdown(text), working_path=tmp_path, executor=executor, concurrency=2
+    )
+    tables = [element for element in elements if isinstance(element, Table)]
+    assert [table.rows for table in tables] == [[[1000]], [[1498.5]]]
+    assert isinstance(elements[2], ErrorBox)
@@ -0,0 +1,221 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from trilogy import Dialects, Executor
+from trilogy.dialect.config import DuckDBConfig
+from trilogy.execution.config import load_config_file
+from trilogy.execution.connection_pool import (
+    SharedEngine,
+    active_engine_pool,
+    is_shareable,
+    pool_key,
+    shared_engine_factory,
+    shared_engine_scope,
+)
+
+
+def _executor(path=None, **kwargs) -> Executor:
+    return Dialects.DUCK_DB.default_executor(
+        conf=DuckDBConfig(path=str(path) if path else None, **kwargs),
+        _engine_factory=shared_engine_factory,
+    )
+
+
+def test_executors_share_one_engine_per_config(tmp_path):
+    db = tmp_path / "warehouse.duckdb"
+    with shared_engine_scope(max_size=2) as pool:
+        first = _executor(db)
+        second = _executor(db)
+        other = _executor(tmp_path / "other.duckdb")
+        assert isinstance(first.engine, SharedEngine)
+        assert first.engine is second.engine
+        assert other.engine is not first.engine
+        for executor in (first, second, other):
+            executor.close()
+        assert len(pool._engines) == 2
+    assert active_engine_pool() is None
+    # without a scope each executor owns its engine again
+    alone = _executor(db)
+    assert not isinstance(alone.engine, SharedEngine)
+    alone.close()
+
+
+def test_pool_key_ignores_instance_identity(tmp_path):
+    db = str(tmp_path / "warehouse.duckdb")
+    assert pool_key(DuckDBConfig(path=db)) == pool_key(DuckDBConfig(path=db))
+    assert pool_key(DuckDBConfig(path=db)) != pool_key(
+        DuckDBConfig(path=db, read_only=True)
+    )
+
+
+def test_in_memory_databases_are_never_shared():
+    assert not is_shareable(DuckDBConfig())
+    with shared_engine_scope(max_size=2):
+        first = _executor()
+        second = _executor()
+        try:
+            assert not isinstance(first.engine, SharedEngine)
+            first.execute_raw_sql("CREATE TABLE only_here AS SELECT 1 AS x")
+            assert not second.execute_raw_sql(
+                "SELECT * FROM information_schema.tables "
+                "WHERE table_name = 'only_here'"
+            ).fetchall()
+        finally:
+            first.close()
+            second.close()
+
+
+def test_many_executors_reuse_a_bounded_set_of_connections(tmp_path):
+    db = tmp_path / "warehouse.duckdb"
+    seen: set[int] = set()
+    lock = threading.Lock()
+
+    def run(i: int) -> int:
+        executor = _executor(db)
+        try:
+            with lock:
+                seen.add(id(executor.connection.connection.dbapi_connection))
+            return executor.execute_raw_sql(f"SELECT {i}").fetchone()[0]
+        finally:
+            executor.close()
+
+    with shared_engine_scope(max_size=3) as pool:
+        with ThreadPoolExecutor(max_workers=3) as threads:
+            assert sorted(threads.map(run, range(12))) == list(range(12))
+        (shared,) = pool._engines.values()
+        assert shared.engine.pool.size() == 3
+        assert shared.engine.pool.checkedout() == 0
+    assert len(seen) <= 3
+
+
+def test_connect_time_setup_runs_once_per_connection(tmp_path, monkeypatch):
+    calls: list[str] = []
+    original = Executor._duckdb_macro_exists
+
+    def counting(self, name, marker):
+        calls.append(name)
+        return original(self, name, marker)
+
+    monkeypatch.setattr(Executor, "_duckdb_macro_exists", counting)
+    db = tmp_path / "warehouse.duckdb"
+    with shared_engine_scope(max_size=1):
+        for _ in range(3):
+            _executor(db).close()
+    assert calls == ["uv_run"]
+
+    # settings that setup established survive the checkin reset, so it
+    # still runs once per connection
+    with shared_engine_scope(max_size=1):
+        for _ in range(2):
+            executor = _executor(db, remote_cache_row_groups=True)
+            assert executor.execute_raw_sql(
+                "SELECT current_setting('parquet_metadata_cache')"
+            ).fetchone() == (True,)
+            executor.close()
+        assert calls == ["uv_run"] * 2
+
+        # a session that undoes one is reset all the way, and setup reruns
+        executor = _executor(db, remote_cache_row_groups=True)
+        executor.execute_raw_sql("SET parquet_metadata_cache = false")
+        executor.close()
+        executor = _executor(db, remote_cache_row_groups=True)
+        assert executor.execute_raw_sql(
+            "SELECT current_setting('parquet_metadata_cache')"
+        ).fetchone() == (True,)
+        executor.close()
+    assert calls == ["uv_run"] * 3
+
+    # unpooled connections are new each time, so setup always runs
+    for _ in range(2):
+        _executor(db).close()
+    assert calls == ["uv_run"] * 5
+
+
+def test_session_state_does_not_leak_between_executors(tmp_path):
+    db = tmp_path / "warehouse.duckdb"
+    with shared_engine_scope(max_size=1):
+        first = _executor(db)
+        first.execute_raw_sql("CREATE TEMP TABLE scratch AS SELECT 42 AS x")
+        first.execute_raw_sql("CREATE TEMP VIEW scratch_view AS SELECT 1 AS y")
+        first.execute_raw_sql("CREATE TEMP MACRO scratch_macro(a) AS a + 1")
+        first.execute_raw_sql("SET VARIABLE scratch_var = 'from-a'")
+        first.execute_raw_sql("SET TimeZone = 'America/New_York'")
+        connection = first.connection.connection.dbapi_connection
+        first.close()
+
+        second = _executor(db)
+        try:
+            # the same physical connection, scrubbed
+            assert second.connection.connection.dbapi_connection is connection
+            assert not second.execute_raw_sql(
+                "SELECT * FROM duckdb_tables() WHERE temporary"
+            ).fetchall()
+            assert not second.execute_raw_sql(
+                "SELECT * FROM duckdb_views() WHERE temporary AND NOT internal"
+            ).fetchall()
+            assert second.execute_raw_sql(
+                "SELECT getvariable('scratch_var')"
+            ).fetchone() == (None,)
+            assert second.execute_raw_sql(
+                "SELECT current_setting('TimeZone')"
+            ).fetchone() != ("America/New_York",)
+            # a script creating the same temp objects no longer collides
+            second.execute_raw_sql("CREATE TEMP TABLE scratch AS SELECT 1 AS x")
+            second.execute_raw_sql("CREATE TEMP MACRO scratch_macro(a) AS a + 2")
+        finally:
+            second.close()
+
+
+def test_setup_variables_survive_checkin(tmp_path):
+    db = tmp_path / "warehouse.duckdb"
+    with shared_engine_scope(max_size=1):
+        first = _executor(db)
+        first._connection_setup(
+            "variable", lambda: first.execute_raw_sql("SET VARIABLE kept = 'setup'")
+        )
+        first.execute_raw_sql("SET VARIABLE scratch = 'session'")
+        first.close()
+
+        second = _executor(db)
+        try:
+            assert second.execute_raw_sql(
+                "SELECT getvariable('kept'), getvariable('scratch')"
+            ).fetchone() == ("setup", None)
+        finally:
+            second.close()
+
+
+def test_close_drops_shared_cte_tables_before_returning_connection(tmp_path):
+    db = tmp_path / "warehouse.duckdb"
+    with shared_engine_scope(max_size=1):
+        first = _executor(db)
+        first.execute_raw_sql("CREATE TEMP TABLE __shared_x AS SELECT 1 AS x")
+        first._shared_cte_tables.append("__shared_x")
+        first.close()
+        second = _executor(db)
+        try:
+            assert not second.execute_raw_sql(
+                "SELECT * FROM duckdb_tables() WHERE table_name = '__shared_x'"
+            ).fetchall()
+        finally:
+            second.close()
+
+
+def test_nested_scope_joins_outer(tmp_path):
+    with shared_engine_scope(max_size=4) as outer:
+        with shared_engine_scope(max_size=1) as inner:
+            assert inner is outer
+            executor = _executor(tmp_path / "warehouse.duckdb")
+            executor.close()
+        # the inner exit left the outer pool open
+        assert active_engine_pool() is outer
+        assert outer._engines
+    assert not outer._engines
+
+
+def test_config_pool_size(tmp_path):
+    toml_path = tmp_path / "trilogy.toml"
+    toml_path.write_text('[engine]\ndialect = "duckdb"\npool_size = 4\n')
+    assert load_config_file(toml_path).pool_size == 4
+    toml_path.write_text('[engine]\ndialect = "duckdb"\n')
+    assert load_config_file(toml_path).pool_size is None
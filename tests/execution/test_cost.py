@@ -0,0 +1,200 @@
+import json
+
+import pytest
+
+from trilogy import Dialects, Executor
+from trilogy.core.exceptions import (
+    ConfigurationException,
+    CostBudgetExceededException,
+)
+from trilogy.dialect.bigquery_engine import BigQueryConnection
+from trilogy.execution.config import load_config_file
+from trilogy.execution.cost import (
+    CostBudget,
+    RunCost,
+    StatementCost,
+    active_run_cost,
+    estimate_statement,
+    format_bytes,
+    parse_byte_size,
+    run_cost_scope,
+)
+from trilogy.execution.report import report_run
+
+
+def test_parse_byte_size():
+    assert parse_byte_size(1024) == 1024
+    assert parse_byte_size("512") == 512
+    assert parse_byte_size("50 GB") == 50 * 1000**3
+    assert parse_byte_size("1.5TiB") == int(1.5 * 1024**4)
+    assert parse_byte_size("2 k") == 2000
+    with pytest.raises(ValueError, match="Invalid byte size"):
+        parse_byte_size("lots")
+    with pytest.raises(ValueError, match="Invalid byte size"):
+        parse_byte_size("10i")
+
+
+def test_format_bytes():
+    assert format_bytes(None) == "unknown"
+    assert format_bytes(999) == "999 B"
+    assert format_bytes(1_500_000) == "1.50 MB"
+    assert format_bytes(3 * 1000**5) == "3,000.00 TB"
+
+
+def test_run_cost_admits_within_budget_and_refuses_over_it():
+    budget = CostBudget(max_statement_bytes=100, max_run_bytes=150)
+    run = RunCost()
+    assert run.admit(StatementCost("a", 90), budget) == 90
+    # unknown estimates never block
+    assert run.admit(StatementCost("b", None), budget) == 90
+
+    with pytest.raises(CostBudgetExceededException) as statement_error:
+        run.admit(StatementCost("c", 101), budget)
+    assert statement_error.value.scope == "statement"
+
+    with pytest.raises(CostBudgetExceededException) as run_error:
+        run.admit(StatementCost("d", 61), budget)
+    assert run_error.value.scope == "run"
+    assert run_error.value.run_bytes == 90
+    # refused statements are not counted
+    assert run.total_bytes == 90
+    assert [cost.sql for cost in run.statements] == ["a", "b"]
+
+
+def test_budget_from_dict():
+    assert not CostBudget.from_dict({}).enabled
+    assert CostBudget.from_dict({"dry_run": True}).enabled
+    budget = CostBudget.from_dict({"max_run_bytes": "1 TB"})
+    assert budget.max_run_bytes == 1000**4
+    assert budget.max_statement_bytes is None
+
+
+def test_estimate_statement_captures_errors():
+    def failing(sql, params):
+        raise RuntimeError("Table not found: t")
+
+    cost = estimate_statement(failing, "select 1", None)
+    assert cost.estimated_bytes is None
+    assert cost.error == "Table not found: t"
+    assert estimate_statement(lambda sql, params: 7, "select 1", None).to_dict() == {
+        "sql": "select 1",
+        "estimated_bytes": 7,
+        "error": None,
+    }
+
+
+@pytest.fixture
+def estimated_executor():
+    executor = Dialects.DUCK_DB.default_executor()
+    seen: list[str] = []
+
+    def estimate(sql, params):
+        seen.append(sql)
+        return 40
+
+    executor.cost_budget = CostBudget(max_statement_bytes=50, max_run_bytes=100)
+    executor._estimate_cost = estimate
+    executor.seen = seen
+    yield executor
+    executor.close()
+
+
+def test_executor_checks_each_statement_once(estimated_executor):
+    estimated_executor.execute_raw_sql("select 1 as x")
+    estimated_executor.execute_raw_sql("select 2 as x")
+    assert estimated_executor.seen == ["select 1 as x", "select 2 as x"]
+    assert estimated_executor.run_cost.total_bytes == 80
+
+
+def test_executor_refuses_a_statement_over_the_run_budget(estimated_executor):
+    estimated_executor.execute_raw_sql("create table t as select 1 as x")
+    estimated_executor.execute_raw_sql("insert into t select 2")
+    with pytest.raises(CostBudgetExceededException, match="run"):
+        estimated_executor.execute_raw_sql("insert into t select 3")
+    # refused before it ran
+    estimated_executor._estimate_cost = None
+    rows = estimated_executor.execute_raw_sql("select count(*) from t").fetchall()
+    assert rows[0][0] == 2
+
+
+def test_executors_share_a_run_total_inside_a_scope():
+    with run_cost_scope() as run:
+        first = Dialects.DUCK_DB.default_executor()
+        second = Dialects.DUCK_DB.default_executor()
+        assert first.run_cost is run and second.run_cost is run
+        assert active_run_cost() is run
+        first.close()
+        second.close()
+    assert active_run_cost() is None
+
+
+def budgeted_executor(budget: CostBudget) -> Executor:
+    return Executor(
+        dialect=Dialects.DUCK_DB,
+        engine=Dialects.DUCK_DB.default_engine(),
+        cost_budget=budget,
+    )
+
+
+def test_budget_rejected_on_an_engine_without_estimates():
+    with pytest.raises(ConfigurationException, match="cannot estimate"):
+        budgeted_executor(CostBudget(dry_run=True))
+
+
+def test_disabled_budget_is_ignored():
+    executor = budgeted_executor(CostBudget())
+    assert executor.cost_budget is None
+    executor.close()
+
+
+def test_config_parses_cost_section(tmp_path):
+    path = tmp_path / "trilogy.toml"
+    path.write_text("""
+[cost]
+dry_run = true
+max_statement_bytes = "50 GB"
+max_run_bytes = 2000000
+""".strip())
+    config = load_config_file(path)
+    assert config.cost == CostBudget(
+        dry_run=True, max_statement_bytes=50 * 1000**3, max_run_bytes=2_000_000
+    )
+
+
+def test_summary_carries_the_run_estimate(tmp_path, estimated_executor):
+    report = tmp_path / "report.jsonl"
+    with report_run("run", str(report), None) as sink:
+        estimated_executor.run_cost = active_run_cost()
+        estimated_executor.execute_raw_sql("select 1 as x")
+        sink.emit("summary", success=True)
+    records = [json.loads(line) for line in report.read_text().splitlines()]
+    (cost,) = [r for r in records if r["type"] == "statement_cost"]
+    assert cost["estimated_bytes"] == 40
+    assert cost["run_estimated_bytes"] == 40
+    assert records[-1]["type"] == "summary"
+    assert records[-1]["estimated_bytes"] == 40
+
+
+class FakeDryRunJob:
+    total_bytes_processed = 12_345
+
+
+class FakeDryRunClient:
+    def __init__(self):
+        self.configs: list = []
+
+    def query(self, sql, job_config=None):
+        self.configs.append((sql, job_config))
+        return FakeDryRunJob()
+
+
+def test_bigquery_estimate_is_a_dry_run():
+    from sqlalchemy import text
+
+    client = FakeDryRunClient()
+    connection = BigQueryConnection(client)
+    assert connection.estimate_bytes(text("select :x"), {"x": 1}) == 12_345
+    ((sql, job_config),) = client.configs
+    assert sql == "select @x"
+    assert job_config.dry_run is True
+    assert job_config.use_query_cache is False
@@ -155,3 +155,25 @@ def test_transform_rewrites_additional_locations():
     transform_datasource(ds, "dev")
     assert isinstance(ds.address, Address)
     assert ds.address.additional_locations == ["out/b_dev.parquet"]
+
+
+def test_executor_transform_copies_only_rewritten_datasources():
+    from trilogy import Dialects, Environment
+
+    env, _ = Environment().parse("""
+key id int;
+datasource managed (id) grain (id) address orders;
+root datasource raw (id) grain (id) address raw_orders;
+""")
+    dup = env.duplicate()
+    executor = Dialects.DUCK_DB.default_executor(environment=dup)
+    executor.datasource_transform = lambda ds: transform_datasource(ds, "dev")
+    executor.parse_text("select id;")
+
+    datasources = executor.environment.datasources
+    assert datasources["managed"].safe_address == "dev_orders"
+    assert datasources.owns("managed")
+    # the root is left alone, so it is still the object the source holds
+    assert not datasources.owns("raw")
+    assert datasources["raw"] is env.datasources["raw"]
+    assert env.datasources["managed"].safe_address == "orders"
@@ -0,0 +1,86 @@
+import json
+from decimal import Decimal
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from trilogy import Dialects
+from trilogy.core.enums import IOType
+from trilogy.dialect.results import buffered_rows
+from trilogy.execution.export import export_result, result_reader
+
+
+def test_reader_pulls_one_batch_at_a_time():
+    result = buffered_rows(["n", "label"], [(i, None) for i in range(10)])
+    reader = result_reader(result, {"label": pa.string()}, batch_rows=4)
+
+    assert reader.schema.field("label").type == pa.string()
+    first = reader.read_next_batch()
+    assert first.num_rows == 4
+    # the rest has not been fetched yet
+    assert len(result.fetchmany(100)) == 6
+
+
+def test_null_leading_batch_takes_the_later_type():
+    rows = [(None,)] * 3 + [(5,)]
+    reader = result_reader(buffered_rows(["v"], rows), {"v": pa.int64()}, 2)
+    assert reader.read_all().column("v").to_pylist() == [None, None, None, 5]
+
+
+def test_undeclared_columns_are_unified_across_batches():
+    rows = [(None, Decimal("1.5")), (3, Decimal("123.456"))]
+    reader = result_reader(buffered_rows(["n", "d"], rows), None, batch_rows=1)
+    assert reader.schema.field("n").type == pa.int64()
+    assert reader.schema.field("d").type == pa.decimal128(6, 3)
+    table = reader.read_all()
+    assert table.column("n").to_pylist() == [None, 3]
+    assert table.column("d").to_pylist() == [Decimal("1.500"), Decimal("123.456")]
+
+
+def test_declared_types_take_precedence_over_the_data():
+    rows = [(Decimal(2), Decimal("1.5")), (Decimal(7), Decimal("123.456"))]
+    reader = result_reader(
+        buffered_rows(["total", "d"], rows),
+        {"total": pa.int64(), "d": pa.decimal128(12, 4)},
+        batch_rows=1,
+    )
+    table = reader.read_all()
+    assert table.schema.field("total").type == pa.int64()
+    assert table.column("total").to_pylist() == [2, 7]
+    assert table.column("d").to_pylist() == [Decimal("1.5"), Decimal("123.456")]
+
+
+def test_unconvertible_value_names_the_column():
+    reader = result_reader(buffered_rows(["v"], [("x",)]), {"v": pa.int64()})
+    with pytest.raises(ValueError, match="column 'v'"):
+        reader.read_all()
+
+
+def test_empty_result_writes_a_header(tmp_path):
+    target = tmp_path / "out.csv"
+    rows = export_result(buffered_rows(["a", "b"], []), IOType.CSV, str(target))
+    assert rows == 0
+    assert target.read_text().strip() == '"a","b"'
+
+
+@pytest.mark.parametrize("io_type", [IOType.CSV, IOType.JSON, IOType.PARQUET])
+def test_copy_streams_on_engines_without_native_copy(tmp_path, io_type):
+    target = tmp_path / f"out.{io_type.value}"
+    executor = Dialects.SQLITE.default_executor()
+    executor.execute_text(f"""key id int;
+property id.label string;
+datasource ids (id: id, label: label) grain (id)
+query '''select 1 as id, 'a' as label union all select 2, null''';
+
+copy into {io_type.value} '{target}' from select id, label order by id asc;
+""")
+    if io_type == IOType.PARQUET:
+        table = pq.read_table(target)
+        assert table.column("id").to_pylist() == [1, 2]
+        assert table.schema.field("label").type == pa.string()
+    elif io_type == IOType.JSON:
+        lines = [json.loads(line) for line in target.read_text().splitlines()]
+        assert [line["id"] for line in lines] == [1, 2]
+    else:
+        assert target.read_text().splitlines()[1:] == ['1,"a"', "2,"]
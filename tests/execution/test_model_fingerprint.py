@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from trilogy import parse
+from trilogy import Environment, parse
 from trilogy.core.fingerprint import ChangeKind, build_environment_fingerprint
 from trilogy.execution.envs import (
     EnvActivation,
@@ -10,6 +10,8 @@ from trilogy.execution.envs import (
     strip_env_prefix,
 )
 from trilogy.execution.model_fingerprint import (
+    CACHE_SUBPATH,
+    FingerprintCache,
     build_project_fingerprint,
     diff_project_fingerprints,
     load_project_fingerprint,
@@ -167,3 +169,62 @@ def test_persist_targets_are_fingerprinted(tmp_path: Path):
     diff = diff_project_fingerprints(original, current)
     assert not diff.identical
     assert "orders_summary" in {d.datasource_id for d in diff.invalidated_datasources}
+
+
+def test_cached_project_fingerprint_reparses_only_changed_closures(tmp_path: Path):
+    (tmp_path / "base.preql").write_text(MODEL_B, encoding="utf-8")
+    (tmp_path / "a.preql").write_text(MODEL_A, encoding="utf-8")
+    (tmp_path / "b.preql").write_text(
+        "import base as base;\n\nauto total_price <- sum(base.price);\n",
+        encoding="utf-8",
+    )
+    files = [tmp_path / "a.preql", tmp_path / "b.preql"]
+
+    cache = FingerprintCache.for_project(tmp_path)
+    first = build_project_fingerprint(files, tmp_path, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert (tmp_path / CACHE_SUBPATH).exists()
+    assert first == build_project_fingerprint(files, tmp_path)
+
+    cache = FingerprintCache.for_project(tmp_path)
+    assert build_project_fingerprint(files, tmp_path, cache=cache) == first
+    assert (cache.hits, cache.misses) == (2, 0)
+
+    # editing an import re-fingerprints only the scripts that import it
+    (tmp_path / "base.preql").write_text(
+        MODEL_B.replace("price float", "price int"), encoding="utf-8"
+    )
+    cache = FingerprintCache.for_project(tmp_path)
+    current = build_project_fingerprint(files, tmp_path, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert current == build_project_fingerprint(files, tmp_path)
+    diff = diff_project_fingerprints(first, current)
+    assert list(diff.changed_scripts) == ["b.preql"]
+
+    # parameters are part of the key
+    cache = FingerprintCache.for_project(tmp_path)
+    build_project_fingerprint(files, tmp_path, {"x": 1}, cache=cache)
+    assert cache.hits == 0
+
+
+# Effective hashes recorded before node memoization; any canonicalizer change
+# that moves them must bump FINGERPRINT_VERSION, or cached manifests compare
+# as changed instead of being invalidated.
+PINNED_ROOTS = {
+    "modeling/tpc_ds_duckdb/query23.preql": "e1b9cd5fbf0af9144ed3fef74c9512bc",
+    "modeling/tpc_ds_duckdb/query44.preql": "d505e025c1d3bee0c2874f73aca655e8",
+    "profiling/query01.preql": "a263228014119032b59813e6fed77409",
+}
+
+
+def test_fingerprints_match_pinned_hashes():
+    tests_root = Path(__file__).parent.parent
+    for relative, root in PINNED_ROOTS.items():
+        path = tests_root / relative
+        env = Environment(working_path=path.parent)
+        env.parse(path.read_text())
+        fingerprint = build_environment_fingerprint(env)
+        assert fingerprint.root == root, relative
+        if relative.endswith("query23.preql"):
+            concept = fingerprint.concepts["best_customers.best_customer_id"]
+            assert concept.effective == "c3c50134f4315cfdb70a0456dd68acc4"
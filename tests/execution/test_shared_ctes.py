@@ -0,0 +1,145 @@
+from types import SimpleNamespace
+
+import pytest
+
+from trilogy import Dialects
+from trilogy.constants import CONFIG
+from trilogy.dialect.bigquery import BigqueryDialect
+from trilogy.execution import shared_ctes
+from trilogy.execution.shared_ctes import SHARED_TABLE_PREFIX, plan_shared_ctes
+
+MODEL = """
+key order_id int;
+key store_id int;
+property order_id.amount float;
+property store_id.store_name string;
+datasource orders (id: order_id, store: store_id, amount: amount)
+grain (order_id) address orders;
+datasource stores (store: store_id, name: store_name)
+grain (store_id) address stores;
+auto store_total <- sum(amount) by store_id;
+"""
+
+FIRST = "select store_name, store_total order by store_name asc;"
+SECOND = (
+    "select store_name, store_total, count(order_id) -> orders "
+    "order by store_name asc;"
+)
+
+
+@pytest.fixture
+def executor():
+    executor = Dialects.DUCK_DB.default_executor()
+    executor.execute_raw_sql(
+        "create table orders as select range as id, range % 7 as store, "
+        "range * 1.5 as amount from range(1000)"
+    )
+    executor.execute_raw_sql(
+        "create table stores as select range as store, 'name_' || range as name "
+        "from range(7)"
+    )
+    executor.parse_text(MODEL)
+    return executor
+
+
+@pytest.fixture
+def sharing(monkeypatch):
+    monkeypatch.setattr(CONFIG.execution, "share_ctes", True)
+
+
+def test_explain_finds_shared_aggregate(executor):
+    plan = executor.explain_shared_ctes(FIRST + SECOND)
+    assert len(plan.shared) == 1
+    assert plan.shared[0].statements == [0, 1]
+    assert "statements 0, 1" in plan.explain()
+
+
+def test_shared_run_matches_unshared(executor, sharing):
+    expected = executor.execute_text(SECOND)[-1].fetchall()
+    results = executor.execute_text(FIRST + SECOND)
+    plan = executor.last_sharing_plan
+    assert plan is not None and plan.shared[0].materialized
+    assert plan.shared[0].rows == 7
+    assert results[-1].fetchall() == expected
+    tables = executor.execute_raw_sql(
+        "select table_name from duckdb_tables() where temporary"
+    ).fetchall()
+    assert [row[0] for row in tables] == [plan.shared[0].table]
+
+
+def test_consumer_reads_temp_table(executor, sharing):
+    executor.execute_text(FIRST + SECOND)
+    share = executor.last_sharing_plan.shared[0]
+    for consumer, _ in share.consumers:
+        assert share.table in executor.generator.compile_statement(consumer)
+
+
+def test_write_statement_ends_run(executor, sharing):
+    executor.execute_text(FIRST + "raw_sql('''select 1''');" + SECOND)
+    assert executor.last_sharing_plan.shared == []
+
+
+def test_row_limit_skips_share(executor, sharing, monkeypatch):
+    monkeypatch.setattr(CONFIG.execution, "shared_cte_max_rows", 3)
+    expected = executor.execute_text(SECOND)[-1].fetchall()
+    results = executor.execute_text(FIRST + SECOND)
+    share = executor.last_sharing_plan.shared[0]
+    assert not share.materialized
+    assert "row limit" in share.skipped
+    assert results[-1].fetchall() == expected
+    assert SHARED_TABLE_PREFIX not in executor.generator.compile_statement(
+        share.consumers[1][0]
+    )
+
+
+def test_row_limit_bounds_the_create(executor, sharing, monkeypatch):
+    monkeypatch.setattr(CONFIG.execution, "shared_cte_max_rows", 3)
+    statements: list[str] = []
+    run = executor.execute_raw_sql
+
+    def spy(command, *args, **kwargs):
+        statements.append(str(command))
+        return run(command, *args, **kwargs)
+
+    monkeypatch.setattr(executor, "execute_raw_sql", spy)
+    executor.execute_text(FIRST + SECOND)
+    (create,) = [sql for sql in statements if sql.startswith("CREATE TEMPORARY")]
+    assert create.rstrip().endswith("LIMIT 4")
+
+
+def test_source_preparation_failure_skips_share(executor, sharing, monkeypatch):
+    expected = executor.execute_text(SECOND)[-1].fetchall()
+    prepare = executor._prepare_query_sources
+    calls: list[object] = []
+
+    def fail_first(query):
+        # the first preparation of the run is the share's
+        calls.append(query)
+        if len(calls) == 1:
+            raise RuntimeError("no sources")
+        prepare(query)
+
+    monkeypatch.setattr(executor, "_prepare_query_sources", fail_first)
+    results = executor.execute_text(FIRST + SECOND)
+    share = executor.last_sharing_plan.shared[0]
+    assert share.skipped == "create failed: no sources"
+    assert results[-1].fetchall() == expected
+
+
+def test_consumers_are_counted_by_statement(monkeypatch):
+    # one statement computing the same CTE twice is not a share
+    monkeypatch.setattr(
+        shared_ctes, "cte_fingerprints", lambda query, dialect: {"a": "f", "b": "f"}
+    )
+    monkeypatch.setattr(shared_ctes, "_does_work", lambda cte: True)
+    query = SimpleNamespace(ctes=[SimpleNamespace(name="a"), SimpleNamespace(name="b")])
+    assert plan_shared_ctes([(0, query)], dialect=None).shared == []
+    (share,) = plan_shared_ctes([(0, query), (1, query)], dialect=None).shared
+    assert share.statements == [0, 1]
+    assert len(share.consumers) == 4
+
+
+def test_disabled_by_default(executor):
+    executor.execute_text(FIRST + SECOND)
+    assert executor.last_sharing_plan is None
+    assert BigqueryDialect.SUPPORTS_SESSION_TEMP_TABLES is False
@@ -1,6 +1,7 @@
 import pyarrow as pa
 import pytest
 
+from trilogy.io import contract
 from trilogy.io.adapters import to_reader
 from trilogy.io.contract import (
     Filter,
@@ -110,6 +111,69 @@ def test_ordering_an_empty_result_keeps_the_schema():
     assert out.column_names == ["i", "state"]
 
 
+def _mixed_table():
+    values = [None, float("nan"), 1.0, 2.0, 3.5]
+    labels = ["x", "y", None, "z"]
+    return pa.Table.from_pylist(
+        [
+            {"a": values[(n * 7) % 5], "b": labels[(n * 3) % 4], "i": n}
+            for n in range(2_000)
+        ]
+    )
+
+
+def _batched(table, rows=130):
+    return pa.RecordBatchReader.from_batches(
+        table.schema, table.to_batches(max_chunksize=rows)
+    )
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_spilled_sort_matches_an_in_memory_sort(monkeypatch, tmp_path, descending):
+    """Ties, nulls and NaNs land exactly where one Arrow sort puts them."""
+    monkeypatch.setattr(contract, "SORT_MEMORY_BYTES", 4_000)
+    monkeypatch.setattr(contract, "MERGE_BATCH_ROWS", 300)
+    monkeypatch.setenv(contract.SPILL_DIR_ENV, str(tmp_path))
+    spilled: list[str] = []
+    spill_run = contract._spill_run
+
+    def recording(*args):
+        spilled.append(spill_run(*args))
+        return spilled[-1]
+
+    monkeypatch.setattr(contract, "_spill_run", recording)
+    table = _mixed_table()
+    order_by = (Sort("a", descending), Sort("b", not descending))
+    out = apply(_batched(table), SourceRequest(order_by=order_by), ()).read_all()
+
+    expected = table.sort_by(
+        [
+            ("a", "descending" if descending else "ascending"),
+            ("b", "ascending" if descending else "descending"),
+        ]
+    )
+    assert len(spilled) > 1
+    assert out.column("i").to_pylist() == expected.column("i").to_pylist()
+    # runs are removed once the stream is drained
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_top_k_holds_only_the_limit(monkeypatch):
+    monkeypatch.setattr(contract, "MERGE_BATCH_ROWS", 100)
+    table = _mixed_table()
+    order_by = (Sort("a", True), Sort("b"))
+    out = apply(
+        _batched(table), SourceRequest(order_by=order_by, limit=25), ()
+    ).read_all()
+    expected = table.sort_by([("a", "descending"), ("b", "ascending")])
+    assert out.column("i").to_pylist() == expected.column("i").to_pylist()[:25]
+
+
+def test_a_zero_limit_under_an_ordering_is_empty():
+    out = result(SourceRequest(order_by=(Sort("i"),), limit=0))
+    assert out.num_rows == 0
+
+
 def test_unknown_sort_column_is_a_clear_error():
     with pytest.raises(ContractError, match="Cannot sort by nope"):
         result(SourceRequest(order_by=(Sort("nope"),)))
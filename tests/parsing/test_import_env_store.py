@@ -347,3 +347,103 @@ def test_projection_publish_is_atomic_under_threads(model_dir: Path):
     )
 
     assert not errors, f"racing projection_for raised: {errors[:3]}"
+
+
+def test_store_key_is_canonical_across_spellings(model_dir: Path):
+    (model_dir / "sub").mkdir()
+    _fresh(model_dir)
+    before = len(isvc._IMPORT_ENV_STORE)
+    # the same file reached through a `..` spelling reuses the entry
+    env = Environment(working_path=str(model_dir / "sub" / ".."))
+    parse(ROOT_TEXT, env)
+    assert len(isvc._IMPORT_ENV_STORE) == before
+
+
+def test_shared_scope_builds_each_module_once_across_threads(model_dir: Path):
+    errors: list[BaseException] = []
+
+    def work() -> None:
+        try:
+            _fresh(model_dir)
+        except BaseException as e:
+            errors.append(e)
+
+    with isvc.shared_import_scope() as run:
+        workers = [threading.Thread(target=work) for _ in range(6)]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join(timeout=120)
+    assert not errors
+    report = {Path(m["path"]).name: m for m in run.report()}
+    assert set(report) == {"base.preql", "mid.preql"}
+    # single-flight: one build per module, every other script reused it
+    assert report["mid.preql"]["builds"] == 1
+    assert report["mid.preql"]["reuses"] == 5
+    assert report["base.preql"]["builds"] == 1
+    assert report["mid.preql"]["concepts"] > 0
+
+
+def test_shared_scope_pins_entries_past_the_cap(model_dir: Path, monkeypatch):
+    monkeypatch.setattr(isvc, "_IMPORT_ENV_STORE_MAX", 1)
+    with isvc.shared_import_scope():
+        _fresh(model_dir)
+        assert len(isvc._IMPORT_ENV_STORE) == 2
+        _fresh(model_dir)
+        assert len(isvc._IMPORT_ENV_STORE) == 2
+    # the cap applies again once the run ends
+    assert len(isvc._IMPORT_ENV_STORE) == 1
+
+
+def test_shared_scope_breaks_cross_thread_import_cycles(monkeypatch):
+    import time
+
+    monkeypatch.setattr(isvc, "SHARED_BUILD_WAIT_S", 20.0)
+    run = isvc.SharedImportRun()
+    first, second = ("a.preql",), ("b.preql",)
+    both_held = threading.Barrier(2, timeout=10)
+    errors: list[BaseException] = []
+
+    def build(own: tuple, other: tuple) -> None:
+        # each thread holds its own module's slot, then needs the other's
+        try:
+            with run.build_slot(own):
+                both_held.wait()
+                with run.build_slot(other):
+                    pass
+        except BaseException as e:
+            errors.append(e)
+
+    start = time.perf_counter()
+    threads = [
+        threading.Thread(target=build, args=(first, second)),
+        threading.Thread(target=build, args=(second, first)),
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=30)
+    assert not errors
+    assert time.perf_counter() - start < 10
+    # the same thread re-entering a slot it holds does not wait either
+    with run.build_slot(first), run.build_slot(first):
+        pass
+    assert not run._owners and not run._waiting
+
+
+def test_shared_slot_rejects_edits_to_its_module():
+    from trilogy.core.enums import Purpose
+    from trilogy.core.models.author import Concept
+    from trilogy.core.models.core import DataType
+
+    env = Environment()
+    run = isvc.SharedImportRun()
+    with pytest.raises(RuntimeError, match="read-only"), run.build_slot(
+        ("mod.preql",)
+    ) as claim:
+        claim.hold(env)
+        env.add_concept(
+            Concept(name="late", datatype=DataType.INTEGER, purpose=Purpose.KEY)
+        )
+    # the slot is released regardless
+    assert not run._owners
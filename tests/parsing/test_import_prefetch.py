@@ -0,0 +1,118 @@
+"""Import-closure prefetch: the root parse reads and parses the whole import
+closure concurrently, and hydration produces the same environment."""
+
+from pathlib import Path
+
+import pytest
+
+from trilogy import Environment, parse
+from trilogy.constants import Parsing
+from trilogy.parser import parse_text
+from trilogy.parsing.v2 import import_prefetch
+from trilogy.parsing.v2 import import_service as isvc
+
+pytest.importorskip("_preql_import_resolver")
+
+
+@pytest.fixture(autouse=True)
+def clean_store():
+    isvc.clear_import_env_store()
+    yield
+    isvc.clear_import_env_store()
+
+
+@pytest.fixture
+def model_dir(tmp_path: Path) -> Path:
+    (tmp_path / "dims").mkdir()
+    (tmp_path / "dims" / "store.preql").write_text(
+        "key store_id int;\nproperty store_id.store_name string;\n"
+        "datasource stores (id: store_id, name: store_name) grain (store_id) "
+        "address stores;\n"
+    )
+    (tmp_path / "dims" / "item.preql").write_text(
+        "key item_id int;\n"
+        "datasource items (id: item_id) grain (item_id) address items;\n"
+    )
+    (tmp_path / "sales.preql").write_text(
+        "import dims.store as store;\nimport dims.item as item;\n"
+        "key sale_id int;\nproperty sale_id.amount float;\n"
+    )
+    return tmp_path
+
+
+ROOT_TEXT = (
+    "import sales as sales;\nimport dims.store as store;\n"
+    "select sales.store.store_name, store.store_id;"
+)
+
+
+def _sig(env: Environment) -> tuple:
+    return sorted(env.concepts.data.keys()), sorted(env.datasources.keys())
+
+
+def test_closure_discovered_in_dependency_order(model_dir: Path):
+    order = import_prefetch.discover_import_closure(
+        [str((model_dir / "sales.preql").resolve())]
+    )
+    names = [Path(path).name for path in order]
+    assert names[-1] == "sales.preql"
+    assert set(names) == {"store.preql", "item.preql", "sales.preql"}
+
+
+def test_prefetch_loads_closure_before_hydration(model_dir: Path, monkeypatch):
+    seen: list[import_prefetch.ImportPrefetch] = []
+    original = import_prefetch.prefetch_import_closure
+
+    def spy(*args, **kwargs):
+        result = original(*args, **kwargs)
+        seen.append(result)
+        return result
+
+    monkeypatch.setattr(import_prefetch, "prefetch_import_closure", spy)
+    env = Environment(working_path=str(model_dir))
+    parse(ROOT_TEXT, env)
+    # one pass, at the root only, covering every transitive file
+    assert len(seen) == 1
+    assert {Path(path).name for path in seen[0].loaded} == {
+        "store.preql",
+        "item.preql",
+        "sales.preql",
+    }
+    assert seen[0].parsed == 3
+    assert "sales.store.store_name" in env.concepts.data
+
+
+def test_prefetch_matches_sequential_parse(model_dir: Path, monkeypatch):
+    prefetched = Environment(working_path=str(model_dir))
+    parse(ROOT_TEXT, prefetched)
+    isvc.clear_import_env_store()
+
+    calls: list[int] = []
+    monkeypatch.setattr(
+        import_prefetch,
+        "prefetch_import_closure",
+        lambda *args, **kwargs: calls.append(1),
+    )
+    sequential = Environment(working_path=str(model_dir))
+    parse_text(ROOT_TEXT, sequential, parse_config=Parsing(prefetch_imports=False))
+    assert calls == []
+    assert _sig(prefetched) == _sig(sequential)
+
+
+def test_prefetch_skips_parsing_store_backed_closures(model_dir: Path):
+    parse(ROOT_TEXT, Environment(working_path=str(model_dir)))
+    text_lookup: dict = {}
+    target = str((model_dir / "sales.preql").resolve())
+    result = import_prefetch.prefetch_import_closure(
+        [target], text_lookup, skip_parse=isvc._stored_closures([target])
+    )
+    # texts are still loaded (store validation re-hashes them) but not parsed
+    assert len(result.loaded) == 3
+    assert result.parsed == 0
+
+
+def test_prefetch_tolerates_broken_files(model_dir: Path):
+    (model_dir / "dims" / "item.preql").write_text("key item_id int\nthis is bad")
+    env = Environment(working_path=str(model_dir))
+    with pytest.raises(ImportError, match="item"):
+        parse(ROOT_TEXT, env)
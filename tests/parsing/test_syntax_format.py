@@ -0,0 +1,32 @@
+import pytest
+
+from trilogy.parsing.syntax_format import format_syntax
+
+
+def test_statements_move_to_their_own_lines():
+    text = "key x int;   key y int;\n\tselect x, y;"
+    assert format_syntax(text) == "key x int;\nkey y int;\nselect x, y;\n"
+
+
+def test_layout_whitespace_is_normalized():
+    text = "\n\nkey x int;  \n\n\n\n# note\nselect\n\tx,\n;"
+    assert format_syntax(text) == "key x int;\n\n# note\nselect\n    x,\n;\n"
+
+
+def test_formatting_is_idempotent():
+    text = "key x int;   key y int; # trailing\n\n\n\nselect x;"
+    once = format_syntax(text)
+    assert format_syntax(once) == once
+
+
+def test_multi_line_tokens_are_left_alone():
+    raw = "'''\nselect 1 as x   \n\n\n\n\tfrom dual\n'''"
+    text = f"key x int;\ndatasource d (x: x) grain (x) query {raw};\n"
+    formatted = format_syntax(text)
+    assert raw in formatted
+    assert formatted == text
+
+
+def test_syntax_errors_raise():
+    with pytest.raises(Exception, match="Syntax"):
+        format_syntax("select col2 col3 col4")
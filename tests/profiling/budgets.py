@@ -0,0 +1,207 @@
+"""Planner call-count budgets. Run as a module:
+
+    python -m tests.profiling.budgets [--corpus NAME] [--update]
+
+Compiles (parse + plan + render, no execution) each modeling corpus and
+counts calls to the planner's hot functions under cProfile, plus the number
+of ``Build*`` model objects constructed (``build_objects``). Call counts are
+exact for a given tree, unlike seconds, so they are what gets compared: each
+corpus is checked against ``budgets.json`` and any count above its budget by
+more than ``TOLERANCE`` is a regression. Set iteration order follows the hash
+seed, which can steer search down a slightly different path, hence the small
+tolerance rather than exact equality.
+
+``--update`` rewrites the budgets from the current tree; commit the result
+alongside a change that intentionally moves them.
+
+The pytest check (``test_budgets.py``) runs in CI for the small corpora.
+Corpora in ``SLOW_CORPORA`` take minutes under cProfile, so their cases are
+marked ``planner_budget`` and, like ``adventureworks_execution``, left out of
+the CI run. Run them with ``pytest tests/profiling -m planner_budget`` before
+merging planner changes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import json
+import pstats
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from tests.profiling.build_objects import count_constructions
+from trilogy import Dialects
+from trilogy.core.models.build import Factory
+from trilogy.core.models.environment import Environment
+from trilogy.core.optimization import optimize_ctes
+from trilogy.core.processing.v4_helper.network_search import search_sources
+from trilogy.dialect.base import BaseDialect
+
+HERE = Path(__file__).parent
+REPO_ROOT = HERE.parent.parent
+BUDGETS_PATH = HERE / "budgets.json"
+MODELING = REPO_ROOT / "tests" / "modeling"
+
+# relative headroom over the committed count before a budget fails
+TOLERANCE = 0.02
+
+CORPORA: dict[str, Path] = {
+    "tpc_ds": MODELING / "tpc_ds_duckdb",
+    "tpc_h": MODELING / "tpc_h",
+    "thelook": MODELING / "thelook_duckdb",
+}
+
+# corpora too slow to compile under cProfile on every CI run
+SLOW_CORPORA = frozenset({"tpc_ds"})
+
+HOT_FUNCTIONS: dict[str, Callable[..., Any]] = {
+    "search_sources": search_sources,
+    "Factory.build": Factory.build,
+    "optimize_ctes": optimize_ctes,
+    "render_cte": BaseDialect.render_cte,
+}
+
+
+@dataclass
+class Regression:
+    corpus: str
+    metric: str
+    budget: int
+    measured: int
+
+    def __str__(self) -> str:
+        change = (self.measured - self.budget) / self.budget if self.budget else 1.0
+        return (
+            f"{self.corpus}: {self.metric} {self.measured:,} exceeds budget "
+            f"{self.budget:,} (+{change:.1%})"
+        )
+
+
+def corpus_files(corpus: str) -> list[Path]:
+    return sorted(CORPORA[corpus].glob("query*.preql"))
+
+
+def _compile(files: list[Path], working_path: Path) -> None:
+    for path in files:
+        executor = Dialects.DUCK_DB.default_executor(
+            environment=Environment(working_path=working_path)
+        )
+        executor.generate_sql(path.read_text())
+        executor.close()
+
+
+def _pstats_key(function: Callable[..., Any]) -> tuple[str, int, str]:
+    code = function.__code__
+    return (code.co_filename, code.co_firstlineno, code.co_name)
+
+
+def measure(corpus: str) -> dict[str, Any]:
+    """Call and construction counts for compiling every query of ``corpus``."""
+    files = corpus_files(corpus)
+    # one throwaway compile so import-time and lazily-built module state is
+    # not charged to the measured pass
+    _compile(files[:1], CORPORA[corpus])
+    profiler = cProfile.Profile()
+    with count_constructions() as constructed:
+        profiler.enable()
+        try:
+            _compile(files, CORPORA[corpus])
+        finally:
+            profiler.disable()
+    stats: dict[tuple[str, int, str], tuple[Any, ...]] = pstats.Stats(
+        profiler
+    ).stats  # type: ignore[attr-defined]
+    calls = {}
+    for label, function in HOT_FUNCTIONS.items():
+        entry = stats.get(_pstats_key(function))
+        # (primitive calls, total calls, ...); recursion counts every entry
+        calls[label] = entry[1] if entry else 0
+    return {
+        "queries": len(files),
+        "calls": calls,
+        "constructed": sum(constructed.values()),
+    }
+
+
+def compare(
+    corpus: str,
+    measured: dict[str, Any],
+    budget: dict[str, Any],
+    tolerance: float = TOLERANCE,
+) -> list[Regression]:
+    limits = {f"calls.{k}": v for k, v in budget.get("calls", {}).items()}
+    limits["constructed"] = budget.get("constructed", 0)
+    actual = {f"calls.{k}": v for k, v in measured["calls"].items()}
+    actual["constructed"] = measured["constructed"]
+    return [
+        Regression(corpus, metric, limit, actual.get(metric, 0))
+        for metric, limit in limits.items()
+        if actual.get(metric, 0) > limit * (1 + tolerance)
+    ]
+
+
+def load_budgets(path: Path = BUDGETS_PATH) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def write_budgets(budgets: dict[str, Any], path: Path = BUDGETS_PATH) -> None:
+    path.write_text(json.dumps(budgets, indent=2, sort_keys=True) + "\n")
+
+
+def _print_record(corpus: str, record: dict[str, Any], budget: dict | None) -> None:
+    print(f"{corpus}: {record['queries']} queries")
+    rows = [(f"calls.{k}", v) for k, v in record["calls"].items()]
+    rows.append(("constructed", record["constructed"]))
+    limits = {f"calls.{k}": v for k, v in (budget or {}).get("calls", {}).items()}
+    if budget:
+        limits["constructed"] = budget.get("constructed", 0)
+    for metric, value in rows:
+        limit = limits.get(metric)
+        delta = f"{(value - limit) / limit:+.1%}" if limit else "new"
+        print(f"  {metric:<28} {value:>12,}  {delta}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--corpus",
+        choices=sorted(CORPORA),
+        action="append",
+        help="measure only this corpus (repeatable)",
+    )
+    parser.add_argument(
+        "--update", action="store_true", help="rewrite budgets.json from this tree"
+    )
+    parser.add_argument("--json", action="store_true", help="print the raw records")
+    args = parser.parse_args(argv)
+    budgets = load_budgets()
+    records = {corpus: measure(corpus) for corpus in args.corpus or sorted(CORPORA)}
+    if args.json:
+        print(json.dumps(records))
+    else:
+        for corpus, record in records.items():
+            _print_record(corpus, record, budgets.get(corpus))
+    if args.update:
+        budgets.update(records)
+        write_budgets(budgets)
+        print(f"Wrote {BUDGETS_PATH.relative_to(REPO_ROOT)}")
+        return 0
+    regressions = [
+        regression
+        for corpus, record in records.items()
+        if corpus in budgets
+        for regression in compare(corpus, record, budgets[corpus])
+    ]
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Build-layer object/allocation benchmark. Run as a module:
+
+    python -m tests.profiling.build_objects [--queries N]
+
+Compiles (parse + plan + render, no execution) the TPC-DS query corpus and
+reports how many objects of each ``Build*`` model class were constructed,
+alongside tracemalloc's peak and the total number of allocated blocks. The
+counts are deterministic for a given tree, so they are the figure to compare
+across commits; timings are reported for orientation only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from trilogy import Dialects
+from trilogy.core.models import build as build_models
+from trilogy.core.models.environment import Environment
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+TPCDS = REPO_ROOT / "tests" / "modeling" / "tpc_ds_duckdb"
+
+
+def _build_classes() -> list[type]:
+    return [
+        value
+        for name, value in vars(build_models).items()
+        if name.startswith("Build")
+        and isinstance(value, type)
+        and value.__module__ == build_models.__name__
+    ]
+
+
+@contextmanager
+def count_constructions() -> Iterator[Counter[str]]:
+    """Count exact-type constructions of every Build model class in scope."""
+    counts: Counter[str] = Counter()
+    originals: dict[type, Any] = {}
+    for cls in _build_classes():
+        original = cls.__init__
+        originals[cls] = original
+
+        def counted(self, *args, __original=original, __cls=cls, **kwargs):
+            __original(self, *args, **kwargs)
+            if type(self) is __cls:
+                counts[__cls.__name__] += 1
+
+        cls.__init__ = counted  # type: ignore[misc]
+    try:
+        yield counts
+    finally:
+        for cls, original in originals.items():
+            cls.__init__ = original  # type: ignore[misc]
+
+
+def compile_corpus(limit: int | None) -> int:
+    files = sorted(TPCDS.glob("query*.preql"))[:limit]
+    for path in files:
+        executor = Dialects.DUCK_DB.default_executor(
+            environment=Environment(working_path=TPCDS)
+        )
+        executor.generate_sql(path.read_text())
+    return len(files)
+
+
+def run(limit: int | None) -> dict[str, Any]:
+    # one throwaway compile so import-time and lazily-built module state is
+    # not charged to the measured pass
+    compile_corpus(1)
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with count_constructions() as counts:
+        compiled = compile_corpus(limit)
+    elapsed = time.perf_counter() - start
+    snapshot = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "queries": compiled,
+        "seconds": round(elapsed, 3),
+        "peak_kib": peak // 1024,
+        "live_blocks": sum(stat.count for stat in snapshot.statistics("filename")),
+        "constructed": sum(counts.values()),
+        "by_class": dict(counts.most_common()),
+    }
+
+
+def _print_summary(record: dict[str, Any]) -> None:
+    print(
+        f"queries={record['queries']} constructed={record['constructed']} "
+        f"peak={record['peak_kib']}KiB seconds={record['seconds']}"
+    )
+    for name, count in record["by_class"].items():
+        print(f"  {name:<36} {count:>8}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--queries", type=int, default=None, help="compile only the first N"
+    )
+    parser.add_argument("--json", action="store_true", help="print the raw record")
+    args = parser.parse_args(argv)
+    record = run(args.queries)
+    if args.json:
+        print(json.dumps(record))
+    else:
+        _print_summary(record)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+import pytest
+
+from tests.profiling.budgets import (
+    CORPORA,
+    SLOW_CORPORA,
+    compare,
+    load_budgets,
+    measure,
+)
+
+
+@pytest.mark.parametrize(
+    "corpus",
+    [
+        pytest.param(
+            name,
+            marks=[pytest.mark.planner_budget] if name in SLOW_CORPORA else [],
+        )
+        for name in sorted(CORPORA)
+    ],
+)
+def test_planner_call_counts_within_budget(corpus: str):
+    budget = load_budgets().get(corpus)
+    assert (
+        budget is not None
+    ), f"no budget for {corpus}; run python -m tests.profiling.budgets --update"
+    measured = measure(corpus)
+    assert (
+        measured["queries"] == budget["queries"]
+    ), "corpus changed; run python -m tests.profiling.budgets --update"
+    regressions = compare(corpus, measured, budget)
+    assert not regressions, "\n".join(str(r) for r in regressions)
+
+
+def test_compare_flags_only_counts_past_tolerance():
+    budget = {"calls": {"search_sources": 100, "render_cte": 50}, "constructed": 1000}
+    measured = {
+        "calls": {"search_sources": 101, "render_cte": 60},
+        "constructed": 900,
+    }
+    regressions = compare("tpc_h", measured, budget, tolerance=0.02)
+    assert [(r.metric, r.measured) for r in regressions] == [("calls.render_cte", 60)]
+    assert "+20.0%" in str(regressions[0])
@@ -1,5 +1,6 @@
 import json
 import sys
+import threading
 import types
 from dataclasses import replace
 from pathlib import Path
@@ -18,7 +19,7 @@ from trilogy.rendering.theme import (
     THEMES,
     get_theme,
 )
-from trilogy.report import render_report
+from trilogy.report import render_report, render_reports
 from trilogy.report.backends import available_formats, get_backend
 from trilogy.report.backends.html import (
     _render_element,
@@ -447,3 +448,176 @@ def test_png_snapshot_chromium_launch_failure(tmp_path, monkeypatch):
     monkeypatch.setitem(sys.modules, "playwright.sync_api", sync_api)
     with pytest.raises(RuntimeError, match="Could not launch chromium"):
         _snapshot("<html></html>", tmp_path / "report.png")
+
+
+def _fake_playwright(monkeypatch) -> MagicMock:
+    package = types.ModuleType("playwright")
+    sync_api = types.ModuleType("playwright.sync_api")
+    package.sync_api = sync_api  # type: ignore[attr-defined]
+    cm = MagicMock()
+    sync_api.sync_playwright = MagicMock(return_value=cm)  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "playwright", package)
+    monkeypatch.setitem(sys.modules, "playwright.sync_api", sync_api)
+    return cm
+
+
+def test_browser_pool_reuses_browser(tmp_path, monkeypatch):
+    from trilogy.report.backends.png import BrowserPool
+
+    cm = _fake_playwright(monkeypatch)
+    with BrowserPool(1) as pool:
+        futures = [
+            pool.submit("<html></html>", tmp_path / f"{i}.png") for i in range(3)
+        ]
+        for future in futures:
+            future.result()
+    launch = cm.__enter__.return_value.chromium.launch
+    assert launch.call_count == 1
+    browser = launch.return_value
+    assert browser.new_page.call_count == 3
+    browser.close.assert_called_once()
+    with pytest.raises(RuntimeError, match="closed"):
+        pool.submit("<html></html>", tmp_path / "late.png")
+
+
+def test_browser_pool_launch_failure_fails_jobs(tmp_path, monkeypatch):
+    from trilogy.report.backends.png import BrowserPool
+
+    cm = _fake_playwright(monkeypatch)
+    cm.__enter__.return_value.chromium.launch.side_effect = Exception("no browser")
+    with BrowserPool(2) as pool:
+        future = pool.submit("<html></html>", tmp_path / "a.png")
+        with pytest.raises(RuntimeError, match="Could not launch chromium"):
+            future.result(timeout=10)
+
+
+def test_browser_pool_failed_worker_leaves_queue_to_the_others(tmp_path, monkeypatch):
+    from trilogy.report.backends.png import BrowserPool
+
+    cm = _fake_playwright(monkeypatch)
+    launch = cm.__enter__.return_value.chromium.launch
+    browser = MagicMock()
+    # both workers are launching before the first of them fails
+    both = threading.Barrier(2, timeout=10)
+    calls: list[int] = []
+    lock = threading.Lock()
+
+    def launching(**kwargs):
+        both.wait()
+        with lock:
+            calls.append(1)
+            first = len(calls) == 1
+        if first:
+            raise OSError("no browser")
+        return browser
+
+    launch.side_effect = launching
+    with BrowserPool(2) as pool:
+        futures = [
+            pool.submit("<html></html>", tmp_path / f"{i}.png") for i in range(4)
+        ]
+        for future in futures:
+            future.result(timeout=10)
+    assert browser.new_page.call_count == 4
+
+
+def test_render_reports_batch_shares_browsers(tmp_path, monkeypatch):
+    pytest.importorskip("markdown")
+    cm = _fake_playwright(monkeypatch)
+    sources = []
+    for name in ("one", "two", "three"):
+        source = tmp_path / f"{name}.md"
+        source.write_text(f"# {name}\n", encoding="utf-8")
+        sources.append(source)
+    out = tmp_path / "out"
+    out.mkdir()
+    targets = render_reports(sources, output_dir=out, browsers=2)
+    assert targets == [out / "one.png", out / "two.png", out / "three.png"]
+    launch = cm.__enter__.return_value.chromium.launch
+    assert 1 <= launch.call_count <= 2
+    page = launch.return_value.new_page.return_value
+    shots = {call.kwargs["path"] for call in page.screenshot.call_args_list}
+    assert shots == {str(target) for target in targets}
+
+
+def test_render_reports_finishes_batch_before_raising(tmp_path):
+    pytest.importorskip("markdown")
+    good = tmp_path / "good.md"
+    good.write_text("# Good\n", encoding="utf-8")
+    with pytest.raises(FileNotFoundError):
+        render_reports([tmp_path / "missing.md", good], output_format="html")
+    assert (tmp_path / "good.html").exists()
+
+
+def test_render_reports_closes_each_report_executor(tmp_path):
+    pytest.importorskip("markdown")
+    from trilogy import Dialects
+
+    built = []
+
+    def factory(source):
+        executor = Dialects.DUCK_DB.default_executor(working_path=source.parent)
+        built.append(executor)
+        return executor
+
+    good = tmp_path / "good.md"
+    good.write_text("# Good\n\n" + _NUMS_SETUP, encoding="utf-8")
+    with pytest.raises(FileNotFoundError):
+        render_reports(
+            [good, tmp_path / "missing.md"],
+            output_format="html",
+            executor_factory=factory,
+        )
+    assert len(built) == 2
+    assert not any(executor.connected for executor in built)
+
+
+def test_run_document_closes_the_executor_it_builds(monkeypatch):
+    fake_exec = MagicMock()
+    fake_dialects = MagicMock()
+    fake_dialects.DUCK_DB.default_executor.return_value = fake_exec
+    monkeypatch.setattr("trilogy.report.runner.Dialects", fake_dialects)
+    run_document([], working_path=Path("."))
+    fake_exec.close.assert_called_once()
+    passed = MagicMock()
+    run_document([], working_path=Path("."), executor=passed)
+    passed.close.assert_not_called()
+
+
+def test_chart_image_cache_keys_on_spec():
+    alt = pytest.importorskip("altair")
+    pd = pytest.importorskip("pandas")
+    from trilogy.rendering.image_cache import ChartImageCache
+
+    cache = ChartImageCache(max_entries=1)
+    frame = pd.DataFrame({"x": [1, 2], "y": [3, 4]})
+    chart = alt.Chart(frame).mark_line().encode(x="x", y="y")
+    first = cache.render(chart, "json")
+    assert cache.render(chart, "json") is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.render(chart.mark_bar(), "json")
+    cache.render(chart, "json")
+    # evicted by the bar chart, so converted again
+    assert cache.misses == 3
+
+
+def test_chart_image_cache_keys_on_data_without_serializing_it(monkeypatch):
+    alt = pytest.importorskip("altair")
+    pd = pytest.importorskip("pandas")
+    from trilogy.rendering.image_cache import ChartImageCache
+
+    def chart(frame):
+        return alt.layer(
+            alt.Chart(frame).mark_line().encode(x="x", y="y"),
+            alt.Chart(frame).mark_point().encode(x="x", y="y"),
+        )
+
+    frame = pd.DataFrame({"x": [1, 2], "y": [3, 4]})
+    key = ChartImageCache.key(chart(frame), "svg", {})
+    # the data is fingerprinted, not written out as JSON
+    monkeypatch.setattr(
+        pd.DataFrame, "to_json", lambda *a, **k: pytest.fail("serialized data")
+    )
+    assert ChartImageCache.key(chart(frame.copy()), "svg", {}) == key
+    assert ChartImageCache.key(chart(frame.assign(y=[3, 5])), "svg", {}) != key
+    assert ChartImageCache.key(chart(frame.astype({"y": "float64"})), "svg", {}) != key
@@ -6,10 +6,8 @@ from trilogy.execution.state.snapshot import (
     StateSnapshot,
     StateSnapshotSummary,
 )
-from trilogy.scripts.serve_helpers.state_cache import (
-    StateSnapshotCache,
-    fingerprint_directory,
-)
+from trilogy.scripts.serve_helpers.file_index import ModelFileIndex
+from trilogy.scripts.serve_helpers.state_cache import StateSnapshotCache
 
 
 @pytest.fixture
@@ -18,6 +16,10 @@ def project(tmp_path: Path) -> Path:
     return tmp_path
 
 
+def _fingerprint(directory: Path) -> str:
+    return ModelFileIndex(directory).fingerprint()
+
+
 def _snapshot(target: str = ".", stale: int = 0) -> StateSnapshot:
     return StateSnapshot(
         snapshot_ts="2026-07-31T00:00:00+00:00",
@@ -29,7 +31,7 @@ def _snapshot(target: str = ".", stale: int = 0) -> StateSnapshot:
 
 def test_round_trip(project):
     cache = StateSnapshotCache(project)
-    fp = fingerprint_directory(project)
+    fp = _fingerprint(project)
     cache.put(".", _snapshot(stale=3), fp, "2026-07-31T00:00:00+00:00")
 
     hit = cache.get(".", fp)
@@ -39,12 +41,12 @@ def test_round_trip(project):
 
 
 def test_miss_when_absent(project):
-    assert StateSnapshotCache(project).get(".", fingerprint_directory(project)) is None
+    assert StateSnapshotCache(project).get(".", _fingerprint(project)) is None
 
 
 def test_targets_do_not_collide(project):
     cache = StateSnapshotCache(project)
-    fp = fingerprint_directory(project)
+    fp = _fingerprint(project)
     cache.put(".", _snapshot(".", stale=1), fp, "t")
     cache.put("model.preql", _snapshot("model.preql", stale=2), fp, "t")
 
@@ -54,30 +56,30 @@ def test_targets_do_not_collide(project):
 
 def test_fingerprint_mismatch_is_a_miss(project):
     cache = StateSnapshotCache(project)
-    cache.put(".", _snapshot(), fingerprint_directory(project), "t")
+    cache.put(".", _snapshot(), _fingerprint(project), "t")
     assert cache.get(".", "some-other-fingerprint") is None
 
 
 def test_fingerprint_tracks_edits_and_additions(project):
-    before = fingerprint_directory(project)
+    before = _fingerprint(project)
 
     (project / "model.preql").write_text("key i int; key j int;", encoding="utf-8")
-    after_edit = fingerprint_directory(project)
+    after_edit = _fingerprint(project)
     assert after_edit != before
 
     (project / "second.preql").write_text("key k int;", encoding="utf-8")
-    assert fingerprint_directory(project) != after_edit
+    assert _fingerprint(project) != after_edit
 
 
 def test_fingerprint_ignores_non_model_files(project):
-    before = fingerprint_directory(project)
+    before = _fingerprint(project)
     (project / "notes.txt").write_text("not a model", encoding="utf-8")
-    assert fingerprint_directory(project) == before
+    assert _fingerprint(project) == before
 
 
 def test_clear_drops_every_entry(project):
     cache = StateSnapshotCache(project)
-    fp = fingerprint_directory(project)
+    fp = _fingerprint(project)
     cache.put(".", _snapshot(), fp, "t")
     cache.put("model.preql", _snapshot("model.preql"), fp, "t")
 
@@ -93,7 +95,7 @@ def test_clear_without_a_cache_directory_is_a_noop(project):
 
 def test_corrupt_entry_reads_as_a_miss(project):
     cache = StateSnapshotCache(project)
-    fp = fingerprint_directory(project)
+    fp = _fingerprint(project)
     cache.put(".", _snapshot(), fp, "t")
 
     snapshot_path, _ = cache._paths(".")
@@ -104,7 +106,7 @@ def test_corrupt_entry_reads_as_a_miss(project):
 
 def test_state_input_path_only_for_a_live_entry(project):
     cache = StateSnapshotCache(project)
-    fp = fingerprint_directory(project)
+    fp = _fingerprint(project)
     assert cache.state_input_path(".", fp) is None
 
     cache.put(".", _snapshot(), fp, "t")
@@ -117,7 +119,7 @@ def test_state_input_path_only_for_a_live_entry(project):
 
 def test_adopt_takes_a_job_snapshot_and_renormalizes_target(project, tmp_path):
     cache = StateSnapshotCache(project)
-    fp = fingerprint_directory(project)
+    fp = _fingerprint(project)
     written = tmp_path / "job.state.json"
     # A subprocess records the absolute path it was invoked with.
     written.write_text(
@@ -135,6 +137,6 @@ def test_adopt_takes_a_job_snapshot_and_renormalizes_target(project, tmp_path):
 
 def test_adopt_of_an_unreadable_file_reports_failure(project, tmp_path):
     cache = StateSnapshotCache(project)
-    fp = fingerprint_directory(project)
+    fp = _fingerprint(project)
     assert cache.adopt(".", tmp_path / "missing.json", fp) is False
     assert cache.get(".", fp) is None
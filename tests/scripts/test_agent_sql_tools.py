@@ -140,10 +140,26 @@ def test_execute_sql_truncates_output(sql_engine):
     assert "truncated" in out
 
 
+def test_execute_sql_previews_in_batches(sql_engine, monkeypatch):
+    monkeypatch.setattr(sql_mod, "_MAX_RESULT_ROWS", 3)
+    monkeypatch.setattr(sql_mod, "_FETCH_BATCH_ROWS", 2)
+    out = _execute_sql(AgentState(), "select range as n from range(9)")
+    assert '"row_count": 9' in out
+    assert '"displayed": 3' in out
+    assert "<redacted 6 rows>" in out
+    # head and tail straddle fetch batches; stats still cover every row
+    assert out.index("<redacted 6 rows>") < out.index("8")
+    assert '"min": 0' in out and '"max": 8' in out
+
+
 def test_execute_sql_handles_resultless_keys(monkeypatch):
     class _Result:
-        def fetchall(self):
-            return [(1,)]
+        def __init__(self):
+            self.rows = [(1,)]
+
+        def fetchmany(self, size):
+            rows, self.rows = self.rows[:size], self.rows[size:]
+            return rows
 
         def keys(self):
             raise RuntimeError("no keys here")
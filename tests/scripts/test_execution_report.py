@@ -239,6 +239,26 @@ def test_run_directory_per_file_and_statement_records(runner, tmp_path):
     assert summary["failed"] == 0
 
 
+def test_run_directory_reports_shared_imports(runner, tmp_path):
+    _run_workspace(tmp_path)
+    (tmp_path / "c.preql").write_text(
+        "import a;\n\nselect max(uid) -> top_uid;\n", encoding="utf-8"
+    )
+    report = tmp_path / "report.jsonl"
+    result = runner.invoke(
+        cli, ["run", str(tmp_path), "duckdb", "--report-file", str(report)]
+    )
+    assert result.exit_code == 0, result.output
+
+    shared = records_of(read_report(report), "shared_imports")
+    assert len(shared) == 1
+    modules = {Path(m["path"]).name: m for m in shared[0]["modules"]}
+    # b and c both import a; the module is built once and reused
+    assert modules["a.preql"]["builds"] == 1
+    assert modules["a.preql"]["reuses"] >= 1
+    assert modules["a.preql"]["datasources"] == 1
+
+
 def test_failure_and_skip(runner, tmp_path):
     _failing_workspace(tmp_path)
     report = tmp_path / "report.jsonl"
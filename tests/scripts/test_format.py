@@ -88,3 +88,86 @@ def test_format_directory_error(runner):
         assert "1/2 files" in result.output
         assert "Failed to format" in result.output
         assert "Syntax" in result.output  # Error message should mention syntax
+
+
+def test_format_check_does_not_write(runner, tmp_path):
+    (tmp_path / "clean.preql").write_text("select\n    1 as one,\n;\n")
+    (tmp_path / "dirty.preql").write_text("select 2 as two;")
+
+    result = runner.invoke(cli, ["fmt", "--check", str(tmp_path)])
+
+    assert result.exit_code == 1
+    assert "Would reformat" in result.output
+    assert "dirty.preql" in result.output
+    assert "clean.preql" not in result.output.replace("Checked", "")
+    assert (tmp_path / "dirty.preql").read_text() == "select 2 as two;"
+
+    runner.invoke(cli, ["fmt", str(tmp_path)])
+    result = runner.invoke(cli, ["fmt", "--check", str(tmp_path)])
+    assert result.exit_code == 0
+    assert "0 would be reformatted" in result.output
+
+
+def test_format_syntax_only(runner, tmp_path):
+    path = tmp_path / "script.preql"
+    path.write_text("key x int;   key y int;\n\n\n\nselect x,   y;")
+
+    result = runner.invoke(cli, ["fmt", "--syntax-only", str(path)])
+
+    assert result.exit_code == 0
+    assert "Formatted 3 statements" in result.output
+    # statement bodies are kept as written
+    assert path.read_text() == "key x int;\nkey y int;\n\nselect x,   y;\n"
+
+
+def test_format_cache_skips_unchanged_files(runner, tmp_path, monkeypatch):
+    from trilogy.scripts import fmt
+
+    (tmp_path / "base.preql").write_text("key x int;\n")
+    (tmp_path / "top.preql").write_text("import base;\n\nselect x;\n")
+    rendered: list[str] = []
+    render = fmt.render_file
+
+    def counting_render(file_path):
+        rendered.append(Path(file_path).name)
+        return render(file_path)
+
+    monkeypatch.setattr(fmt, "render_file", counting_render)
+    # counted in-process only
+    monkeypatch.setattr(fmt, "ProcessPoolExecutor", _InlineExecutor)
+
+    assert runner.invoke(cli, ["fmt", str(tmp_path)]).exit_code == 0
+    assert (tmp_path / fmt.CACHE_SUBPATH).exists()
+    rendered.clear()
+
+    result = runner.invoke(cli, ["fmt", "--check", str(tmp_path)])
+    assert result.exit_code == 0
+    assert rendered == []
+    assert "2 unchanged" in result.output
+
+    # an edited import invalidates the files that depend on it
+    (tmp_path / "base.preql").write_text("key x int;\nkey y int;\n")
+    runner.invoke(cli, ["fmt", "--check", str(tmp_path)])
+    assert sorted(rendered) == ["base.preql", "top.preql"]
+
+    rendered.clear()
+    runner.invoke(cli, ["fmt", "--check", "--no-cache", str(tmp_path)])
+    assert sorted(rendered) == ["base.preql", "top.preql"]
+
+
+class _InlineExecutor:
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, fn, *args):
+        from concurrent.futures import Future
+
+        future: Future = Future()
+        future.set_result(fn(*args))
+        return future
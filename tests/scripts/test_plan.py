@@ -154,6 +154,73 @@ class TestPlanSingleFile:
         assert len(data["edges"]) == 0
 
 
+class TestPlanCost:
+    """Tests for plan --cost dry-run estimates."""
+
+    @pytest.fixture
+    def cost_dir(self, tmp_path):
+        (tmp_path / "base.preql").write_text(
+            "key order_id int;\nproperty order_id.amount float;\n"
+            "datasource orders (order_id, amount) grain (order_id) address orders;\n"
+        )
+        (tmp_path / "report.preql").write_text(
+            "import base;\nselect sum(amount) -> total;\n"
+            "select order_id, amount where amount > 100;\n"
+        )
+        return tmp_path
+
+    def test_plan_cost_json(self, runner, cost_dir, monkeypatch):
+        """Every compiled statement is estimated, none is run."""
+        from trilogy.execution import cost
+
+        estimated: list[str] = []
+
+        def fake_resolver(connection, dialect):
+            def estimate(sql, params):
+                estimated.append(sql)
+                return 1_000
+
+            return estimate
+
+        monkeypatch.setattr(cost, "resolve_cost_estimator", fake_resolver)
+        result = runner.invoke(
+            cli,
+            ["plan", str(cost_dir), "--json", "--cost", "--dialect", "duckdb"],
+        )
+        assert result.exit_code == 0, result.output
+
+        data = json.loads(result.output)
+        scripts = {s["script"]: s for s in data["cost"]["scripts"]}
+        assert scripts["base.preql"]["statements"] == []
+        statements = scripts["report.preql"]["statements"]
+        assert len(statements) == 2 == len(estimated)
+        assert scripts["report.preql"]["estimated_bytes"] == 2_000
+        assert data["cost"]["estimated_bytes"] == 2_000
+
+    def test_plan_cost_skips_startup_scripts(self, runner, cost_dir, monkeypatch):
+        """A dry run executes none of the configured startup scripts."""
+        from trilogy.execution import cost
+
+        (cost_dir / "setup.sql").write_text("SELECT error('startup ran');\n")
+        (cost_dir / "trilogy.toml").write_text('[setup]\nsql = ["setup.sql"]\n')
+        monkeypatch.setattr(
+            cost, "resolve_cost_estimator", lambda connection, dialect: lambda *_: 1
+        )
+        result = runner.invoke(
+            cli,
+            ["plan", str(cost_dir), "--json", "--cost", "--dialect", "duckdb"],
+        )
+        assert result.exit_code == 0, result.output
+        assert "startup ran" not in result.output
+
+    def test_plan_cost_needs_an_estimating_dialect(self, runner, cost_dir):
+        result = runner.invoke(
+            cli, ["plan", str(cost_dir), "--cost", "--dialect", "duckdb"]
+        )
+        assert result.exit_code != 0
+        assert "cannot estimate" in result.output
+
+
 class TestPlanErrors:
     """Tests for error handling in plan command."""
 
@@ -38,3 +38,19 @@ def test_render_cli_surfaces_error(tmp_path, monkeypatch):
     result = CliRunner().invoke(cli, ["render", str(src), "--to", "html"])
     assert result.exit_code == 1
     assert "kaboom" in result.output
+
+
+def test_render_cli_batch(tmp_path):
+    pytest.importorskip("markdown")
+    sources = []
+    for name in ("first", "second"):
+        src = tmp_path / f"{name}.md"
+        src.write_text(f"# {name}\n", encoding="utf-8")
+        sources.append(str(src))
+    out = tmp_path / "out"
+    result = CliRunner().invoke(
+        cli, ["render", *sources, "--to", "html", "-o", str(out)]
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output.count("Rendered report") == 2
+    assert (out / "first.html").exists() and (out / "second.html").exists()
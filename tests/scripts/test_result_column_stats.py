@@ -3,7 +3,12 @@ from decimal import Decimal
 
 import trilogy.scripts.display_core as _core
 from trilogy.core.scope_diagnostics import DerivedValueScope
-from trilogy.scripts.display_execution import _column_stats, _emit_results_json
+from trilogy.scripts.display_execution import (
+    _DISTINCT_CAP,
+    _column_stats,
+    _ColumnStats,
+    _emit_results_json,
+)
 from trilogy.scripts.display_models import ResultSet
 
 
@@ -172,3 +177,14 @@ def test_scope_warnings_disabled_by_env(capsys, monkeypatch):
     )
     payload = _emit_capture(_scope_result(scope), cap=10, capsys=capsys)
     assert "warnings" not in payload
+
+
+def test_streamed_distinct_count_is_capped():
+    stats = _ColumnStats(["id", "flag"])
+    for start in range(0, _DISTINCT_CAP * 2, 1000):
+        stats.update([(i, i % 2) for i in range(start, start + 1000)])
+    by_col = {s["column"]: s for s in stats.result()}
+    assert by_col["id"]["distinct"] == f">{_DISTINCT_CAP}"
+    assert by_col["id"]["max"] == _DISTINCT_CAP * 2 - 1
+    assert by_col["flag"]["distinct"] == 2
+    assert not stats._distinct[0]
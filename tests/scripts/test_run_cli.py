@@ -256,3 +256,29 @@ def test_run_rejects_a_non_positive_timeout(tmp_path: Path):
     result = CliRunner().invoke(cli, ["run", str(f), "duck_db", "--timeout", "0"])
     assert result.exit_code != 0
     assert "0" in (result.output or "")
+
+
+def test_run_profile_writes_trace_and_summary(tmp_path: Path):
+    import json
+
+    f = tmp_path / "q.preql"
+    f.write_text(
+        "key id int;\nproperty id.v float;\n"
+        "datasource t (id: id, v: v) grain (id) "
+        "query '''select range as id, range * 1.5 as v from range(100)''';\n"
+        "select id, v order by id asc limit 5;\nselect sum(v) -> total;\n",
+        encoding="utf-8",
+    )
+    trace = tmp_path / "profile.json"
+    result = CliRunner().invoke(
+        cli, ["run", str(f), "duck_db", "--profile", str(trace)]
+    )
+    assert result.exit_code == 0, (result.output, result.exception)
+    assert "Profile" in result.output
+    data = json.loads(trace.read_text(encoding="utf-8"))
+    names = {event["name"] for event in data["traceEvents"] if event["ph"] == "X"}
+    assert {"parse", "build", "discovery", "optimize", "render", "execute"} <= names
+    selects = [s for s in data["statements"] if s["label"] == "SelectStatement"]
+    assert [s["rows"] for s in selects] == [5, 1]
+    assert all(s["script"] == str(f) for s in selects)
+    assert set(selects[0]["phases"]) >= {"build", "discovery", "execute"}
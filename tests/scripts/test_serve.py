@@ -1664,6 +1664,89 @@ def test_state_cache_is_busted_by_a_model_edit(tmp_path):
     )
 
 
+def test_state_cache_is_scoped_to_the_target_imports(tmp_path):
+    """Only files the target imports can invalidate its snapshot."""
+    (tmp_path / "base.preql").write_text(SIMPLE_PREQL)
+    (tmp_path / "test.preql").write_text("import base;\n")
+    unrelated = tmp_path / "other.preql"
+    unrelated.write_text("key other int;\n")
+    client = _app_no_token(tmp_path, engine="duck_db")
+
+    def cached() -> str:
+        return client.get("/state", params={"target": "test.preql"}).headers[
+            "X-Trilogy-Cached"
+        ]
+
+    client.get("/state", params={"target": "test.preql"})
+    unrelated.write_text("key other int;\nproperty other.name string;\n")
+    assert cached() == "true"
+
+    (tmp_path / "base.preql").write_text(SIMPLE_PREQL + "\nproperty id.extra int;\n")
+    assert cached() == "false"
+
+
+@pytest.fixture
+def counted_probes(monkeypatch):
+    """Replace the state probe with a slow fake that counts its calls."""
+    import trilogy.scripts.serve_helpers as helpers
+
+    calls: list[Path] = []
+    real = helpers.compute_state_snapshot_sync
+
+    def slow_probe(target_path, *args):
+        calls.append(target_path)
+        time.sleep(0.3)
+        return real(target_path, *args)
+
+    monkeypatch.setattr(helpers, "compute_state_snapshot_sync", slow_probe)
+    return calls
+
+
+def test_concurrent_state_misses_share_one_probe(tmp_path, counted_probes):
+    (tmp_path / "test.preql").write_text(SIMPLE_PREQL)
+    client = _app_no_token(tmp_path, engine="duck_db")
+    responses: list = []
+
+    def fetch():
+        responses.append(client.get("/state", params={"target": "test.preql"}))
+
+    threads = [threading.Thread(target=fetch) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(counted_probes) == 1
+    assert {r.status_code for r in responses} == {200}
+    assert len({r.headers["X-Trilogy-Computed-At"] for r in responses}) == 1
+
+
+def test_state_is_refreshed_ahead_after_an_edit(tmp_path, counted_probes, monkeypatch):
+    import trilogy.scripts.serve as serve_module
+
+    monkeypatch.setattr(serve_module, "REFRESH_AHEAD_DELAY", 0.05)
+    (tmp_path / "test.preql").write_text(SIMPLE_PREQL)
+    app = FastAPI()
+    create_app(app, "duck_db", tmp_path, "localhost", 80)
+    with TestClient(app) as client:
+        client.get("/state", params={"target": "test.preql"})
+        assert len(counted_probes) == 1
+
+        client.put(
+            "/files/test.preql",
+            json={"content": SIMPLE_PREQL + "\nproperty id.extra int;\n"},
+        )
+        deadline = time.monotonic() + 10
+        while len(counted_probes) < 2 and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert len(counted_probes) == 2
+
+        # the request joins or follows the background probe, never a third
+        response = client.get("/state", params={"target": "test.preql"})
+        assert response.status_code == 200
+        assert len(counted_probes) == 2
+
+
 def test_state_cache_can_be_disabled(tmp_path):
     (tmp_path / "test.preql").write_text(SIMPLE_PREQL)
     client = _app_no_token(tmp_path, engine="duck_db", enable_state_cache=False)
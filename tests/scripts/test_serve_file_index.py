@@ -0,0 +1,123 @@
+import time
+from pathlib import Path
+
+from trilogy.scripts.serve_helpers import ModelFileIndex
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_index_lists_model_files(tmp_path: Path):
+    (tmp_path / "a.preql").write_text("key a int;")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.sql").write_text("select 1;")
+    (tmp_path / "data.csv").write_text("x\n1\n")
+    (tmp_path / "notes.txt").write_text("ignored")
+
+    index = ModelFileIndex(tmp_path)
+    assert [p.relative_to(tmp_path).as_posix() for p in index.files()] == [
+        "a.preql",
+        "data.csv",
+        "sub/b.sql",
+    ]
+    assert index.files((".sql",)) == [tmp_path / "sub" / "b.sql"]
+
+
+def test_watched_index_picks_up_outside_edits(tmp_path: Path):
+    index = ModelFileIndex(tmp_path, poll_interval=0.05)
+    index.start()
+    try:
+        assert index.watching
+        version = index.version
+        (tmp_path / "new.preql").write_text("key n int;")
+        assert _wait_for(lambda: index.version > version)
+        assert index.files() == [tmp_path / "new.preql"]
+    finally:
+        index.stop()
+    assert not index.watching
+
+
+def test_notify_applies_a_known_change_immediately(tmp_path: Path):
+    model = tmp_path / "a.preql"
+    model.write_text("# first\nkey a int;")
+    index = ModelFileIndex(tmp_path, poll_interval=60)
+    index.start()
+    try:
+        assert index.description(model) == "first"
+        model.write_text("# second, and longer\nkey a int;")
+        index.notify([model])
+        assert index.description(model) == "second, and longer"
+
+        model.unlink()
+        index.notify([model])
+        assert index.files() == []
+    finally:
+        index.stop()
+
+
+def test_fingerprint_covers_the_import_closure(tmp_path: Path):
+    (tmp_path / "base.preql").write_text("key a int;")
+    target = tmp_path / "target.preql"
+    target.write_text("import base;\nselect a;")
+    other = tmp_path / "other.preql"
+    other.write_text("key o int;")
+    index = ModelFileIndex(tmp_path)
+
+    assert index.closure(target) == {target, tmp_path / "base.preql"}
+    before = index.fingerprint(target)
+    other.write_text("key o int;\nkey p int;")
+    assert index.fingerprint(target) == before
+    (tmp_path / "base.preql").write_text("key a int;\nkey b int;")
+    assert index.fingerprint(target) != before
+
+
+def test_a_new_file_can_complete_a_missing_import(tmp_path: Path):
+    target = tmp_path / "target.preql"
+    target.write_text("import later;\n")
+    index = ModelFileIndex(tmp_path)
+    assert index.closure(target) == {target}
+
+    (tmp_path / "later.preql").write_text("key a int;")
+    assert index.closure(target) == {target, tmp_path / "later.preql"}
+
+
+def test_directory_targets_and_unimported_inputs(tmp_path: Path):
+    (tmp_path / "shared.preql").write_text("key s int;")
+    (tmp_path / "jobs").mkdir()
+    job = tmp_path / "jobs" / "job.preql"
+    job.write_text("import ..shared;\n")
+    setup = tmp_path / "setup.sql"
+    setup.write_text("create table t (x int);")
+    script = tmp_path / "source.py"
+    script.write_text("print(1)")
+    (tmp_path / "elsewhere.preql").write_text("key e int;")
+
+    index = ModelFileIndex(tmp_path, always_included=[setup])
+    assert index.closure(tmp_path / "jobs") == {
+        job,
+        tmp_path / "shared.preql",
+        setup,
+        script,
+    }
+
+
+def test_cached_is_reused_until_a_change(tmp_path: Path):
+    model = tmp_path / "a.preql"
+    model.write_text("key a int;")
+    index = ModelFileIndex(tmp_path)
+    calls: list[int] = []
+
+    def compute() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert index.cached("k", compute) == 1
+    assert index.cached("k", compute) == 1
+    model.write_text("key a int;\nkey b int;")
+    assert index.cached("k", compute) == 2
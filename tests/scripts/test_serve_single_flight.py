@@ -0,0 +1,56 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from trilogy.scripts.serve_helpers import SingleFlight
+
+
+@pytest.fixture
+def flights():
+    pool = ThreadPoolExecutor(max_workers=4)
+    yield SingleFlight(pool)
+    pool.shutdown(wait=True)
+
+
+def test_callers_share_an_in_flight_computation(flights):
+    release = threading.Event()
+    calls: list[int] = []
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return "state"
+
+    first = flights.submit("a", compute)
+    second = flights.submit("a", compute)
+    other = flights.submit("b", compute)
+    assert first is second
+    assert other is not first
+    assert flights.in_flight("a")
+
+    release.set()
+    assert first.result(5) == "state"
+    assert other.result(5) == "state"
+    assert len(calls) == 2
+
+
+def test_a_finished_flight_is_forgotten(flights):
+    assert flights.submit("a", lambda: 1).result(5) == 1
+    assert flights.submit("a", lambda: 2).result(5) == 2
+
+
+def test_errors_reach_every_waiter_and_are_not_kept(flights):
+    release = threading.Event()
+
+    def failing():
+        release.wait(5)
+        raise ValueError("no dialect")
+
+    first = flights.submit("a", failing)
+    second = flights.submit("a", failing)
+    release.set()
+    for future in (first, second):
+        with pytest.raises(ValueError, match="no dialect"):
+            future.result(5)
+    assert not flights.in_flight("a")
@@ -140,7 +140,7 @@ def test_exception_fmt():
 
             result = runner.invoke(
                 cli,
-                ["fmt", str(bad_syntax_fmt)],
+                ["fmt", "--no-cache", str(bad_syntax_fmt)],
             )
 
             assert result.exit_code == 0
@@ -186,7 +186,9 @@ def test_cli_string_progress_debug():
             assert "Statements: 3" in result.output.strip()
 
 
-def test_cli_fmt_string():
+def test_cli_fmt_string(tmp_path, monkeypatch):
+    # format beside tmp_path so the run's cache lands there, not in the repo
+    monkeypatch.chdir(tmp_path)
     for mode in RICH_MODES:
         with set_rich_mode(mode):
             runner = CliRunner()
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from trilogy import Dialects
+from trilogy.async_executor import AsyncExecutor
+from trilogy.core.exceptions import QueryCancelledException
+from trilogy.dialect.results import BufferedResult
+
+MODEL = """
+key id int;
+datasource ids (id: id) grain (id) query '''select range as id from range(25)''';
+"""
+
+# long enough that only a cancel ends it inside the test
+SLOW_SQL = "select count(*) from range(100000000000) a"
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_execute_text_returns_detached_results():
+    async def inner():
+        async with AsyncExecutor(Dialects.DUCK_DB.default_executor()) as executor:
+            results = await executor.execute_text(
+                MODEL + "select count(id) -> n; select id order by id asc limit 2;"
+            )
+            sql = await executor.generate_sql("select id order by id asc;")
+            return results, sql
+
+    results, sql = _run(inner())
+    assert all(isinstance(result, BufferedResult) for result in results)
+    assert results[0].fetchall() == [(25,)]
+    assert [tuple(row) for row in results[1]] == [(0,), (1,)]
+    assert "ORDER BY" in sql[-1]
+
+
+def test_stream_yields_batches():
+    async def inner():
+        async with AsyncExecutor(Dialects.DUCK_DB.default_executor()) as executor:
+            return [
+                len(batch)
+                async for batch in executor.stream(
+                    MODEL + "select id order by id asc;", batch_rows=10
+                )
+            ]
+
+    assert _run(inner()) == [10, 10, 5]
+
+
+def test_calls_run_one_at_a_time_in_order():
+    async def inner():
+        async with AsyncExecutor(Dialects.DUCK_DB.default_executor()) as executor:
+            await executor.execute_raw_sql("create table t (n int)")
+            await asyncio.gather(
+                *(
+                    executor.execute_raw_sql(f"insert into t values ({n})")
+                    for n in range(5)
+                )
+            )
+            result = await executor.execute_raw_sql("select n from t")
+            return [row[0] for row in result.fetchall()]
+
+    assert _run(inner()) == [0, 1, 2, 3, 4]
+
+
+def test_cancelling_the_task_interrupts_the_statement():
+    async def inner():
+        async with AsyncExecutor(Dialects.DUCK_DB.default_executor()) as executor:
+            task = asyncio.create_task(executor.execute_raw_sql(SLOW_SQL))
+            await asyncio.sleep(0.3)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(task, timeout=30)
+            # the connection is handed back usable
+            result = await executor.execute_raw_sql("select 1")
+            return result.fetchall()
+
+    assert _run(inner()) == [(1,)]
+
+
+def test_cancel_before_a_statement_stops_it():
+    executor = Dialects.DUCK_DB.default_executor()
+    assert executor.cancel()
+    with pytest.raises(QueryCancelledException):
+        executor.execute_raw_sql("select 1")
+    assert executor.execute_raw_sql("select 1").fetchall() == [(1,)]
@@ -1,3 +1,4 @@
+import copy
 from pathlib import Path
 
 from pydantic import TypeAdapter, ValidationError
@@ -232,3 +233,80 @@ property user_id.name string;
     assert user_id.metadata.line_number == 1
     # Column positions should be captured
     assert user_id.metadata.column is not None
+
+
+def test_duplicate_is_copy_on_write():
+    env = Environment.from_file(Path(__file__).parent / "test_env.preql")
+    dup = env.duplicate()
+    # forking copies nothing: every entry is shared
+    assert dup.concepts.data.shared == len(env.concepts.data)
+    assert dup.datasources.shared == len(env.datasources)
+
+    # reads and iteration hand out the shared objects without copying
+    assert dup.concepts["local.id"] is env.concepts["local.id"]
+    assert [ds for ds in dup.datasources.values()] == list(env.datasources.values())
+    assert dup.datasources.shared == len(env.datasources)
+
+    # an in-place edit on the duplicate copies first and never reaches the source
+    ds_id = next(iter(env.datasources))
+    version = dup.datasources.version
+    dup.datasources.edit(ds_id).columns = []
+    assert dup.datasources.version > version
+    assert env.datasources[ds_id].columns
+    assert dup.datasources.shared == len(env.datasources) - 1
+
+    # dict-level writes stay on their own side, in both directions
+    dup.add_concept(
+        Concept(name="dup_only", datatype=DataType.INTEGER, purpose=Purpose.KEY)
+    )
+    env.add_concept(
+        Concept(name="env_only", datatype=DataType.INTEGER, purpose=Purpose.KEY)
+    )
+    assert "local.dup_only" not in env.concepts
+    assert "local.env_only" not in dup.concepts
+    dup.delete_datasource(ds_id)
+    assert ds_id in env.datasources
+    assert ds_id not in dup.datasources
+
+
+def test_duplicate_survives_parent_mutation():
+    env = Environment.from_file(Path(__file__).parent / "test_env.preql")
+    ds_id = next(iter(env.datasources))
+    columns = list(env.datasources[ds_id].columns)
+    dup = env.duplicate()
+
+    # the source is edited after forking: it copies, the child keeps the original
+    env.datasources.edit(ds_id).columns = []
+    assert dup.datasources[ds_id].columns == columns
+    assert env.datasources[ds_id] is not dup.datasources[ds_id]
+
+    env.delete_datasource(ds_id)
+    env.add_concept(
+        Concept(name="late", datatype=DataType.INTEGER, purpose=Purpose.KEY)
+    )
+    assert ds_id in dup.datasources
+    assert "local.late" not in dup.concepts
+
+    # a duplicate of a duplicate is isolated from both
+    nested = dup.duplicate()
+    dup.datasources.edit(ds_id).columns = []
+    assert nested.datasources[ds_id].columns == columns
+
+
+def test_copy_on_write_dict_forks_stay_bounded():
+    from trilogy.core.models.copy_on_write import MAX_LAYERS, CopyOnWriteDict
+
+    root: CopyOnWriteDict[str, list[int]] = CopyOnWriteDict({"a": [1]}, copier=list)
+    current = root
+    for i in range(MAX_LAYERS * 3):
+        current[f"k{i}"] = [i]
+        current = current.fork()
+        assert len(current._layers) <= MAX_LAYERS
+    assert len(current) == MAX_LAYERS * 3 + 1
+    assert current["k0"] == [0]
+    del current["a"]
+    assert "a" not in current and root["a"] == [1]
+    assert sorted(current) == sorted(f"k{i}" for i in range(MAX_LAYERS * 3))
+    # deep copies flatten, since tombstones do not survive a copy
+    clone = copy.deepcopy(current)
+    assert dict(clone.items()) == dict(current.items())
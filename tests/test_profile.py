@@ -0,0 +1,69 @@
+import gc
+import time
+
+from trilogy import Dialects
+from trilogy.core.profile import Profiler, get_profiler, phase, profiling
+
+
+def test_nested_phases_are_charged_exclusive_time():
+    profiler = Profiler()
+    with profiler.statement("select") as statement, profiler.phase("discovery"):
+        time.sleep(0.02)
+        with profiler.phase("build"):
+            time.sleep(0.02)
+    assert statement.phases["build"] >= 0.02
+    # discovery's own time excludes the nested build
+    assert statement.phases["discovery"] < 0.035
+    assert statement.total >= 0.04
+
+
+def test_phase_is_a_no_op_without_a_profiler():
+    assert get_profiler() is None
+    with phase("parse"):
+        pass
+
+
+def test_planning_and_execution_share_a_statement():
+    executor = Dialects.DUCK_DB.default_executor()
+    with profiling() as profiler:
+        queries = executor.parse_text("const x <- 1; select x; select x + 1 -> y;")
+        for query in queries:
+            executor.execute_statement(query)
+    assert get_profiler() is None
+    labels = [statement.label for statement in profiler.statements]
+    assert labels == ["SelectStatement", "SelectStatement"]
+    for statement in profiler.statements:
+        assert {"build", "render", "execute"} <= set(statement.phases)
+        assert "parse" not in statement.phases
+    # parsing is the run's, not a statement's
+    assert profiler.parse_seconds > 0
+    assert profiler.phase_totals()["parse"] == profiler.parse_seconds
+    assert profiler.to_trace()["parse_s"] > 0
+
+
+def test_bound_statements_are_not_kept_alive():
+    executor = Dialects.DUCK_DB.default_executor()
+    with profiling() as profiler:
+        for query in executor.parse_text("const x <- 1; select x;"):
+            executor.execute_statement(query)
+        del query
+        gc.collect()
+        assert profiler._bound == {}
+    assert len(profiler.statements) == 1
+
+
+def test_fused_chart_layers_count_their_rows_once():
+    executor = Dialects.DUCK_DB.default_executor()
+    with profiling() as profiler:
+        queries = executor.parse_text("""
+key id int;
+property id.v float;
+datasource t (id: id, v: v) grain (id)
+query '''select range as id, range * 1.5 as v from range(10)''';
+chart
+  layer bar ( x_axis <- id, y_axis <- v )
+  layer line ( x_axis <- id, y_axis <- v * 2 as doubled );
+""")
+        result = executor.execute_statement(queries[-1])
+    assert len(result.statement.queries) == 1
+    assert profiler.statements[-1].rows == 10
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from trilogy.async_executor import AsyncExecutor
     from trilogy.constants import CONFIG
     from trilogy.core.models.environment import Environment, EnvironmentConfig
     from trilogy.dialect.enums import Dialects
@@ -11,6 +12,7 @@ __version__ = "0.3.337"
 
 __all__ = [
     "CONFIG",
+    "AsyncExecutor",
     "Dialects",
     "Environment",
     "EnvironmentConfig",
@@ -24,6 +26,7 @@ __all__ = [
 # PEP 562 defers each name to first attribute access; `from trilogy import
 # Executor` is unchanged, it just resolves on use.
 _LAZY_ATTRS: dict[str, str] = {
+    "AsyncExecutor": "trilogy.async_executor",
     "CONFIG": "trilogy.constants",
     "Dialects": "trilogy.dialect.enums",
     "Environment": "trilogy.core.models.environment",
@@ -0,0 +1,138 @@
+"""An asyncio front end for ``Executor``.
+
+Every call runs on one worker thread that the ``AsyncExecutor`` owns: parsing
+and planning are CPU-bound and the warehouse drivers are blocking, so the
+event loop only ever awaits the thread. An ``Executor`` and its connection are
+not safe to share between threads, so calls on one ``AsyncExecutor`` run one
+at a time, in the order they were made; open one per concurrent workload (one
+per request, or a small pool) to overlap compilation with warehouse I/O.
+
+Cancelling the awaiting task cancels the statement: the executor is asked to
+abort it through the driver (``dialect/cancel.py``) and the task waits for the
+worker to hand the connection back, rolled back, before it re-raises. Where
+the driver cannot interrupt a running statement, that one finishes and the
+rest of the script is skipped.
+
+Results are read on the worker before they are returned, since a live cursor
+cannot be consumed from the event loop while the connection runs the next
+call. ``stream`` hands a large result over batch by batch instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from typing import Any, Self, TypeVar
+
+from trilogy.dialect.results import BufferedResult, StreamedResult
+from trilogy.engine import ResultProtocol
+from trilogy.executor import Executor
+
+T = TypeVar("T")
+
+DEFAULT_STREAM_BATCH_ROWS = 10_000
+
+
+def _detach(result: ResultProtocol | None) -> ResultProtocol | None:
+    """Read a result still backed by a driver cursor into memory."""
+    from sqlalchemy.engine import CursorResult
+
+    if isinstance(result, CursorResult):
+        if not result.returns_rows:
+            return BufferedResult([], [])
+        return BufferedResult(list(result.keys()), list(result.fetchall()))
+    if isinstance(result, StreamedResult):
+        return BufferedResult(list(result.keys()), result.fetchall())
+    return result
+
+
+class AsyncExecutor:
+    """Awaitable ``execute_*`` and ``parse_text`` over an ``Executor``.
+
+    Use as an async context manager, or ``await close()`` when done."""
+
+    def __init__(self, executor: Executor):
+        self.executor = executor
+        self._worker = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="trilogy-async"
+        )
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def _call(self, fn: Callable[..., T], *args: Any) -> T:
+        async with self._lock:
+            return await self._run(fn, *args)
+
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn`` on the worker; the caller holds the lock."""
+        loop = asyncio.get_running_loop()
+        # a cancel that landed after the previous call finished is stale
+        self.executor.clear_cancel()
+        future = loop.run_in_executor(self._worker, fn, *args)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            self.executor.cancel()
+            # the connection is only reusable once the worker lets go of it
+            with suppress(Exception):
+                await future
+            self.executor.clear_cancel()
+            raise
+
+    def _execute_text(self, command: str, non_interactive: bool) -> list[Any]:
+        return [
+            _detach(result)
+            for result in self.executor.execute_text_generator(
+                command, non_interactive=non_interactive
+            )
+        ]
+
+    async def execute_text(
+        self, command: str, non_interactive: bool = False
+    ) -> list[ResultProtocol]:
+        return await self._call(self._execute_text, command, non_interactive)
+
+    async def execute_query(self, query: Any) -> ResultProtocol | None:
+        return await self._call(lambda: _detach(self.executor.execute_query(query)))
+
+    async def execute_raw_sql(
+        self, command: str, variables: dict | None = None
+    ) -> ResultProtocol | None:
+        return await self._call(
+            lambda: _detach(self.executor.execute_raw_sql(command, variables))
+        )
+
+    async def parse_text(self, command: str) -> list[Any]:
+        return await self._call(self.executor.parse_text, command)
+
+    async def generate_sql(self, command: str) -> list[str]:
+        return await self._call(self.executor.generate_sql, command)
+
+    async def stream(
+        self, command: str, batch_rows: int = DEFAULT_STREAM_BATCH_ROWS
+    ) -> AsyncIterator[list[Any]]:
+        """Run ``command`` and yield the last statement's rows in batches.
+
+        Earlier statements run first and their results are discarded; the
+        last one is read straight off its cursor. Other calls on this executor
+        wait until the stream is exhausted or closed, since the rows are read
+        from the connection as they are yielded."""
+        async with self._lock:
+            results = await self._run(self.executor.execute_text, command)
+            if not results:
+                return
+            result = results[-1]
+            while rows := await self._run(result.fetchmany, batch_rows):
+                yield rows
+
+    async def close(self) -> None:
+        async with self._lock:
+            await self._run(self.executor.close)
+        self._worker.shutdown(wait=True)
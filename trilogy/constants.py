@@ -75,6 +75,8 @@ class Optimizations:
     join_hoist: bool = True
     union_dim_pushdown: bool = True
     order_inner_joins_first: bool = True
+    # run chart layers at the same grain and filters as one select
+    fuse_chart_layers: bool = True
 
 
 @dataclass
@@ -134,6 +136,29 @@ class Parsing:
 
     strict_name_shadow_enforcement: bool = False
     select_as_definition: bool = True
+    # Read + parse a root script's whole import closure concurrently before
+    # hydrating it (see parsing/v2/import_prefetch.py).
+    prefetch_imports: bool = True
+
+
+@dataclass
+class Execution:
+    """Control script execution"""
+
+    # Compute CTEs that several selects of one script plan identically once,
+    # into session temp tables (see trilogy/execution/shared_ctes.py).
+    share_ctes: bool = False
+    # A shared CTE that materializes more rows than this is dropped again and
+    # left to each statement, to bound what a script parks in the session.
+    shared_cte_max_rows: int = 1_000_000
+    # Consecutive selects/charts of a script run on up to this many
+    # connections at once (see trilogy/execution/concurrent.py); 1 runs them
+    # in order on the executor's own connection.
+    statement_concurrency: int = 1
+    # Reduce line/area chart layers with more rows than the chart has pixels
+    # to spare in the warehouse (see trilogy/execution/downsample.py). Set
+    # False to keep every row, e.g. when a chart's result data is exported.
+    downsample_charts: bool = True
 
 
 class ParserBackend(Enum):
@@ -153,6 +178,7 @@ class Config:
     rendering: Rendering = field(default_factory=Rendering)
     parsing: Parsing = field(default_factory=Parsing)
     generation: Generation = field(default_factory=Generation)
+    execution: Execution = field(default_factory=Execution)
     parser_backend: ParserBackend = ParserBackend.PEST
 
     @property
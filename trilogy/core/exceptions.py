@@ -41,6 +41,37 @@ class QueryTimeoutException(Exception):
     same budget again."""
 
 
+class QueryCancelledException(Exception):
+    """A caller cancelled a running statement (``Executor.cancel``).
+
+    Never retried, for the same reason as a timeout."""
+
+
+class CostBudgetExceededException(Exception):
+    """A statement's dry-run estimate was over the configured byte budget, so
+    it was refused before it ran (see ``trilogy.execution.cost``)."""
+
+    def __init__(
+        self, estimated: int, limit: int, scope: str, run_bytes: int | None = None
+    ):
+        self.estimated = estimated
+        self.limit = limit
+        self.scope = scope
+        self.run_bytes = run_bytes
+        if scope == "run":
+            message = (
+                f"Statement would scan an estimated {estimated:,} bytes, taking "
+                f"the run to {estimated + (run_bytes or 0):,} bytes, over the "
+                f"max_run_bytes budget of {limit:,}."
+            )
+        else:
+            message = (
+                f"Statement would scan an estimated {estimated:,} bytes, over the "
+                f"max_statement_bytes budget of {limit:,}."
+            )
+        super().__init__(message)
+
+
 class UndefinedConceptException(Exception):
     def __init__(self, message, suggestions: list[str]):
         super().__init__(message)
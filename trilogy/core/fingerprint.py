@@ -194,6 +194,11 @@ class _Canonicalizer:
         self.deep = deep
         self._memo: dict[str, str] = {}
         self._in_progress: set[str] = set()
+        # id(obj) -> (obj, hash) for structured nodes; the object is held so its
+        # id cannot be reused by a different object while the memo lives
+        self._nodes: dict[int, tuple[Any, str]] = {}
+        # bumped whenever a reference resolves to a cycle marker
+        self._cycles = 0
 
     def node(self, obj: Any) -> str:
         if obj is None:
@@ -242,12 +247,27 @@ class _Canonicalizer:
             return _h("uset", *sorted(self.node(v) for v in obj))
         if isinstance(obj, dict):
             return self._mapping(obj)
-        if is_dataclass(obj):
-            return self._dataclass(obj)
-        if isinstance(obj, BaseModel):
-            return self._pydantic(obj)
+        if is_dataclass(obj) or isinstance(obj, BaseModel):
+            return self._structured(obj)
         raise FingerprintError(f"Cannot canonicalize {type(obj).__name__}")
 
+    def _structured(self, obj: Any) -> str:
+        # Parsed models share sub-expression objects (a concept's lineage is
+        # the same object in every statement that uses it), so hash each once.
+        cached = self._nodes.get(id(obj))
+        if cached is not None and cached[0] is obj:
+            return cached[1]
+        cycles = self._cycles
+        if is_dataclass(obj):
+            result = self._dataclass(obj)
+        else:
+            result = self._pydantic(obj)
+        # a hash that saw a cycle marker depends on which concept was being
+        # expanded at the time; recompute it in every other context
+        if self._cycles == cycles:
+            self._nodes[id(obj)] = (obj, result)
+        return result
+
     def _mapping(self, obj: dict) -> str:
         items = sorted((self.node(k), self.node(v)) for k, v in obj.items())
         return _h("map", *[p for kv in items for p in kv])
@@ -304,12 +324,16 @@ class _Canonicalizer:
         return result
 
     def concept_effective(self, concept: Concept) -> str:
+        # Always expanded afresh, never via the reference memo: a memoized
+        # reference may have been taken while an upstream was mid-expansion
+        # and so carry a cycle marker the top-level hash must not.
         return self._concept_node(concept)
 
     def _concept_node(self, concept: Concept) -> str:
         if not self.deep:
             return _h("ref", concept.address)
         if concept.address in self._in_progress:
+            self._cycles += 1
             return _h("cycle")
         self._in_progress.add(concept.address)
         try:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass, field
@@ -704,10 +705,31 @@ class BuildGrain:
         )
         self._str_no_condition = self._calculate_string_no_condition()
 
+    @classmethod
+    def interned(
+        cls, components: Iterable[str], where_clause: BuildWhereClause | None = None
+    ) -> BuildGrain:
+        """Hash-consed constructor: every unconditioned grain over the same
+        component set is one shared instance (a compile builds tens of
+        thousands of grains over a few hundred distinct sets). Conditioned
+        grains are not shared. Callers must never mutate ``components`` in
+        place — the instance may be shared with any other concept."""
+        if where_clause is not None:
+            return cls(components=set(components), where_clause=where_clause)
+        key = components if isinstance(components, frozenset) else frozenset(components)
+        hit = _GRAIN_INTERN.get(key)
+        if hit is None:
+            if len(_GRAIN_INTERN) >= GRAIN_INTERN_MAX:
+                _GRAIN_INTERN.clear()
+                _GRAIN_INTERN[frozenset()] = DEFAULT_GRAIN
+            hit = cls(components=set(key))
+            _GRAIN_INTERN[key] = hit
+        return hit
+
     def without_condition(self):
         if not self.where_clause:
             return self
-        return BuildGrain(components=self.components)
+        return BuildGrain.interned(self.components)
 
     @classmethod
     def from_concepts(
@@ -717,10 +739,8 @@ class BuildGrain:
         where_clause: BuildWhereClause | None = None,
     ) -> BuildGrain:
 
-        return BuildGrain(
-            components=concepts_to_build_grain_concepts(
-                concepts, environment=environment
-            ),
+        return BuildGrain.interned(
+            concepts_to_build_grain_concepts(concepts, environment=environment),
             where_clause=where_clause,
         )
 
@@ -742,13 +762,13 @@ class BuildGrain:
                 # raise NotImplementedError(
                 #     f"Cannot merge grains with where clauses, self {self.where_clause} other {other.where_clause}"
                 # )
-        return BuildGrain(
-            components=self.components.union(other.components), where_clause=where
+        return BuildGrain.interned(
+            self.components.union(other.components), where_clause=where
         )
 
     def __sub__(self, other: BuildGrain) -> BuildGrain:
-        return BuildGrain(
-            components=self.components.difference(other.components),
+        return BuildGrain.interned(
+            self.components.difference(other.components),
             where_clause=self.where_clause,
         )
 
@@ -764,14 +784,14 @@ class BuildGrain:
 
     def union(self, other: BuildGrain):
         addresses = self.components.union(other.components)
-        return BuildGrain(components=addresses, where_clause=self.where_clause)
+        return BuildGrain.interned(addresses, where_clause=self.where_clause)
 
     def isdisjoint(self, other: BuildGrain):
         return self.components.isdisjoint(other.components)
 
     def intersection(self, other: BuildGrain) -> BuildGrain:
         intersection = self.components.intersection(other.components)
-        return BuildGrain(components=intersection)
+        return BuildGrain.interned(intersection)
 
     def _calculate_string(self):
         if self.abstract:
@@ -808,6 +828,12 @@ class BuildGrain:
 
 DEFAULT_GRAIN = BuildGrain(components=set())
 
+# Hash-consing table behind BuildGrain.interned. Grains are a pure function of
+# their component set, so the table is process-wide; the cap only bounds
+# memory for long-lived processes compiling many unrelated models.
+GRAIN_INTERN_MAX = 65536
+_GRAIN_INTERN: dict[frozenset[str], BuildGrain] = {frozenset(): DEFAULT_GRAIN}
+
 
 @dataclass(slots=True)
 class BuildParenthetical(DataTyped, ConstantInlineable, BuildConceptArgs):
@@ -1355,9 +1381,11 @@ class BuildConcept(Addressable, BuildConceptArgs, DataTyped):
     canonical_address: str = field(init=False)
 
     def __post_init__(self):
-        self.address = f"{self.namespace}.{self.name}"
-        self.canonical_address = canonical_address_for(
-            self.namespace, self.canonical_name
+        # Interned: the same address is rebuilt for every grain/scope variant
+        # of a concept, and is the key of nearly every planner dict and set.
+        self.address = sys.intern(f"{self.namespace}.{self.name}")
+        self.canonical_address = sys.intern(
+            canonical_address_for(self.namespace, self.canonical_name)
         )
         if (
             isinstance(self.lineage, BuildFunction)
@@ -1409,6 +1437,18 @@ class BuildConcept(Addressable, BuildConceptArgs, DataTyped):
             # and self.keys == other.keys
         )
 
+    def equals_at_grain(self, other: BuildConcept) -> bool:
+        """``self.with_grain(other.grain) == other`` without building the
+        re-grained copy (datasource column matching asks this per column)."""
+        return (
+            type(other) is BuildConcept
+            and other.grain is not None
+            and self.name == other.name
+            and self.datatype == other.datatype
+            and self.purpose == other.purpose
+            and self.namespace == other.namespace
+        )
+
     @cached_property
     def canonical_address_grain(self) -> str:
         return f"{self.canonical_address}@{self.grain!s}"
@@ -1500,7 +1540,7 @@ class BuildConcept(Addressable, BuildConceptArgs, DataTyped):
     def _with_default_grain(self) -> Self:
         if self.purpose == Purpose.KEY:
             # we need to make this abstract
-            grain = BuildGrain(components={self.address})
+            grain = BuildGrain.interned((self.address,))
         elif self.purpose == Purpose.PROPERTY:
             components = []
             if self.keys:
@@ -1509,14 +1549,12 @@ class BuildConcept(Addressable, BuildConceptArgs, DataTyped):
                 for item in self.lineage.concept_arguments:
                     components += [x.address for x in item.sources]
             # TODO: set synonyms
-            grain = BuildGrain(
-                components={x for x in components},
-            )  # synonym_set=generate_BuildConcept_synonyms(components))
+            grain = BuildGrain.interned(components)
         elif self.purpose == Purpose.METRIC:
             grain = DEFAULT_GRAIN
         elif self.purpose == Purpose.CONSTANT:
             if self.derivation != Derivation.CONSTANT:
-                grain = BuildGrain(components={self.address})
+                grain = BuildGrain.interned((self.address,))
             else:
                 grain = self.grain
         else:
@@ -2424,9 +2462,7 @@ class BuildDatasource:
         exact_match = None
         canonical_match = None
         for x in self.columns:
-            is_exact = (
-                x.concept == concept or x.concept.with_grain(concept.grain) == concept
-            )
+            is_exact = x.concept == concept or x.concept.equals_at_grain(concept)
             if is_exact or (
                 concept.address in x.concept.pseudonyms
                 or x.concept.address in concept.pseudonyms
@@ -4135,9 +4171,8 @@ class Factory:
             cached = self.grain_build_cache.get(cache_key)
             if cached is not None:
                 return cached
-            rval = BuildGrain(
-                components=self._normalize_grain_components(base.components),
-                where_clause=None,
+            rval = BuildGrain.interned(
+                self._normalize_grain_components(base.components)
             )
             self.grain_build_cache[cache_key] = rval
             return rval
@@ -0,0 +1,230 @@
+"""Copy-on-write mapping used by environment duplication.
+
+``Environment.duplicate`` used to deep-copy every concept and datasource up
+front, which dominates validate/refresh dry runs on large models even though
+the copy typically touches a handful of keys. A ``CopyOnWriteDict`` forks in
+constant time instead:
+
+* entries live in *layers*: frozen dicts shared by every fork that can see
+  them, newest first, under a per-fork *overlay* of its own writes (and
+  ``_DELETED`` tombstones). Forking freezes the source's overlay into a new
+  layer — a pointer move — and gives both sides an empty overlay, so a write
+  on either side never reaches the other;
+* values are shared too. Reads (lookups and iteration) hand out the shared
+  object without copying; a caller about to edit one *in place* takes it
+  through :meth:`CopyOnWriteDict.edit`, which copies a value still held in a
+  shared layer into the caller's overlay first. Whichever side edits first
+  pays for the copy, and only for that key;
+* ``version`` stamps every write, so a cache can tell whether a fork has
+  diverged from the state it was built on.
+
+Objects a dict cannot see being edited are the one hazard: mutating a value
+obtained by a plain read edits every fork that shares it. Every in-place edit
+of an environment's datasources goes through ``edit``.
+
+Forking is not read-only on the source: it moves the source's overlay into
+a shared layer, or the source's own later edits would reach the fork. A
+per-dict lock serializes ``fork`` with writes (``__setitem__``,
+``__delitem__``, ``edit``), so forking from one thread while another writes
+cannot lose or leak an entry. Reads take no lock; the fork publishes the new
+layer before it empties the overlay, so a concurrent read sees every entry.
+
+Layer chains are flattened once they grow past ``MAX_LAYERS``, so lookups
+stay bounded however many times a dict is forked.
+"""
+
+from __future__ import annotations
+
+from collections.abc import (
+    Callable,
+    ItemsView,
+    Iterator,
+    KeysView,
+    MutableMapping,
+    ValuesView,
+)
+from threading import Lock
+from typing import Any, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+# Depth at which a fork flattens its layers into one (an O(n) pointer copy,
+# amortized over the forks that built the chain).
+MAX_LAYERS = 8
+
+_MISSING: Any = object()
+_DELETED: Any = object()
+
+
+class CopyOnWriteDict(MutableMapping[K, V]):
+    """A mapping that shares its entries with its forks until either side
+    writes."""
+
+    def __init__(
+        self, *args: Any, copier: Callable[[V], V] | None = None, **kwargs: Any
+    ) -> None:
+        self._layers: tuple[dict[K, V], ...] = ()
+        self._own: dict[K, V] = {}
+        self._lock = Lock()
+        self._size = 0
+        self.copier = copier
+        self.version = 0
+        if args or kwargs:
+            self.update(*args, **kwargs)
+
+    def _lookup(self, key: K) -> Any:
+        value = self._own.get(key, _MISSING)
+        if value is _MISSING:
+            for layer in self._layers:
+                value = layer.get(key, _MISSING)
+                if value is not _MISSING:
+                    break
+        return _MISSING if value is _DELETED else value
+
+    def fork(self) -> CopyOnWriteDict[K, V]:
+        """A copy that shares every entry, in time independent of its size.
+
+        Freezes this dict's overlay into a layer, under the write lock.
+        Subclass attributes are carried over shallowly."""
+        with self._lock:
+            if self._own:
+                self._layers = (self._own, *self._layers)
+                self._own = {}
+                if len(self._layers) > MAX_LAYERS:
+                    self._layers = (self._flatten(),)
+            child = self.__class__.__new__(self.__class__)
+            child.__dict__.update(self.__dict__)
+        child._own = {}
+        child._lock = Lock()
+        return child
+
+    def _flatten(self) -> dict[K, V]:
+        flat: dict[K, V] = {}
+        for layer in reversed(self._layers):
+            for key, value in layer.items():
+                if value is _DELETED:
+                    flat.pop(key, None)
+                else:
+                    flat[key] = value
+        return flat
+
+    @property
+    def shared(self) -> int:
+        """Count of entries this dict has not written since its last fork."""
+        if not self._layers:
+            return 0
+        return sum(1 for key in self if key not in self._own)
+
+    def owns(self, key: K) -> bool:
+        """Whether ``key``'s value belongs to this dict alone."""
+        value = self._own.get(key, _MISSING)
+        return value is not _MISSING and value is not _DELETED
+
+    def edit(self, key: K) -> V:
+        """``self[key]``, for a caller about to modify the value in place.
+
+        A value still shared with another fork is copied into this dict
+        first. Raises ``KeyError`` for a missing key."""
+        with self._lock:
+            value = self._lookup(key)
+            if value is _MISSING:
+                raise KeyError(key)
+            if self._layers and not self.owns(key):
+                assert self.copier is not None, "edit() needs a copier"
+                value = self.copier(value)
+                self._own[key] = value
+                self.version += 1
+        return value
+
+    def __getitem__(self, key: K) -> V:
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: K, default: Any = None) -> Any:  # type: ignore[override]
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def __contains__(self, key: object) -> bool:
+        return self._lookup(key) is not _MISSING  # type: ignore[arg-type]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        with self._lock:
+            if self._lookup(key) is _MISSING:
+                self._size += 1
+            self._own[key] = value
+            self.version += 1
+
+    def __delitem__(self, key: K) -> None:
+        with self._lock:
+            if self._lookup(key) is _MISSING:
+                raise KeyError(key)
+            if self._layers:
+                self._own[key] = _DELETED
+            else:
+                del self._own[key]
+            self._size -= 1
+            self.version += 1
+
+    def _single(self) -> dict[K, V] | None:
+        """The one dict holding every entry, when there is one. Neither an
+        unforked overlay nor a lone layer can hold tombstones: deletes only
+        leave them when there are layers underneath."""
+        if not self._layers:
+            return self._own
+        if len(self._layers) == 1 and not self._own:
+            return self._layers[0]
+        return None
+
+    def __iter__(self) -> Iterator[K]:
+        single = self._single()
+        if single is not None:
+            return iter(single)
+        return self._iter_layers()
+
+    def _iter_layers(self) -> Iterator[K]:
+        seen: set[K] = set()
+        for layer in (*reversed(self._layers), self._own):
+            for key in layer:
+                if key in seen:
+                    continue
+                seen.add(key)
+                if self._lookup(key) is not _MISSING:
+                    yield key
+
+    # Read-only views straight over the backing dict when there is only one,
+    # so iterating an environment costs what iterating a dict does.
+    def keys(self) -> KeysView[K]:
+        single = self._single()
+        return single.keys() if single is not None else super().keys()
+
+    def values(self) -> ValuesView[V]:
+        single = self._single()
+        return single.values() if single is not None else super().values()
+
+    def items(self) -> ItemsView[K, V]:
+        single = self._single()
+        return single.items() if single is not None else super().items()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getstate__(self) -> dict[str, Any]:
+        # pickle/deepcopy: flatten, since tombstones do not survive a copy
+        state = dict(self.__dict__)
+        state["_layers"] = ()
+        state["_own"] = dict(self.items())
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def copy(self) -> dict[K, V]:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
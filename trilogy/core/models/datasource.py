@@ -2,7 +2,7 @@ from collections.abc import ItemsView, ValuesView
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from enum import Enum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
@@ -27,6 +27,7 @@ from trilogy.core.models.author import (
     Namespaced,
     WhereClause,
 )
+from trilogy.core.models.copy_on_write import CopyOnWriteDict
 
 LOGGER_PREFIX = "[MODELS_DATASOURCE]"
 
@@ -500,18 +501,17 @@ class Datasource(HasUUID, Namespaced, BaseModel):
         ]
 
 
-class EnvironmentDatasourceDict(dict):
+class EnvironmentDatasourceDict(CopyOnWriteDict[str, Datasource]):
     def __init__(self, *args, **kwargs) -> None:
-        # See EnvironmentConceptDict.mutations — same contract. A plain-dict
-        # subclass must also hook update(): dict.update bypasses __setitem__.
+        # See EnvironmentConceptDict.mutations — same contract.
         self.mutations: int = 0
         # See EnvironmentConceptDict.content_version — effective writes only.
         self.content_version: int = 0
-        super().__init__(self, *args, **kwargs)
+        super().__init__(*args, copier=Datasource.duplicate, **kwargs)
 
     def __setitem__(self, key: str, value: Datasource) -> None:
         self.mutations += 1
-        if dict.get(self, key) is not value:
+        if self.get(key) is not value:
             self.content_version += 1
         super().__setitem__(key, value)
 
@@ -520,15 +520,14 @@ class EnvironmentDatasourceDict(dict):
         self.content_version += 1
         super().__delitem__(key)
 
-    def update(self, *args, **kwargs) -> None:  # type: ignore[override]
-        self.mutations += 1
-        self.content_version += 1
-        super().update(*args, **kwargs)
-
-    def pop(self, *args):
-        self.mutations += 1
-        self.content_version += 1
-        return super().pop(*args)
+    def edit(self, key: str) -> Datasource:
+        version = self.version
+        value = super().edit(key)
+        if self.version != version:
+            # copied out of a shared layer: the key now holds a new object
+            self.mutations += 1
+            self.content_version += 1
+        return value
 
     def __getitem__(self, key: str) -> Datasource:
         try:
@@ -547,6 +546,8 @@ class EnvironmentDatasourceDict(dict):
         return super().items()
 
     def duplicate(self) -> "EnvironmentDatasourceDict":
-        new = EnvironmentDatasourceDict()
-        new.update({k: v.duplicate() for k, v in self.items()})
+        """Copy-on-write fork; see ``CopyOnWriteDict``."""
+        new = cast(EnvironmentDatasourceDict, self.fork())
+        new.mutations += 1
+        new.content_version += 1
         return new
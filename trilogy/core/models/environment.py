@@ -48,6 +48,7 @@ from trilogy.core.models.author import (
     UndefinedConceptFull,
     address_with_namespace,
 )
+from trilogy.core.models.copy_on_write import CopyOnWriteDict
 from trilogy.core.models.core import DataType, StructType
 from trilogy.core.models.datasource import Datasource, EnvironmentDatasourceDict
 from trilogy.utility import safe_open
@@ -295,6 +296,10 @@ class EnvironmentConceptDict(UserDict[str, Concept]):
         # survive a re-parse of identical statements.
         self.content_version: int = 0
         super().__init__(*args, **kwargs)
+        # Forkable backing store, so duplicate() shares every concept.
+        self.data: CopyOnWriteDict[str, Concept] = CopyOnWriteDict(  # type: ignore[assignment]
+            self.data, copier=Concept.duplicate
+        )
         self.undefined: dict[str, UndefinedConceptFull] = {}
         self.fail_on_missing: bool = True
         self.hidden: set[str] = set()
@@ -318,9 +323,12 @@ class EnvironmentConceptDict(UserDict[str, Concept]):
         self.populate_default_concepts()
 
     def duplicate(self) -> EnvironmentConceptDict:
+        """Copy of this dict (hidden concepts included) that shares every
+        concept until either side writes it; see ``CopyOnWriteDict``."""
         new = EnvironmentConceptDict()
-        # include hidden items via raw iteration
-        new.update({k: v.duplicate() for k, v in self.data.items()})
+        new.data = self.data.fork()  # type: ignore[attr-defined]
+        new.mutations += 1
+        new.content_version += 1
         new.undefined = self.undefined
         new.fail_on_missing = self.fail_on_missing
         new.hidden = set(self.hidden)
@@ -777,6 +785,12 @@ def datasource_structural_signature(datasource: Datasource) -> tuple:
     )
 
 
+def _alias_origin_dict(
+    entries: Mapping[str, Concept] | None = None,
+) -> CopyOnWriteDict[str, Concept]:
+    return CopyOnWriteDict(entries or {}, copier=Concept.duplicate)
+
+
 @dataclass
 class Environment:
     concepts: EnvironmentConceptDict = field(default_factory=EnvironmentConceptDict)
@@ -811,7 +825,9 @@ class Environment:
     config: EnvironmentConfig = field(default_factory=EnvironmentConfig)
     version: str = field(default_factory=get_version)
     cte_name_map: dict[str, str] = field(default_factory=dict)
-    alias_origin_lookup: dict[str, Concept] = field(default_factory=dict)
+    alias_origin_lookup: CopyOnWriteDict[str, Concept] = field(
+        default_factory=lambda: _alias_origin_dict()
+    )
     # Global `merge` statements as build-time join pairs. These are evaluated
     # alongside query-scoped joins by Factory.scoped_merge_map instead of
     # rewriting the author environment during parse.
@@ -1056,6 +1072,12 @@ class Environment:
             raise InvalidSyntaxException(f"Invalid merge declaration: {reason}")
 
     def duplicate(self):
+        """Independent copy of this environment.
+
+        Concepts, datasources and alias origins are forked copy-on-write, so
+        duplicating takes constant time and a value is only copied when one
+        side edits it; see ``CopyOnWriteDict``.
+        """
         return Environment(
             datasources=self.datasources.duplicate(),
             concepts=self.concepts.duplicate(),
@@ -1070,9 +1092,7 @@ class Environment:
             config=copy.deepcopy(self.config),
             version=self.version,
             cte_name_map=dict(self.cte_name_map),
-            alias_origin_lookup={
-                k: v.duplicate() for k, v in self.alias_origin_lookup.items()
-            },
+            alias_origin_lookup=self.alias_origin_lookup.fork(),
             merges=list(self.merges),
             env_file_path=self.env_file_path,
         )
@@ -1095,6 +1115,8 @@ class Environment:
         self.add_concept(concept)
 
     def __post_init__(self) -> None:
+        if not isinstance(self.alias_origin_lookup, CopyOnWriteDict):
+            self.alias_origin_lookup = _alias_origin_dict(self.alias_origin_lookup)
         self._add_path_concepts()
 
     @classmethod
@@ -1136,10 +1158,12 @@ class Environment:
                 k: _custom_type_adapter().validate_python(v)
                 for k, v in data.get("data_types", {}).items()
             },
-            alias_origin_lookup={
-                k: _concept_adapter().validate_python(v)
-                for k, v in data.get("alias_origin_lookup", {}).items()
-            },
+            alias_origin_lookup=_alias_origin_dict(
+                {
+                    k: _concept_adapter().validate_python(v)
+                    for k, v in data.get("alias_origin_lookup", {}).items()
+                }
+            ),
             merges=[
                 (source, target, JoinType(join_type))
                 for source, target, join_type in data.get("merges", [])
@@ -1203,11 +1227,12 @@ class Environment:
                 return
 
             invalidated = False
-            for k, datasource in self.datasources.items():
-                if existing.address in datasource.output_concepts:
+            for k in list(self.datasources.keys()):
+                if existing.address in self.datasources[k].output_concepts:
                     logger.warning(
                         f"Removed concept for {existing} assignment from {k}"
                     )
+                    datasource = self.datasources.edit(k)
                     clen = len(datasource.columns)
                     datasource.columns = [
                         x
@@ -1593,7 +1618,7 @@ class Environment:
             )
         # Identical redeclaration keeps the durable object (and its runtime
         # status) — no effective write, content_version-stamped caches survive.
-        durable = dict.get(self.datasources, datasource.identifier)
+        durable = self.datasources.get(datasource.identifier)
         if durable is not None and (
             durable is datasource
             or datasource_structural_signature(durable)
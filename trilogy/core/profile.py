@@ -0,0 +1,350 @@
+"""Per-statement phase timings for profiled runs (``trilogy run --profile``).
+
+A profiled run installs a :class:`Profiler`; the parser, planner, dialect and
+executor mark their work with :func:`phase`, which is a no-op when nothing is
+installed. Phases nest (building a nested select happens inside discovery),
+so each statement is charged a phase's *exclusive* time — its duration minus
+that of the phases inside it — and a statement's phase times add up to the
+time it was actually worked on.
+
+Work is charged to the statement open on the current thread. Parsing is not
+any one statement's work — a script is parsed whole — so it is reported as
+the run's own ``parse`` total rather than as a statement. Planning and
+execution are separate steps (a script is parsed and planned up front, then
+its statements run), so the executor binds each processed statement to the
+profile its planning opened, and execution picks the same profile back up.
+
+The profiler is a plain module global rather than a ContextVar: a directory
+run executes scripts on worker threads that a ContextVar set in the CLI
+entrypoint would not reach (the ``execution.report`` sink precedent).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+PHASES = ("parse", "build", "discovery", "optimize", "fetch", "render", "execute")
+
+
+@dataclass
+class StatementProfile:
+    """Where one statement's time went."""
+
+    index: int
+    label: str
+    script: str | None = None
+    phases: dict[str, float] = field(default_factory=dict)
+    rows: int | None = None
+    bytes_scanned: int | None = None
+
+    @property
+    def total(self) -> float:
+        return sum(self.phases.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "index": self.index,
+            "label": self.label,
+            "script": self.script,
+            "total_s": round(self.total, 6),
+            "phases": {name: round(value, 6) for name, value in self.phases.items()},
+            "rows": self.rows,
+            "bytes_scanned": self.bytes_scanned,
+        }
+
+
+@dataclass
+class _Span:
+    name: str
+    start: float
+    duration: float
+    thread: int
+    statement: StatementProfile | None
+    args: dict[str, Any]
+
+
+class _ThreadState(threading.local):
+    def __init__(self) -> None:
+        self.statement: StatementProfile | None = None
+        self.script: str | None = None
+        # child time of each open phase, innermost last
+        self.stack: list[list[float]] = []
+
+
+class Profiler:
+    """Collects phase spans and per-statement totals for one run."""
+
+    def __init__(self) -> None:
+        self.origin = perf_counter()
+        self.statements: list[StatementProfile] = []
+        # time spent parsing, which belongs to no one statement
+        self.parse_seconds = 0.0
+        self._spans: list[_Span] = []
+        # processed statement id -> (weak ref to statement, profile); the
+        # entry is dropped when the statement is collected, so its id cannot
+        # be reused while bound. Processed statements are unhashable, which
+        # rules out a WeakKeyDictionary.
+        self._bound: dict[int, tuple[Any, StatementProfile]] = {}
+        self._threads: dict[int, int] = {}
+        self._state = _ThreadState()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def script(self, name: str) -> Iterator[None]:
+        """Attribute statements opened inside to script ``name``."""
+        state = self._state
+        previous = state.script
+        state.script = name
+        try:
+            yield
+        finally:
+            state.script = previous
+
+    @contextmanager
+    def statement(
+        self, label: str, key: object | None = None
+    ) -> Iterator[StatementProfile]:
+        """Charge work inside to a statement: the one bound to ``key`` if any,
+        else the statement already open on this thread, else a new one."""
+        state = self._state
+        profile = self.profile_for(key) or state.statement
+        if profile is None:
+            with self._lock:
+                profile = StatementProfile(
+                    index=len(self.statements), label=label, script=state.script
+                )
+                self.statements.append(profile)
+        previous = state.statement
+        state.statement = profile
+        try:
+            yield profile
+        finally:
+            state.statement = previous
+
+    @contextmanager
+    def parsing(self) -> Iterator[None]:
+        """Time the block as parsing: added to ``parse_seconds``, phases inside
+        it included, and charged to no statement."""
+        state = self._state
+        previous = state.statement
+        state.statement = None
+        start = perf_counter()
+        try:
+            with self.phase("parse"):
+                yield
+        finally:
+            duration = perf_counter() - start
+            state.statement = previous
+            with self._lock:
+                self.parse_seconds += duration
+
+    def bind(self, key: object, profile: StatementProfile) -> None:
+        ident = id(key)
+
+        def unbind(ref: weakref.ref) -> None:
+            # no lock: collection can run this while the same thread holds it.
+            # The id is not reused until the statement's memory is freed, so
+            # no rebind can race this check.
+            if self._bound.get(ident, (None,))[0] is ref:
+                self._bound.pop(ident, None)
+
+        try:
+            ref: Any = weakref.ref(key, unbind)
+        except TypeError:
+            # not weak-referenceable: hold it, as a strong ref pins its id
+            ref = lambda: key
+        with self._lock:
+            self._bound[ident] = (ref, profile)
+
+    def profile_for(self, key: object | None) -> StatementProfile | None:
+        if key is None:
+            return None
+        bound = self._bound.get(id(key))
+        return bound[1] if bound is not None and bound[0]() is key else None
+
+    @contextmanager
+    def phase(self, name: str, **args: Any) -> Iterator[None]:
+        state = self._state
+        children = [0.0]
+        state.stack.append(children)
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            duration = perf_counter() - start
+            state.stack.pop()
+            if state.stack:
+                state.stack[-1][0] += duration
+            self._record(name, start, duration, duration - children[0], args)
+
+    def _record(
+        self,
+        name: str,
+        start: float,
+        duration: float,
+        exclusive: float,
+        args: dict[str, Any],
+    ) -> None:
+        statement = self._state.statement
+        ident = threading.get_ident()
+        with self._lock:
+            thread = self._threads.setdefault(ident, len(self._threads))
+            self._spans.append(_Span(name, start, duration, thread, statement, args))
+            if statement is not None:
+                statement.phases[name] = statement.phases.get(name, 0.0) + exclusive
+
+    def top(self, count: int = 10) -> list[StatementProfile]:
+        """The ``count`` statements that took longest, slowest first."""
+        return sorted(self.statements, key=lambda s: s.total, reverse=True)[:count]
+
+    def phase_totals(self) -> dict[str, float]:
+        totals: dict[str, float] = {}
+        if self.parse_seconds:
+            totals["parse"] = self.parse_seconds
+        for statement in self.statements:
+            for name, value in statement.phases.items():
+                totals[name] = totals.get(name, 0.0) + value
+        return totals
+
+    def to_trace(self) -> dict[str, Any]:
+        """A Chrome trace (``chrome://tracing`` / Perfetto) of every span,
+        with the per-statement totals alongside under ``statements``."""
+        pid = os.getpid()
+        events: list[dict[str, Any]] = []
+        with self._lock:
+            spans = list(self._spans)
+            threads = dict(self._threads)
+        for ident in threads.values():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": ident,
+                    "args": {"name": f"worker-{ident}"},
+                }
+            )
+        for span in spans:
+            args = dict(span.args)
+            if span.statement is not None:
+                args["statement"] = span.statement.index
+                args["label"] = span.statement.label
+                if span.statement.script:
+                    args["script"] = span.statement.script
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": "trilogy",
+                    "ph": "X",
+                    "ts": round((span.start - self.origin) * 1e6, 3),
+                    "dur": round(span.duration * 1e6, 3),
+                    "pid": pid,
+                    "tid": span.thread,
+                    "args": args,
+                }
+            )
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "parse_s": round(self.parse_seconds, 6),
+            "statements": [statement.to_dict() for statement in self.statements],
+        }
+
+    def write(self, path: str | Path) -> None:
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(self.to_trace(), default=str), encoding="utf-8")
+
+
+_ACTIVE: Profiler | None = None
+
+
+def set_profiler(profiler: Profiler | None) -> None:
+    global _ACTIVE
+    _ACTIVE = profiler
+
+
+def get_profiler() -> Profiler | None:
+    return _ACTIVE
+
+
+@contextmanager
+def profiling() -> Iterator[Profiler]:
+    """Install a fresh profiler for the duration of the block."""
+    previous = _ACTIVE
+    profiler = Profiler()
+    set_profiler(profiler)
+    try:
+        yield profiler
+    finally:
+        set_profiler(previous)
+
+
+@contextmanager
+def phase(name: str, **args: Any) -> Iterator[None]:
+    """Time the block as phase ``name`` of the current statement, if profiling."""
+    profiler = _ACTIVE
+    if profiler is None:
+        yield
+        return
+    with profiler.phase(name, **args):
+        yield
+
+
+@contextmanager
+def statement_scope(
+    label: str, key: object | None = None
+) -> Iterator[StatementProfile | None]:
+    """``Profiler.statement`` on the active profiler; yields None when off."""
+    profiler = _ACTIVE
+    if profiler is None:
+        yield None
+        return
+    with profiler.statement(label, key) as profile:
+        yield profile
+
+
+def bind_statement(key: object, profile: StatementProfile | None) -> None:
+    """Have later work on ``key`` charged to ``profile``."""
+    profiler = _ACTIVE
+    if profiler is not None and profile is not None:
+        profiler.bind(key, profile)
+
+
+def record_rows(key: object, rows: int) -> None:
+    """Set the row count of the statement bound to ``key``, once a caller has
+    read the whole result."""
+    profiler = _ACTIVE
+    profile = profiler.profile_for(key) if profiler is not None else None
+    if profile is not None:
+        profile.rows = rows
+
+
+@contextmanager
+def parse_scope() -> Iterator[None]:
+    """``Profiler.parsing`` on the active profiler; a no-op when off."""
+    profiler = _ACTIVE
+    if profiler is None:
+        yield
+        return
+    with profiler.parsing():
+        yield
+
+
+@contextmanager
+def script_scope(name: str) -> Iterator[None]:
+    profiler = _ACTIVE
+    if profiler is None:
+        yield
+        return
+    with profiler.script(name):
+        yield
@@ -87,6 +87,7 @@ from trilogy.core.processing.partial_bridging import (
     heal_pinned_partials,
 )
 from trilogy.core.processing.utility import unrenderable_outputs
+from trilogy.core.profile import phase
 from trilogy.core.scope_diagnostics import (
     DerivedValueScope,
     extract_derived_value_scopes,
@@ -96,9 +97,11 @@ from trilogy.core.statements.author import (
     ChartLayer,
     ChartStatement,
     ConceptDeclarationStatement,
+    ConceptTransform,
     CopyStatement,
     MultiSelectStatement,
     PersistStatement,
+    SelectItem,
     SelectStatement,
 )
 from trilogy.core.statements.execute import (
@@ -980,27 +983,39 @@ def get_query_node(
     if caches.pseudonym_map is None:
         caches.pseudonym_map = get_canonical_pseudonyms(environment)
 
-    base_factory = Factory(
-        environment=environment,
-        build_cache=caches.build_cache,
-        canonical_build_cache=caches.canonical_build_cache,
-        grain_build_cache=caches.grain_build_cache,
-        pseudonym_map=caches.pseudonym_map,
-        scoped_joins=caches.scoped_joins,
-    )
-    build_statement: BuildSelectLineage | BuildMultiSelectLineage = base_factory.build(
-        statement
-    )
-    if build_lineage_sink is not None:
-        build_lineage_sink.append(build_statement)
-
-    # Baseline + overlay delta (see nested_select.build_nested_select): the
-    # statement's own materialization seeds the per-resolution baseline that
-    # nested arms under the same scoped joins then reuse.
-    baseline_key = environment.materialize_join_key(caches.scoped_joins)
-    baseline = caches.env_baselines.get(baseline_key)
-    if baseline is None:
-        baseline = environment.materialize_baseline(
+    with phase("build"):
+        base_factory = Factory(
+            environment=environment,
+            build_cache=caches.build_cache,
+            canonical_build_cache=caches.canonical_build_cache,
+            grain_build_cache=caches.grain_build_cache,
+            pseudonym_map=caches.pseudonym_map,
+            scoped_joins=caches.scoped_joins,
+        )
+        build_statement: BuildSelectLineage | BuildMultiSelectLineage = (
+            base_factory.build(statement)
+        )
+        if build_lineage_sink is not None:
+            build_lineage_sink.append(build_statement)
+
+        # Baseline + overlay delta (see nested_select.build_nested_select): the
+        # statement's own materialization seeds the per-resolution baseline that
+        # nested arms under the same scoped joins then reuse.
+        baseline_key = environment.materialize_join_key(caches.scoped_joins)
+        baseline = caches.env_baselines.get(baseline_key)
+        if baseline is None:
+            baseline = environment.materialize_baseline(
+                build_cache=caches.build_cache,
+                pseudonym_map=base_factory.pseudonym_map,
+                grain_build_cache=base_factory.grain_build_cache,
+                canonical_build_cache=caches.canonical_build_cache,
+                datasource_build_cache=caches.datasource_build_cache,
+                scoped_joins=caches.scoped_joins,
+            )
+            caches.env_baselines[baseline_key] = baseline
+        build_environment = environment.materialize_delta(
+            baseline,
+            build_statement.local_concepts,
             build_cache=caches.build_cache,
             pseudonym_map=base_factory.pseudonym_map,
             grain_build_cache=base_factory.grain_build_cache,
@@ -1008,17 +1023,6 @@ def get_query_node(
             datasource_build_cache=caches.datasource_build_cache,
             scoped_joins=caches.scoped_joins,
         )
-        caches.env_baselines[baseline_key] = baseline
-    build_environment = environment.materialize_delta(
-        baseline,
-        build_statement.local_concepts,
-        build_cache=caches.build_cache,
-        pseudonym_map=base_factory.pseudonym_map,
-        grain_build_cache=base_factory.grain_build_cache,
-        canonical_build_cache=caches.canonical_build_cache,
-        datasource_build_cache=caches.datasource_build_cache,
-        scoped_joins=caches.scoped_joins,
-    )
     build_environment.statement_authored_addresses = _authored_reference_addresses(
         statement, environment
     )
@@ -1038,22 +1042,22 @@ def get_query_node(
     ):
         heal_pinned_partials(build_environment, build_statement.where_clause)
 
-    graph = generate_graph(build_environment)
-
     staged_conditions = (
         build_statement.where_clauses or None
         if isinstance(build_statement, BuildSelectLineage)
         else None
     )
 
-    return _plan_query_node(
-        build_statement=build_statement,
-        build_environment=build_environment,
-        graph=graph,
-        conditions=build_statement.where_clause,
-        history=history,
-        staged_conditions=staged_conditions,
-    )
+    with phase("discovery"):
+        graph = generate_graph(build_environment)
+        return _plan_query_node(
+            build_statement=build_statement,
+            build_environment=build_environment,
+            graph=graph,
+            conditions=build_statement.where_clause,
+            history=history,
+            staged_conditions=staged_conditions,
+        )
 
 
 def get_query_datasources(
@@ -1077,7 +1081,8 @@ def get_query_datasources(
         build_lineage_sink=build_lineage_sink,
     )
 
-    final_qds = ds.resolve()
+    with phase("discovery"):
+        final_qds = ds.resolve()
 
     if hooks:
         for hook in hooks:
@@ -1218,8 +1223,12 @@ def process_persist(
     statement: PersistStatement,
     hooks: list[BaseHook] | None = None,
 ) -> ProcessedQueryPersist:
-    ds: Datasource = environment.datasources.get(
-        statement.datasource.identifier, statement.datasource
+    identifier = statement.datasource.identifier
+    # the status is toggled in place below
+    ds: Datasource = (
+        environment.datasources.edit(identifier)
+        if identifier in environment.datasources
+        else statement.datasource
     )
     original_status = ds.status
     # For partial datasources, scope the source query to the partition condition so
@@ -1347,11 +1356,11 @@ def _binding_safe_address(
 def _process_chart_layer(
     environment: Environment,
     layer: ChartLayer,
-    hooks: list[BaseHook] | None,
+    select: ProcessedQuery,
+    fused: bool = False,
 ) -> ProcessedChartLayer:
     if layer.select is None:
         raise ValueError("Chart layer is missing a resolved select statement")
-    select = process_query(environment=environment, statement=layer.select, hooks=hooks)
     output_fields = {c.safe_address for c in layer.select.output_components}
 
     role_map: dict[str, str] = {}
@@ -1370,6 +1379,13 @@ def _process_chart_layer(
     def _single(role: str) -> str | None:
         return role_map.get(role)
 
+    columns: list[str] = []
+    if fused:
+        hidden = layer.select.hidden_components
+        for c in layer.select.output_components:
+            if c.address not in hidden and c.safe_address not in columns:
+                columns.append(c.safe_address)
+
     x_field = role_map.get("x_axis")
     y_field = role_map.get("y_axis")
     return ProcessedChartLayer(
@@ -1385,19 +1401,178 @@ def _process_chart_layer(
         y_trellis_field=_single("y_trellis"),
         geo_field=_single("geo"),
         annotation_field=_single("annotation"),
+        columns=columns,
+    )
+
+
+def _can_fuse_chart_selects(first: SelectStatement, other: SelectStatement) -> bool:
+    """Whether two layer selects ask for the same grain under the same
+    filters, so their columns can be requested from a single select."""
+    if (
+        first.limit is not None
+        or other.limit is not None
+        or first.join_clauses
+        or other.join_clauses
+        or first.grouping is not None
+        or other.grouping is not None
+        or first.eligible_datasources is not None
+        or other.eligible_datasources is not None
+    ):
+        return False
+    if first.grain.components != other.grain.components:
+        return False
+    if (
+        first.where_clauses != other.where_clauses
+        or first.having_clause != other.having_clause
+        or first.order_by != other.order_by
+    ):
+        return False
+    defined = {item.concept.address: item for item in first.selection}
+    for item in other.selection:
+        existing = defined.get(item.concept.address)
+        if existing is None:
+            continue
+        if existing.modifiers != item.modifiers:
+            return False
+        if (
+            isinstance(existing.content, ConceptTransform)
+            and isinstance(item.content, ConceptTransform)
+            and existing != item
+        ):
+            return False
+    shared = set(first.local_concepts.keys()) & set(other.local_concepts.keys())
+    return all(
+        first.local_concepts[key] is other.local_concepts[key]
+        or first.local_concepts[key] == other.local_concepts[key]
+        for key in shared
+    )
+
+
+def _fuse_chart_selects(selects: list[SelectStatement]) -> SelectStatement:
+    """One select with every column of ``selects``; a column defined in one
+    layer and referenced in another is emitted once, from its definition."""
+    items: dict[str, SelectItem] = {}
+    local_concepts = selects[0].local_concepts.copy()
+    for select in selects:
+        for item in select.selection:
+            address = item.concept.address
+            existing = items.get(address)
+            if existing is None or (
+                isinstance(item.content, ConceptTransform)
+                and not isinstance(existing.content, ConceptTransform)
+            ):
+                items[address] = item
+        for key, concept in select.local_concepts.items():
+            if key not in local_concepts:
+                local_concepts[key] = concept
+    return replace(
+        selects[0], selection=list(items.values()), local_concepts=local_concepts
     )
 
 
+def _chart_layer_groups(layers: list[ChartLayer]) -> list[list[int]]:
+    """Layer indexes grouped so each group can run as one select."""
+    groups: list[list[int]] = []
+    for idx, layer in enumerate(layers):
+        if layer.select is None:
+            raise ValueError("Chart layer is missing a resolved select statement")
+        if not CONFIG.optimizations.fuse_chart_layers:
+            groups.append([idx])
+            continue
+        for group in groups:
+            if all(
+                _can_fuse_chart_selects(
+                    layers[member].select, layer.select  # type: ignore[arg-type]
+                )
+                for member in group
+            ):
+                group.append(idx)
+                break
+        else:
+            groups.append([idx])
+    return groups
+
+
+def _select_leaves(environment: Environment, select: SelectStatement) -> set[str]:
+    """The concepts without lineage that ``select`` ultimately reads."""
+    leaves: set[str] = set()
+    seen: set[str] = set()
+    pending = [item.concept.address for item in select.selection]
+    if select.where_clause is not None:
+        pending += [c.address for c in select.where_clause.concept_arguments]
+    while pending:
+        address = pending.pop()
+        if address in seen:
+            continue
+        seen.add(address)
+        concept = select.local_concepts.get(address) or environment.concepts.get(
+            address
+        )
+        if concept is None or concept.lineage is None:
+            leaves.add(address)
+            continue
+        pending += [c.address for c in concept.concept_arguments]
+    return leaves
+
+
+def _one_datasource_covers(
+    environment: Environment, selects: list[SelectStatement]
+) -> bool:
+    """Whether one datasource binds every leaf concept of ``selects``, a
+    precondition for their fused plan being a single scan. Checked before
+    planning so layers that need a join are planned once, separately."""
+    leaves: set[str] = set()
+    for select in selects:
+        leaves |= _select_leaves(environment, select)
+    return any(
+        leaves <= {c.address for c in datasource.output_concepts}
+        for datasource in environment.datasources.values()
+    )
+
+
+def _is_single_scan(query: ProcessedQuery) -> bool:
+    """Whether every column of ``query`` comes off the same source rows.
+
+    Only then does a fused select return exactly the rows each layer would
+    have got on its own; a join could add members one layer lacks or drop
+    members another has."""
+    return all(isinstance(cte, CTE) and not cte.joins for cte in query.ctes)
+
+
 def process_chart(
     environment: Environment,
     statement: ChartStatement,
     hooks: list[BaseHook] | None = None,
 ) -> ProcessedChartStatement:
-    layers = [
-        _process_chart_layer(environment, layer, hooks) for layer in statement.layers
-    ]
+    """Process every layer's select. Layers at the same grain under the same
+    filters share one query, and each keeps only its own columns of it."""
+    layers: list[ProcessedChartLayer | None] = [None] * len(statement.layers)
+    for group in _chart_layer_groups(statement.layers):
+        selects: list[SelectStatement] = [
+            statement.layers[idx].select for idx in group  # type: ignore[misc]
+        ]
+        if len(group) > 1 and _one_datasource_covers(environment, selects):
+            fused = process_query(
+                environment=environment,
+                statement=_fuse_chart_selects(selects),
+                hooks=hooks,
+            )
+            if _is_single_scan(fused):
+                for idx in group:
+                    layers[idx] = _process_chart_layer(
+                        environment, statement.layers[idx], fused, fused=True
+                    )
+                continue
+        for idx in group:
+            layer = statement.layers[idx]
+            select = process_query(
+                environment=environment,
+                statement=layer.select,  # type: ignore[arg-type]
+                hooks=hooks,
+            )
+            layers[idx] = _process_chart_layer(environment, layer, select)
     return ProcessedChartStatement(
-        layers=layers,
+        layers=[layer for layer in layers if layer is not None],
         placements=list(statement.placements),
         hide_legend=statement.hide_legend,
         show_title=statement.show_title,
@@ -1514,14 +1689,15 @@ def process_query(
     )
     scoped_merge_map = dict(domain_graph.canonical_map())
 
-    final_ctes = optimize_ctes(
-        deduped_ctes,
-        root_cte,
-        statement,
-        having_alias=having_alias,
-        domain_graph=domain_graph,
-        supports_full_join=supports_full_join,
-    )
+    with phase("optimize"):
+        final_ctes = optimize_ctes(
+            deduped_ctes,
+            root_cte,
+            statement,
+            having_alias=having_alias,
+            domain_graph=domain_graph,
+            supports_full_join=supports_full_join,
+        )
     _expose_downstream_referenced_columns(final_ctes, root_cte)
     # Observational only — a diagnostics failure must never block the query.
     derived_value_scopes: list[DerivedValueScope] = []
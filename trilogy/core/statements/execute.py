@@ -75,6 +75,9 @@ class ProcessedQuery:
     # observational scope diagnostics (docs/SPEC_query_derived_value_scopes.md);
     # empty when the query has no aggregate/window values or extraction failed.
     derived_value_scopes: list[DerivedValueScope] = field(default_factory=list)
+    # CTE name -> session temp table already holding that CTE's rows; set by
+    # the script-level sharing pass (trilogy/execution/shared_ctes.py).
+    shared_ctes: dict[str, str] = field(default_factory=dict)
 
 
 @dataclass
@@ -194,6 +197,10 @@ class ProcessedChartLayer:
     y_trellis_field: str | None = None
     geo_field: str | None = None
     annotation_field: str | None = None
+    # set when the layer shares its query with other layers at the same grain:
+    # the output columns that belong to this layer. Empty when the layer owns
+    # every column of its query.
+    columns: list[str] = field(default_factory=list)
 
 
 @dataclass
@@ -205,6 +212,16 @@ class ProcessedChartStatement:
     scale_x: ScaleType | None = None
     scale_y: ScaleType | None = None
 
+    @property
+    def queries(self) -> list[ProcessedQuery]:
+        """Each distinct query behind the layers, in layer order; layers
+        fused at planning share one."""
+        queries: list[ProcessedQuery] = []
+        for layer in self.layers:
+            if layer.query is not None and not any(layer.query is q for q in queries):
+                queries.append(layer.query)
+        return queries
+
 
 @dataclass
 class ProcessedChartCopyStatement(CopyQueryMixin):
@@ -12,25 +12,54 @@ exact (two distinct integers below ~1e5 can never be within the relative
 tolerance), while large whole-number sums tolerate float accumulation drift —
 an asymmetric exact-integer carve-out in an earlier version false-failed
 whole-dollar sums >= 1e6.
+
+Large tolerant comparisons (``COLUMNAR_MIN_ROWS`` and up) run on the NumPy
+engine in :mod:`trilogy.core.validation.rows_columnar`; the row engine here
+stays the reference implementation and the fallback without NumPy. The
+``*_mismatch`` functions return the first differing rows instead of a bool.
 """
 
 from __future__ import annotations
 
 import math
 from collections import Counter, defaultdict
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
 from decimal import Decimal
+from operator import itemgetter
 
 from trilogy.core.enums import QueryComparison
 
 COMPARISON_SIG_FIGS = 6
 COMPARISON_REL_TOL = 10 ** (1 - COMPARISON_SIG_FIGS)
 COMPARISON_ABS_TOL = 1e-9
+# Below this many rows the per-bucket matcher is already fast and skipping the
+# NumPy import/encode keeps small validations cheap.
+COLUMNAR_MIN_ROWS = 256
+# Groups up to this size are matched directly rather than split further.
+_MATCH_GROUP_ROWS = 64
 
 ExactCell = tuple[str, str]
 ComparisonRow = tuple[tuple[ExactCell, ...], tuple[float, ...]]
 
 
+@dataclass
+class RowMismatch:
+    """Why two result sets differ, with the first differing rows when known."""
+
+    reason: str
+    candidate_row: tuple | None = None
+    reference_row: tuple | None = None
+
+    def describe(self) -> str:
+        parts = [self.reason]
+        if self.candidate_row is not None:
+            parts.append(f"candidate row {self.candidate_row!r}")
+        if self.reference_row is not None:
+            parts.append(f"reference row {self.reference_row!r}")
+        return "; ".join(parts)
+
+
 def _comparison_cell(value: object) -> tuple[str, object]:
     """Split a cell into ("numeric", float) or ("exact", repr)."""
     if isinstance(value, bool):
@@ -86,6 +115,51 @@ def _assign(
     return False
 
 
+def _gap_separates(previous: float, value: float) -> bool:
+    """Whether sorted neighbours ``previous <= value`` are too far apart for any
+    value at or below ``previous`` to be close to any at or above ``value``.
+
+    The doubled relative term covers a negative run, where the far side's
+    magnitude (which scales the tolerance) exceeds both neighbours'."""
+    bound = 2 * COMPARISON_REL_TOL * max(abs(previous), abs(value))
+    return value - previous > bound + COMPARISON_ABS_TOL
+
+
+def _tolerance_groups(
+    candidate: list[tuple[float, ...]],
+    reference: list[tuple[float, ...]],
+    position: int = 0,
+) -> Iterator[tuple[list[tuple[float, ...]], list[tuple[float, ...]]]]:
+    """Split one same-arity bucket into groups no row can match across.
+
+    Both sides are sorted together on the ``position``-th numeric cell and cut
+    wherever a gap is wider than any tolerance; a group still too large to
+    match cheaply is split again on the next cell. One sort per level, so an
+    all-numeric table (one big bucket) costs ``n log n`` instead of a match
+    over every pair."""
+    arity = len(candidate[0]) if candidate else len(reference[0]) if reference else 0
+    if len(candidate) + len(reference) <= _MATCH_GROUP_ROWS or position >= arity:
+        yield candidate, reference
+        return
+    tagged = sorted(
+        (
+            (row[position], side, row)
+            for side, rows in enumerate((candidate, reference))
+            for row in rows
+        ),
+        key=itemgetter(0),
+    )
+    groups: tuple[list, list] = ([], [])
+    previous: float | None = None
+    for value, side, row in tagged:
+        if previous is not None and _gap_separates(previous, value):
+            yield from _tolerance_groups(*groups, position + 1)
+            groups = ([], [])
+        groups[side].append(row)
+        previous = value
+    yield from _tolerance_groups(*groups, position + 1)
+
+
 def _bucket_matches(
     candidate: list[tuple[float, ...]],
     reference: list[tuple[float, ...]],
@@ -93,41 +167,97 @@ def _bucket_matches(
     """Maximum-match one exact-value bucket under tolerant numeric equality."""
     if len(candidate) != len(reference):
         return False
-    matched: dict[int, int] = {}
-    return all(
-        _assign(candidate, reference, matched, idx, set())
-        for idx in range(len(reference))
-    )
-
+    by_arity: dict[int, tuple[list, list]] = defaultdict(lambda: ([], []))
+    for side, rows in enumerate((candidate, reference)):
+        for row in rows:
+            by_arity[len(row)][side].append(row)
+    for same_arity in by_arity.values():
+        for group_candidate, group_reference in _tolerance_groups(*same_arity):
+            if len(group_candidate) != len(group_reference):
+                return False
+            matched: dict[int, int] = {}
+            if not all(
+                _assign(group_candidate, group_reference, matched, idx, set())
+                for idx in range(len(group_reference))
+            ):
+                return False
+    return True
 
-def rows_equal_tolerant(candidate: list, reference: list) -> bool:
-    """Compare unordered rows/columns: exact non-numerics, tolerant numerics.
 
-    Independent significant-figure rounding is not suitable for equality: two
-    nearly identical values can land on opposite sides of a rounding boundary.
-    Bucket rows by their exact cells, then maximum-match numeric cells with
-    ``isclose`` so multiset cardinality is still enforced.
-    """
+def _tolerant_mismatch_rows(candidate: list, reference: list) -> RowMismatch | None:
+    """Row engine: bucket rows by their exact cells, then maximum-match numeric
+    cells with ``isclose`` so multiset cardinality is still enforced."""
     if len(candidate) != len(reference):
-        return False
+        return RowMismatch(
+            reason=f"row count differs: {len(candidate)} vs {len(reference)}"
+        )
     candidate_buckets: dict[tuple[ExactCell, ...], list[tuple[float, ...]]] = (
         defaultdict(list)
     )
     reference_buckets: dict[tuple[ExactCell, ...], list[tuple[float, ...]]] = (
         defaultdict(list)
     )
+    candidate_first: dict[tuple[ExactCell, ...], tuple] = {}
+    reference_first: dict[tuple[ExactCell, ...], tuple] = {}
     for row in candidate:
         exact, numeric = _comparison_row(row)
         candidate_buckets[exact].append(numeric)
+        candidate_first.setdefault(exact, tuple(row))
     for row in reference:
         exact, numeric = _comparison_row(row)
         reference_buckets[exact].append(numeric)
-    if candidate_buckets.keys() != reference_buckets.keys():
-        return False
-    return all(
-        _bucket_matches(rows, reference_buckets[exact])
-        for exact, rows in candidate_buckets.items()
-    )
+        reference_first.setdefault(exact, tuple(row))
+    only_reference = [key for key in reference_buckets if key not in candidate_buckets]
+    for exact in [*candidate_buckets, *only_reference]:
+        rows = candidate_buckets.get(exact, [])
+        expected = reference_buckets.get(exact, [])
+        if len(rows) != len(expected):
+            return RowMismatch(
+                reason=(
+                    f"non-numeric cells occur {len(rows)} time(s) "
+                    f"in candidate vs {len(expected)} in reference"
+                ),
+                candidate_row=candidate_first.get(exact),
+                reference_row=reference_first.get(exact),
+            )
+    for exact, rows in candidate_buckets.items():
+        if not _bucket_matches(rows, reference_buckets[exact]):
+            return RowMismatch(
+                reason="numeric cells differ beyond tolerance",
+                candidate_row=candidate_first[exact],
+                reference_row=reference_first[exact],
+            )
+    return None
+
+
+def tolerant_mismatch(candidate: list, reference: list) -> RowMismatch | None:
+    """``None`` when the result sets match under ``TOLERANT`` semantics,
+    otherwise the first differing rows.
+
+    Large inputs use the columnar engine (sort + vectorized ``isclose``, with
+    bipartite matching only inside ambiguous groups); both engines agree on
+    every input.
+    """
+    if len(candidate) >= COLUMNAR_MIN_ROWS:
+        from trilogy.core.validation.rows_columnar import (
+            columnar_available,
+            tolerant_mismatch_columnar,
+        )
+
+        if columnar_available():
+            return tolerant_mismatch_columnar(candidate, reference)
+    return _tolerant_mismatch_rows(candidate, reference)
+
+
+def rows_equal_tolerant(candidate: list, reference: list) -> bool:
+    """Compare unordered rows/columns: exact non-numerics, tolerant numerics.
+
+    Independent significant-figure rounding is not suitable for equality: two
+    nearly identical values can land on opposite sides of a rounding boundary.
+    Bucket rows by their exact cells, then maximum-match numeric cells with
+    ``isclose`` so multiset cardinality is still enforced.
+    """
+    return tolerant_mismatch(candidate, reference) is None
 
 
 def _exact_key(row: Sequence) -> str:
@@ -136,6 +266,31 @@ def _exact_key(row: Sequence) -> str:
     return repr(tuple(_comparison_cell(value) for value in row))
 
 
+def exact_mismatch(candidate: list, reference: list) -> RowMismatch | None:
+    candidate_counts = Counter(_exact_key(r) for r in candidate)
+    reference_counts = Counter(_exact_key(r) for r in reference)
+    if candidate_counts == reference_counts:
+        return None
+    for row in candidate:
+        key = _exact_key(row)
+        if candidate_counts[key] != reference_counts.get(key, 0):
+            return RowMismatch(
+                reason=(
+                    f"row occurs {candidate_counts[key]} time(s) in candidate "
+                    f"vs {reference_counts.get(key, 0)} in reference"
+                ),
+                candidate_row=tuple(row),
+            )
+    for row in reference:
+        key = _exact_key(row)
+        if reference_counts[key] != candidate_counts.get(key, 0):
+            return RowMismatch(
+                reason="reference row missing from candidate",
+                reference_row=tuple(row),
+            )
+    return None
+
+
 def rows_equal_exact(candidate: list, reference: list) -> bool:
     """Unordered rows, positional columns, strictly equal cell values."""
     return Counter(_exact_key(r) for r in candidate) == Counter(
@@ -143,18 +298,43 @@ def rows_equal_exact(candidate: list, reference: list) -> bool:
     )
 
 
+def ordered_mismatch(candidate: list, reference: list) -> RowMismatch | None:
+    for idx, (cand_row, ref_row) in enumerate(zip(candidate, reference)):
+        cand_exact, cand_numeric = _comparison_row(cand_row)
+        ref_exact, ref_numeric = _comparison_row(ref_row)
+        if cand_exact != ref_exact or not _numeric_rows_close(
+            cand_numeric, ref_numeric
+        ):
+            return RowMismatch(
+                reason=f"rows differ at position {idx}",
+                candidate_row=tuple(cand_row),
+                reference_row=tuple(ref_row),
+            )
+    if len(candidate) != len(reference):
+        return RowMismatch(
+            reason=f"row count differs: {len(candidate)} vs {len(reference)}"
+        )
+    return None
+
+
 def rows_equal_ordered(candidate: list, reference: list) -> bool:
     """Tolerant cell semantics with row order enforced."""
     if len(candidate) != len(reference):
         return False
-    for cand_row, ref_row in zip(candidate, reference):
-        cand_exact, cand_numeric = _comparison_row(cand_row)
-        ref_exact, ref_numeric = _comparison_row(ref_row)
-        if cand_exact != ref_exact:
-            return False
-        if not _numeric_rows_close(cand_numeric, ref_numeric):
-            return False
-    return True
+    return ordered_mismatch(candidate, reference) is None
+
+
+def rows_mismatch(
+    candidate: list,
+    reference: list,
+    comparison: QueryComparison = QueryComparison.TOLERANT,
+) -> RowMismatch | None:
+    """Like :func:`rows_equal`, but reports the first differing rows."""
+    if comparison is QueryComparison.EXACT:
+        return exact_mismatch(candidate, reference)
+    if comparison is QueryComparison.ORDERED:
+        return ordered_mismatch(candidate, reference)
+    return tolerant_mismatch(candidate, reference)
 
 
 def rows_equal(
@@ -0,0 +1,240 @@
+"""Columnar engine for tolerant result-row comparison.
+
+Same semantics as :func:`trilogy.core.validation.rows.rows_equal_tolerant`,
+built for large result sets. Instead of bucketing rows by their stringified
+exact cells and maximum-matching every bucket, both sides are encoded once:
+
+* exact cells become one integer code per row (factorized jointly across both
+  sides, so equal codes mean equal exact-cell multisets);
+* numeric cells become a float64 matrix, sorted within each row (tolerant mode
+  ignores column order) and NaN-padded where rows carry fewer numeric cells.
+
+Both sides are then lexsorted on ``(code, numerics...)`` and compared aligned,
+vectorized, under the shared ``isclose`` tolerance. A sorted alignment that
+passes is a valid complete matching, so the common case never matches
+anything. Tolerance is not transitive, though, so an aligned failure only
+proves the *alignment* is wrong — those groups (and only those) fall back to
+the row engine's bipartite matching before a mismatch is reported.
+
+NumPy is optional: :func:`columnar_available` gates the engine and callers fall
+back to the row engine without it.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from trilogy.core.validation.rows import (
+    COMPARISON_ABS_TOL,
+    COMPARISON_REL_TOL,
+    RowMismatch,
+    _bucket_matches,
+    _comparison_cell,
+    _comparison_row,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def columnar_available() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@dataclass
+class _EncodedSide:
+    keys: list[tuple]
+    numeric: np.ndarray
+
+
+def _uniform_kind(column: Sequence) -> str | None:
+    """Return "numeric"/"exact" when every cell in the column agrees, else None."""
+    kind: str | None = None
+    for value in column:
+        cell_kind = _comparison_cell(value)[0]
+        if kind is None:
+            kind = cell_kind
+        elif cell_kind != kind:
+            return None
+    return kind
+
+
+def _encode_by_column(rows: Sequence[Sequence], width: int) -> _EncodedSide | None:
+    """Fast path: every column is uniformly numeric or uniformly exact, so the
+    numeric block converts column-wise with no per-cell classification."""
+    import numpy as np
+
+    columns = list(zip(*rows)) if rows else [() for _ in range(width)]
+    numeric_cols: list[Sequence] = []
+    exact_cols: list[list[str]] = []
+    for column in columns:
+        kind = _uniform_kind(column)
+        if kind is None:
+            return None
+        if kind == "numeric":
+            numeric_cols.append(column)
+        else:
+            exact_cols.append([repr(value) for value in column])
+    n = len(rows)
+    numeric = np.empty((n, len(numeric_cols)), dtype=np.float64)
+    for idx, values in enumerate(numeric_cols):
+        numeric[:, idx] = np.fromiter(
+            (float(value) for value in values), dtype=np.float64, count=n
+        )
+    numeric.sort(axis=1)
+    if not exact_cols:
+        keys: list[tuple] = [()] * n
+    elif len(exact_cols) == 1:
+        keys = [(value,) for value in exact_cols[0]]
+    else:
+        keys = [tuple(sorted(cells)) for cells in zip(*exact_cols)]
+    return _EncodedSide(keys=keys, numeric=numeric)
+
+
+def _encode_by_row(rows: Sequence[Sequence]) -> _EncodedSide:
+    """General path for mixed columns (e.g. NULLs in a measure): classify per
+    row and NaN-pad the numeric block. Rows sharing an exact key always carry
+    the same numeric arity, so padding never crosses a comparison group."""
+    import numpy as np
+
+    split = [_comparison_row(row) for row in rows]
+    width = max((len(numeric) for _, numeric in split), default=0)
+    numeric = np.full((len(rows), width), np.nan, dtype=np.float64)
+    for idx, (_, values) in enumerate(split):
+        numeric[idx, : len(values)] = values
+    keys = [tuple(sorted(cell[1] for cell in exact)) for exact, _ in split]
+    return _EncodedSide(keys=keys, numeric=numeric)
+
+
+def _encode(rows: Sequence[Sequence]) -> _EncodedSide:
+    widths = {len(row) for row in rows}
+    if len(widths) == 1:
+        encoded = _encode_by_column(rows, widths.pop())
+        if encoded is not None:
+            return encoded
+    return _encode_by_row(rows)
+
+
+def _numeric_tuple(values: np.ndarray) -> tuple[float, ...]:
+    return tuple(float(value) for value in values if not math.isnan(value))
+
+
+def _close(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Elementwise ``math.isclose`` with the shared tolerances; NaN padding
+    compares equal to NaN padding."""
+    import numpy as np
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        bound = np.maximum(
+            COMPARISON_REL_TOL * np.maximum(np.abs(left), np.abs(right)),
+            COMPARISON_ABS_TOL,
+        )
+        return (
+            (left == right)
+            | (np.abs(left - right) <= bound)
+            | (np.isnan(left) & np.isnan(right))
+        )
+
+
+def _sort_order(codes: np.ndarray, numeric: np.ndarray) -> np.ndarray:
+    import numpy as np
+
+    # lexsort treats the LAST key as primary
+    sort_keys: list[Any] = [
+        numeric[:, idx] for idx in range(numeric.shape[1] - 1, -1, -1)
+    ]
+    sort_keys.append(codes)
+    return np.lexsort(sort_keys)
+
+
+def tolerant_mismatch_columnar(
+    candidate: Sequence[Sequence], reference: Sequence[Sequence]
+) -> RowMismatch | None:
+    """Columnar counterpart of ``rows.tolerant_mismatch``: ``None`` on a match,
+    otherwise the first differing rows."""
+    import numpy as np
+
+    if len(candidate) != len(reference):
+        return RowMismatch(
+            reason=f"row count differs: {len(candidate)} vs {len(reference)}"
+        )
+    if not candidate:
+        return None
+    cand = _encode(candidate)
+    ref = _encode(reference)
+
+    key_codes: dict[tuple, int] = {}
+    cand_codes = np.fromiter(
+        (key_codes.setdefault(key, len(key_codes)) for key in cand.keys),
+        dtype=np.int64,
+        count=len(cand.keys),
+    )
+    ref_codes = np.fromiter(
+        (key_codes.setdefault(key, len(key_codes)) for key in ref.keys),
+        dtype=np.int64,
+        count=len(ref.keys),
+    )
+    cand_counts = np.bincount(cand_codes, minlength=len(key_codes))
+    ref_counts = np.bincount(ref_codes, minlength=len(key_codes))
+    differing = np.flatnonzero(cand_counts != ref_counts)
+    if differing.size:
+        code = int(differing[0])
+        cand_hits = np.flatnonzero(cand_codes == code)
+        ref_hits = np.flatnonzero(ref_codes == code)
+        return RowMismatch(
+            reason=(
+                f"non-numeric cells occur {int(cand_counts[code])} time(s) "
+                f"in candidate vs {int(ref_counts[code])} in reference"
+            ),
+            candidate_row=tuple(candidate[cand_hits[0]]) if cand_hits.size else None,
+            reference_row=tuple(reference[ref_hits[0]]) if ref_hits.size else None,
+        )
+
+    if cand.numeric.shape[1] != ref.numeric.shape[1]:
+        # a narrower side only gains trailing NaN padding; a group whose two
+        # sides truly differ in numeric arity fails alignment on the padding
+        # and then fails the bipartite fallback's arity check
+        width = max(cand.numeric.shape[1], ref.numeric.shape[1])
+        cand.numeric = _pad(cand.numeric, width)
+        ref.numeric = _pad(ref.numeric, width)
+
+    cand_order = _sort_order(cand_codes, cand.numeric)
+    ref_order = _sort_order(ref_codes, ref.numeric)
+    aligned_ok = _close(cand.numeric[cand_order], ref.numeric[ref_order]).all(axis=1)
+    if aligned_ok.all():
+        return None
+
+    sorted_codes = cand_codes[cand_order]
+    failing_positions = np.flatnonzero(~aligned_ok)
+    for code in dict.fromkeys(int(c) for c in sorted_codes[failing_positions]):
+        cand_idx = cand_order[sorted_codes == code]
+        ref_idx = ref_order[ref_codes[ref_order] == code]
+        if _bucket_matches(
+            [_numeric_tuple(cand.numeric[i]) for i in cand_idx],
+            [_numeric_tuple(ref.numeric[i]) for i in ref_idx],
+        ):
+            continue
+        first = int(failing_positions[sorted_codes[failing_positions] == code][0])
+        return RowMismatch(
+            reason="numeric cells differ beyond tolerance",
+            candidate_row=tuple(candidate[cand_order[first]]),
+            reference_row=tuple(reference[ref_order[first]]),
+        )
+    return None
+
+
+def _pad(numeric: np.ndarray, width: int) -> np.ndarray:
+    import numpy as np
+
+    if numeric.shape[1] == width:
+        return numeric
+    padded = np.full((numeric.shape[0], width), np.nan, dtype=np.float64)
+    padded[:, : numeric.shape[1]] = numeric
+    return padded
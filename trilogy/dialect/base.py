@@ -908,6 +908,21 @@ class BaseDialect:
     # UNION-declared key; dialects without it (MySQL, MariaDB) get those joins
     # lowered to a UNION key spine by the optimizer instead.
     SUPPORTS_FULL_JOIN = True
+    # Whether ``CREATE TEMPORARY TABLE ... AS <select>`` creates a table that
+    # outlives the statement for the rest of the session. Gates script-level
+    # CTE sharing (trilogy/execution/shared_ctes.py); BigQuery temp tables die
+    # with their job, and some engines lack the form entirely.
+    SUPPORTS_SESSION_TEMP_TABLES = True
+    # Whether a second connection from the engine sees the same data and needs
+    # no per-connection setup, so independent reads can run on a pool of them.
+    # Off for embedded engines: a new in-memory connection is a new, empty
+    # database, and DuckDB/SQLite setup (extensions, secrets, registered python
+    # sources) is per connection.
+    SUPPORTS_CONCURRENT_READS = True
+    # Whether a compiled select, CTEs and ORDER BY included, can be wrapped as a
+    # derived table. Gates warehouse-side chart downsampling
+    # (trilogy/execution/downsample.py).
+    SUPPORTS_DERIVED_TABLE_WRAPPING = True
     # Whether the dialect has an array type. Dialects without one raise on array
     # membership rather than emitting SQL that cannot parse.
     SUPPORTS_ARRAYS = True
@@ -3095,7 +3110,18 @@ class BaseDialect:
         self,
         query: ProcessedQuery,
     ) -> list[CompiledCTE]:
-        return [self.render_cte(cte) for cte in query.ctes[:-1]] + [
+        shared = query.shared_ctes
+        return [
+            (
+                CompiledCTE(
+                    name=cte.name,
+                    statement=f"SELECT * FROM {self.quote(shared[cte.name])}",
+                )
+                if cte.name in shared
+                else self.render_cte(cte)
+            )
+            for cte in query.ctes[:-1]
+        ] + [
             # last CTE needs to respect the user output order
             self.render_cte(sort_select_output(query.ctes[-1], query), auto_sort=False)
         ]
@@ -3498,6 +3524,10 @@ class BaseDialect:
         """An empty table shaped like the target, to stage the new rows in."""
         return f"CREATE TEMPORARY TABLE {staged} AS SELECT * FROM {target} WHERE 1=0"
 
+    def render_shared_cte_create(self, table: str, select: str) -> str:
+        """A session temp table holding a CTE shared by several statements."""
+        return f"CREATE TEMPORARY TABLE {self.quote(table)} AS {select}"
+
     def partition_key_match(
         self, left: str, right: str, partition_by: list[str]
     ) -> str:
@@ -3657,9 +3687,7 @@ class BaseDialect:
             return "\n".join(text)
         elif isinstance(query, ProcessedChartStatement):
             return ";\n".join(
-                self.compile_statement(layer.query)
-                for layer in query.layers
-                if layer.query is not None
+                self.compile_statement(layer_query) for layer_query in query.queries
             )
         elif isinstance(query, ProcessedChartCopyStatement):
             return self.compile_statement(query.chart)
@@ -267,6 +267,8 @@ class BigqueryDialect(BaseDialect):
     SUPPORTS_QUALIFY = True
     # python datasources have to be staged to GCS before a query can name them
     REQUIRES_SOURCE_PREPARATION = True
+    # temp tables only live as long as the job that created them
+    SUPPORTS_SESSION_TEMP_TABLES = False
     # `404 Not found: Table proj:ds.tbl was not found in location US`
     TABLE_NOT_FOUND_PATTERN = r"Not found: (Table|Dataset)"
     # unqualified `Unrecognized name: col`; qualified `Name col not found inside base`.
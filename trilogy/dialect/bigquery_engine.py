@@ -14,6 +14,7 @@ from __future__ import annotations
 import datetime
 import decimal
 import re
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any
 
 from trilogy.constants import logger
@@ -33,6 +34,7 @@ if TYPE_CHECKING:
     from sqlalchemy.sql.elements import TextClause
 
     from trilogy.core.statements.execute import ProcessedQueryPersist
+    from trilogy.dialect.bigquery_storage_read import StorageReader
     from trilogy.dialect.config import BigQueryConfig
     from trilogy.executor import Executor
 
@@ -136,9 +138,14 @@ class BigQueryConnection(NonTransactionalConnection):
     statements are unaffected.
     """
 
-    def __init__(self, client: bigquery.Client):
+    def __init__(
+        self, client: bigquery.Client, storage_reader: StorageReader | None = None
+    ):
         self.client = client
         self.external_tables: dict[str, Any] = {}
+        # Reads results of at least ``storage_reader.min_rows`` rows as Arrow
+        # over the Storage Read API instead of REST pages; None stays on REST.
+        self.storage_reader = storage_reader
 
     def register_external_table(self, name: str, config: Any) -> None:
         self.external_tables[name] = config
@@ -176,15 +183,35 @@ class BigQueryConnection(NonTransactionalConnection):
         # shared cursor — so it stays valid once this connection runs the next
         # statement, and rows can be wrapped as they are consumed.
         rows = job.result()
+        values: Iterator[Any]
+        reader = self.storage_reader
+        if reader is not None and reader.applies(rows.total_rows, job.destination):
+            from trilogy.dialect.bigquery_storage_read import preserves_order
+
+            values = reader.rows(job.destination, preserve_order=preserves_order(sql))
+        else:
+            # A BigQuery Row is not tuple-equal, which SQLAlchemy Row consumers
+            # rely on, so streamed_rows re-wraps the values.
+            values = (row.values() for row in rows)
         # DDL/DML jobs report an empty schema and yield no rows.
-        # A BigQuery Row is not tuple-equal, which SQLAlchemy Row consumers
-        # rely on, so streamed_rows re-wraps the values.
         return streamed_rows(
             [field.name for field in rows.schema],
-            (row.values() for row in rows),
+            values,
             "BigQueryRow",
+            rowcount=rows.total_rows if rows.total_rows is not None else -1,
+            bytes_scanned=job.total_bytes_processed,
         )
 
+    def estimate_bytes(self, statement: Any, parameters: Any | None = None) -> int:
+        """Bytes the statement would scan, from a dry-run job. Free, and
+        rejects an invalid statement with the error the real run would raise."""
+        sql, query_parameters = to_bigquery_sql(statement, parameters)
+        config = self.query_job_config(sql, query_parameters)
+        config.dry_run = True
+        config.use_query_cache = False
+        job = self.client.query(sql, job_config=config)
+        return job.total_bytes_processed or 0
+
     def close(self) -> None:
         self.external_tables.clear()
 
@@ -196,9 +223,27 @@ class BigQueryEngine(ExecutionEngine):
 
     def _bigquery_connection(self) -> BigQueryConnection:
         if self._connection is None:
-            self._connection = BigQueryConnection(self.config.resolve_client())
+            client = self.config.resolve_client()
+            self._connection = BigQueryConnection(client, self._storage_reader(client))
         return self._connection
 
+    def _storage_reader(self, client: Any) -> StorageReader | None:
+        min_rows = self.config.storage_read_min_rows
+        if min_rows is None:
+            return None
+        from trilogy.dialect.bigquery_storage_read import (
+            DEFAULT_MAX_STREAMS,
+            StorageReader,
+            default_read_client,
+        )
+
+        return StorageReader(
+            read_client=self.config.read_client or default_read_client(client),
+            project=client.project,
+            min_rows=min_rows,
+            max_streams=self.config.storage_read_streams or DEFAULT_MAX_STREAMS,
+        )
+
     def connect(self) -> EngineConnection:
         return self._bigquery_connection()
 
@@ -17,21 +17,33 @@ TABLE`` points a catalog entry at a stable object path. Costs an extra job per
 script, but the table is queryable outside trilogy and survives the session, so
 the object is deliberately *not* cleaned up — see the lifecycle guidance in
 docs/bigquery_python_datasources.md.
+
+A script registered with ``partitions`` is run once per slice instead, in
+parallel (``python_source.stream_partitions``), each slice to its own object
+under a fresh per-run prefix, ``<table>/<run>/``. BigQuery reads the set
+through one wildcard URI, so both modes above treat it exactly like a single
+object. Once the new run is in place (the external table repointed at it, in
+that mode) every other run under ``<table>/`` is deleted, so slices of an
+earlier run with different partitions are never read back.
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass, field
 from typing import Any
+from uuid import uuid4
 
 from trilogy.constants import logger
 from trilogy.core.models.datasource import Address
 from trilogy.dialect.python_source import (
+    DEFAULT_PARTITION_WORKERS,
     ParquetStreamWriter,
     normalize_object_uri,
     open_uri_sink,
+    partition_slug,
     staged_object_name,
+    stream_partitions,
     stream_script,
 )
 
@@ -47,13 +59,41 @@ OPTIONS (
 )"""
 
 
+PARTITION_WILDCARD = "*.parquet"
+
+
 def delete_uri(uri: str) -> None:
+    """Delete a staged object, or every slice behind a partition wildcard."""
     from pyarrow import fs as pafs
 
+    if uri.endswith("/" + PARTITION_WILDCARD):
+        directory = uri[: -len(PARTITION_WILDCARD)]
+        filesystem, path = pafs.FileSystem.from_uri(normalize_object_uri(directory))
+        filesystem.delete_dir(path.rstrip("/"))
+        return
     filesystem, path = pafs.FileSystem.from_uri(normalize_object_uri(uri))
     filesystem.delete_file(path)
 
 
+def delete_siblings(directory: str, keep: str) -> list[str]:
+    """Delete everything directly under ``directory`` except ``keep``."""
+    from pyarrow import fs as pafs
+
+    filesystem, path = pafs.FileSystem.from_uri(normalize_object_uri(directory))
+    _, kept = pafs.FileSystem.from_uri(normalize_object_uri(keep))
+    deleted: list[str] = []
+    selector = pafs.FileSelector(path.rstrip("/"), allow_not_found=True)
+    for info in filesystem.get_file_info(selector):
+        if info.path.rstrip("/") == kept.rstrip("/"):
+            continue
+        if info.type == pafs.FileType.Directory:
+            filesystem.delete_dir(info.path)
+        else:
+            filesystem.delete_file(info.path)
+        deleted.append(info.path)
+    return deleted
+
+
 @dataclass
 class BigQueryPythonStaging:
     """Resolves and materializes GCS-backed staging for python scripts."""
@@ -68,6 +108,10 @@ class BigQueryPythonStaging:
     # script location -> staged object URI. A script is staged once per
     # executor, not once per statement that references it.
     staged: dict[str, str] = field(default_factory=dict)
+    # script location -> the ``--partition`` slices to fan it out over. A
+    # script without an entry runs once, unpartitioned.
+    partitions: dict[str, list[dict[str, str]]] = field(default_factory=dict)
+    max_partition_workers: int = DEFAULT_PARTITION_WORKERS
 
     def __post_init__(self) -> None:
         self.root_uri = normalize_object_uri(self.root_uri).rstrip("/") + "/"
@@ -105,18 +149,73 @@ class BigQueryPythonStaging:
     def object_uri(self, address: Address) -> str:
         return f"{self.object_root}{self.table_name(address)}.parquet"
 
+    def partition_root(self, address: Address) -> str:
+        return f"{self.object_root}{self.table_name(address)}/"
+
+    def run_root(self, address: Address, run: str) -> str:
+        return f"{self.partition_root(address)}{run}/"
+
+    def partition_uri(
+        self, address: Address, run: str, partition: Mapping[str, str]
+    ) -> str:
+        return f"{self.run_root(address, run)}{partition_slug(partition)}.parquet"
+
+    def _stage_partitions(
+        self, address: Address, partitions: Sequence[Mapping[str, str]]
+    ) -> tuple[str, int]:
+        run = uuid4().hex[:12]
+
+        def writer_for(index: int, partition: Mapping[str, str]) -> ParquetStreamWriter:
+            return ParquetStreamWriter(
+                open_uri_sink(self.partition_uri(address, run, partition))
+            )
+
+        rows = stream_partitions(
+            address.location,
+            "",
+            partitions,
+            writer_for,
+            max_workers=self.max_partition_workers,
+        )
+        return self.run_root(address, run) + PARTITION_WILDCARD, sum(rows.values())
+
+    def _drop_previous_runs(self, address: Address, uri: str) -> None:
+        """Delete the runs under ``<table>/`` other than the one ``uri`` reads.
+        Best-effort: a stale run left behind is no longer referenced."""
+        if not uri.endswith("/" + PARTITION_WILDCARD):
+            return
+        try:
+            delete_siblings(
+                self.partition_root(address), uri[: -len(PARTITION_WILDCARD)]
+            )
+        except Exception as e:
+            logger.warning(
+                "%s could not clear earlier runs of %s: %s",
+                LOGGER_PREFIX,
+                address.location,
+                e,
+            )
+
     def stage(self, address: Address, force: bool = False) -> str | None:
         """Stream the script's Arrow output to a parquet object in GCS.
 
-        Returns the object URI written, or None if it was already staged.
+        Returns the object URI written, or None if it was already staged. For a
+        partitioned script that is a wildcard over its per-slice objects.
         """
         if not force and address.location in self.staged:
             return None
-        uri = self.object_uri(address)
-        rows = stream_script(
-            address.location, "", ParquetStreamWriter(open_uri_sink(uri))
-        )
+        partitions = self.partitions.get(address.location)
+        if partitions:
+            uri, rows = self._stage_partitions(address, partitions)
+        else:
+            uri = self.object_uri(address)
+            rows = stream_script(
+                address.location, "", ParquetStreamWriter(open_uri_sink(uri))
+            )
         self.staged[address.location] = uri
+        if not self.uses_external_tables:
+            # nothing outside this executor reads the previous run
+            self._drop_previous_runs(address, uri)
         logger.info(
             "%s staged %s rows from %s to %s",
             LOGGER_PREFIX,
@@ -148,6 +247,8 @@ class BigQueryPythonStaging:
         if uri is None:
             return None
         run_sql(self.external_table_ddl(address, uri))
+        # only once the table reads the new run can the old ones go
+        self._drop_previous_runs(address, uri)
         return uri
 
     def cleanup(self) -> list[str]:
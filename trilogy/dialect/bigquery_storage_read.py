@@ -0,0 +1,179 @@
+"""Read large BigQuery results through the Storage Read API.
+
+``BigQueryConnection`` normally pages a finished query's rows through the REST
+``RowIterator`` — one HTTP round-trip per page of JSON, decoded row by row.
+That is fine for a dashboard tile and the bottleneck for a multi-million-row
+extract. A query job's result lives in an anonymous destination table, and the
+Storage Read API can open a read session over that table and serve it as Arrow
+record batches across several parallel streams.
+
+Small results stay on REST: a read session is an extra RPC plus a gRPC stream
+per worker, which costs more than it saves below a few pages of rows. Results
+with an ``ORDER BY`` are read through one stream, since rows from parallel
+streams arrive interleaved in no particular order.
+
+Requires the optional ``google-cloud-bigquery-storage`` package unless a read
+client is supplied.
+"""
+
+from __future__ import annotations
+
+import queue
+import re
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Below this many rows the REST pages are cheaper than opening a session.
+DEFAULT_MIN_ROWS = 100_000
+DEFAULT_MAX_STREAMS = 4
+# Batches buffered per stream ahead of the consumer; bounds memory when the
+# streams outpace whoever is reading the result.
+QUEUE_DEPTH_PER_STREAM = 2
+# How often a blocked producer checks whether the consumer went away.
+_PUT_TIMEOUT_SECONDS = 0.1
+
+# Same test google-cloud-bigquery applies before reading a result in parallel.
+_ORDER_BY = re.compile(r"ORDER\s+BY", re.IGNORECASE)
+
+_DONE = object()
+
+
+def preserves_order(sql: str) -> bool:
+    return bool(_ORDER_BY.search(sql))
+
+
+def table_path(destination: Any) -> str:
+    """Read-session table name for a ``bigquery.TableReference``."""
+    return (
+        f"projects/{destination.project}/datasets/{destination.dataset_id}"
+        f"/tables/{destination.table_id}"
+    )
+
+
+def batch_rows(batch: pa.RecordBatch) -> Iterator[tuple]:
+    """The rows of ``batch`` as tuples, in column order."""
+    return zip(*(column.to_pylist() for column in batch.columns), strict=True)
+
+
+def _stream_batches(read_client: Any, session: Any, stream: Any) -> Iterator[Any]:
+    reader = read_client.read_rows(stream.name)
+    for page in reader.rows(session).pages:
+        yield page.to_arrow()
+
+
+def _produce(batches: Iterator[Any], out: queue.Queue, stop: threading.Event) -> None:
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=_PUT_TIMEOUT_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        for batch in batches:
+            if not put(batch):
+                return
+    except Exception as e:
+        put(e)
+        return
+    put(_DONE)
+
+
+def interleave(sources: list[Callable[[], Iterator[Any]]]) -> Iterator[Any]:
+    """Items from every source, each drained on its own thread.
+
+    Arrival order across sources is whatever the threads produce. At most
+    ``QUEUE_DEPTH_PER_STREAM`` items per source wait unconsumed; a source that
+    raises ends the iteration with its error. Closing the iterator early tells
+    the threads to stop at their next item rather than waiting on them, since
+    one may be blocked on the network."""
+    out: queue.Queue = queue.Queue(maxsize=QUEUE_DEPTH_PER_STREAM * len(sources))
+    stop = threading.Event()
+    threads = [
+        threading.Thread(
+            target=_produce,
+            args=(source(), out, stop),
+            name=f"trilogy-bq-read-{index}",
+            daemon=True,
+        )
+        for index, source in enumerate(sources)
+    ]
+    for thread in threads:
+        thread.start()
+    remaining = len(threads)
+    try:
+        while remaining:
+            item = out.get()
+            if item is _DONE:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        stop.set()
+
+
+@dataclass
+class StorageReader:
+    """Serves a finished query's destination table over read streams."""
+
+    # google.cloud.bigquery_storage.BigQueryReadClient, or anything with its
+    # create_read_session / read_rows surface.
+    read_client: Any
+    # Project billed for the read session.
+    project: str
+    min_rows: int = DEFAULT_MIN_ROWS
+    max_streams: int = DEFAULT_MAX_STREAMS
+
+    def applies(self, total_rows: int | None, destination: Any) -> bool:
+        # DDL, DML and scripts have no readable destination table
+        return (
+            destination is not None
+            and total_rows is not None
+            and total_rows >= self.min_rows
+        )
+
+    def batches(self, destination: Any, preserve_order: bool = False) -> Iterator[Any]:
+        session = self.read_client.create_read_session(
+            parent=f"projects/{self.project}",
+            read_session={"table": table_path(destination), "data_format": "ARROW"},
+            max_stream_count=1 if preserve_order else self.max_streams,
+        )
+        streams = list(session.streams)
+        # an empty table is served with no streams at all
+        if len(streams) <= 1:
+            for stream in streams:
+                yield from _stream_batches(self.read_client, session, stream)
+            return
+        yield from interleave(
+            [
+                partial(_stream_batches, self.read_client, session, stream)
+                for stream in streams
+            ]
+        )
+
+    def rows(self, destination: Any, preserve_order: bool = False) -> Iterator[tuple]:
+        for batch in self.batches(destination, preserve_order):
+            yield from batch_rows(batch)
+
+
+def default_read_client(client: Any) -> Any:
+    """A read client sharing ``client``'s credentials."""
+    try:
+        from google.cloud import bigquery_storage  # type: ignore[attr-defined]
+    except ImportError as e:
+        raise ImportError(
+            "storage_read_min_rows is set, which reads large BigQuery results "
+            "through the Storage Read API; install google-cloud-bigquery-storage "
+            "or unset it to stay on REST paging."
+        ) from e
+    return bigquery_storage.BigQueryReadClient(credentials=client._credentials)
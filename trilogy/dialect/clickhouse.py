@@ -228,6 +228,8 @@ class ClickhouseDialect(BaseDialect):
     QUOTE_CHARACTER = "`"
     SQL_TEMPLATE = CLICKHOUSE_SQL_TEMPLATE
     SUPPORTS_QUALIFY = True
+    # temporary tables need an explicit engine clause
+    SUPPORTS_SESSION_TEMP_TABLES = False
     # CH doesn't accept arrayJoin as a FROM-clause table function; DIRECT mode
     # emits `SELECT arrayJoin(...) AS alias` with no FROM, which CH supports.
     UNNEST_MODE = UnnestMode.DIRECT
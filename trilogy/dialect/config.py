@@ -73,6 +73,9 @@ class BigQueryConfig(DialectConfig):
         enable_python_datasources: bool | None = None,
         use_sqlalchemy: bool | None = None,
         native_partition_swap: bool | None = None,
+        storage_read_min_rows: int | None = None,
+        storage_read_streams: int | None = None,
+        read_client: Any | None = None,
     ):
         super().__init__(retry_config=retry_config)
         self.project = project
@@ -99,6 +102,15 @@ class BigQueryConfig(DialectConfig):
         # the rows compared — which is the only thing that shows the two
         # implementations agree.
         self._native_partition_swap = native_partition_swap
+        # Results of at least this many rows are read as Arrow through the
+        # Storage Read API, over up to `storage_read_streams` parallel streams,
+        # rather than paged through REST. Unset stays on REST throughout; the
+        # native engine only. `read_client` supplies the BigQueryReadClient,
+        # otherwise one is built from the client's credentials (needs
+        # google-cloud-bigquery-storage).
+        self.storage_read_min_rows = storage_read_min_rows
+        self.storage_read_streams = storage_read_streams
+        self.read_client = read_client
 
     @property
     def enable_python_datasources(self) -> bool:
@@ -149,6 +161,9 @@ class DuckDBConfig(DialectConfig):
         gcs_cache_bust: bool | None = None,
         retry_config: RetryConfig | None = None,
         read_only: bool | None = None,
+        remote_cache: bool | None = None,
+        remote_cache_max_mb: int | None = None,
+        remote_cache_row_groups: bool | None = None,
     ):
         super().__init__(retry_config=retry_config)
         self.path = path
@@ -157,6 +172,13 @@ class DuckDBConfig(DialectConfig):
         self._enable_spatial = enable_spatial
         self._gcs_cache_bust = gcs_cache_bust
         self.read_only = read_only
+        # Serve remote file datasources from validated local copies under the
+        # staging root (see trilogy.remote_cache). Row-group caching keeps
+        # parquet footers and row groups in DuckDB's in-memory caches for the
+        # files that stay on the network path (too large, or authenticated).
+        self._remote_cache = remote_cache
+        self.remote_cache_max_mb = remote_cache_max_mb
+        self._remote_cache_row_groups = remote_cache_row_groups
         self.guid = id(self)
 
     @property
@@ -175,6 +197,14 @@ class DuckDBConfig(DialectConfig):
     def gcs_cache_bust(self) -> bool:
         return self._gcs_cache_bust or False
 
+    @property
+    def remote_cache(self) -> bool:
+        return self._remote_cache or False
+
+    @property
+    def remote_cache_row_groups(self) -> bool:
+        return self._remote_cache_row_groups or False
+
     def connection_string(self) -> str:
         if not self.path:
             return "duckdb:///:memory:"
@@ -195,22 +225,39 @@ class SQLiteConfig(DialectConfig):
         path: str | None = None,
         retry_config: RetryConfig | None = None,
         staging_path: str | None = None,
+        remote_cache: bool | None = None,
     ):
         super().__init__(retry_config=retry_config)
         self._remote = bool(path and path.startswith(REMOTE_PREFIXES))
+        self.remote_cache = remote_cache or False
         self.path: str | None
         if self._remote:
-            self.path = self._download_remote(path, staging_path)  # type: ignore
+            self.path = self._download_remote(
+                path, staging_path, self.remote_cache  # type: ignore[arg-type]
+            )
         else:
             self.path = path
 
     @staticmethod
-    def _download_remote(url: str, staging_path: str | None = None) -> str:
+    def _download_remote(
+        url: str, staging_path: str | None = None, cache: bool = False
+    ) -> str:
         # Local imports: urllib.request drags in http.client and the email
         # package (~0.1s), and this file is on the CLI's startup path.
         import tempfile
         import urllib.request
 
+        if cache:
+            # The database is opened read-only, so executors can share one
+            # validated copy instead of each downloading their own.
+            from trilogy.remote_cache import RemoteFileCache
+            from trilogy.staging import StagingConfig
+
+            remote_cache = RemoteFileCache.for_staging(StagingConfig(path=staging_path))
+            cached = remote_cache.get(url) if remote_cache else None
+            if cached is not None:
+                return cached
+
         with tempfile.NamedTemporaryFile(
             suffix=".db", delete=False, dir=staging_path
         ) as tmp:
@@ -7,13 +7,15 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
     from trilogy.constants import Rendering
     from trilogy.core.statements.execute import ProcessedQuery
     from trilogy.dialect.config import DialectConfig
     from trilogy.engine import ResultProtocol
+    from trilogy.executor import Executor
     from trilogy.io.contract import SourceRequest
+    from trilogy.remote_cache import RemoteFileCache
     from trilogy.staging import StagingConfig
 
 from jinja2 import Template
@@ -390,6 +392,7 @@ class DuckDBDialect(BaseDialect):
     SUPPORTS_AGGREGATE_GROUPING_MODES = True
     SUPPORTS_ALIAS_IN_HAVING = True
     SUPPORTS_RESULT_SUMMARY = True
+    SUPPORTS_CONCURRENT_READS = False
     NULL_WRAPPER = staticmethod(null_wrapper)
     TABLE_NOT_FOUND_PATTERN = "Catalog Error: Table with name"
     # <=1.4: `... URL "x": 404 (Not Found)`; >=1.5: `... on 'x' (HTTP 404 Not Found)`
@@ -449,6 +452,19 @@ class DuckDBDialect(BaseDialect):
             self._gcs_cache_bust_token: str | None = str(random.randint(1, 2**31))
         else:
             self._gcs_cache_bust_token = None
+        self._remote_cache: RemoteFileCache | None = None
+        if isinstance(config, DuckDBConfig) and config.remote_cache:
+            from trilogy.remote_cache import RemoteFileCache
+            from trilogy.staging import StagingConfig
+
+            max_mb = config.remote_cache_max_mb
+            self._remote_cache = RemoteFileCache.for_staging(
+                staging or StagingConfig(),
+                max_bytes=max_mb * 1024**2 if max_mb else None,
+            )
+        # local copies of remote files, resolved by prepare_sources
+        self._cached_files: dict[str, str] = {}
+        self.REQUIRES_SOURCE_PREPARATION = self._remote_cache is not None
 
     _GCS_PREFIXES = ("gcs://", "gs://", "https://storage.googleapis.com")
 
@@ -457,17 +473,43 @@ class DuckDBDialect(BaseDialect):
             return f"{url}?cache_bust={self._gcs_cache_bust_token}"
         return url
 
+    _FILE_TYPES = (AddressType.CSV, AddressType.TSV, AddressType.PARQUET)
+
+    def prepare_sources(self, addresses: Iterable[Address], executor: Executor) -> None:
+        """Fetch or revalidate the remote cache's copy of every file a query
+        is about to read, so rendering can point at it without a request."""
+        if self._remote_cache is None:
+            return
+        for address in addresses:
+            if address.type not in self._FILE_TYPES:
+                continue
+            for url in address.all_locations:
+                cached = self._remote_cache.get(url)
+                if cached is None:
+                    self._cached_files.pop(url, None)
+                else:
+                    self._cached_files[url] = Path(cached).as_posix()
+
+    def _file_location(self, url: str) -> str:
+        """Where a file table function should read ``url`` from: the local
+        copy ``prepare_sources`` resolved, else the (possibly cache-busted)
+        remote location. Never touches the network."""
+        cached = self._cached_files.get(url)
+        if cached is not None:
+            return cached
+        return self._maybe_bust_gcs_url(url)
+
     def render_source(
         self, address: Address, request: SourceRequest | None = None
     ) -> str:
         hive = ", hive_partitioning=true" if address.partition_columns else ""
         if address.additional_locations:
             paths = ", ".join(
-                f"'{self._maybe_bust_gcs_url(p)}'" for p in address.all_locations
+                f"'{self._file_location(p)}'" for p in address.all_locations
             )
             location_arg = f"[{paths}]"
         else:
-            location_arg = f"'{self._maybe_bust_gcs_url(address.location)}'"
+            location_arg = f"'{self._file_location(address.location)}'"
         if address.type == AddressType.CSV:
             return f"read_csv({location_arg}{hive})"
         if address.type == AddressType.TSV:
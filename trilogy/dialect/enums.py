@@ -13,13 +13,13 @@ from trilogy.constants import Rendering, logger
 from trilogy.dialect.config import DialectConfig, DuckDBConfig
 
 
-def default_factory(conf: DialectConfig, config_type):
+def default_factory(conf: DialectConfig, config_type, pool_args: dict | None = None):
     from sqlalchemy import create_engine
     from sqlalchemy.pool import NullPool
 
-    engine_args = {
-        "poolclass": NullPool,
-    }
+    # Pooling is opt-in (see trilogy.execution.connection_pool): an engine
+    # owned by one executor has no one to hand its connections back to.
+    engine_args: dict = dict(pool_args) if pool_args else {"poolclass": NullPool}
     # the DuckDB IdentifierPreparer uses a global connection that is not thread safe
     if isinstance(conf, DuckDBConfig):
         # we monkey patch to parent to avoid this
@@ -63,9 +63,9 @@ def handle_publish_statement(
 ) -> MockResult:
     """Handle publish statements by updating environment and returning result."""
     for x in query.targets:
-        datasource = environment.datasources.get(x)
-        if not datasource:
+        if x not in environment.datasources:
             raise ValueError(f"Datasource {x} not found in environment")
+        datasource = environment.datasources.edit(x)
         if query.action == PublishAction.UNPUBLISH:
             datasource.status = DatasourceState.UNPUBLISHED
         else:
@@ -1466,10 +1466,10 @@ def _mock_targets(
     mock_manager = MockManager(environment, scale_factor=scale_factor)
     targets: list[Datasource] = []
     for target in target_names or list(environment.datasources.keys()):
-        datasource = environment.datasources.get(target)
-        if not datasource:
+        if target not in environment.datasources:
             raise ValueError(f"Datasource {target} not found in environment")
-        targets.append(datasource)
+        # mocking rewrites each target's address in place
+        targets.append(environment.datasources.edit(target))
     rollups = rollup_datasources(targets, environment)
     available: set[str] = set()
     for datasource in synthesis_order(
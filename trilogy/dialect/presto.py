@@ -109,6 +109,8 @@ class PrestoDialect(BaseDialect):
     GROUP_MODE = GroupMode.BY_INDEX
     SUPPORTS_AGGREGATE_GROUPING_MODES = True
     SUPPORTS_QUALIFY = True
+    # no temporary tables at all
+    SUPPORTS_SESSION_TEMP_TABLES = False
     ALIAS_ORDER_REFERENCING_ALLOWED = (
         False  # some complex presto functions don't support aliasing
     )
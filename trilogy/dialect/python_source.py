@@ -16,7 +16,8 @@ import shlex
 import subprocess
 import tempfile
 import time
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import IO, TYPE_CHECKING, Any
@@ -29,19 +30,25 @@ if TYPE_CHECKING:
     import pyarrow as pa
 
 __all__ = [
+    "DEFAULT_PARTITION_WORKERS",
     "MAX_ATTEMPTS",
+    "MAX_PARTITION_ROUNDS",
     "RETRYABLE_UV_ERROR_MARKERS",
     "RETRY_DELAYS_SECONDS",
     "ParquetStreamWriter",
+    "PartitionedDatasourceError",
     "PythonDatasourceError",
     "build_uv_command",
     "is_retryable_uv_error",
     "normalize_object_uri",
     "open_uri_sink",
+    "partition_args",
+    "partition_slug",
     "retry_delay",
     "script_metadata",
     "source_key",
     "staged_object_name",
+    "stream_partitions",
     "stream_script",
 ]
 
@@ -60,9 +67,19 @@ RETRYABLE_UV_ERROR_MARKERS = (
 
 UV_RUN_PREFIX = ("uv", "run", "--no-project", "--quiet")
 
+# Partition invocations in flight at once. Each is a process whose time goes
+# to waiting on its own upstream, so this bounds load on the API, not on us.
+DEFAULT_PARTITION_WORKERS = 8
+# Passes over the partitions still failing, each after the pool drains; a
+# partition that fails once in a 365-slice backfill is retried on its own
+# rather than failing the other 364.
+MAX_PARTITION_ROUNDS = 2
+
 # Identifier-safe stem for generated staging table names.
 _UNSAFE_IDENTIFIER = re.compile(r"[^A-Za-z0-9_]")
 _MAX_STEM_LENGTH = 32
+# Characters kept as is when a partition value becomes part of an object path.
+_UNSAFE_PATH = re.compile(r"[^A-Za-z0-9_.-]")
 
 
 class PythonDatasourceError(RuntimeError):
@@ -91,6 +108,32 @@ class PythonDatasourceError(RuntimeError):
         )
 
 
+class PartitionedDatasourceError(RuntimeError):
+    """Some partitions of a fanned-out script still failed after every retry.
+
+    The partitions that succeeded are written; ``rows`` has their counts, so
+    a caller can record them and re-run only ``failures``."""
+
+    def __init__(
+        self,
+        script: str,
+        failures: dict[int, PythonDatasourceError],
+        partitions: Sequence[Mapping[str, str]],
+        rows: dict[int, int],
+    ):
+        self.script = script
+        self.failures = failures
+        self.rows = rows
+        self.failed_partitions = [dict(partitions[i]) for i in sorted(failures)]
+        first = failures[min(failures)]
+        super().__init__(
+            f"Python datasource script '{script}' failed for {len(failures)} of "
+            f"{len(partitions)} partitions "
+            f"({', '.join(partition_slug(p) for p in self.failed_partitions[:5])}"
+            f"{', ...' if len(failures) > 5 else ''}); first error: {first}"
+        )
+
+
 def parse_script_error(stderr: str) -> dict[str, Any] | None:
     """The structured failure a ``trilogy.io`` script writes ahead of its traceback."""
     for line in stderr.splitlines():
@@ -219,6 +262,84 @@ def stream_script(
     raise PythonDatasourceError(script, 1, "exhausted retries")
 
 
+def partition_args(args: str, partition: Mapping[str, str]) -> str:
+    """``args`` plus the contract's ``--partition`` flags for one slice."""
+    flags = [
+        f"--partition {shlex.quote(f'{key}={value}')}"
+        for key, value in sorted(partition.items())
+    ]
+    return " ".join(part for part in (args.strip(), *flags) if part)
+
+
+def _slug_part(value: str) -> str:
+    safe = _UNSAFE_PATH.sub("_", value)
+    if safe == value:
+        return value
+    # Sanitizing is lossy ("us/west" and "us_west" would share a name), so a
+    # changed value carries a hash of the original. "~" is itself unsafe, so
+    # an unchanged value can never look like a hashed one.
+    return f"{safe}~{hashlib.sha256(value.encode()).hexdigest()[:8]}"
+
+
+def partition_slug(partition: Mapping[str, str]) -> str:
+    """Readable, path-safe, collision-free name for one slice, e.g.
+    ``day=2024-01-01``."""
+    return ",".join(
+        f"{_slug_part(str(key))}={_slug_part(str(value))}"
+        for key, value in sorted(partition.items())
+    )
+
+
+def stream_partitions(
+    script: str,
+    args: str,
+    partitions: Sequence[Mapping[str, str]],
+    writer_for: Callable[[int, Mapping[str, str]], Callable[..., int]],
+    max_workers: int = DEFAULT_PARTITION_WORKERS,
+    max_attempts: int = MAX_ATTEMPTS,
+    rounds: int = MAX_PARTITION_ROUNDS,
+) -> dict[int, int]:
+    """Run ``script`` once per partition, up to ``max_workers`` at a time.
+
+    ``writer_for(index, partition)`` returns the ``stream_script`` writer for
+    one slice -- typically a ``ParquetStreamWriter`` on that slice's own
+    object, so a retried slice rewrites only itself. Each invocation retries
+    transient failures as ``stream_script`` does; partitions still failing
+    once the pool drains get ``rounds - 1`` further passes of their own.
+    Returns rows written per partition index, and raises
+    ``PartitionedDatasourceError`` if any partition never succeeded.
+    """
+
+    def one(index: int) -> int:
+        partition = partitions[index]
+        return stream_script(
+            script,
+            partition_args(args, partition),
+            writer_for(index, partition),
+            max_attempts=max_attempts,
+        )
+
+    rows: dict[int, int] = {}
+    pending = list(range(len(partitions)))
+    failures: dict[int, PythonDatasourceError] = {}
+    workers = max(1, min(max_workers, len(partitions)))
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="trilogy-partition"
+    ) as pool:
+        for _ in range(max(1, rounds)):
+            failures = {}
+            futures = {index: pool.submit(one, index) for index in pending}
+            for index, future in futures.items():
+                try:
+                    rows[index] = future.result()
+                except PythonDatasourceError as e:
+                    failures[index] = e
+            if not failures:
+                return rows
+            pending = sorted(failures)
+    raise PartitionedDatasourceError(script, failures, partitions, rows)
+
+
 @dataclass
 class ParquetStreamWriter:
     """A ``stream_script`` writer that streams batches out as parquet.
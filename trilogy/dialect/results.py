@@ -1,6 +1,6 @@
 from collections import namedtuple
 from collections.abc import Iterable, Iterator, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from itertools import islice
 from typing import Any
 
@@ -44,6 +44,8 @@ def streamed_rows(
     columns: Sequence[str],
     rows: Iterable[Sequence[Any]],
     name: str = "Row",
+    rowcount: int = -1,
+    bytes_scanned: int | None = None,
 ) -> "StreamedResult":
     """``buffered_rows`` for a driver whose cursor pages server-side.
 
@@ -53,9 +55,11 @@ def streamed_rows(
     (on commit, or when the connection runs the next statement) must buffer.
     """
     if not columns:
-        return StreamedResult([], iter(rows))
+        return StreamedResult([], iter(rows), rowcount, bytes_scanned)
     row_class = namedtuple_row_class(columns, name)
-    return StreamedResult(list(columns), (row_class(*row) for row in rows))
+    return StreamedResult(
+        list(columns), (row_class(*row) for row in rows), rowcount, bytes_scanned
+    )
 
 
 @dataclass
@@ -102,29 +106,46 @@ class MockResult(ResultProtocol):
 @dataclass
 class BufferedResult(ResultProtocol):
     """A result read fully into memory, so it outlives the cursor that produced
-    it. Rows are kept as the driver returned them."""
+    it. Rows are kept as the driver returned them.
+
+    Reads advance a cursor instead of popping the head of ``rows``, which is
+    quadratic over a large result; rows already read are dropped in bulk once
+    they make up half of the list, so a long read still releases memory as it
+    goes."""
 
     columns: list[str]
     rows: list[Any]
+    _offset: int = field(default=0, init=False, repr=False, compare=False)
+
+    def _take(self, size: int) -> list[Any]:
+        start = self._offset
+        taken = self.rows[start : start + size]
+        self._offset = start + len(taken)
+        if self._offset >= len(self.rows):
+            self.rows = []
+            self._offset = 0
+        elif self._offset * 2 >= len(self.rows):
+            del self.rows[: self._offset]
+            self._offset = 0
+        return taken
 
     def __iter__(self):
-        while self.rows:
-            yield self.rows.pop(0)
+        # one row per step, so a consumer that stops early leaves the rest
+        while taken := self._take(1):
+            yield taken[0]
 
     def fetchall(self):
-        rval = self.rows
+        rval = self.rows[self._offset :] if self._offset else self.rows
         self.rows = []
+        self._offset = 0
         return rval
 
     def fetchone(self):
-        if self.rows:
-            return self.rows.pop(0)
-        return None
+        taken = self._take(1)
+        return taken[0] if taken else None
 
     def fetchmany(self, size: int):
-        rval = self.rows[:size]
-        self.rows = self.rows[size:]
-        return rval
+        return self._take(size)
 
     def keys(self):
         return self.columns
@@ -140,6 +161,10 @@ class StreamedResult(ResultProtocol):
 
     columns: list[str]
     rows: Iterator[Any]
+    # as reported by the driver when the statement finished; -1 when unknown,
+    # like a DB-API cursor
+    rowcount: int = -1
+    bytes_scanned: int | None = None
 
     def __iter__(self):
         return self.rows
@@ -188,12 +213,79 @@ class MockResultRow:
         return self._values.keys()
 
 
+# set by warehouse-side downsampling: the layer's row count before reduction
+SOURCE_ROWS_COLUMN = "_trilogy_source_rows"
+
+
+class ChartColumns(Sequence[dict]):
+    """One chart layer's rows, held column by column.
+
+    Renderers that build a frame take ``columns`` as is; indexing and
+    iteration still give one dict per row, for row-oriented consumers.
+    ``source_rows`` is the row count before downsampling, when the layer
+    query was reduced in the warehouse."""
+
+    def __init__(self, columns: dict[str, list[Any]], source_rows: int | None = None):
+        self.columns = columns
+        self._length = len(next(iter(columns.values()), []))
+        self.source_rows = source_rows
+
+    @classmethod
+    def from_result(cls, result: ResultProtocol | None) -> "ChartColumns":
+        if result is None:
+            return cls({})
+        keys = [str(key) for key in result.keys()]  # noqa: SIM118
+        rows = result.fetchall()
+        if not rows:
+            columns: dict[str, list[Any]] = {key: [] for key in keys}
+        else:
+            columns = {key: list(values) for key, values in zip(keys, zip(*rows))}
+        source = columns.pop(SOURCE_ROWS_COLUMN, None)
+        return cls(columns, source_rows=source[0] if source else None)
+
+    @property
+    def downsampled(self) -> bool:
+        return self.source_rows is not None and self.source_rows > self._length
+
+    def project(self, names: Sequence[str]) -> "ChartColumns":
+        """Only the ``names`` columns; the column lists are shared, not copied."""
+        return ChartColumns(
+            {name: self.columns[name] for name in names if name in self.columns},
+            source_rows=self.source_rows,
+        )
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _row(self, idx: int) -> dict:
+        return {name: values[idx] for name, values in self.columns.items()}
+
+    def __getitem__(self, idx):  # type: ignore[override]
+        if isinstance(idx, slice):
+            return [self._row(i) for i in range(self._length)[idx]]
+        return self._row(range(self._length)[idx])
+
+    def __iter__(self) -> Iterator[dict]:
+        for idx in range(self._length):
+            yield self._row(idx)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ChartColumns):
+            return self.columns == other.columns
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ChartColumns({self.columns!r})"
+
+
 @dataclass
 class ChartResult(ResultProtocol):
     """Result type for chart statements that preserves data for re-rendering."""
 
     chart: Any
-    data: list[list[dict]]
+    data: Sequence[Sequence[dict]]
     statement: Any  # ProcessedChartStatement
 
     def __iter__(self):
@@ -77,6 +77,10 @@ class SqlServerDialect(BaseDialect):
     SQL_TEMPLATE = TSQL_TEMPLATE
     SUPPORTS_AGGREGATE_GROUPING_MODES = True
     SUPPORTS_ARRAYS = False
+    # temp tables are `SELECT ... INTO #name`, not CREATE ... AS
+    SUPPORTS_SESSION_TEMP_TABLES = False
+    # a derived table may hold neither a WITH clause nor an ORDER BY without TOP
+    SUPPORTS_DERIVED_TABLE_WRAPPING = False
     # Msg 208: `Invalid object name 'dbo.orders'.`
     TABLE_NOT_FOUND_PATTERN = r"Invalid object name"
     # Msg 207: `Invalid column name 'updated_at'.` Msg 4104 (multi-part
@@ -232,6 +232,7 @@ class SQLiteDialect(BaseDialect):
     SQL_TEMPLATE = SQLITE_SQL_TEMPLATE
     CREATE_TABLE_SQL_TEMPLATE = SQLITE_CREATE_TABLE_SQL_TEMPLATE
     SUPPORTS_ARRAYS = False
+    SUPPORTS_CONCURRENT_READS = False
     TABLE_NOT_FOUND_PATTERN = "no such table"
     COLUMN_NOT_FOUND_PATTERN = "no such column"
 
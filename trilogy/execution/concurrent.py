@@ -0,0 +1,61 @@
+"""Concurrent execution of independent read statements.
+
+A script's selects and charts that follow each other with no write between
+them do not depend on one another's data, but ``execute_text`` used to run
+them strictly in order on one connection. In concurrent mode they are
+dispatched to a small pool of extra connections. The dependency graph is
+deliberately coarse: every statement that can change data or the model is a
+barrier that waits for all reads before it and runs alone. That covers
+persists, raw SQL, creates, calls, publishes and mocks. Datasource and concept
+declarations are applied at parse time, before any statement runs, so they
+never need to wait.
+
+Only the SQL runs off-thread. Compiling a statement uses the dialect's
+render-time state, and hydrating bind parameters may itself query the main
+connection, so both happen on the calling thread before dispatch. Turning
+layer rows into a chart happens on the calling thread when the result is
+collected. Results come back buffered in statement order.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from trilogy.core.statements.execute import ProcessedChartStatement, ProcessedQuery
+from trilogy.engine import ResultProtocol
+
+if TYPE_CHECKING:
+    from trilogy.dialect.results import BufferedResult
+    from trilogy.executor import Executor
+
+ConcurrentRead = ProcessedQuery | ProcessedChartStatement
+
+
+def is_concurrent_read(statement: object) -> bool:
+    """Whether ``statement`` only reads through SQL and can run off-thread."""
+    return type(statement) is ProcessedQuery or isinstance(
+        statement, ProcessedChartStatement
+    )
+
+
+@dataclass
+class PendingRead:
+    """A read statement whose SQL is running on the executor's read pool;
+    one future per query (a chart has one per distinct layer query)."""
+
+    executor: Executor
+    statement: ConcurrentRead
+    futures: list[Future[BufferedResult]]
+
+    def wait(self) -> None:
+        """Block until the SQL has finished, without collecting the result;
+        errors surface from ``result``."""
+        wait(self.futures)
+
+    def result(self) -> ResultProtocol | None:
+        return self.executor.finish_read(
+            self.statement,
+            [future.result() for future in self.futures],
+        )
@@ -3,9 +3,8 @@ import re
 from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
-
 from tomllib import loads
+from typing import Any
 
 from trilogy.ai.enums import Provider
 from trilogy.constants import REMOTE_PREFIXES, logger
@@ -22,6 +21,7 @@ from trilogy.dialect import (
     SQLServerConfig,
 )
 from trilogy.dialect.enums import Dialects
+from trilogy.execution.cost import CostBudget
 from trilogy.staging import StagingConfig
 from trilogy.utility import safe_open
 
@@ -204,6 +204,9 @@ class RuntimeConfig:
     startup_trilogy: list[Path]
     startup_sql: list[Path]
     parallelism: int = DEFAULT_PARALLELISM
+    # max pooled connections per warehouse for commands that share them
+    # (trilogy.execution.connection_pool); None sizes the pool from parallelism
+    pool_size: int | None = None
     engine_dialect: Dialects | None = None
     engine_config: DialectConfig | None = None
     source_path: Path | None = None
@@ -219,6 +222,8 @@ class RuntimeConfig:
     import_paths: list[Path] = field(default_factory=list)
     # registry home for deployment environments (trilogy env ...); default ~/.trilogy
     environments_home: Path | None = None
+    # [cost]: dry-run estimates and byte budgets (trilogy.execution.cost)
+    cost: CostBudget | None = None
 
 
 # Schema of known fields. `[engine.config]` is intentionally omitted (validated
@@ -238,9 +243,10 @@ _KNOWN_TOP_LEVEL: set[str] = {
     "import_paths",
     "cloud",
     "environments",
+    "cost",
 }
 _KNOWN_SECTIONS: dict[str, set[str] | None] = {
-    "engine": {"dialect", "config", "env_file", "parallelism"},
+    "engine": {"dialect", "config", "env_file", "parallelism", "pool_size"},
     "engine.config": None,
     "setup": {"trilogy", "sql"},
     "staging": {"path"},
@@ -250,6 +256,7 @@ _KNOWN_SECTIONS: dict[str, set[str] | None] = {
     "project": {"name"},
     "report": {"theme"},
     "environments": {"home"},
+    "cost": {"dry_run", "max_statement_bytes", "max_run_bytes"},
     # Consumed by `trilogy cloud` (scripts/cloud.py), not by RuntimeConfig —
     # listed so the documented [cloud] section doesn't audit as unknown.
     # `api_url`/`org` say which environment to talk to; the rest are the
@@ -503,6 +510,9 @@ def load_config_file(
         )
     )
 
+    pool_size_raw = engine_raw.get("pool_size")
+    pool_size = int(pool_size_raw) if pool_size_raw is not None else None
+
     # Fallback roots for import resolution; relative entries resolve against
     # the toml's directory.
     import_paths_raw = config_data.get("import_paths", [])
@@ -520,10 +530,14 @@ def load_config_file(
         else None
     )
 
+    cost_raw: dict | None = config_data.get("cost")
+    cost = CostBudget.from_dict(cost_raw) if cost_raw else None
+
     return RuntimeConfig(
         startup_trilogy=[path.parent / p for p in setup.get("trilogy", [])],
         startup_sql=[path.parent / p for p in setup.get("sql", [])],
         parallelism=parallelism,
+        pool_size=pool_size,
         engine_dialect=engine,
         engine_config=engine_config,
         source_path=path,
@@ -536,4 +550,5 @@ def load_config_file(
         report_theme=report_theme,
         import_paths=import_paths,
         environments_home=environments_home,
+        cost=cost,
     )
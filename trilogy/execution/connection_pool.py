@@ -0,0 +1,332 @@
+"""Warehouse connections shared by every executor a command opens.
+
+A directory refresh builds an executor per script for each probe phase and
+again for each refresh, all on ``parallelism`` threads. Engines default to
+``NullPool``, so every one of them opens its own connection and closes it on
+the way out — hundreds of logins for a large project, and for DuckDB as many
+runs of the connect-time setup (extension loads, the ``uv_run`` macro).
+
+Inside :func:`shared_engine_scope`, executors built through
+``create_executor`` instead take their engine from one registry per process,
+keyed by the dialect config, so executors with the same connection settings
+check connections in and out of the same SQLAlchemy ``QueuePool``:
+
+- at most ``max_size`` connections per config; a checkout beyond that waits up
+  to ``timeout`` seconds for one to come back, then fails;
+- each checkout is pre-pinged, and a connection that fails the ping is
+  replaced (which also clears its setup record, below);
+- setup that only has to happen once per connection is recorded on the
+  physical connection (``Executor._connection_setup``) and skipped on reuse;
+- a DuckDB connection is scrubbed on checkin, so no executor sees another's
+  session: temp tables, views, sequences and macros are dropped, variables
+  are reset, and settings are put back to their values at connect, except
+  the variables and settings connect-time setup itself established. A
+  session that changed one of those is reset all the way and its setup
+  record cleared, so the next executor runs setup again; a connection that
+  cannot be put back is discarded.
+
+Executors treat the shared engine as their own: closing one returns its
+connection to the pool and leaves the engine open. The scope disposes every
+engine it created on exit. In-memory databases are never shared — each
+connection to one is a separate, empty database — and engines that are not
+SQLAlchemy (native BigQuery, chdb) are built as before.
+
+Like the run-cost scope, the active registry is a plain module global: the
+executors are created on worker threads the command did not start.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from trilogy.constants import CONFIG, logger
+from trilogy.dialect.config import DialectConfig, DuckDBConfig
+from trilogy.dialect.enums import default_factory
+
+# Seconds a checkout waits for a connection when the pool is at its limit.
+POOL_TIMEOUT_SECONDS = 30.0
+# connection.info entry recording which connect-time setup already ran
+CONNECTION_SETUP_KEY = "trilogy_setup"
+# connection.info entry holding a DuckDB connection's settings at connect
+_SETTINGS_KEY = "trilogy_settings"
+# connection.info entry holding the settings and variables connect-time setup
+# established on top of those, which a checkin reset keeps
+_SETUP_STATE_KEY = "trilogy_setup_state"
+# Per-instance identity, not connection settings.
+_UNKEYED_ATTRIBUTES = {"guid"}
+_IN_MEMORY_BACKENDS = {"duckdb", "sqlite"}
+
+_ACTIVE_POOL: EnginePool | None = None
+
+
+def default_pool_size(parallelism: int) -> int:
+    """One connection per worker, plus each worker's concurrent readers."""
+    return max(parallelism, 1) * (1 + CONFIG.execution.statement_concurrency)
+
+
+def pool_key(conf: DialectConfig) -> tuple:
+    """Identity of a config's connection settings; two configs with the same
+    key can share connections."""
+    settings = tuple(
+        sorted(
+            (name, repr(value))
+            for name, value in vars(conf).items()
+            if name not in _UNKEYED_ATTRIBUTES
+        )
+    )
+    return (type(conf).__qualname__, conf.connection_string(), settings)
+
+
+def is_shareable(conf: DialectConfig) -> bool:
+    from sqlalchemy.engine import make_url
+
+    url = make_url(conf.connection_string())
+    return not (
+        url.get_backend_name() in _IN_MEMORY_BACKENDS
+        and url.database in (None, "", ":memory:")
+    )
+
+
+def _duckdb_rows(cursor: Any, sql: str) -> list[tuple]:
+    cursor.execute(sql)
+    return cursor.fetchall()
+
+
+def _duckdb_settings(cursor: Any) -> dict[str, Any]:
+    return dict(_duckdb_rows(cursor, "SELECT name, value FROM duckdb_settings()"))
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _duckdb_variables(cursor: Any) -> dict[str, str]:
+    return dict(
+        _duckdb_rows(
+            cursor, "SELECT name, CAST(value AS VARCHAR) FROM duckdb_variables()"
+        )
+    )
+
+
+def _duckdb_session_reset(cursor: Any, keep: dict[str, str]) -> list[str]:
+    """Statements that drop a DuckDB session's temp objects and variables,
+    except variables still holding the value ``keep`` gives them."""
+    statements = [
+        f"DROP TABLE IF EXISTS temp.main.{_quote(name)}"
+        for (name,) in _duckdb_rows(
+            cursor, "SELECT table_name FROM duckdb_tables() WHERE temporary"
+        )
+    ]
+    statements += [
+        f"DROP VIEW IF EXISTS temp.main.{_quote(name)}"
+        for (name,) in _duckdb_rows(
+            cursor,
+            "SELECT view_name FROM duckdb_views() WHERE temporary AND NOT internal",
+        )
+    ]
+    statements += [
+        f"DROP SEQUENCE IF EXISTS temp.main.{_quote(name)}"
+        for (name,) in _duckdb_rows(
+            cursor, "SELECT sequence_name FROM duckdb_sequences() WHERE temporary"
+        )
+    ]
+    statements += [
+        f"DROP MACRO {'TABLE ' if kind == 'table_macro' else ''}"
+        f"IF EXISTS temp.main.{_quote(name)}"
+        for name, kind in _duckdb_rows(
+            cursor,
+            "SELECT DISTINCT function_name, function_type FROM duckdb_functions() "
+            "WHERE database_name = 'temp' AND NOT internal "
+            "AND function_type IN ('macro', 'table_macro')",
+        )
+    ]
+    statements += [
+        f"RESET VARIABLE {_quote(name)}"
+        for name, value in _duckdb_variables(cursor).items()
+        if name not in keep or keep[name] != value
+    ]
+    return statements
+
+
+def _record_duckdb_settings(dbapi_connection: Any, connection_record: Any) -> None:
+    """Pool ``connect`` hook: remember the settings a session starts with."""
+    cursor = dbapi_connection.cursor()
+    try:
+        connection_record.info[_SETTINGS_KEY] = _duckdb_settings(cursor)
+    finally:
+        cursor.close()
+
+
+def record_setup_state(connection: Any) -> None:
+    """After connect-time setup on a pooled DuckDB ``connection``: remember
+    the settings and variables it established, so checkin resets keep them
+    and the setup is not rerun for every executor."""
+    info = getattr(connection, "info", None)
+    if not isinstance(info, dict) or info.get(_SETTINGS_KEY) is None:
+        return
+    baseline = info[_SETTINGS_KEY]
+    cursor = connection.connection.dbapi_connection.cursor()
+    try:
+        settings = {
+            name: value
+            for name, value in _duckdb_settings(cursor).items()
+            if baseline.get(name, value) != value
+        }
+        info[_SETUP_STATE_KEY] = (settings, _duckdb_variables(cursor))
+    finally:
+        cursor.close()
+
+
+def _reset_duckdb_session(dbapi_connection: Any, connection_record: Any) -> None:
+    """Pool ``checkin`` hook: put a DuckDB session back the way connect-time
+    setup left it, so the next executor to check it out sees none of this
+    one's state. If the session changed something setup established, the
+    session goes all the way back to how it connected and setup runs again."""
+    if dbapi_connection is None:
+        return
+    baseline = connection_record.info.get(_SETTINGS_KEY)
+    setup_settings, setup_variables = connection_record.info.get(
+        _SETUP_STATE_KEY, ({}, {})
+    )
+    try:
+        cursor = dbapi_connection.cursor()
+        try:
+            settings = _duckdb_settings(cursor)
+            variables = _duckdb_variables(cursor)
+            keep_setup = all(
+                settings.get(name) == value for name, value in setup_settings.items()
+            ) and all(
+                variables.get(name) == value for name, value in setup_variables.items()
+            )
+            if not keep_setup:
+                setup_settings, setup_variables = {}, {}
+            statements = _duckdb_session_reset(cursor, keep=setup_variables)
+            if baseline is not None:
+                target = {**baseline, **setup_settings}
+                statements += [
+                    f"RESET {_quote(name)}"
+                    for name, value in settings.items()
+                    if target.get(name, value) != value
+                ]
+            for statement in statements:
+                cursor.execute(statement)
+            if baseline is not None and any(
+                target.get(name, value) != value
+                for name, value in _duckdb_settings(cursor).items()
+            ):
+                raise ValueError("settings could not be reset to their defaults")
+        finally:
+            cursor.close()
+    except Exception as e:
+        # discard rather than hand out a session we could not clean
+        logger.debug(f"Discarding pooled DuckDB connection: {e}")
+        connection_record.invalidate(e)
+        return
+    if not keep_setup:
+        # the reset undid what connect-time setup established
+        connection_record.info.pop(CONNECTION_SETUP_KEY, None)
+        connection_record.info.pop(_SETUP_STATE_KEY, None)
+
+
+class SharedEngine:
+    """A pooled engine handed to many executors.
+
+    ``dispose`` is a no-op: an executor closing only gives its connection back,
+    and the scope that created the engine closes the pool."""
+
+    def __init__(self, engine: Any) -> None:
+        self.engine = engine
+
+    def connect(self) -> Any:
+        return self.engine.connect()
+
+    def dispose(self, close: bool = True) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.engine, name)
+
+
+class EnginePool:
+    """Process-wide registry of pooled engines, one per connection config."""
+
+    def __init__(self, max_size: int, timeout: float = POOL_TIMEOUT_SECONDS) -> None:
+        self.max_size = max(max_size, 1)
+        self.timeout = timeout
+        self._engines: dict[tuple, SharedEngine] = {}
+        self._lock = threading.Lock()
+
+    def engine(self, conf: DialectConfig, config_type: type) -> SharedEngine:
+        from sqlalchemy import event
+        from sqlalchemy.pool import QueuePool
+
+        key = pool_key(conf)
+        with self._lock:
+            shared = self._engines.get(key)
+            if shared is None:
+                engine = default_factory(
+                    conf,
+                    config_type,
+                    pool_args={
+                        "poolclass": QueuePool,
+                        "pool_size": self.max_size,
+                        "max_overflow": 0,
+                        "pool_timeout": self.timeout,
+                        "pool_pre_ping": True,
+                    },
+                )
+                if isinstance(conf, DuckDBConfig):
+                    event.listen(engine, "connect", _record_duckdb_settings)
+                    event.listen(engine, "checkin", _reset_duckdb_session)
+                shared = SharedEngine(engine)
+                self._engines[key] = shared
+                logger.debug(
+                    f"Pooling up to {self.max_size} connection(s) to "
+                    f"{type(conf).__name__}"
+                )
+            return shared
+
+    def dispose(self) -> None:
+        with self._lock:
+            engines, self._engines = list(self._engines.values()), {}
+        for shared in engines:
+            try:
+                shared.engine.dispose()
+            except Exception as e:
+                logger.debug(f"Failed to dispose pooled engine: {e}")
+
+
+def active_engine_pool() -> EnginePool | None:
+    return _ACTIVE_POOL
+
+
+def shared_engine_factory(conf: DialectConfig, config_type: type) -> Any:
+    """``Dialects.default_engine`` factory: the active scope's pooled engine
+    for ``conf``, or a private one when there is no scope or it cannot be
+    shared."""
+    pool = _ACTIVE_POOL
+    if pool is None or not is_shareable(conf):
+        return default_factory(conf, config_type)
+    return pool.engine(conf, config_type)
+
+
+@contextmanager
+def shared_engine_scope(
+    max_size: int, timeout: float = POOL_TIMEOUT_SECONDS
+) -> Iterator[EnginePool]:
+    """Share pooled connections across every executor created inside the
+    block. A nested scope joins the outer one, keeping its size."""
+    global _ACTIVE_POOL
+    if _ACTIVE_POOL is not None:
+        yield _ACTIVE_POOL
+        return
+    pool = EnginePool(max_size, timeout)
+    _ACTIVE_POOL = pool
+    try:
+        yield pool
+    finally:
+        _ACTIVE_POOL = None
+        pool.dispose()
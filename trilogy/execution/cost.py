@@ -0,0 +1,276 @@
+"""Dry-run cost estimates and byte budgets for billed warehouses.
+
+A model change that drops a partition filter still compiles and still runs —
+it just scans the whole table. Warehouses that bill by bytes scanned can say
+what a statement will read before it runs: BigQuery through a dry-run job,
+Snowflake through ``EXPLAIN``. With a ``[cost]`` section in trilogy.toml the
+executor asks before every statement, records the estimate in the run report
+(``statement_cost``) and refuses a statement whose estimate, or the run total
+it would bring, is over budget.
+
+```toml
+[cost]
+dry_run = true                  # record estimates without enforcing a budget
+max_statement_bytes = "50 GB"
+max_run_bytes = "1 TB"
+```
+
+Run totals are shared across every executor a command creates (a directory
+run opens one per script) through :func:`run_cost_scope`, which every CLI
+command enters with its ``report_run``. It is a plain module global for the
+same reason as the report sink: work happens on threads the CLI entrypoint did
+not start.
+
+Engines with no estimate reject the section rather than ignore it, as a query
+timeout does on a driver that cannot cancel. An estimate the engine declines to
+give for one statement (Snowflake cannot ``EXPLAIN`` DDL) is recorded as
+unknown and does not block it.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from trilogy.constants import logger
+from trilogy.core.exceptions import CostBudgetExceededException
+from trilogy.execution.report import emit_report
+
+if TYPE_CHECKING:
+    from trilogy.dialect.enums import Dialects
+    from trilogy.engine import EngineConnection
+
+LOGGER_PREFIX = "[COST]"
+
+# (sql, bind parameters) -> estimated bytes, or None when unknown
+Estimator = Callable[[str, "dict | None"], "int | None"]
+
+_SIZE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*((?:[kmgtp]i?)?b?)\s*$", re.IGNORECASE)
+_UNITS = {"": 1, "b": 1}
+for _power, _prefix in enumerate("kmgtp", start=1):
+    _UNITS[f"{_prefix}b"] = _UNITS[_prefix] = 1000**_power
+    _UNITS[f"{_prefix}ib"] = _UNITS[f"{_prefix}i"] = 1024**_power
+
+
+def parse_byte_size(value: int | str) -> int:
+    """``1073741824``, ``"50 GB"`` or ``"1.5TiB"`` as a byte count."""
+    if isinstance(value, int):
+        return value
+    match = _SIZE.match(value)
+    if not match:
+        raise ValueError(
+            f"Invalid byte size {value!r}; use a number of bytes or a size such "
+            "as '50 GB' or '1 TiB'."
+        )
+    number, unit = match.groups()
+    return int(float(number) * _UNITS[unit.lower()])
+
+
+def format_bytes(value: int | None) -> str:
+    if value is None:
+        return "unknown"
+    size = float(value)
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if size < 1000 or unit == "TB":
+            return f"{size:,.0f} {unit}" if unit == "B" else f"{size:,.2f} {unit}"
+        size /= 1000
+    raise AssertionError("unreachable")
+
+
+@dataclass(frozen=True)
+class CostBudget:
+    """The ``[cost]`` section of trilogy.toml."""
+
+    # Estimate every statement even with no budget to enforce.
+    dry_run: bool = False
+    max_statement_bytes: int | None = None
+    max_run_bytes: int | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            self.dry_run
+            or self.max_statement_bytes is not None
+            or self.max_run_bytes is not None
+        )
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any]) -> CostBudget:
+        def size(key: str) -> int | None:
+            value = raw.get(key)
+            return None if value is None else parse_byte_size(value)
+
+        return cls(
+            dry_run=bool(raw.get("dry_run", False)),
+            max_statement_bytes=size("max_statement_bytes"),
+            max_run_bytes=size("max_run_bytes"),
+        )
+
+
+@dataclass
+class StatementCost:
+    """One statement's estimate; ``estimated_bytes`` is None when unknown."""
+
+    sql: str
+    estimated_bytes: int | None
+    error: str | None = None
+
+    @property
+    def label(self) -> str:
+        return " ".join(self.sql.split())[:80]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "sql": self.label,
+            "estimated_bytes": self.estimated_bytes,
+            "error": self.error,
+        }
+
+
+@dataclass
+class RunCost:
+    """Estimates of every statement a run has let through, in order."""
+
+    statements: list[StatementCost] = field(default_factory=list)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(cost.estimated_bytes or 0 for cost in self.statements)
+
+    def admit(self, cost: StatementCost, budget: CostBudget) -> int:
+        """Add ``cost`` to the run if the budget allows it; returns the new run
+        total. Checked and added under one lock, so concurrent scripts cannot
+        each squeeze under the run budget together."""
+        estimated = cost.estimated_bytes
+        with self._lock:
+            total = self.total_bytes
+            if estimated is not None:
+                limit = budget.max_statement_bytes
+                if limit is not None and estimated > limit:
+                    raise CostBudgetExceededException(estimated, limit, "statement")
+                limit = budget.max_run_bytes
+                if limit is not None and total + estimated > limit:
+                    raise CostBudgetExceededException(
+                        estimated, limit, "run", run_bytes=total
+                    )
+            self.statements.append(cost)
+            return self.total_bytes
+
+
+_ACTIVE_RUN: RunCost | None = None
+
+
+def active_run_cost() -> RunCost | None:
+    return _ACTIVE_RUN
+
+
+@contextmanager
+def run_cost_scope() -> Iterator[RunCost]:
+    """Share one run total across every executor created inside the block."""
+    global _ACTIVE_RUN
+    previous = _ACTIVE_RUN
+    run = RunCost()
+    _ACTIVE_RUN = run
+    try:
+        yield run
+    finally:
+        _ACTIVE_RUN = previous
+
+
+def _bigquery_estimator(connection: EngineConnection) -> Estimator | None:
+    from trilogy.dialect.bigquery_engine import BigQueryConnection
+
+    if not isinstance(connection, BigQueryConnection):
+        return None
+
+    def estimate(sql: str, params: dict | None) -> int | None:
+        from sqlalchemy import text
+
+        return connection.estimate_bytes(text(sql), params)
+
+    return estimate
+
+
+def _snowflake_estimator(
+    connection: EngineConnection, dialect: Dialects
+) -> Estimator | None:
+    from trilogy.dialect.enums import Dialects
+
+    if dialect != Dialects.SNOWFLAKE:
+        return None
+
+    def estimate(sql: str, params: dict | None) -> int | None:
+        from sqlalchemy import text
+
+        try:
+            statement = text(f"EXPLAIN USING JSON {sql}")
+            result = (
+                connection.execute(statement, params)
+                if params
+                else connection.execute(statement)
+            )
+            plan = json.loads(result.fetchall()[0][0])
+            return int(plan["GlobalStats"]["bytesAssigned"])
+        except Exception as e:
+            # EXPLAIN covers queries and DML only; anything else is unknown
+            logger.debug("%s no estimate for statement: %s", LOGGER_PREFIX, e)
+            return None
+
+    return estimate
+
+
+def resolve_cost_estimator(
+    connection: EngineConnection, dialect: Dialects
+) -> Estimator | None:
+    """How to estimate a statement's bytes scanned on ``connection``."""
+    return _bigquery_estimator(connection) or _snowflake_estimator(connection, dialect)
+
+
+def estimate_statement(
+    estimator: Estimator, sql: str, params: dict | None
+) -> StatementCost:
+    try:
+        return StatementCost(sql, estimator(sql, params))
+    except Exception as e:
+        return StatementCost(sql, None, error=str(e))
+
+
+def check_statement(
+    estimator: Estimator,
+    sql: str,
+    params: dict | None,
+    budget: CostBudget,
+    run: RunCost,
+) -> StatementCost:
+    """Estimate a statement about to run and admit it against the budget.
+
+    A dry run that fails is not swallowed: BigQuery rejects an invalid
+    statement at dry-run time with the error the real run would raise."""
+    cost = StatementCost(sql, estimator(sql, params))
+    try:
+        total = run.admit(cost, budget)
+    except CostBudgetExceededException as e:
+        emit_report(
+            "statement_cost",
+            sql_bytes=len(sql),
+            estimated_bytes=cost.estimated_bytes,
+            run_estimated_bytes=run.total_bytes,
+            refused=True,
+            error=str(e),
+        )
+        raise
+    emit_report(
+        "statement_cost",
+        sql_bytes=len(sql),
+        estimated_bytes=cost.estimated_bytes,
+        run_estimated_bytes=total,
+    )
+    return cost
@@ -0,0 +1,196 @@
+"""Warehouse-side downsampling of large line and area chart layers.
+
+A line over a multi-million row series ships every row to the renderer, which
+either runs out of memory or emits a Vega spec hundreds of megabytes large,
+while the chart is only ever a few hundred pixels wide. When a layer query
+feeds only line/area layers on a continuous x axis, its SQL can be wrapped so
+the warehouse splits each series into one bucket per horizontal pixel of the
+chart and keeps, per bucket, the first and last point and the extreme points
+of every y field (M4 aggregation). That is the pixel-exact analogue of
+largest-triangle-three-buckets: the line drawn from the kept points covers the
+same pixels as the full series, and it needs only window functions.
+
+Buckets are equal spans of x, ``floor((x - min) / (max - min) * width)`` per
+series, so each one is the slice of the axis a pixel column covers; temporal
+x is measured in seconds (days for dates) from the series' first point.
+Series no longer than ``POINTS_PER_BUCKET`` rows per bucket are returned as
+is, since reduction could not shrink them. NULL y values are never picked as
+a bucket's extreme; they draw no point, so a gap in the line would otherwise
+cost the bucket its real minimum or maximum. The layer's own ORDER BY is
+kept. Every row also carries the layer's row count before reduction, so the
+renderer can say that it happened.
+
+On by default for line and area layers past the threshold; set
+``CONFIG.execution.downsample_charts`` to False to keep every row.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from trilogy.core.enums import ChartType, FunctionType, Ordering
+from trilogy.core.models.core import DataType
+from trilogy.core.statements.execute import ProcessedChartStatement, ProcessedQuery
+from trilogy.dialect.results import SOURCE_ROWS_COLUMN
+from trilogy.rendering.rich_types import is_numeric
+
+if TYPE_CHECKING:
+    from trilogy.dialect.base import BaseDialect
+
+DOWNSAMPLED_TYPES = frozenset({ChartType.LINE, ChartType.AREA})
+# M4 keeps at most four rows (first, last, lowest, highest) per bucket
+POINTS_PER_BUCKET = 4
+_TEMPORAL_TYPES = {DataType.DATE, DataType.DATETIME, DataType.TIMESTAMP}
+
+
+@dataclass
+class DownsamplePlan:
+    """How to reduce one layer query: the x field to bucket along, the y
+    fields whose extremes survive, the fields that split series, and the
+    layer's own ordering."""
+
+    x: str
+    ys: list[str]
+    buckets: int
+    series: list[str] = field(default_factory=list)
+    order: list[tuple[str, Ordering]] = field(default_factory=list)
+    # date part temporal x is measured in; None for numeric x
+    x_unit: str | None = None
+
+    @property
+    def threshold(self) -> int:
+        """Series with at most this many rows are left alone."""
+        return self.buckets * POINTS_PER_BUCKET
+
+
+def _continuous(datatype: object) -> bool:
+    base = getattr(datatype, "data_type", datatype)
+    return is_numeric(datatype) or base in _TEMPORAL_TYPES
+
+
+def plan_downsample(
+    statement: ProcessedChartStatement,
+    query: ProcessedQuery,
+    buckets: int,
+) -> DownsamplePlan | None:
+    """A plan for ``query`` when every layer reading it is a line or area
+    over the same continuous x with numeric y, else None. ``buckets`` is the
+    width, in pixels, the chart is drawn at."""
+    layers = [layer for layer in statement.layers if layer.query is query]
+    if not layers or any(
+        layer.layer_type not in DOWNSAMPLED_TYPES
+        or len(layer.x_fields) != 1
+        or len(layer.y_fields) != 1
+        for layer in layers
+    ):
+        return None
+    datatypes = {
+        column.safe_address: column.datatype for column in query.output_columns
+    }
+    x = layers[0].x_fields[0]
+    if any(layer.x_fields[0] != x for layer in layers) or not _continuous(
+        datatypes.get(x)
+    ):
+        return None
+    ys: list[str] = []
+    series: list[str] = []
+    for layer in layers:
+        y = layer.y_fields[0]
+        if not is_numeric(datatypes.get(y)):
+            return None
+        if y not in ys:
+            ys.append(y)
+        for split in (
+            layer.color_field,
+            layer.group_field,
+            layer.x_trellis_field,
+            layer.y_trellis_field,
+        ):
+            if split is not None and split not in series and split not in ys:
+                series.append(split)
+    columns = {column.address: column.safe_address for column in query.output_columns}
+    order: list[tuple[str, Ordering]] = []
+    for item in query.order_by.items if query.order_by else []:
+        name = columns.get(getattr(item.expr, "address", ""))
+        if name is None:
+            # ordered by an expression the wrapper cannot reference
+            return None
+        order.append((name, item.order))
+    x_base = getattr(datatypes[x], "data_type", datatypes[x])
+    x_unit = (
+        "day"
+        if x_base == DataType.DATE
+        else "second" if x_base in _TEMPORAL_TYPES else None
+    )
+    return DownsamplePlan(
+        x=x, ys=ys, buckets=buckets, series=series, order=order, x_unit=x_unit
+    )
+
+
+def render_downsample(
+    sql: str, query: ProcessedQuery, plan: DownsamplePlan, dialect: BaseDialect
+) -> str:
+    """Wrap a layer query's ``sql`` so the warehouse returns the reduced rows."""
+    quote = dialect.quote
+    columns = [
+        quote(column.safe_address)
+        for column in query.output_columns
+        if column.address not in query.hidden_columns
+    ]
+    x = quote(plan.x)
+    partition = ", ".join(quote(name) for name in plan.series)
+    series = f"PARTITION BY {partition} " if partition else ""
+    bucket = f"PARTITION BY {partition + ', ' if partition else ''}_bucket"
+    ranks = [
+        f"ROW_NUMBER() OVER ({bucket} ORDER BY {x} ASC) AS _first",
+        f"ROW_NUMBER() OVER ({bucket} ORDER BY {x} DESC) AS _last",
+    ]
+    keep = ["_first = 1", "_last = 1"]
+    for idx, y in enumerate(plan.ys):
+        # NULLs rank after every value in both directions (dialects disagree
+        # on where DESC puts them), so they only win an all-NULL bucket
+        nulls_last = f"CASE WHEN {quote(y)} IS NULL THEN 1 ELSE 0 END"
+        ranks.append(
+            f"ROW_NUMBER() OVER ({bucket} ORDER BY {nulls_last}, {quote(y)} ASC)"
+            f" AS _low_{idx}"
+        )
+        ranks.append(
+            f"ROW_NUMBER() OVER ({bucket} ORDER BY {nulls_last}, {quote(y)} DESC)"
+            f" AS _high_{idx}"
+        )
+        keep.extend([f"_low_{idx} = 1", f"_high_{idx} = 1"])
+    if plan.x_unit is None:
+        offset, span = f"{x} - _x_min", "_x_max - _x_min"
+    else:
+        date_diff = dialect.FUNCTION_MAP[FunctionType.DATE_DIFF]
+        offset = date_diff(["_x_min", x, plan.x_unit], [])
+        span = date_diff(["_x_min", "_x_max", plan.x_unit], [])
+    floor = dialect.FUNCTION_MAP[FunctionType.FLOOR]
+    pixel = floor([f"1.0 * ({offset}) / ({span}) * {plan.buckets}"], [])
+    if plan.order:
+        ordering = ", ".join(
+            dialect.render_ordering(quote(name), direction)
+            for name, direction in plan.order
+        )
+    else:
+        ordering = f"{partition + ', ' if partition else ''}{x}"
+    inner = sql.strip().rstrip(";")
+    return (
+        f"SELECT {', '.join(columns)}, _total AS {quote(SOURCE_ROWS_COLUMN)}\n"
+        "FROM (\n"
+        f"SELECT *, {', '.join(ranks)}\n"
+        "FROM (\n"
+        f"SELECT *, CASE WHEN _x_max = _x_min THEN 0 ELSE {pixel} END AS _bucket\n"
+        "FROM (\n"
+        f"SELECT *, COUNT(*) OVER () AS _total, "
+        f"COUNT(*) OVER ({series.strip()}) AS _series_rows, "
+        f"MIN({x}) OVER ({series.strip()}) AS _x_min, "
+        f"MAX({x}) OVER ({series.strip()}) AS _x_max\n"
+        f"FROM (\n{inner}\n) AS _layer\n"
+        ") AS _spanned\n"
+        ") AS _bucketed\n"
+        ") AS _ranked\n"
+        f"WHERE _series_rows <= {plan.threshold} OR {' OR '.join(keep)}\n"
+        f"ORDER BY {ordering}"
+    )
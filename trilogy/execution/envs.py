@@ -430,5 +430,6 @@ def apply_env_to_environment(
     Used where parsing bypasses the Executor (the directory probe's
     lightweight phase-1 parse)."""
     working_dir = Path(environment.working_path)
-    for ds in environment.datasources.values():
-        activation.transform(ds, working_dir=working_dir)
+    datasources = environment.datasources
+    for key in list(datasources.keys()):
+        activation.transform(datasources.edit(key), working_dir=working_dir)
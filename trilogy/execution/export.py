@@ -0,0 +1,167 @@
+"""Stream a query result out to a file through the ``trilogy.io`` sinks.
+
+Engines without a native ``COPY ... TO`` (everything but DuckDB) export by
+reading the result back. Rows are pulled with ``fetchmany`` a batch at a time,
+turned into Arrow record batches and written as they arrive, so an export
+holds one batch in memory however many rows it writes.
+
+The file schema is fixed before the first batch is written, so it is taken
+from the types the statement declares for its outputs, not from the data.
+Only columns with no declared Arrow type (arrays, structs, maps) are inferred,
+from up to ``TYPE_LOOKAHEAD_BATCHES`` batches unified with Arrow's permissive
+promotion (``decimal(2, 1)`` and ``decimal(6, 3)`` widen to ``decimal(6, 3)``,
+int and float to double); a column still null throughout is written as
+string. A batch whose values are of a neighbouring type (a ``Decimal`` for an
+integer sum) is converted to the schema type; one that cannot be is an error
+naming the column.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import TYPE_CHECKING, Any
+
+from trilogy.core.enums import IOType
+from trilogy.engine import ResultProtocol
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# rows per fetchmany call and per written record batch
+EXPORT_BATCH_ROWS = 50_000
+# batches read ahead, at most, to infer the types of undeclared columns
+TYPE_LOOKAHEAD_BATCHES = 4
+
+
+def _sink_format(io_type: IOType) -> Any:
+    from trilogy.io.sinks import Format
+
+    formats = {
+        IOType.CSV: Format.CSV,
+        IOType.JSON: Format.JSON,
+        IOType.PARQUET: Format.PARQUET,
+    }
+    if io_type not in formats:
+        raise NotImplementedError(f"Unsupported IO Type {io_type}")
+    return formats[io_type]
+
+
+def result_batches(
+    result: ResultProtocol, batch_rows: int = EXPORT_BATCH_ROWS
+) -> Iterator[list[Any]]:
+    """Non-empty lists of rows, read from ``result`` ``batch_rows`` at a time."""
+    while rows := result.fetchmany(batch_rows):
+        yield rows
+
+
+def _inferred_type(name: str, batches: list[list[Any]], index: int) -> pa.DataType:
+    import pyarrow as pa
+
+    observed = [
+        pa.schema([pa.field(name, pa.array([row[index] for row in rows]).type)])
+        for rows in batches
+    ]
+    if not observed:
+        return pa.string()
+    unified = pa.unify_schemas(observed, promote_options="permissive").field(name)
+    return pa.string() if pa.types.is_null(unified.type) else unified.type
+
+
+def _schema(
+    columns: list[str], batches: list[list[Any]], declared: Mapping[str, pa.DataType]
+) -> pa.Schema:
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            pa.field(
+                name,
+                (
+                    declared[name]
+                    if name in declared
+                    else _inferred_type(name, batches, index)
+                ),
+            )
+            for index, name in enumerate(columns)
+        ]
+    )
+
+
+def _column(values: list[Any], field: pa.Field) -> pa.Array:
+    import pyarrow as pa
+
+    try:
+        return pa.array(values, type=field.type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        pass
+    try:
+        return pa.array(values).cast(field.type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        raise ValueError(
+            f"Cannot export column '{field.name}' as {field.type}: {e}"
+        ) from e
+
+
+def _record_batch(rows: list[Any], schema: pa.Schema) -> pa.RecordBatch:
+    import pyarrow as pa
+
+    return pa.RecordBatch.from_arrays(
+        [
+            _column([row[index] for row in rows], field)
+            for index, field in enumerate(schema)
+        ],
+        schema=schema,
+    )
+
+
+def result_reader(
+    result: ResultProtocol,
+    declared: Mapping[str, pa.DataType] | None = None,
+    batch_rows: int = EXPORT_BATCH_ROWS,
+) -> pa.RecordBatchReader:
+    """An Arrow stream over ``result``, pulled lazily as the reader is read.
+
+    ``declared`` maps column names to their Arrow type; other columns are
+    inferred from the first few batches."""
+    import pyarrow as pa
+
+    declared = declared or {}
+    columns = list(map(str, result.keys()))
+    batches = result_batches(result, batch_rows)
+    ahead: list[list[Any]] = []
+    if any(name not in declared for name in columns):
+        # read ahead until every undeclared column has shown a non-null value
+        for rows in batches:
+            ahead.append(rows)
+            if len(ahead) >= TYPE_LOOKAHEAD_BATCHES or all(
+                name in declared
+                or any(row[index] is not None for batch in ahead for row in batch)
+                for index, name in enumerate(columns)
+            ):
+                break
+    schema = _schema(columns, ahead, declared)
+
+    def stream() -> Iterator[pa.RecordBatch]:
+        for rows in ahead:
+            yield _record_batch(rows, schema)
+        for rows in batches:
+            yield _record_batch(rows, schema)
+
+    return pa.RecordBatchReader.from_batches(schema, stream())
+
+
+def export_result(
+    result: ResultProtocol,
+    io_type: IOType,
+    target: str,
+    declared: Mapping[str, pa.DataType] | None = None,
+    batch_rows: int = EXPORT_BATCH_ROWS,
+) -> int:
+    """Write ``result`` to ``target`` as ``io_type``; returns the rows written.
+
+    CSV gets a header row, JSON is newline-delimited, and ``target`` may be a
+    local path or a ``gs://`` / ``s3://`` URI."""
+    from trilogy.io.sinks import write
+
+    fmt = _sink_format(io_type)
+    return write(result_reader(result, declared, batch_rows), fmt, target)
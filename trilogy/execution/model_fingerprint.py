@@ -15,13 +15,22 @@ Scripts are parsed lightweight (no executor, engine, or startup scripts) —
 fingerprinting never needs a database. Fingerprints are env-invariant (see
 ``trilogy.core.fingerprint``), so a transformed executor environment and an
 unscoped parse of the same code produce the same manifest.
+
+Parsing dominates, so script fingerprints are cached (``FingerprintCache``)
+under a key over the script's source and the source of every file it imports:
+an edit re-fingerprints only the scripts whose import closure contains the
+edited file, and the rest of the manifest is read back from the cache.
 """
 
+import hashlib
+import json
+import os
 from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+from trilogy.constants import logger
 from trilogy.core.fingerprint import (
     FINGERPRINT_VERSION,
     ChangeKind,
@@ -35,6 +44,9 @@ from trilogy.core.fingerprint import (
 from trilogy.core.models.environment import Environment
 from trilogy.execution.envs import EnvironmentManager
 
+#: Relative to the project root, beside serve's ``.trilogy/state``.
+CACHE_SUBPATH = Path(".trilogy") / "fingerprints.json"
+
 
 class ProjectFingerprint(BaseModel):
     fingerprint_version: int = FINGERPRINT_VERSION
@@ -111,14 +123,130 @@ def fingerprint_script(
     return build_environment_fingerprint(parsed, extra_datasources=persists)
 
 
+def _import_closure(path: Path) -> list[Path]:
+    """``path`` and every file it imports, transitively, in a stable order."""
+    from _preql_import_resolver import PyImportResolver
+
+    from trilogy.scripts.dependency import normalize_path_variants
+
+    root = normalize_path_variants(path.resolve())
+    result = PyImportResolver().resolve(str(root))
+    return sorted(
+        {normalize_path_variants(p) for p in result.get("order", [])} | {root}
+    )
+
+
+class FingerprintCache:
+    """Script fingerprints keyed by everything that can change them.
+
+    The key covers the fingerprint algorithm and trilogy versions, the
+    parameters, and the bytes of every file in the script's import closure,
+    so a hit is exactly the fingerprint a fresh parse would produce. A script
+    whose imports cannot be resolved is never cached. File digests are
+    memoized per instance, so a module imported by many scripts is read once.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._digests: dict[Path, str] = {}
+        self._dirty = False
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            if raw.get("fingerprint_version") == FINGERPRINT_VERSION:
+                self.entries = raw.get("scripts", {})
+        except (OSError, ValueError, AttributeError) as e:
+            logger.debug(f"No usable fingerprint cache at {path}: {e}")
+
+    @classmethod
+    def for_project(cls, project_root: Path) -> "FingerprintCache":
+        return cls(project_root / CACHE_SUBPATH)
+
+    def _digest(self, path: Path) -> str:
+        digest = self._digests.get(path)
+        if digest is None:
+            digest = hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+            self._digests[path] = digest
+        return digest
+
+    def source_key(self, path: Path, env_params: dict[str, Any] | None) -> str | None:
+        from trilogy import __version__
+
+        try:
+            closure = _import_closure(path)
+            digests = [f"{p.as_posix()}={self._digest(p)}" for p in closure]
+        except Exception as e:
+            logger.debug(f"Not caching the fingerprint of {path}: {e}")
+            return None
+        return _h(
+            "script",
+            str(FINGERPRINT_VERSION),
+            __version__,
+            json.dumps(env_params or {}, sort_keys=True, default=str),
+            *digests,
+        )
+
+    def fingerprint(
+        self, key: str, path: Path, env_params: dict[str, Any] | None = None
+    ) -> EnvironmentFingerprint:
+        """The fingerprint of script ``path``, stored under manifest ``key``."""
+        source_key = self.source_key(path, env_params)
+        entry = self.entries.get(key)
+        if source_key is not None and entry and entry.get("source") == source_key:
+            self.hits += 1
+            return EnvironmentFingerprint.model_validate(entry["fingerprint"])
+        self.misses += 1
+        fingerprint = fingerprint_script(path, env_params)
+        if source_key is not None:
+            self.entries[key] = {
+                "source": source_key,
+                "fingerprint": fingerprint.model_dump(mode="json"),
+            }
+            self._dirty = True
+        return fingerprint
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(
+                json.dumps(
+                    {
+                        "fingerprint_version": FINGERPRINT_VERSION,
+                        "scripts": self.entries,
+                    }
+                ),
+                encoding="utf-8",
+            )
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.debug(f"Could not write fingerprint cache {self.path}: {e}")
+
+
 def build_project_fingerprint(
     files: list[Path],
     project_root: Path,
     env_params: dict[str, Any] | None = None,
+    cache: FingerprintCache | None = None,
 ) -> ProjectFingerprint:
-    scripts = {
-        script_key(f, project_root): fingerprint_script(f, env_params) for f in files
-    }
+    """Fingerprint each script. With ``cache``, unchanged scripts are not
+    parsed, and the cache is saved with any new entries."""
+    if cache is None:
+        scripts = {
+            script_key(f, project_root): fingerprint_script(f, env_params)
+            for f in files
+        }
+        return ProjectFingerprint(scripts=scripts)
+    scripts = {}
+    for f in files:
+        key = script_key(f, project_root)
+        scripts[key] = cache.fingerprint(key, f, env_params)
+    cache.save()
     return ProjectFingerprint(scripts=scripts)
 
 
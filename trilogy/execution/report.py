@@ -35,11 +35,21 @@ Record vocabulary (fields with ``None`` values are omitted):
   refresh begins)
 - ``asset_refresh_query``: datasource_id, sql_bytes (length only)
 - ``plan_graph``: nodes, edges (dependency graph of a ``plan`` invocation)
+- ``plan_cost``: estimated_bytes, scripts [{script, estimated_bytes,
+  statements [{sql, estimated_bytes, error}]}] (``plan --cost``)
 - ``state_snapshot``: a full StateSnapshot payload (see
   ``trilogy.execution.state.snapshot``), or {path} when written to a file
 - ``error``: error_type, message, file (fatal errors outside the file loop)
+- ``shared_imports``: modules [{path, builds, reuses, invalidations,
+  build_s, concepts, datasources, allocated_bytes}] — per imported module of
+  a directory run, most expensive build first. ``allocated_bytes`` is present
+  only when tracemalloc is tracing (``PYTHONTRACEMALLOC=1``).
+- ``statement_cost``: sql_bytes (length only), estimated_bytes (None when the
+  engine gave no estimate), run_estimated_bytes, and refused + error when the
+  statement was over a ``[cost]`` budget (see ``trilogy.execution.cost``)
 - ``summary``: terminal record — success, exit_code, total, succeeded,
-  failed, skipped, partial_failure, total_duration_s, refreshed_assets.
+  failed, skipped, partial_failure, total_duration_s, refreshed_assets, and
+  estimated_bytes when any statement was dry-run.
   A multi-phase command (``integration --refresh-derived failed`` runs
   integration, refresh, then integration again) emits one per phase; the
   LAST summary in the file is the run's outcome.
@@ -102,11 +112,11 @@ class ReportSink:
                     "run_id": self.run_id,
                     "seq": self._seq,
                 }
-                for key, value in fields.items():
-                    if value is not None:
-                        record[key] = value
+                record.update(fields)
+                record = {k: v for k, v in record.items() if v is not None}
                 if record_type == "summary":
                     self._summary_emitted = True
+                    record["estimated_bytes"] = _estimated_run_bytes()
                 # Open-per-write append (the agent --log-file precedent):
                 # each record is durable immediately, and there is no handle
                 # to leak if the process dies mid-run.
@@ -136,6 +146,13 @@ def get_report_sink() -> ReportSink | None:
     return _ACTIVE_SINK
 
 
+def _estimated_run_bytes() -> int | None:
+    from trilogy.execution.cost import active_run_cost
+
+    run = active_run_cost()
+    return run.total_bytes if run is not None and run.statements else None
+
+
 def emit_report(record_type: str, **fields: Any) -> None:
     """Emit a record to the active sink; no-op when reporting is off."""
     sink = _ACTIVE_SINK
@@ -265,7 +282,22 @@ def report_run(
     reaching it (config errors, parse failures outside the file loop), a
     fallback failure summary is written so consumers always see a terminal
     record. Deactivates the sink on exit.
+
+    Also the command's ``run_cost_scope``: dry-run estimates from every
+    executor the command opens add up to one run total.
     """
+    from trilogy.execution.cost import run_cost_scope
+
+    with run_cost_scope():
+        yield from _report_run(command, report_file, run_id, **run_fields)
+
+
+def _report_run(
+    command: str,
+    report_file: str | None,
+    run_id: str | None,
+    **run_fields: Any,
+) -> Iterator[ReportSink | None]:
     path = resolve_report_file(report_file)
     if path is None:
         yield None
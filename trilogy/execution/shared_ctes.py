@@ -0,0 +1,172 @@
+"""Script-level sharing of identical CTEs across statements.
+
+Every statement of a script is planned on its own, so report files that run
+many selects over the same filtered population re-scan and re-aggregate the
+same fact tables once per statement. The planner already names CTEs
+canonically — ``generate_cte_name`` keys names on the query datasource
+identity through the environment's ``cte_name_map``, and
+``canonicalize_graph`` keeps references pointed at the live instance — but
+that identity is neither sufficient nor necessary for identical SQL:
+pushdown and column pruning run per statement, and the same aggregate can be
+reached through datasources with different identities. A CTE's
+*fingerprint* is therefore its rendered SQL with every reference to a parent
+CTE replaced by that parent's fingerprint, so it is independent of the names
+the statement happened to assign.
+
+A CTE whose fingerprint appears in two or more statements of a run (a
+statement computing it twice still counts once) is materialized once as a
+session temp table. Each consumer then records it in
+``ProcessedQuery.shared_ctes`` under its own name for it, and the dialect renders that CTE as a scan of
+the table. A *run* is a maximal sequence of plain selects and copies.
+Anything that can change data (persists, raw SQL, creates, calls, ...) ends
+the run, because a table computed before a write must not be read after it.
+
+Only CTEs that do work are candidates: a bare projection of one datasource is
+as cheap to re-read as the temp table. The temp table is created with a
+``LIMIT`` of one past ``CONFIG.execution.shared_cte_max_rows``, so an
+oversized share writes at most that many rows before it is dropped again and
+each statement computes it inline, as before.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from trilogy.core.models.execute import CTE, RecursiveCTE, UnionCTE
+from trilogy.core.statements.execute import ProcessedCopyStatement, ProcessedQuery
+
+if TYPE_CHECKING:
+    from trilogy.dialect.base import BaseDialect
+
+SHARED_TABLE_PREFIX = "_trilogy_shared_"
+MIN_CONSUMERS = 2
+
+
+@dataclass
+class SharedCTE:
+    """One CTE computed identically by several statements of a run."""
+
+    fingerprint: str
+    cte_name: str
+    # script positions of the consuming statements, for explain output
+    statements: list[int] = field(default_factory=list)
+    # each consumer with the name it gave this CTE
+    consumers: list[tuple[ProcessedQuery, str]] = field(
+        default_factory=list, repr=False
+    )
+    rows: int | None = None
+    skipped: str | None = None
+
+    @property
+    def table(self) -> str:
+        return f"{SHARED_TABLE_PREFIX}{self.fingerprint[:16]}"
+
+    @property
+    def materialized(self) -> bool:
+        return self.rows is not None and self.skipped is None
+
+
+@dataclass
+class SharingPlan:
+    shared: list[SharedCTE] = field(default_factory=list)
+
+    def explain(self) -> str:
+        if not self.shared:
+            return "No CTEs shared across statements."
+        lines = [f"{len(self.shared)} CTE(s) shared across statements:"]
+        for share in self.shared:
+            used_by = ", ".join(str(idx) for idx in share.statements)
+            line = f"  {share.cte_name} -> {share.table} (statements {used_by})"
+            if share.skipped:
+                line += f": not materialized, {share.skipped}"
+            elif share.rows is not None:
+                line += f": {share.rows} rows"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+def is_shareable_statement(statement: object) -> bool:
+    """Whether ``statement`` only reads, and so can join a sharing run."""
+    return type(statement) in (ProcessedQuery, ProcessedCopyStatement) and not any(
+        isinstance(cte, RecursiveCTE)
+        for cte in statement.ctes  # type: ignore[attr-defined]
+    )
+
+
+def _does_work(cte: CTE | UnionCTE) -> bool:
+    if isinstance(cte, UnionCTE):
+        return True
+    return bool(
+        cte.joins
+        or cte.condition is not None
+        or cte.group_to_grain
+        or cte.dependency_nodes()
+    )
+
+
+def cte_fingerprints(query: ProcessedQuery, dialect: BaseDialect) -> dict[str, str]:
+    """Fingerprint of every CTE but the output one, keyed by CTE name.
+
+    CTEs are in dependency order, so a parent's fingerprint is always known
+    before its children's."""
+    prints: dict[str, str] = {}
+    for cte in query.ctes[:-1]:
+        text = dialect.render_cte(cte).statement
+        parents = {node.name for node in cte.dependency_nodes()} & prints.keys()
+        # longest first, so a name that prefixes another is not clobbered
+        for parent in sorted(parents, key=len, reverse=True):
+            text = re.sub(rf"\b{re.escape(parent)}\b", prints[parent], text)
+        prints[cte.name] = hashlib.sha256(text.encode()).hexdigest()
+    return prints
+
+
+def plan_shared_ctes(
+    queries: Sequence[tuple[int, ProcessedQuery]], dialect: BaseDialect
+) -> SharingPlan:
+    """Find the CTEs that two or more of ``queries`` (script position,
+    statement) compute identically. Shares come back in an order where a
+    shared parent precedes any shared child, so materializing in order lets a
+    child read its parent's table."""
+    found: dict[str, SharedCTE] = {}
+    for position, query in queries:
+        by_name = {cte.name: cte for cte in query.ctes}
+        for name, fingerprint in cte_fingerprints(query, dialect).items():
+            if not _does_work(by_name[name]):
+                continue
+            share = found.setdefault(fingerprint, SharedCTE(fingerprint, name))
+            if position not in share.statements:
+                share.statements.append(position)
+            share.consumers.append((query, name))
+    # dict order is (first statement, position in it): topological, because a
+    # child's fingerprint covers its parent's, so every statement computing
+    # the child computes the parent too
+    return SharingPlan(
+        shared=[
+            share for share in found.values() if len(share.statements) >= MIN_CONSUMERS
+        ]
+    )
+
+
+def render_shared_select(
+    share: SharedCTE, dialect: BaseDialect, limit: int | None = None
+) -> str:
+    """A standalone select of ``share``'s rows, built from its first consumer:
+    the CTEs it depends on, then the CTE itself as the output select. Shares
+    already materialized are read from their tables. ``limit`` caps the rows,
+    by wrapping the select as a derived table."""
+    owner, name = share.consumers[0]
+    compiled = dialect.generate_ctes(owner)
+    index = next(i for i, cte in enumerate(compiled) if cte.name == name)
+    select = dialect.SQL_TEMPLATE.render(
+        recursive=False,
+        output=None,
+        full_select=compiled[index].statement,
+        ctes=compiled[:index],
+    )
+    if limit is None:
+        return select
+    return f"SELECT * FROM (\n{select.strip()}\n) AS _shared LIMIT {limit}"
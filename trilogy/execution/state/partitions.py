@@ -26,7 +26,7 @@ processes: values are rendered canonically, never via ``repr``.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from typing import TYPE_CHECKING
@@ -63,6 +63,8 @@ from trilogy.execution.state.watermarks import (
 )
 
 if TYPE_CHECKING:
+    import pyarrow as pa
+
     from trilogy.core.models.environment import Environment
 
 LOGGER_PREFIX = "[PARTITIONS]"
@@ -76,6 +78,10 @@ PARTITION_ID_SEPARATOR = "/"
 
 PartitionValue = str | int | float | bool | datetime | date | None
 
+#: Below this many slices, judging them one at a time is cheaper than laying
+#: them out in Arrow (see "vectorized comparison" below).
+VECTORIZE_MIN_SLICES = 256
+
 
 @dataclass
 class PartitionObservation:
@@ -300,6 +306,110 @@ def partition_verdict(
     return PartitionVerdict(False)
 
 
+def partition_verdicts(
+    pairs: Sequence[tuple[PartitionObservation | None, PartitionObservation | None]],
+) -> list[PartitionVerdict]:
+    """:func:`partition_verdict` for each ``(observed, expected)`` pair.
+
+    Equal to calling it pair by pair, which is what happens for a handful of
+    slices. Past :data:`VECTORIZE_MIN_SLICES` each watermark key is compared
+    for every slice at once in Arrow; only the stale slices' reasons are
+    formatted one at a time.
+    """
+    if len(pairs) < VECTORIZE_MIN_SLICES:
+        return [partition_verdict(obs, exp) for obs, exp in pairs]
+    key_orders = {tuple(exp.keys) for _, exp in pairs if exp is not None}
+    if len(key_orders) > 1:
+        # The first failing key names the reason, so slices that list their
+        # keys differently cannot share one pass.
+        return [partition_verdict(obs, exp) for obs, exp in pairs]
+
+    verdicts: list[PartitionVerdict | None] = [None] * len(pairs)
+    undecided: list[tuple[int, PartitionObservation, PartitionObservation]] = []
+    for i, (obs, exp) in enumerate(pairs):
+        if obs is None:
+            verdicts[i] = _MISSING
+        elif exp is None:
+            verdicts[i] = _FRESH
+        elif obs.row_count == 0:
+            verdicts[i] = _EMPTY
+        else:
+            undecided.append((i, obs, exp))
+
+    for key in next(iter(key_orders), ()):
+        if not undecided:
+            break
+        expected_values = [exp.keys[key].value for _, _, exp in undecided]
+        current_values = [
+            observed_key.value if observed_key else None
+            for observed_key in (obs.keys.get(key) for _, obs, _ in undecided)
+        ]
+        behind = _less_than(current_values, expected_values)
+        still_undecided = []
+        for position, entry in enumerate(undecided):
+            i = entry[0]
+            expected_value = expected_values[position]
+            current = current_values[position]
+            if expected_value is None:
+                still_undecided.append(entry)
+            elif current is None:
+                verdicts[i] = PartitionVerdict(
+                    True, f"'{key}' missing (expected {expected_value})"
+                )
+            elif (
+                behind[position]
+                if behind is not None
+                else _compare_watermark_values(current, expected_value) < 0
+            ):
+                verdicts[i] = PartitionVerdict(
+                    True, f"'{key}' behind: {current} < {expected_value}"
+                )
+            else:
+                still_undecided.append(entry)
+        undecided = still_undecided
+    return [verdict or _FRESH for verdict in verdicts]
+
+
+def paired_slices(
+    observed: list[PartitionObservation], expected: list[PartitionObservation]
+) -> list[tuple[str, PartitionObservation | None, PartitionObservation | None]]:
+    """Every slice id on either side, sorted, with each side's observation.
+
+    A side listing one id twice keeps the later observation. Past
+    :data:`VECTORIZE_MIN_SLICES` the ids are rendered and matched in Arrow (a
+    full outer join) rather than through per-slice dicts.
+    """
+    if len(observed) + len(expected) < VECTORIZE_MIN_SLICES:
+        observed_by_id = {obs.id: obs for obs in observed}
+        expected_by_id = {exp.id: exp for exp in expected}
+        return [
+            (pid, observed_by_id.get(pid), expected_by_id.get(pid))
+            for pid in sorted(observed_by_id.keys() | expected_by_id.keys())
+        ]
+    joined = (
+        _last_by_id(observed, "observed")
+        .join(
+            _last_by_id(expected, "expected"),
+            keys="id",
+            join_type="full outer",
+            coalesce_keys=True,
+        )
+        .sort_by("id")
+    )
+    return [
+        (
+            pid,
+            observed[o] if o is not None else None,
+            expected[e] if e is not None else None,
+        )
+        for pid, o, e in zip(
+            joined["id"].to_pylist(),
+            joined["observed"].to_pylist(),
+            joined["expected"].to_pylist(),
+        )
+    ]
+
+
 def stale_slices(
     observed: list[PartitionObservation], expected: list[PartitionObservation]
 ) -> list[PartitionObservation]:
@@ -308,14 +418,166 @@ def stale_slices(
     Returned as observations rather than rendered states because a refresh needs
     the real values to build its filter.
     """
-    observed_by_id = {obs.id: obs for obs in observed}
+    if len(observed) + len(expected) < VECTORIZE_MIN_SLICES:
+        observed_by_id = {obs.id: obs for obs in observed}
+        return [
+            exp
+            for exp in expected
+            if partition_verdict(observed_by_id.get(exp.id), exp).stale
+        ]
+    import pyarrow as pa
+
+    # a left join from every expected slice, duplicates included, back into
+    # the expected side's order
+    expected_table = pa.table(
+        {
+            "id": _partition_ids(expected),
+            "expected": pa.array(range(len(expected)), pa.int64()),
+        }
+    )
+    joined = expected_table.join(
+        _last_by_id(observed, "observed"), keys="id", join_type="left outer"
+    ).sort_by("expected")
+    pairs = [
+        (observed[o] if o is not None else None, expected[e])
+        for o, e in zip(joined["observed"].to_pylist(), joined["expected"].to_pylist())
+    ]
     return [
         exp
-        for exp in expected
-        if partition_verdict(observed_by_id.get(exp.id), exp).stale
+        for (_, exp), verdict in zip(pairs, partition_verdicts(pairs))
+        if verdict.stale
     ]
 
 
+# --- vectorized comparison -------------------------------------------------
+#
+# Hourly partitions over a few years are tens of thousands of slices, and the
+# per-slice loop above is a visible pause on every refresh dry run. Both sides
+# are laid out column-wise in Arrow instead: ids rendered a column at a time,
+# matched by a join, watermarks compared a key at a time. Only values whose
+# Arrow rendering or ordering is known to match Python's take this path; any
+# other column or key falls back to the per-value functions, so the answers are
+# the same either way.
+
+_MISSING = PartitionVerdict(True, "partition missing")
+_EMPTY = PartitionVerdict(True, "partition empty")
+_FRESH = PartitionVerdict(False)
+
+# Python types whose Arrow string cast / ordering matches Python's exactly.
+_ARROW_RENDERABLE = (int, str, bool, date)
+_ARROW_COMPARABLE = (int, float, str, bool, date, datetime)
+
+
+def _single_type(values: Iterable[object]) -> type | None:
+    kinds = {type(value) for value in values if value is not None}
+    return kinds.pop() if len(kinds) == 1 else None
+
+
+def _render_column(values: list[PartitionValue]) -> pa.Array:
+    """:func:`render_partition_value` over one column, as a string array."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    kind = _single_type(values)
+    rendered = None
+    if kind in _ARROW_RENDERABLE or kind is datetime:
+        try:
+            array = pa.array(values)
+            if kind is datetime:
+                rendered = _iso_timestamps(array)
+            else:
+                rendered = pc.cast(array, pa.string())
+        except (pa.ArrowException, TypeError, ValueError, OverflowError):
+            rendered = None
+    elif kind is None and all(value is None for value in values):
+        rendered = pa.nulls(len(values), pa.string())
+    if rendered is None:
+        return pa.array([render_partition_value(v) for v in values], pa.string())
+    return pc.fill_null(rendered, NULL_PARTITION_TOKEN)
+
+
+def _iso_timestamps(array: pa.Array) -> pa.Array | None:
+    """``datetime.isoformat`` for a naive timestamp array; None if aware."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if not pa.types.is_timestamp(array.type) or array.type.tz is not None:
+        return None
+    seconds = pc.floor_temporal(array, unit="second")
+    # the string cast renders "YYYY-MM-DD HH:MM:SS"; isoformat uses a "T"
+    base = pc.replace_substring(
+        pc.cast(pc.cast(seconds, pa.timestamp("s")), pa.string()),
+        " ",
+        "T",
+        max_replacements=1,
+    )
+    micros = pc.cast(pc.subtract(array, seconds), pa.int64())
+    fraction = pc.utf8_lpad(pc.cast(micros, pa.string()), width=6, padding="0")
+    # isoformat shows microseconds only when there are some
+    return pc.if_else(
+        pc.equal(micros, 0), base, pc.binary_join_element_wise(base, fraction, ".")
+    )
+
+
+def _partition_ids(observations: list[PartitionObservation]) -> pa.Array:
+    """:func:`partition_id` for each observation, as a string array."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    columns = list(observations[0].values) if observations else []
+    if any(list(obs.values) != columns for obs in observations):
+        return pa.array([obs.id for obs in observations], pa.string())
+    if not columns:
+        return pa.array([""] * len(observations), pa.string())
+    parts = [
+        pc.binary_join_element_wise(
+            f"{column}=",
+            _render_column([obs.values[column] for obs in observations]),
+            "",
+        )
+        for column in columns
+    ]
+    return pc.binary_join_element_wise(*parts, PARTITION_ID_SEPARATOR)
+
+
+def _last_by_id(observations: list[PartitionObservation], side: str) -> pa.Table:
+    """``(id, <side>)`` with the index of each id's last observation, which is
+    the one an ``{obs.id: obs}`` dict would keep."""
+    import pyarrow as pa
+
+    table = pa.table(
+        {
+            "id": _partition_ids(observations),
+            side: pa.array(range(len(observations)), pa.int64()),
+        }
+    )
+    last = table.group_by("id").aggregate([(side, "max")])
+    return last.rename_columns(["id", side])
+
+
+def _less_than(current: list, expected: list) -> list[bool] | None:
+    """``current[i] < expected[i]`` under :func:`_compare_watermark_values`,
+    computed in Arrow; None when the values are not all of one type that
+    Arrow orders the same way Python does."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    kind = _single_type([*current, *expected])
+    if kind not in _ARROW_COMPARABLE:
+        return None
+    if kind is datetime and any(
+        value is not None and value.tzinfo is not None  # type: ignore[union-attr]
+        for value in (*current, *expected)
+    ):
+        # mixed awareness raises in the scalar rule; let it
+        return None
+    try:
+        result = pc.less(pa.array(current), pa.array(expected))
+    except (pa.ArrowException, TypeError, ValueError, OverflowError):
+        return None
+    return [bool(value) for value in result.to_pylist()]
+
+
 def partition_filter(
     ds: Datasource,
     environment: Environment,
@@ -112,10 +112,11 @@ from trilogy.core.models.datasource import (
 from trilogy.execution.state.partitions import (
     PartitionObservation,
     PartitionValue,
+    paired_slices,
     parse_partition_value,
     partition_column_name,
     partition_id,
-    partition_verdict,
+    partition_verdicts,
     render_partition_value,
 )
 from trilogy.execution.state.phases import get_phase_recorder
@@ -333,6 +334,9 @@ class StateSnapshot(BaseModel):
     dialect: str | None = None
     assets: list[PhysicalAssetState] = Field(default_factory=list)
     summary: StateSnapshotSummary = Field(default_factory=StateSnapshotSummary)
+    # Dry-run estimate of the bytes the producing run scanned, when it ran with
+    # a [cost] section (trilogy.execution.cost). None for a read-only probe.
+    estimated_bytes: int | None = None
 
 
 def is_remote_address(address: str) -> bool:
@@ -750,18 +754,15 @@ def build_partition_states(
     not here where the information is still recoverable. ``limit`` is for a
     caller that never wants to hold the whole set in the first place.
     """
-    observed_by_id = {obs.id: obs for obs in observed}
-    expected_by_id = {exp.id: exp for exp in expected}
+    pairs = paired_slices(observed, expected)
+    # The single verdict rule, shared with the refresh work list — see
+    # ``partitions.partition_verdict``.
+    verdicts = partition_verdicts([(obs, exp) for _, obs, exp in pairs])
 
     states: list[PartitionState] = []
-    for pid in sorted(observed_by_id.keys() | expected_by_id.keys()):
-        obs = observed_by_id.get(pid)
-        exp = expected_by_id.get(pid)
+    for (pid, obs, exp), verdict in zip(pairs, verdicts):
         source = obs or exp
-        assert source is not None  # pid came from one of the two maps
-        # The single verdict rule, shared with the refresh work list — see
-        # ``partitions.partition_verdict``.
-        verdict = partition_verdict(obs, exp)
+        assert source is not None  # pid came from one of the two sides
         states.append(
             PartitionState(
                 partition_id=pid,
@@ -791,7 +792,7 @@ def build_partition_states(
     # returns []. Saying `scan` there is what stops a consumer reading
     # `missing: 0` as a clean bill of health.
     level: Literal["metadata", "scan", "reconciled"] = (
-        "reconciled" if expected_by_id else "scan"
+        "reconciled" if expected else "scan"
     )
     summary = summarize_partitions(states, level)
     if limit is None:
@@ -1320,6 +1321,10 @@ def merge_snapshots(base: StateSnapshot, *deltas: StateSnapshot) -> StateSnapsho
             existing.owner_script = existing.owner_script or incoming.owner_script
 
     ordered = [assets[address] for address in sorted(assets)]
+    # each worker's run scanned its own bytes, so the estimates add up
+    estimates = [
+        s.estimated_bytes for s in (base, *deltas) if s.estimated_bytes is not None
+    ]
     return StateSnapshot(
         snapshot_ts=utc_now_iso(),
         run_id=latest.run_id,
@@ -1328,6 +1333,7 @@ def merge_snapshots(base: StateSnapshot, *deltas: StateSnapshot) -> StateSnapsho
         dialect=base.dialect or latest.dialect,
         assets=ordered,
         summary=summarize(ordered),
+        estimated_bytes=sum(estimates) if estimates else None,
     )
 
 
@@ -1,18 +1,21 @@
+import copy
 import datetime
 import json
+import queue
 import random
 import subprocess
 import threading
 import time
 import uuid
 from collections.abc import Callable, Generator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import replace as dc_replace
 from functools import singledispatchmethod
 from pathlib import Path
-from typing import Any, TypeVar, cast
+from typing import Any, NoReturn, TypeVar, cast
 
-from trilogy.constants import MagicConstants, Rendering, logger
+from trilogy.constants import CONFIG, MagicConstants, Rendering, logger
 from trilogy.core.enums import (
     AddressType,
     ComparisonOperator,
@@ -23,13 +26,25 @@ from trilogy.core.enums import (
     PersistMode,
     ValidationScope,
 )
-from trilogy.core.exceptions import ConfigurationException, QueryTimeoutException
+from trilogy.core.exceptions import (
+    ConfigurationException,
+    QueryCancelledException,
+    QueryTimeoutException,
+)
 from trilogy.core.models.author import Comment, Comparison, Concept, Function
 from trilogy.core.models.build import BuildDatasource, BuildFunction
 from trilogy.core.models.core import ListWrapper, MapWrapper
 from trilogy.core.models.datasource import Address, Datasource, UpdateKeys
 from trilogy.core.models.environment import Environment
 from trilogy.core.models.execute import collect_source_addresses
+from trilogy.core.profile import (
+    StatementProfile,
+    bind_statement,
+    get_profiler,
+    parse_scope,
+    phase,
+    statement_scope,
+)
 from trilogy.core.statements.author import (
     STATEMENT_TYPES,
     CallStatement,
@@ -92,7 +107,12 @@ from trilogy.dialect.metadata import (
     handle_show_statement_outputs,
 )
 from trilogy.dialect.mock import handle_processed_mock_statement
-from trilogy.dialect.results import BufferedResult, ChartResult, MockResult
+from trilogy.dialect.results import (
+    BufferedResult,
+    ChartColumns,
+    ChartResult,
+    MockResult,
+)
 from trilogy.engine import (
     EngineConnection,
     ExecutionEngine,
@@ -100,6 +120,30 @@ from trilogy.engine import (
     SupportsNativePersist,
     escape_literal_colons,
 )
+from trilogy.execution.concurrent import (
+    ConcurrentRead,
+    PendingRead,
+    is_concurrent_read,
+)
+from trilogy.execution.connection_pool import (
+    CONNECTION_SETUP_KEY,
+    record_setup_state,
+)
+from trilogy.execution.cost import (
+    CostBudget,
+    Estimator,
+    RunCost,
+    active_run_cost,
+    check_statement,
+    resolve_cost_estimator,
+)
+from trilogy.execution.shared_ctes import (
+    SharedCTE,
+    SharingPlan,
+    is_shareable_statement,
+    plan_shared_ctes,
+    render_shared_select,
+)
 from trilogy.hooks.base_hook import BaseHook
 from trilogy.parser import parse_text
 from trilogy.render import get_dialect_generator
@@ -212,6 +256,43 @@ def _is_catalog_write_conflict(error: BaseException) -> bool:
     return _CATALOG_WRITE_CONFLICT in str(error)
 
 
+def _chart_layer_data(
+    statement: ProcessedChartStatement, results: Sequence[ChartColumns]
+) -> list[ChartColumns]:
+    """Split the fetched results of ``statement.queries`` into per-layer
+    columns."""
+    fetched = {id(query): result for query, result in zip(statement.queries, results)}
+    layer_data: list[ChartColumns] = []
+    for layer in statement.layers:
+        if layer.query is None:
+            layer_data.append(ChartColumns({}))
+            continue
+        columns = fetched[id(layer.query)]
+        if layer.columns:
+            columns = columns.project(layer.columns)
+        layer_data.append(columns)
+    return layer_data
+
+
+def _record_result(profile: StatementProfile, result: ResultProtocol | None) -> None:
+    """Rows and bytes scanned, where the result reports them without being read.
+    A chart's rows are already fetched; a cursor's ``rowcount`` is -1 until
+    it has been, on most drivers."""
+    if isinstance(result, ChartResult):
+        # fused layers share one query's rows; count each query once
+        rows: dict[int, int] = {}
+        for layer, data in zip(result.statement.layers, result.data):
+            rows.setdefault(id(layer.query), len(data))
+        profile.rows = sum(rows.values())
+        return
+    rowcount = getattr(result, "rowcount", None)
+    if isinstance(rowcount, int) and rowcount >= 0:
+        profile.rows = rowcount
+    scanned = getattr(result, "bytes_scanned", None)
+    if isinstance(scanned, int):
+        profile.bytes_scanned = scanned
+
+
 def _fire_cancel(fired: threading.Event, cancel: Callable[[], None]) -> None:
     """Timer body for a query timeout: record that we cancelled, then cancel.
 
@@ -234,6 +315,7 @@ class Executor:
         chart_theme: str | None = None,
         datasource_transform: Callable[[Datasource], None] | None = None,
         query_timeout: float | None = None,
+        cost_budget: CostBudget | None = None,
     ):
 
         self.dialect: Dialects = dialect
@@ -242,6 +324,17 @@ class Executor:
         # it has to be set before the connection is opened.
         self.query_timeout = query_timeout
         self._cancel_query: Callable[[], None] | None = None
+        # set by cancel() from another thread; the running statement, or the
+        # next one to start, fails with QueryCancelledException and clears it
+        self._cancel_requested = threading.Event()
+        # Dry-run every statement before it runs and refuse any over budget
+        # (trilogy.toml [cost]). Estimates land in ``run_cost``, which is the
+        # command-wide total when created inside ``run_cost_scope``.
+        self.cost_budget = (
+            cost_budget if cost_budget is not None and cost_budget.enabled else None
+        )
+        self.run_cost: RunCost = active_run_cost() or RunCost()
+        self._estimate_cost: Estimator | None = None
         self.engine = engine
         self.environment = environment or Environment()
         # Physical-address rewrite (e.g. deployment-env prefixing) applied to
@@ -270,6 +363,17 @@ class Executor:
             dict[str, Datasource | BuildDatasource] | None
         ) = None
         self._validation_temp_tables: list[str] = []
+        # temp tables backing the current script run's shared CTEs; dropped
+        # when the next run starts, since the run's last result may still be
+        # reading from them
+        self._shared_cte_tables: list[str] = []
+        self.last_sharing_plan: SharingPlan | None = None
+        # extra connections for concurrent reads, opened on first use
+        self._read_pool: ThreadPoolExecutor | None = None
+        self._read_pool_size = 0
+        self._readers: list[Executor] = []
+        self._idle_readers: queue.Queue[Executor] = queue.Queue()
+        self._readers_lock = threading.Lock()
         # TODO: make generic
         if self.dialect == Dialects.DATAFRAME:
             self.engine.setup(self.environment, self.connection)
@@ -278,6 +382,7 @@ class Executor:
             self._setup_duckdb_python_datasources()
             self._setup_duckdb_gcs()
             self._setup_duckdb_spatial()
+            self._setup_duckdb_remote_cache()
 
     def connect(self) -> EngineConnection:
         self.connection = self.engine.connect()
@@ -291,8 +396,42 @@ class Executor:
                     "driver exposes no way to cancel a running statement. Remove "
                     "the timeout rather than let it silently not apply."
                 )
+        if self.cost_budget is not None:
+            self._estimate_cost = resolve_cost_estimator(self.connection, self.dialect)
+            if self._estimate_cost is None:
+                raise ConfigurationException(
+                    f"A [cost] budget was configured, but {self.dialect.value} "
+                    "cannot estimate a statement's bytes scanned before running "
+                    "it. Remove the section rather than let it silently not apply."
+                )
         return self.connection
 
+    def cancel(self) -> bool:
+        """Abort the statement running on this executor, from another thread.
+
+        The statement in flight fails with ``QueryCancelledException`` and the
+        connection is rolled back; if none is in flight, the next one to start
+        fails instead, so a multi-statement script stops either way. Returns
+        False when the driver cannot interrupt a statement already running,
+        which then finishes before the cancel takes effect."""
+        self._cancel_requested.set()
+        cancel = self._cancel_query or resolve_query_canceller(self.connection)
+        if cancel is None:
+            return False
+        cancel()
+        return True
+
+    def clear_cancel(self) -> None:
+        """Drop a ``cancel`` that no statement has consumed yet."""
+        self._cancel_requested.clear()
+
+    def _raise_cancelled(self, cause: BaseException | None = None) -> NoReturn:
+        self._cancel_requested.clear()
+        if cause is not None:
+            self.connection.rollback()
+            self._owned_transaction = None
+        raise QueryCancelledException("Query cancelled.") from cause
+
     def commit(self) -> None:
         """Commit the open transaction on this executor's connection."""
         self.connection.commit()
@@ -337,6 +476,23 @@ class Executor:
                 # Jittered, or the same losers collide again on every retry.
                 time.sleep(random.uniform(0.01, 0.05) * (attempt + 1))
 
+    def _connection_setup(self, key: str, setup: Callable[[], None]) -> None:
+        """Run connect-time ``setup`` unless this physical connection already
+        has. A pooled connection (see ``trilogy.execution.connection_pool``)
+        serves many executors; its ``info`` lives as long as the driver
+        connection and is cleared if the pool replaces it. Connections without
+        ``info`` always run it."""
+        info = getattr(self.connection, "info", None)
+        if not isinstance(info, dict):
+            setup()
+            return
+        done: set[str] = info.setdefault(CONNECTION_SETUP_KEY, set())
+        if key in done:
+            return
+        setup()
+        done.add(key)
+        record_setup_state(self.connection)
+
     def _duckdb_macro_exists(self, name: str, marker: str) -> bool:
         """Whether a macro is already defined with a body containing ``marker``.
 
@@ -400,15 +556,22 @@ class Executor:
         # on-disk warehouse normally never contend for the catalog at all.
         # The enabled form cannot take this shortcut — it must LOAD extensions
         # and SET the per-instance temp dir variable in every new session.
-        if not enabled and self._duckdb_macro_exists(
-            "uv_run", PYTHON_DATASOURCE_GUARD_MARKER
-        ):
-            return
-        is_windows = sys.platform == "win32"
-        self._execute_setup_ddl(
-            get_python_datasource_setup_sql(
-                enabled, is_windows, self._instance_id, self.staging
-            )
+        sql = get_python_datasource_setup_sql(
+            enabled, sys.platform == "win32", self._instance_id, self.staging
+        )
+
+        def setup() -> None:
+            if not enabled and self._duckdb_macro_exists(
+                "uv_run", PYTHON_DATASOURCE_GUARD_MARKER
+            ):
+                return
+            self._execute_setup_ddl(sql)
+
+        # Keyed on what the setup does, not its SQL: the Windows form embeds
+        # this executor's temp dir, and a pooled connection keeps the first
+        # executor's (see record_setup_state) rather than redoing the setup.
+        self._connection_setup(
+            "python_datasources" if enabled else "python_datasources_guard", setup
         )
 
     def _setup_duckdb_gcs(self) -> None:
@@ -422,7 +585,7 @@ class Executor:
         sql = get_gcs_setup_sql(enabled)
         if sql:
             # CREATE SECRET is a catalog write, so it races the same way.
-            self._execute_setup_ddl(sql)
+            self._connection_setup(sql, lambda: self._execute_setup_ddl(sql))
 
     def _setup_duckdb_spatial(self) -> None:
         """Setup DuckDB spatial extension for geospatial functions."""
@@ -431,13 +594,38 @@ class Executor:
         enabled = isinstance(self.config, DuckDBConfig) and self.config.enable_spatial
         if not enabled:
             return
-        self.execute_raw_sql("INSTALL spatial;")
-        self.execute_raw_sql("LOAD spatial;")
-        self.commit()
+
+        def setup() -> None:
+            self.execute_raw_sql("INSTALL spatial;")
+            self.execute_raw_sql("LOAD spatial;")
+            self.commit()
+
+        self._connection_setup("spatial", setup)
+
+    def _setup_duckdb_remote_cache(self) -> None:
+        """Keep parquet footers and row groups of remote files in memory."""
+        from trilogy.dialect.config import DuckDBConfig
+
+        if not (
+            isinstance(self.config, DuckDBConfig)
+            and self.config.remote_cache_row_groups
+        ):
+            return
+
+        def setup() -> None:
+            self.execute_raw_sql("SET enable_external_file_cache = true;")
+            self.execute_raw_sql("SET parquet_metadata_cache = true;")
+
+        self._connection_setup("remote_cache", setup)
 
     def close(self) -> None:
+        self._close_readers()
         self.generator.teardown()
         if self.connected:
+            # a pooled connection outlives this executor, and its temp tables
+            # with it
+            if self._shared_cte_tables:
+                self._drop_shared_ctes()
             self._flush_transaction()
             self.connection.close()
         self.engine.dispose(close=True)
@@ -618,9 +806,22 @@ class Executor:
     ) -> list[PROCESSED_STATEMENT_TYPES]:
         """Process author statements against this executor's environment/hooks.
         Non-generatable members of the union are rejected by the generator."""
-        return self.generator.generate_queries(
-            self.environment, statements, hooks=self.hooks  # type: ignore[arg-type]
-        )
+        if get_profiler() is None:
+            return self.generator.generate_queries(
+                self.environment, statements, hooks=self.hooks  # type: ignore[arg-type]
+            )
+        # one statement at a time, so each processed statement is bound to
+        # the profile its own planning was charged to
+        output: list[PROCESSED_STATEMENT_TYPES] = []
+        for statement in statements:
+            with statement_scope(type(statement).__name__) as profile:
+                processed = self.generator.generate_queries(
+                    self.environment, [statement], hooks=self.hooks  # type: ignore[list-item]
+                )
+            for item in processed:
+                bind_statement(item, profile)
+            output.extend(processed)
+        return output
 
     def _generate_sql(self, statements: Sequence[STATEMENT_TYPES]) -> list[str]:
         return [self.generator.compile_statement(x) for x in self._generate(statements)]
@@ -628,6 +829,18 @@ class Executor:
     def execute_statement(
         self,
         statement: PROCESSED_STATEMENT_TYPES | STATEMENT_TYPES,
+    ) -> ResultProtocol | None:
+        if get_profiler() is None:
+            return self._execute_statement(statement)
+        with statement_scope(type(statement).__name__, key=statement) as profile:
+            result = self._execute_statement(statement)
+            if profile is not None:
+                _record_result(profile, result)
+        return result
+
+    def _execute_statement(
+        self,
+        statement: PROCESSED_STATEMENT_TYPES | STATEMENT_TYPES,
     ) -> ResultProtocol | None:
         if isinstance(statement, STATEMENT_TYPES):
             generate = self._generate([statement])
@@ -758,13 +971,15 @@ class Executor:
 
         DuckDB reads python scripts and files lazily in the query itself;
         BigQuery has to stage them first. Runs before compilation because
-        rendering the source assumes the staged artifact's name.
+        rendering the source assumes the staged artifact's name. Timed as its
+        own ``fetch`` phase: it is network time, not rendering.
         """
         if not self.generator.REQUIRES_SOURCE_PREPARATION:
             return
         addresses = collect_source_addresses(query.ctes)
         if addresses:
-            self.generator.prepare_sources(addresses, self)
+            with phase("fetch"):
+                self.generator.prepare_sources(addresses, self)
 
     def compile_for_execution(self, query: ProcessedQuery) -> str:
         """Compile a statement that is about to run, rather than be displayed.
@@ -775,7 +990,8 @@ class Executor:
         ``generator.compile_statement`` stays side-effect free for the paths
         that only render SQL (``generate_sql``, `show`, metadata)."""
         self._prepare_query_sources(query)
-        return self.generator.compile_statement(query)
+        with phase("render"):
+            return self.generator.compile_statement(query)
 
     @execute_query.register
     def _(self, query: ProcessedQuery) -> ResultProtocol | None:
@@ -860,6 +1076,25 @@ class Executor:
         select_clause = ", ".join(alias_clauses)
         return f"SELECT {select_clause} FROM ({base_sql}) as _copy_source"
 
+    def _export_copy(
+        self, query: ProcessedCopyStatement, sql: str, target: str
+    ) -> None:
+        """Copy for engines without a native file writer: stream the result
+        back through the ``trilogy.io`` sinks a batch at a time."""
+        from trilogy.dialect.mock import arrow_scalar_type
+        from trilogy.execution.export import export_result
+
+        declared = {}
+        for col in query.output_columns:
+            arrow_type = arrow_scalar_type(col.datatype)
+            if arrow_type is not None:
+                name = query.column_aliases.get(col.address) or col.safe_address
+                declared[name] = arrow_type
+        result = self.execute_raw_sql(sql, local_concepts=query.local_concepts)
+        if result is None:
+            raise ValueError(f"copy into '{target}': query returned no result set")
+        export_result(result, query.target_type, target, declared)
+
     def _resolve_copy_target(self, target: str) -> str:
         """Resolve copy target path, making relative paths relative to working_path."""
         target_path = Path(target)
@@ -888,9 +1123,7 @@ class Executor:
                 raise NotImplementedError(f"Unsupported IO Type {query.target_type}")
             self.execute_raw_sql(copy_sql, local_concepts=query.local_concepts)
         else:
-            raise NotImplementedError(
-                f"COPY statement not supported for dialect {self.dialect}"
-            )
+            self._export_copy(query, sql, target)
         return MockResult(
             [{"query": self.generator.compile_statement(query)}],
             ["query"],
@@ -958,23 +1191,45 @@ class Executor:
             [{"target": query.target, "status": "success"}], ["target", "status"]
         )
 
-    def _run_chart_layers(self, query: ProcessedChartStatement) -> list[list[dict]]:
-        layer_data: list[list[dict]] = []
-        for layer in query.layers:
-            if layer.query is None:
-                layer_data.append([])
-                continue
-            sql = self.compile_for_execution(layer.query)
-            result = self.execute_raw_sql(
-                sql, local_concepts=layer.query.local_concepts
-            )
-            if result is None:
-                layer_data.append([])
-                continue
-            layer_data.append(
-                [dict(zip(result.keys(), row)) for row in result.fetchall()]
+    def _run_chart_layers(
+        self, query: ProcessedChartStatement, width: int | None = None
+    ) -> list[ChartColumns]:
+        # each result is read before the next query runs on the connection
+        results = [
+            ChartColumns.from_result(
+                self.execute_raw_sql(
+                    self._chart_sql(query, layer_query, width),
+                    local_concepts=layer_query.local_concepts,
+                )
             )
-        return layer_data
+            for layer_query in query.queries
+        ]
+        return _chart_layer_data(query, results)
+
+    def _chart_sql(
+        self,
+        statement: ProcessedChartStatement,
+        query: ProcessedQuery,
+        width: int | None = None,
+    ) -> str:
+        """SQL for one of a chart's layer queries, downsampled in the warehouse
+        when its layers would draw more rows than the chart has pixels for.
+
+        ``width`` is the pixel width the chart is drawn at; without one, the
+        report layout's chart width."""
+        from trilogy.execution.downsample import plan_downsample, render_downsample
+        from trilogy.rendering.theme import REPORT_LAYOUT
+
+        sql = self.compile_for_execution(query)
+        if not (
+            CONFIG.execution.downsample_charts
+            and self.generator.SUPPORTS_DERIVED_TABLE_WRAPPING
+        ):
+            return sql
+        plan = plan_downsample(statement, query, width or REPORT_LAYOUT.chart_width)
+        if plan is None:
+            return sql
+        return render_downsample(sql, query, plan, self.generator)
 
     def _resolve_chart_theme(self, override: str | None = None):
         from trilogy.rendering.theme import DEFAULT_THEME, get_theme
@@ -983,9 +1238,13 @@ class Executor:
 
     @execute_query.register
     def _(self, query: ProcessedChartStatement) -> ResultProtocol | None:
+        return self._chart_result(query, self._run_chart_layers(query))
+
+    def _chart_result(
+        self, query: ProcessedChartStatement, layer_data: list[ChartColumns]
+    ) -> ChartResult:
         from trilogy.rendering.altair_renderer import ALTAIR_AVAILABLE, AltairRenderer
 
-        layer_data = self._run_chart_layers(query)
         chart = None
         if ALTAIR_AVAILABLE:
             renderer = AltairRenderer(theme=self._resolve_chart_theme())
@@ -1001,6 +1260,7 @@ class Executor:
             chart_dependency_message,
         )
         from trilogy.rendering.chart_theme import theme_chart
+        from trilogy.rendering.image_cache import CHART_IMAGES
 
         if not ALTAIR_AVAILABLE:
             raise RuntimeError(
@@ -1011,7 +1271,10 @@ class Executor:
             query.options
         )
         theme = self._resolve_chart_theme(theme_name)
-        layer_data = self._run_chart_layers(query.chart)
+        width = size_props.get("width")
+        layer_data = self._run_chart_layers(
+            query.chart, width if isinstance(width, int) else None
+        )
         renderer = AltairRenderer(theme=theme)
         chart = renderer.render(query.chart, layer_data)
         if chart is None:
@@ -1022,7 +1285,12 @@ class Executor:
         if size_props:
             chart = chart.properties(**size_props)
         target = self._resolve_copy_target(query.target)
-        chart.save(target, format=query.target_type.value, **save_kwargs)
+        if target.startswith(("gcs://", "gs://")):
+            chart.save(target, format=query.target_type.value, **save_kwargs)
+        else:
+            CHART_IMAGES.save(
+                chart, target, format=query.target_type.value, **save_kwargs
+            )
         return MockResult([{"target": target}], ["target"])
 
     @singledispatchmethod
@@ -1112,8 +1380,21 @@ class Executor:
         the rewritten addresses."""
         if not self.datasource_transform:
             return
-        for ds in self.environment.datasources.values():
-            self.datasource_transform(ds)
+        datasources = self.environment.datasources
+        for key, datasource in list(datasources.items()):
+            if datasources.owns(key):
+                self.datasource_transform(datasource)
+                continue
+            # Shared with a fork: rewrite a probe carrying its own address,
+            # and only copy the datasource out of the shared layer when the
+            # rewrite actually moves it (most are already rewritten, or are
+            # queries and scripts the transform leaves alone).
+            probe = datasource.model_copy(
+                update={"address": copy.copy(datasource.address)}
+            )
+            self.datasource_transform(probe)
+            if probe.address != datasource.address:
+                datasources.edit(key).address = probe.address
         for statement in parsed:
             if isinstance(statement, PersistStatement):
                 self.datasource_transform(statement.datasource)
@@ -1125,7 +1406,8 @@ class Executor:
         definition statements (rowsets, concepts, imports, datasources, ...).
         Lets callers warn when a file parses cleanly but has no statement that
         produces output (a definitions-only file does nothing on its own)."""
-        _, parsed = parse_text(command, self.environment, root=root)
+        with parse_scope():
+            _, parsed = parse_text(command, self.environment, root=root)
         self._apply_datasource_transform(parsed)
         definitions = [
             x
@@ -1151,7 +1433,8 @@ class Executor:
         None,
     ]:
         """Process a preql text command"""
-        _, parsed = parse_text(command, self.environment, root=root)
+        with parse_scope():
+            _, parsed = parse_text(command, self.environment, root=root)
         self._apply_datasource_transform(parsed)
         generatable = [x for x in parsed if isinstance(x, GENERATABLE_STATEMENT_TYPES)]
         while generatable:
@@ -1306,22 +1589,37 @@ class Executor:
 
         while True:
             attempt += 1
+            if self._cancel_requested.is_set():
+                self._raise_cancelled()
             implicit = not self.connection.in_transaction()
+            if attempt == 1 and self._estimate_cost is not None:
+                # after `implicit`: an EXPLAIN may open the transaction the
+                # statement then runs in, which is still ours to commit
+                check_statement(
+                    self._estimate_cost,
+                    command,
+                    final_params,
+                    self.cost_budget or CostBudget(),
+                    self.run_cost,
+                )
             try:
                 statement = text(command)
                 cancel, timeout = self._cancel_query, self.query_timeout
-                if cancel is None or timeout is None:
-                    result = self._execute_now(statement, final_params)
-                else:
-                    result = self._execute_bounded(
-                        statement, final_params, timeout, cancel
-                    )
+                with phase("execute"):
+                    if cancel is None or timeout is None:
+                        result = self._execute_now(statement, final_params)
+                    else:
+                        result = self._execute_bounded(
+                            statement, final_params, timeout, cancel
+                        )
                 if implicit and self.connection.in_transaction():
                     self._owned_transaction = self.connection.get_transaction()
                 return result
             except QueryTimeoutException:
                 raise
             except Exception as e:
+                if self._cancel_requested.is_set():
+                    self._raise_cancelled(e)
                 policy = self._get_retry_policy(e)
                 if policy is None or attempt >= policy.max_attempts:
                     raise
@@ -1400,15 +1698,53 @@ class Executor:
         return self.execute_write_statements([command], local_concepts=local_concepts)
 
     def execute_text(
-        self, command: str, non_interactive: bool = False
+        self,
+        command: str,
+        non_interactive: bool = False,
+        concurrency: int | None = None,
     ) -> list[ResultProtocol]:
+        """Run a trilogy query expressed as text.
+
+        ``concurrency`` above 1 runs consecutive selects and charts on that
+        many connections at once (see trilogy/execution/concurrent.py);
+        defaults to ``CONFIG.execution.statement_concurrency``."""
+        return list(
+            self.execute_text_generator(
+                command, non_interactive=non_interactive, concurrency=concurrency
+            )
+        )
+
+    def execute_text_generator(
+        self,
+        command: str,
+        non_interactive: bool = False,
+        concurrency: int | None = None,
+    ) -> Generator[ResultProtocol, None, None]:
+        """``execute_text``, yielding each result as its statement finishes.
+
+        A driver may reuse one cursor per connection, so a result read after
+        the next statement has run can come back empty; read (or buffer) each
+        one before advancing."""
         if not self.connected:
             self.connect()
 
-        """Run a trilogy query expressed as text."""
-        output: list[ResultProtocol] = []
+        share = self._sharing_enabled()
+        if share:
+            self.last_sharing_plan = SharingPlan()
+        concurrency = self.read_concurrency(concurrency)
+        run: list[tuple[int, Any]] = []
         # connection = self.engine.connect()
-        for statement in self.parse_text_generator(command):
+        for position, statement in enumerate(self.parse_text_generator(command)):
+            batchable = (share and is_shareable_statement(statement)) or (
+                concurrency > 1 and is_concurrent_read(statement)
+            )
+            if batchable:
+                if not non_interactive or isinstance(statement, ProcessedCopyStatement):
+                    run.append((position, statement))
+                continue
+            if run:
+                yield from self._execute_run(run, share, concurrency)
+                run = []
             if isinstance(statement, ProcessedShowStatement):
                 results = handle_show_statement_outputs(
                     statement,
@@ -1420,14 +1756,14 @@ class Executor:
                     self.environment,
                     self.generator,
                 )
-                output.extend(results)
+                yield from results
                 continue
             elif isinstance(statement, ProcessedValidateStatement):
                 validate_result = handle_processed_validate_statement(
                     statement, self.generator, self.validate_environment
                 )
                 if validate_result:
-                    output.append(validate_result)
+                    yield validate_result
                 continue
             if non_interactive and not isinstance(
                 statement,
@@ -1443,8 +1779,237 @@ class Executor:
                 continue
             result = self.execute_statement(statement)
             if result:
-                output.append(result)
-        return output
+                yield result
+        if run:
+            yield from self._execute_run(run, share, concurrency)
+
+    def _sharing_enabled(self) -> bool:
+        return (
+            CONFIG.execution.share_ctes and self.generator.SUPPORTS_SESSION_TEMP_TABLES
+        )
+
+    def explain_shared_ctes(self, command: str) -> SharingPlan:
+        """Which CTEs ``execute_text`` would compute once and share across
+        ``command``'s statements, without running anything. Row counts are
+        only known after a real run (see ``last_sharing_plan``)."""
+        plan = SharingPlan()
+        run: list[tuple[int, ProcessedQuery]] = []
+        for position, statement in enumerate(self.parse_text_generator(command)):
+            if is_shareable_statement(statement):
+                run.append((position, cast(ProcessedQuery, statement)))
+                continue
+            plan.shared.extend(plan_shared_ctes(run, self.generator).shared)
+            run = []
+        plan.shared.extend(plan_shared_ctes(run, self.generator).shared)
+        return plan
+
+    def _execute_run(
+        self, run: list[tuple[int, Any]], share: bool, concurrency: int
+    ) -> list[ResultProtocol]:
+        """Execute a run of read-only statements, computing the CTEs they
+        share once (see trilogy/execution/shared_ctes.py) and running them
+        concurrently (see trilogy/execution/concurrent.py) when enabled.
+
+        Shared CTE tables are session temp tables that other connections
+        cannot see, so a run that materialized any runs on this connection."""
+        shared = False
+        if share:
+            shared = self._share_run(
+                [(pos, stmt) for pos, stmt in run if is_shareable_statement(stmt)]
+            )
+        statements = [statement for _, statement in run]
+        if concurrency > 1 and not shared:
+            pending = [
+                (
+                    self.submit_read(stmt, concurrency)
+                    if is_concurrent_read(stmt)
+                    else None
+                )
+                for stmt in statements
+            ]
+            results = [
+                read.result() if read else self.execute_statement(stmt)
+                for stmt, read in zip(statements, pending)
+            ]
+        else:
+            results = [self.execute_statement(stmt) for stmt in statements]
+        return [result for result in results if result]
+
+    def _share_run(self, run: list[tuple[int, ProcessedQuery]]) -> bool:
+        """Plan and materialize ``run``'s shared CTEs; whether any were."""
+        self._drop_shared_ctes()
+        plan = plan_shared_ctes(run, self.generator)
+        for share in plan.shared:
+            self._materialize_shared_cte(share)
+        if self.last_sharing_plan is not None:
+            self.last_sharing_plan.shared.extend(plan.shared)
+        if plan.shared:
+            logger.info(plan.explain())
+        return any(share.materialized for share in plan.shared)
+
+    def read_concurrency(self, requested: int | None = None) -> int:
+        """How many read statements may run at once: ``requested`` (or the
+        configured default), or 1 when this dialect's connections do not
+        share data and session setup (in-memory and embedded databases), or
+        when there is no dialect config to open reader connections from."""
+        if not self.generator.SUPPORTS_CONCURRENT_READS or self.config is None:
+            return 1
+        if requested is None:
+            requested = CONFIG.execution.statement_concurrency
+        return max(1, requested)
+
+    def submit_read(self, statement: ConcurrentRead, concurrency: int) -> PendingRead:
+        """Compile ``statement`` here and start its SQL on the read pool."""
+        queries = (
+            statement.queries
+            if isinstance(statement, ProcessedChartStatement)
+            else [statement]
+        )
+        jobs = [
+            self.prepare_sql(
+                (
+                    self._chart_sql(statement, query)
+                    if isinstance(statement, ProcessedChartStatement)
+                    else self.compile_for_execution(query)
+                ),
+                local_concepts=query.local_concepts,
+            )
+            for query in queries
+        ]
+        pool = self._read_threads(concurrency)
+        return PendingRead(
+            self,
+            statement,
+            [pool.submit(self._run_on_reader, *job) for job in jobs],
+        )
+
+    def finish_read(
+        self, statement: ConcurrentRead, results: list[BufferedResult]
+    ) -> ResultProtocol | None:
+        """The result ``execute_statement`` would have given, from the rows a
+        ``submit_read`` fetched."""
+        if isinstance(statement, ProcessedChartStatement):
+            return self._chart_result(
+                statement,
+                _chart_layer_data(
+                    statement, [ChartColumns.from_result(result) for result in results]
+                ),
+            )
+        return results[0]
+
+    def _read_threads(self, concurrency: int) -> ThreadPoolExecutor:
+        if self._read_pool is None or self._read_pool_size != concurrency:
+            if self._read_pool is not None:
+                self._read_pool.shutdown(wait=True)
+            self._read_pool = ThreadPoolExecutor(
+                max_workers=concurrency, thread_name_prefix="trilogy-read"
+            )
+            self._read_pool_size = concurrency
+        return self._read_pool
+
+    def _run_on_reader(self, sql: str, params: dict | None) -> BufferedResult:
+        """Run one prepared read on a pooled connection and buffer its rows:
+        the connection goes back to the pool before the caller reads them."""
+        try:
+            reader = self._idle_readers.get_nowait()
+        except queue.Empty:
+            reader = self._new_reader()
+            with self._readers_lock:
+                self._readers.append(reader)
+        try:
+            result = reader._execute_with_retry(sql, params)
+            buffered = (
+                BufferedResult(list(result.keys()), list(result.fetchall()))
+                if result.returns_rows
+                else BufferedResult([], [])
+            )
+            reader._flush_transaction()
+            return buffered
+        finally:
+            self._idle_readers.put(reader)
+
+    def _new_reader(self) -> "Executor":
+        """A separate executor for concurrent reads, built from this one's
+        config: its own engine connection, generator and caches, so a read
+        never touches state the writer is using. Readers only run SQL the
+        writer already compiled, so they get an empty environment rather
+        than a copy of the writer's, which the writer may be mutating while
+        this runs on a read thread. Cost estimates still count toward this
+        run."""
+        from trilogy.execution.connection_pool import shared_engine_factory
+
+        reader = Executor(
+            dialect=self.dialect,
+            engine=self.dialect.default_engine(
+                conf=self.config, _engine_factory=shared_engine_factory
+            ),
+            environment=Environment(working_path=self.environment.working_path),
+            rendering=self.generator.rendering,
+            hooks=self.hooks,
+            config=self.config,
+            staging=self.staging,
+            query_timeout=self.query_timeout,
+            cost_budget=self.cost_budget,
+        )
+        reader.run_cost = self.run_cost
+        return reader
+
+    def _close_readers(self) -> None:
+        if self._read_pool is not None:
+            self._read_pool.shutdown(wait=True)
+            self._read_pool = None
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        self._idle_readers = queue.Queue()
+        for reader in readers:
+            try:
+                reader.close()
+            except Exception as e:
+                logger.debug(f"Failed to close read connection: {e}")
+
+    def _materialize_shared_cte(self, share: SharedCTE) -> None:
+        owner, _ = share.consumers[0]
+        limit = CONFIG.execution.shared_cte_max_rows
+        # one row past the limit is enough to know the share is too big, so
+        # an oversized share never writes more than that
+        probe = limit + 1 if self.generator.SUPPORTS_DERIVED_TABLE_WRAPPING else None
+        try:
+            self._prepare_query_sources(owner)
+            self.execute_raw_sql(
+                self.generator.render_shared_cte_create(
+                    share.table,
+                    render_shared_select(share, self.generator, limit=probe),
+                ),
+                local_concepts=owner.local_concepts,
+            )
+        except Exception as e:
+            # an optimization must not fail a script that runs without it
+            share.skipped = f"create failed: {e}"
+            logger.debug(f"Could not materialize shared CTE {share.cte_name}: {e}")
+            return
+        self._shared_cte_tables.append(share.table)
+        counted = self.execute_raw_sql(
+            f"SELECT COUNT(*) FROM {self.generator.quote(share.table)}"
+        ).fetchone()
+        share.rows = counted[0] if counted else 0
+        if share.rows > limit:
+            share.skipped = f"more than the {limit} row limit"
+            self._drop_shared_ctes([share.table])
+            return
+        for consumer, name in share.consumers:
+            consumer.shared_ctes[name] = share.table
+
+    def _drop_shared_ctes(self, tables: list[str] | None = None) -> None:
+        tables = list(self._shared_cte_tables) if tables is None else tables
+        for table in tables:
+            try:
+                self.execute_raw_sql(
+                    f"DROP TABLE IF EXISTS {self.generator.quote(table)}"
+                )
+            except Exception as e:
+                logger.debug(f"Failed to drop shared CTE table {table}: {e}")
+            if table in self._shared_cte_tables:
+                self._shared_cte_tables.remove(table)
 
     def execute_ephemeral(self, command: str) -> ResultProtocol | None:
         """Plan and run select statements whose parse artifacts stay
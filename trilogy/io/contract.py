@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import inspect
 import json
+import math
 import re
 from collections.abc import Callable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field, fields, replace
@@ -247,8 +248,10 @@ def apply(
     if not (filters or columns or order_by or limit is not None):
         return reader
     if order_by:
-        # Sorting cannot stream: the last batch can hold the first row. This is
-        # why a source that can order itself should claim ``order_by``.
+        # Sorting cannot stream: the last batch can hold the first row. It is
+        # bounded in memory (top-K, or spilled runs) but still reads the whole
+        # source, which is why a source that can order itself should claim
+        # ``order_by``.
         return _sorted_reader(reader, filters, order_by, columns, limit, schema)
     return pa.RecordBatchReader.from_batches(
         schema, _transform(reader, filters, columns, limit)
@@ -263,21 +266,214 @@ def _sorted_reader(
     limit: int | None,
     schema: pa.Schema,
 ) -> pa.RecordBatchReader:
-    """Filter, then sort, then limit, then project -- in that order."""
-    batches = list(_transform(reader, filters, None, None))
-    table = (
-        pa.Table.from_batches(batches, reader.schema)
-        if batches
-        else reader.schema.empty_table()
-    )
-    table = table.sort_by(
-        [(s.column, "descending" if s.descending else "ascending") for s in order_by]
-    )
+    """Filter, then sort, then limit, then project -- in that order.
+
+    With a limit only the best ``limit`` rows seen so far are held; without
+    one, sorted runs past ``SORT_MEMORY_BYTES`` spill to disk and are merged.
+    Both are stable, so ties keep source order exactly as one in-memory sort
+    would.
+    """
+    batches = _transform(reader, filters, None, None)
     if limit is not None:
-        table = table.slice(0, limit)
+        sorted_batches = _top_k(batches, order_by, limit, reader.schema).to_batches()
+    else:
+        sorted_batches = _external_sort(batches, order_by, reader.schema)
     if columns:
-        table = table.select(list(columns))
-    return pa.RecordBatchReader.from_batches(schema, table.to_batches())
+        sorted_batches = (batch.select(list(columns)) for batch in sorted_batches)
+    return pa.RecordBatchReader.from_batches(schema, iter(sorted_batches))
+
+
+# --- sorting ------------------------------------------------------------------
+# Arrow's sort is stable, so re-sorting kept rows ahead of new ones, or merging
+# runs in the order they were cut, gives the same order as one sort over the
+# whole stream. Nulls and NaNs go last in either direction, as Arrow places them.
+
+#: Bytes of sortable rows held before a sorted run is spilled to disk.
+SORT_MEMORY_BYTES = 256 * 1024 * 1024
+#: Rows per batch in a spilled run, and per batch out of the merge.
+MERGE_BATCH_ROWS = 65_536
+#: Where spilled runs go; defaults to the system temp directory.
+SPILL_DIR_ENV = "TRILOGY_IO_SPILL_DIR"
+
+
+def _sort_table(table: pa.Table, order_by: tuple[Sort, ...]) -> pa.Table:
+    return table.sort_by(
+        [(s.column, "descending" if s.descending else "ascending") for s in order_by]
+    )
+
+
+def _top_k(
+    batches: Iterator[pa.RecordBatch],
+    order_by: tuple[Sort, ...],
+    limit: int,
+    schema: pa.Schema,
+) -> pa.Table:
+    """The first ``limit`` rows of the sorted stream, holding about that many.
+
+    Batches are buffered until they outnumber the kept rows, then sorted in
+    behind them and cut back to ``limit`` -- so each sort is over at most
+    twice the rows kept, plus one batch."""
+    kept = schema.empty_table()
+    pending: list[pa.RecordBatch] = []
+    pending_rows = 0
+    for batch in batches:
+        if limit == 0:
+            break
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        if pending_rows >= max(limit, MERGE_BATCH_ROWS):
+            kept = _keep_top(kept, pending, order_by, limit)
+            pending, pending_rows = [], 0
+    if pending:
+        kept = _keep_top(kept, pending, order_by, limit)
+    return kept.combine_chunks()
+
+
+def _keep_top(
+    kept: pa.Table,
+    pending: list[pa.RecordBatch],
+    order_by: tuple[Sort, ...],
+    limit: int,
+) -> pa.Table:
+    # kept rows go first: they came from earlier in the stream
+    combined = pa.Table.from_batches([*kept.to_batches(), *pending], kept.schema)
+    return _sort_table(combined, order_by).slice(0, limit)
+
+
+def _external_sort(
+    batches: Iterator[pa.RecordBatch],
+    order_by: tuple[Sort, ...],
+    schema: pa.Schema,
+) -> Iterator[pa.RecordBatch]:
+    """Sort the stream, spilling sorted runs to disk once it outgrows memory."""
+    import os
+    import tempfile
+
+    pending: list[pa.RecordBatch] = []
+    pending_bytes = 0
+    spill: tempfile.TemporaryDirectory[str] | None = None
+    runs: list[str] = []
+    try:
+        for batch in batches:
+            pending.append(batch)
+            pending_bytes += batch.nbytes
+            if pending_bytes < SORT_MEMORY_BYTES:
+                continue
+            if spill is None:
+                spill = tempfile.TemporaryDirectory(
+                    prefix="trilogy-sort-", dir=os.environ.get(SPILL_DIR_ENV)
+                )
+            runs.append(_spill_run(pending, order_by, schema, spill.name, len(runs)))
+            pending, pending_bytes = [], 0
+        in_memory = _sort_table(pa.Table.from_batches(pending, schema), order_by)
+        if not runs:
+            yield from in_memory.to_batches()
+            return
+        yield from _merge_runs(runs, in_memory, order_by)
+    finally:
+        if spill is not None:
+            spill.cleanup()
+
+
+def _spill_run(
+    batches: list[pa.RecordBatch],
+    order_by: tuple[Sort, ...],
+    schema: pa.Schema,
+    directory: str,
+    index: int,
+) -> str:
+    import os
+
+    table = _sort_table(pa.Table.from_batches(batches, schema), order_by)
+    path = os.path.join(directory, f"run-{index:05d}.arrow")
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+        for batch in table.to_batches(max_chunksize=MERGE_BATCH_ROWS):
+            writer.write_batch(batch)
+    return path
+
+
+def _run_batches(path: str) -> Iterator[pa.RecordBatch]:
+    # read, not memory-mapped: merged batches can outlive the file
+    with pa.OSFile(path, "rb") as source:
+        reader = pa.ipc.open_file(source)
+        for index in range(reader.num_record_batches):
+            yield reader.get_batch(index)
+
+
+class _Descending:
+    """Inverts ordering for one sort column of a merge key."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+    def __lt__(self, other: _Descending) -> bool:
+        return other.value < self.value
+
+
+def _key_part(value: Any, descending: bool) -> tuple[int, Any]:
+    if value is None:
+        return (2, None)
+    if isinstance(value, float) and math.isnan(value):
+        return (1, None)
+    return (0, _Descending(value) if descending else value)
+
+
+def _keyed_rows(
+    batches: Iterator[pa.RecordBatch], order_by: tuple[Sort, ...]
+) -> Iterator[tuple[tuple, pa.RecordBatch, int]]:
+    """(merge key, batch, offset) for every row of one sorted run."""
+    for batch in batches:
+        values = [batch.column(s.column).to_pylist() for s in order_by]
+        for offset, row in enumerate(zip(*values)):
+            key = tuple(
+                _key_part(value, s.descending) for value, s in zip(row, order_by)
+            )
+            yield key, batch, offset
+
+
+def _merge_runs(
+    runs: list[str], tail: pa.Table, order_by: tuple[Sort, ...]
+) -> Iterator[pa.RecordBatch]:
+    """K-way merge of sorted runs, in run order on ties.
+
+    Only the sort keys are compared in python; each output batch is gathered
+    from the runs' current batches with one ``take``."""
+    import heapq
+
+    sources: list[Iterator[pa.RecordBatch]] = [_run_batches(path) for path in runs]
+    sources.append(iter(tail.to_batches(max_chunksize=MERGE_BATCH_ROWS)))
+    merged = heapq.merge(
+        *(_keyed_rows(source, order_by) for source in sources),
+        key=lambda item: item[0],
+    )
+    blocks: dict[int, tuple[int, pa.RecordBatch]] = {}
+    indices: list[int] = []
+    base = 0
+    for _, batch, offset in merged:
+        entry = blocks.get(id(batch))
+        if entry is None:
+            entry = blocks[id(batch)] = (base, batch)
+            base += batch.num_rows
+        indices.append(entry[0] + offset)
+        if len(indices) >= MERGE_BATCH_ROWS:
+            yield _gather(blocks, indices, tail.schema)
+            blocks, indices, base = {}, [], 0
+    if indices:
+        yield _gather(blocks, indices, tail.schema)
+
+
+def _gather(
+    blocks: dict[int, tuple[int, pa.RecordBatch]],
+    indices: list[int],
+    schema: pa.Schema,
+) -> pa.RecordBatch:
+    table = pa.Table.from_batches([batch for _, batch in blocks.values()], schema)
+    return table.take(pa.array(indices, pa.int64())).combine_chunks().to_batches()[0]
 
 
 def _validate_columns(
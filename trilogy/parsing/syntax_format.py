@@ -0,0 +1,159 @@
+"""Syntax-only layout formatting.
+
+``trilogy fmt`` normally reprints a file through the ``Renderer``, which needs
+the file hydrated: imports resolved, concepts built, virtual references looked
+up. That is the only way to produce canonical statements, and far more work
+than fixing layout needs.
+
+This module formats from the syntax tree alone. The tree keeps named tokens
+and comments with their source positions, but not keywords or punctuation, so
+it cannot reprint a statement. What it can do is normalize the whitespace
+*between* statements and around them, without touching a single token:
+
+- each statement starts at the beginning of its own line;
+- trailing whitespace is stripped, and leading tabs become four spaces;
+- runs of blank lines collapse to one, with none at the start of the file;
+- the file ends with exactly one newline.
+
+Multi-line tokens, such as raw SQL in a ``query '''...'''`` datasource, are
+left byte-for-byte as written. The result is parsed again and must yield the
+same tokens in the same order, or formatting fails rather than change meaning.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+
+from trilogy.parsing.v2.syntax import (
+    SyntaxDocument,
+    SyntaxElement,
+    SyntaxNode,
+    SyntaxToken,
+)
+
+COMMENT_TOKEN = "PARSE_COMMENT"
+INDENT = "    "
+
+_TRAILING_SPACE = re.compile(r"[ \t]+(?=\n)")
+_LEADING_TABS = re.compile(r"(?m)^[ \t]*\t[ \t]*")
+_BLANK_RUN = re.compile(r"\n{3,}")
+
+
+def _tokens(element: SyntaxElement) -> Iterator[SyntaxToken]:
+    if isinstance(element, SyntaxNode):
+        for child in element.children:
+            yield from _tokens(child)
+    else:
+        yield element
+
+
+def _span_end(element: SyntaxElement) -> int:
+    # a statement's trailing comment is its child but lies past its end_pos
+    end = element.end_pos or 0
+    for token in _tokens(element):
+        end = max(end, token.end_pos or 0)
+    return end
+
+
+def _protected_spans(document: SyntaxDocument) -> list[tuple[int, int]]:
+    """Spans of tokens whose text contains a newline; never edited."""
+    spans = []
+    for token in _tokens(document.tree):
+        if (
+            token.name != COMMENT_TOKEN
+            and "\n" in token.value
+            and token.start_pos is not None
+            and token.end_pos is not None
+        ):
+            spans.append((token.start_pos, token.end_pos))
+    return sorted(spans)
+
+
+def _statement_starts(document: SyntaxDocument) -> list[tuple[int, bool]]:
+    """Each statement's start, and whether it shares a line with the text
+    before it."""
+    starts = []
+    previous_end = 0
+    for form in document.forms:
+        start = form.start_pos
+        if start is None:
+            continue
+        if isinstance(form, SyntaxNode):
+            # a comment token carries its own newline, hence the ``- 1``
+            before = document.text[max(previous_end - 1, 0) : start]
+            starts.append((start, previous_end > 0 and "\n" not in before))
+        previous_end = _span_end(form)
+    return starts
+
+
+def _indent_tabs(match: re.Match[str]) -> str:
+    return match.group(0).replace("\t", INDENT)
+
+
+def _normalize_chunk(chunk: str, at_line_start: bool) -> str:
+    chunk = _TRAILING_SPACE.sub("", chunk)
+    if at_line_start:
+        chunk = _LEADING_TABS.sub(_indent_tabs, chunk)
+    else:
+        # the chunk resumes mid-line, right after a protected token
+        head, newline, rest = chunk.partition("\n")
+        chunk = head + newline + _LEADING_TABS.sub(_indent_tabs, rest)
+    return _BLANK_RUN.sub("\n\n", chunk)
+
+
+def layout(document: SyntaxDocument) -> str:
+    """The document's text with normalized layout; see the module docstring."""
+    text = document.text
+    starts = _statement_starts(document)
+    pieces: list[str] = []
+    cursor = 0
+    for start, end in [*_protected_spans(document), (len(text), len(text))]:
+        if start < cursor:
+            continue
+        chunk = text[cursor:start]
+        # statements start after whitespace, so never inside a protected span;
+        # each moves to column 0 of its own line
+        for position, shares_line in reversed(
+            [item for item in starts if cursor <= item[0] < start]
+        ):
+            offset = position - cursor
+            head = chunk[:offset].rstrip(" \t")
+            if shares_line:
+                head += "\n"
+            chunk = head + chunk[offset:]
+        at_line_start = cursor == 0 or text[cursor - 1] == "\n"
+        pieces.append(_normalize_chunk(chunk, at_line_start))
+        pieces.append(text[start:end])
+        cursor = end
+    formatted = "".join(pieces).lstrip("\n").rstrip()
+    return formatted + "\n" if formatted else ""
+
+
+def _token_stream(document: SyntaxDocument) -> list[tuple[str, str]]:
+    return [
+        (
+            token.name,
+            token.value.rstrip() if token.name == COMMENT_TOKEN else token.value,
+        )
+        for token in _tokens(document.tree)
+    ]
+
+
+def format_syntax(text: str) -> str:
+    """Format ``text`` by layout alone, without hydrating it.
+
+    Raises the parser's syntax error for unparseable text, and ``ValueError``
+    if the reformatted text would not parse back to the same tokens."""
+    from trilogy.parsing.parse_engine_v2 import parse_syntax
+
+    document = parse_syntax(text)
+    formatted = layout(document)
+    if formatted == text:
+        return formatted
+    if _token_stream(parse_syntax(formatted)) != _token_stream(document):
+        raise ValueError(
+            "Syntax-only formatting would change the file's tokens; "
+            "format it without --syntax-only."
+        )
+    return formatted
@@ -37,6 +37,7 @@ from trilogy.parsing.v2.statement_planner import (
 from trilogy.parsing.v2.statement_plans import (
     CommentStatementPlan,
     ConceptStatementPlan,
+    ImportStatementPlan,
     RowsetStatementPlan,
     StatementPlan,
     StatementPlanBase,
@@ -242,6 +243,7 @@ class NativeHydrator:
             # and intentionally stays outside the rollback window: imports
             # mutate the environment via add_import and should persist across
             # parse failures in later statements.
+            self._prefetch_imports()
             self._run_phase(HydrationPhase.LOAD_IMPORTS)
             self._run_phase(HydrationPhase.COLLECT_SYMBOLS)
             self._run_phase(HydrationPhase.BIND)
@@ -308,6 +310,19 @@ class NativeHydrator:
     def plan(self, forms: list[SyntaxElement]) -> list[StatementPlan]:
         return self._planner.plan(forms)
 
+    def _prefetch_imports(self) -> None:
+        """Load the document's whole import closure concurrently before the
+        sequential LOAD_IMPORTS walk (root parses only)."""
+        plans = [plan for plan in self.plans if isinstance(plan, ImportStatementPlan)]
+        if not plans or self.import_service.closure_stack:
+            return
+        requests = [
+            request
+            for plan in plans
+            if (request := plan.prepare_request(self)) is not None
+        ]
+        self.import_service.prefetch(requests)
+
     def _run_phase(self, phase: HydrationPhase) -> list[Any]:
         output = []
         for plan in self.plans:
@@ -0,0 +1,118 @@
+"""Import-closure prefetch: read and parse every transitively imported file up
+front, concurrently, before hydration walks the imports depth-first.
+
+Hydration itself stays sequential and in dependency order — a child env must
+be fully built before its importer can ``add_import`` it — but the I/O and the
+pest parse of each file do not depend on anything but the file's text. The
+Rust ``ImportResolver`` already knows how to walk a file's import graph, so the
+root parse hands it the direct import targets, gets the whole closure back in
+topological order, and reads + parses those files on a small thread pool. The
+texts land in the hydration ``text_lookup`` and the syntax trees in the
+``parse_syntax`` cache, so the depth-first walk that follows only hydrates.
+
+Prefetch is best-effort: anything the resolver cannot see (stdlib, configured
+``import_paths``, unreadable or unparseable files) is simply left for the
+regular path, which reports errors with full import context.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from logging import getLogger
+from pathlib import Path
+
+from trilogy.utility import safe_open
+
+perf_logger = getLogger("trilogy.parse.performance")
+
+# Below this many unread files a thread pool costs more than it saves.
+PREFETCH_MIN_FILES = 2
+PREFETCH_MAX_WORKERS = 8
+
+
+@dataclass
+class ImportPrefetch:
+    """What one prefetch pass did: the closure in dependency order (deps
+    first) and the resolved paths whose text was loaded."""
+
+    order: list[str] = field(default_factory=list)
+    loaded: dict[str, str] = field(default_factory=dict)
+    parsed: int = 0
+
+
+def discover_import_closure(targets: list[str]) -> list[str]:
+    """Transitive import closure of ``targets`` in dependency order, via the
+    Rust import resolver. Empty when the extension is unavailable; targets the
+    resolver rejects are skipped."""
+    try:
+        from _preql_import_resolver import PyImportResolver
+    except ImportError:
+        return []
+    resolver = PyImportResolver()
+    order: dict[str, None] = {}
+    for target in targets:
+        try:
+            graph = resolver.resolve(target)
+        except (ValueError, OSError):
+            continue
+        for path in graph.get("order", []):
+            order.setdefault(path)
+    return list(order)
+
+
+def _load(path: str, parse: bool) -> tuple[str, str | None, bool]:
+    from trilogy.parsing.parse_engine_v2 import parse_syntax
+
+    try:
+        with safe_open(path) as f:
+            text = f.read()
+    except OSError:
+        return path, None, False
+    if not parse:
+        return path, text, False
+    try:
+        parse_syntax(text)
+    except Exception:
+        # the regular import path re-parses and raises with import context
+        return path, text, False
+    return path, text, True
+
+
+def prefetch_import_closure(
+    targets: list[str],
+    text_lookup: dict[Path | str, str],
+    skip_parse: set[str] | None = None,
+    max_workers: int = PREFETCH_MAX_WORKERS,
+) -> ImportPrefetch:
+    """Read (and parse, unless in ``skip_parse``) the closure of ``targets``
+    concurrently, publishing texts into ``text_lookup`` keyed by resolved path.
+
+    ``skip_parse`` holds resolved paths whose environments are expected to come
+    from the cross-parse store; their text is still needed to validate the
+    store entry, but parsing them would be wasted work.
+    """
+    order = discover_import_closure(targets)
+    result = ImportPrefetch(order=order)
+    pending = [path for path in order if Path(path) not in text_lookup]
+    if len(pending) < PREFETCH_MIN_FILES:
+        return result
+    skip_parse = skip_parse or set()
+    workers = min(max_workers, len(pending))
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="trilogy-import"
+    ) as pool:
+        loads = list(
+            pool.map(lambda path: _load(path, path not in skip_parse), pending)
+        )
+    for path, text, parsed in loads:
+        if text is None:
+            continue
+        text_lookup[Path(path)] = text
+        result.loaded[path] = text
+        result.parsed += parsed
+    perf_logger.debug(
+        f"Prefetched {len(result.loaded)} import(s), parsed {result.parsed}, "
+        f"closure of {len(order)} file(s) on {workers} thread(s)"
+    )
+    return result
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import threading
+import time
+import tracemalloc
 from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from dataclasses import dataclass, field
-from os.path import dirname
+from os.path import abspath, dirname, normpath
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -21,6 +25,7 @@ from trilogy.core.statements.author import ImportStatement
 from trilogy.utility import safe_open
 
 if TYPE_CHECKING:
+    from trilogy.parsing.v2.import_prefetch import ImportPrefetch
     from trilogy.parsing.v2.semantic_state import SemanticState
 
 
@@ -236,8 +241,212 @@ def _store_fill(key: tuple, entry: _ImportEnvEntry) -> None:
     with _IMPORT_ENV_STORE_LOCK:
         _IMPORT_ENV_STORE[key] = entry
         _IMPORT_ENV_STORE.move_to_end(key)
-        while len(_IMPORT_ENV_STORE) > _IMPORT_ENV_STORE_MAX:
-            _IMPORT_ENV_STORE.popitem(last=False)
+        # a shared-import run pins its modules; the cap applies again on exit
+        if _SHARED_IMPORT_RUN is None:
+            _trim_store()
+
+
+def _trim_store() -> None:
+    while len(_IMPORT_ENV_STORE) > _IMPORT_ENV_STORE_MAX:
+        _IMPORT_ENV_STORE.popitem(last=False)
+
+
+def _canonical_path(path: str) -> str:
+    # Lexical only: following symlinks could conflate two spellings whose
+    # relative imports resolve against different directories.
+    return normpath(abspath(path))
+
+
+# ---------------------------------------------------------------------------
+# Shared import modules for multi-script runs.
+#
+# A directory run parses hundreds of scripts, on a thread pool, that import the
+# same dimension files. Inside `shared_import_scope()` the store above is
+# pinned (no LRU eviction), each store key builds under a single-flight lock so
+# concurrent scripts wait for one build instead of racing their own, and every
+# build/reuse is accounted per module for the run report. Reuse still goes
+# through the store's closure/integrity validation, and aliased imports still
+# receive the entry's cached NamespaceProjection, so the shared env is only
+# ever read; a slot that sees its env change before release raises.
+# ---------------------------------------------------------------------------
+
+# Single-flight waits are bounded as a backstop. Two scripts building each
+# other's imports (a circular import seen from two threads) are caught before
+# they wait: a thread that would wait on a chain of slot holders leading back
+# to itself builds its own copy instead, as it would outside the scope.
+SHARED_BUILD_WAIT_S = 30.0
+
+
+def _content_version(env: Environment) -> tuple[int, int]:
+    return (env.concepts.content_version, env.datasources.content_version)
+
+
+@dataclass
+class SlotClaim:
+    """The env a build slot handed out, checked unchanged at release."""
+
+    key: tuple
+    env: Environment | None = None
+    version: tuple[int, int] | None = None
+
+    def hold(self, env: Environment) -> None:
+        self.env = env
+        self.version = _content_version(env)
+
+    def check(self) -> None:
+        if self.env is not None and _content_version(self.env) != self.version:
+            raise RuntimeError(
+                f"Shared import {self.key[0]} was modified while in use; "
+                "imported modules are read-only inside shared_import_scope()."
+            )
+
+
+@dataclass
+class SharedModuleStats:
+    """Per-module accounting for one shared-import run."""
+
+    path: str
+    builds: int = 0
+    reuses: int = 0
+    invalidations: int = 0
+    build_s: float = 0.0
+    concepts: int = 0
+    datasources: int = 0
+    # Net traced allocation during the (inclusive) build; None unless
+    # tracemalloc is tracing (e.g. PYTHONTRACEMALLOC=1).
+    allocated_bytes: int | None = None
+
+    def as_report(self) -> dict:
+        return {
+            "path": self.path,
+            "builds": self.builds,
+            "reuses": self.reuses,
+            "invalidations": self.invalidations or None,
+            "build_s": round(self.build_s, 6),
+            "concepts": self.concepts,
+            "datasources": self.datasources,
+            "allocated_bytes": self.allocated_bytes,
+        }
+
+
+@dataclass
+class SharedImportRun:
+    modules: dict[tuple, SharedModuleStats] = field(default_factory=dict)
+    _locks: dict[tuple, threading.Lock] = field(default_factory=dict)
+    # thread holding each key's slot, and the key each waiting thread wants
+    _owners: dict[tuple, int] = field(default_factory=dict)
+    _waiting: dict[int, tuple] = field(default_factory=dict)
+    _guard: threading.Lock = field(default_factory=threading.Lock)
+
+    def stats_for(self, key: tuple) -> SharedModuleStats:
+        with self._guard:
+            stats = self.modules.get(key)
+            if stats is None:
+                stats = SharedModuleStats(path=key[0])
+                self.modules[key] = stats
+            return stats
+
+    def _waits_on_self(self, key: tuple, thread: int) -> bool:
+        """Whether waiting for ``key`` would wait on ``thread`` itself: the
+        holders of ``key``, of the key that holder waits for, and so on,
+        lead back to it. Called under ``_guard``."""
+        seen: set[int] = set()
+        while (owner := self._owners.get(key)) is not None and owner not in seen:
+            if owner == thread:
+                return True
+            seen.add(owner)
+            next_key = self._waiting.get(owner)
+            if next_key is None:
+                return False
+            key = next_key
+        return False
+
+    @contextmanager
+    def build_slot(self, key: tuple) -> Iterator[SlotClaim]:
+        thread = threading.get_ident()
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+            acquired = lock.acquire(blocking=False)
+            if acquired:
+                self._owners[key] = thread
+            cyclic = not acquired and self._waits_on_self(key, thread)
+            if not acquired and not cyclic:
+                self._waiting[thread] = key
+        if not acquired and not cyclic:
+            acquired = lock.acquire(timeout=SHARED_BUILD_WAIT_S)
+            with self._guard:
+                del self._waiting[thread]
+                if acquired:
+                    self._owners[key] = thread
+        claim = SlotClaim(key)
+        try:
+            yield claim
+            claim.check()
+        finally:
+            if acquired:
+                with self._guard:
+                    del self._owners[key]
+                lock.release()
+
+    def record_build(
+        self, key: tuple, env: Environment, elapsed: float, allocated: int | None
+    ) -> None:
+        stats = self.stats_for(key)
+        with self._guard:
+            if stats.builds:
+                stats.invalidations += 1
+            stats.builds += 1
+            stats.build_s += elapsed
+            stats.concepts = len(env.concepts)
+            stats.datasources = len(env.datasources)
+            if allocated is not None:
+                stats.allocated_bytes = allocated
+
+    def record_reuse(self, key: tuple) -> None:
+        stats = self.stats_for(key)
+        with self._guard:
+            stats.reuses += 1
+
+    def report(self) -> list[dict]:
+        """Modules ordered by build time, most expensive first."""
+        with self._guard:
+            ordered = sorted(self.modules.values(), key=lambda m: -m.build_s)
+        return [stats.as_report() for stats in ordered]
+
+
+_SHARED_IMPORT_RUN: SharedImportRun | None = None
+
+
+@contextmanager
+def shared_import_scope() -> Iterator[SharedImportRun]:
+    """Share each distinct imported module across every parse in the block,
+    including parses on other threads. Not re-entrant: a nested scope reuses
+    the outer run."""
+    global _SHARED_IMPORT_RUN
+    if _SHARED_IMPORT_RUN is not None:
+        yield _SHARED_IMPORT_RUN
+        return
+    run = SharedImportRun()
+    _SHARED_IMPORT_RUN = run
+    try:
+        yield run
+    finally:
+        _SHARED_IMPORT_RUN = None
+        with _IMPORT_ENV_STORE_LOCK:
+            _trim_store()
+
+
+def _stored_closures(targets: list[str]) -> set[str]:
+    """Resolved paths already covered by a cross-parse store entry for one of
+    ``targets`` — prefetch reads but does not parse them."""
+    wanted = set(targets)
+    with _IMPORT_ENV_STORE_LOCK:
+        entries = list(_IMPORT_ENV_STORE.items())
+    covered: set[str] = set()
+    for key, entry in entries:
+        if str(Path(key[0]).resolve()) in wanted:
+            covered.update(str(Path(path).resolve()) for path in entry.closure)
+    return covered
 
 
 @dataclass
@@ -275,6 +484,40 @@ class ImportHydrationService:
     def set_text(self, key: Path | str, text: str) -> None:
         self.text_lookup[key] = text
 
+    def prefetch(self, requests: list[ImportRequest]) -> ImportPrefetch | None:
+        """Load the import closure of a root parse's filesystem imports ahead of
+        hydration. Nested parses never prefetch: the root pass already covered
+        their closure."""
+        from trilogy.parsing.v2.import_prefetch import prefetch_import_closure
+
+        if self.closure_stack:
+            return None
+        if self.parse_config is not None and not self.parse_config.prefetch_imports:
+            return None
+        if not isinstance(
+            self.environment.config.import_resolver, FileSystemImportResolver
+        ):
+            return None
+        targets = [
+            str(Path(request.target).resolve())
+            for request in requests
+            if not request.is_stdlib and not self.in_stdlib
+        ]
+        if not targets:
+            return None
+        return prefetch_import_closure(
+            targets, self.text_lookup, skip_parse=_stored_closures(targets)
+        )
+
+    def _prefetched_text(self, request: ImportRequest) -> str | None:
+        # prefetch keys texts by resolved path; the request's own key is the
+        # working-path-relative spelling
+        if request.is_stdlib or not isinstance(
+            self.environment.config.import_resolver, FileSystemImportResolver
+        ):
+            return None
+        return self.text_lookup.get(Path(request.target).resolve())
+
     def execute(self, request: ImportRequest) -> ImportStatement:
         from trilogy.parsing.parse_engine_v2 import parse_syntax
         from trilogy.parsing.v2.hydration import HydrationContext, NativeHydrator
@@ -311,6 +554,9 @@ class ImportHydrationService:
 
         if request.token_lookup in self.text_lookup:
             text = self.text_lookup[request.token_lookup]
+        elif (prefetched := self._prefetched_text(request)) is not None:
+            text = prefetched
+            self.text_lookup[request.token_lookup] = text
         else:
             text = _read_import_text(request.target, environment, request.is_stdlib)
             self.text_lookup[request.token_lookup] = text
@@ -340,9 +586,14 @@ class ImportHydrationService:
         from trilogy.execution.envs import active_env
 
         activation = active_env()
+        # Filesystem keys are canonical so scripts in different directories
+        # that reach one file through different relative spellings share it.
+        store_target = (
+            _canonical_path(str(request.target)) if use_store else str(request.target)
+        )
         store_key = (
-            str(request.target),
-            root,
+            store_target,
+            _canonical_path(root) if use_store and root else root,
             environment.config.allow_duplicate_declaration,
             tuple(str(p) for p in environment.import_paths),
             _params_fingerprint(environment.parameters),
@@ -350,76 +601,108 @@ class ImportHydrationService:
         )
 
         store_entry: _ImportEnvEntry | None = None
-        if env_cache_key in self.parsed_environments:
-            new_env = self.parsed_environments[env_cache_key]
-            frame = self.local_closures.get(env_cache_key)
-            if self.closure_stack and frame is not None:
-                self.closure_stack[-1].deps.update(frame.deps)
-                self.closure_stack[-1].tainted |= frame.tainted
-            # Re-importing a file already parsed in THIS parse (a second alias
-            # for it, or a diamond in the import graph). Recover the store entry
-            # so the per-alias projections still cache — identity against the
-            # env we already hold is the validation, so no closure re-hash.
-            local = _IMPORT_ENV_STORE.get(store_key)
-            if local is not None and local.env is new_env:
-                store_entry = local
-        elif use_store and (
-            entry := _store_lookup(store_key, hash(text), self.text_lookup)
-        ):
-            store_entry = entry
-            new_env = entry.env
-            self.parsed_environments[env_cache_key] = new_env
-            self.local_closures[env_cache_key] = _ClosureFrame(deps=dict(entry.closure))
-            if self.closure_stack:
-                self.closure_stack[-1].deps.update(entry.closure)
-        else:
-            self.in_flight_imports.add(target_key)
-            frame = _ClosureFrame(tainted=not use_store)
-            self.closure_stack.append(frame)
-            try:
-                document = parse_syntax(text)
-                new_env = Environment(
-                    working_path=dirname(request.target),
-                    import_paths=list(environment.import_paths),
-                    env_file_path=request.token_lookup,
-                    config=environment.config.copy_for_root(root=root),
-                    parameters=environment.parameters,
-                )
-                child_context = HydrationContext(
-                    environment=new_env,
-                    parse_address=cache_lookup,
-                    token_address=request.token_lookup,
-                    parse_config=self.parse_config,
-                    max_parse_depth=self.max_parse_depth,
-                    parsed_environments=self.parsed_environments,
-                    text_lookup=self.text_lookup,
-                    import_keys=key_path,
-                    in_flight_imports=self.in_flight_imports,
-                    closure_stack=self.closure_stack,
-                    local_closures=self.local_closures,
-                    in_stdlib=request.is_stdlib or self.in_stdlib,
-                )
-                NativeHydrator(child_context).parse(document)
+        shared = _SHARED_IMPORT_RUN if use_store else None
+        slot: AbstractContextManager[SlotClaim | None] = (
+            shared.build_slot(store_key)
+            if shared is not None and env_cache_key not in self.parsed_environments
+            else nullcontext()
+        )
+        with slot as claim:
+            if env_cache_key in self.parsed_environments:
+                new_env = self.parsed_environments[env_cache_key]
+                frame = self.local_closures.get(env_cache_key)
+                if self.closure_stack and frame is not None:
+                    self.closure_stack[-1].deps.update(frame.deps)
+                    self.closure_stack[-1].tainted |= frame.tainted
+                # Re-importing a file already parsed in THIS parse (a second alias
+                # for it, or a diamond in the import graph). Recover the store entry
+                # so the per-alias projections still cache — identity against the
+                # env we already hold is the validation, so no closure re-hash.
+                local = _IMPORT_ENV_STORE.get(store_key)
+                if local is not None and local.env is new_env:
+                    store_entry = local
+            elif use_store and (
+                entry := _store_lookup(store_key, hash(text), self.text_lookup)
+            ):
+                store_entry = entry
+                new_env = entry.env
                 self.parsed_environments[env_cache_key] = new_env
-            except Exception as e:
-                raise ImportError(
-                    f"Unable to import '{request.target}', parsing error: {e}"
-                ) from e
-            finally:
-                self.in_flight_imports.discard(target_key)
-                self.closure_stack.pop()
-            frame.deps[str(request.target)] = hash(text)
-            self.local_closures[env_cache_key] = frame
-            if use_store and not frame.tainted:
-                store_entry = _ImportEnvEntry(
-                    env=new_env,
-                    closure=dict(frame.deps),
-                    integrity=_env_integrity(new_env),
+                self.local_closures[env_cache_key] = _ClosureFrame(
+                    deps=dict(entry.closure)
                 )
-                _store_fill(store_key, store_entry)
-            if self.closure_stack:
-                self.closure_stack[-1].deps.update(frame.deps)
-                self.closure_stack[-1].tainted |= frame.tainted
+                if self.closure_stack:
+                    self.closure_stack[-1].deps.update(entry.closure)
+                if shared is not None:
+                    shared.record_reuse(store_key)
+                if claim is not None:
+                    claim.hold(new_env)
+            else:
+                self.in_flight_imports.add(target_key)
+                frame = _ClosureFrame(tainted=not use_store)
+                self.closure_stack.append(frame)
+                build_start = time.perf_counter()
+                traced_before = (
+                    tracemalloc.get_traced_memory()[0]
+                    if shared is not None and tracemalloc.is_tracing()
+                    else None
+                )
+                try:
+                    document = parse_syntax(text)
+                    new_env = Environment(
+                        working_path=dirname(request.target),
+                        import_paths=list(environment.import_paths),
+                        env_file_path=request.token_lookup,
+                        config=environment.config.copy_for_root(root=root),
+                        parameters=environment.parameters,
+                    )
+                    child_context = HydrationContext(
+                        environment=new_env,
+                        parse_address=cache_lookup,
+                        token_address=request.token_lookup,
+                        parse_config=self.parse_config,
+                        max_parse_depth=self.max_parse_depth,
+                        parsed_environments=self.parsed_environments,
+                        text_lookup=self.text_lookup,
+                        import_keys=key_path,
+                        in_flight_imports=self.in_flight_imports,
+                        closure_stack=self.closure_stack,
+                        local_closures=self.local_closures,
+                        in_stdlib=request.is_stdlib or self.in_stdlib,
+                    )
+                    NativeHydrator(child_context).parse(document)
+                    self.parsed_environments[env_cache_key] = new_env
+                except Exception as e:
+                    raise ImportError(
+                        f"Unable to import '{request.target}', parsing error: {e}"
+                    ) from e
+                finally:
+                    self.in_flight_imports.discard(target_key)
+                    self.closure_stack.pop()
+                frame.deps[store_target] = hash(text)
+                self.local_closures[env_cache_key] = frame
+                if use_store and not frame.tainted:
+                    store_entry = _ImportEnvEntry(
+                        env=new_env,
+                        closure=dict(frame.deps),
+                        integrity=_env_integrity(new_env),
+                    )
+                    _store_fill(store_key, store_entry)
+                    if claim is not None:
+                        claim.hold(new_env)
+                    if shared is not None:
+                        shared.record_build(
+                            store_key,
+                            new_env,
+                            time.perf_counter() - build_start,
+                            (
+                                tracemalloc.get_traced_memory()[0] - traced_before
+                                if traced_before is not None
+                                else None
+                            ),
+                        )
+                if self.closure_stack:
+                    self.closure_stack[-1].deps.update(frame.deps)
+                    self.closure_stack[-1].tainted |= frame.tainted
 
         is_file_resolver = isinstance(
             environment.config.import_resolver, FileSystemImportResolver
@@ -264,6 +264,23 @@ class ImportStatementPlan(StatementPlanBase):
     # same-line trailing comment on the import, captured by the planner so it
     # can be stored on the resulting Import for explore to surface.
     description: str | None = None
+    request: ImportRequest | None = None
+
+    def prepare_request(self, hydrator: NativeHydrator) -> ImportRequest | None:
+        """Resolve the file import this plan will execute, without executing
+        it, so the hydrator can prefetch every target of the document first."""
+        if self.request is None:
+            kind = self.syntax.kind
+            context = hydrator.rule_context()
+            if kind == SyntaxNodeKind.IMPORT_STATEMENT:
+                self.request = import_statement(
+                    self.syntax, context, hydrator.hydrate_rule
+                )
+            elif kind == SyntaxNodeKind.SELECTIVE_IMPORT_STATEMENT:
+                self.request = selective_import_statement(
+                    self.syntax, context, hydrator.hydrate_rule
+                )
+        return self.request
 
     def load_imports(self, hydrator: NativeHydrator) -> None:
         # Imports materialize in their own early phase because later
@@ -271,21 +288,12 @@ class ImportStatementPlan(StatementPlanBase):
         # resolvable during collect_symbols, bind, and hydrate. This is
         # not a generic commit - it is an intentional early binding of
         # another environment into this one.
-        kind = self.syntax.kind
-        context = hydrator.rule_context()
-        if kind == SyntaxNodeKind.IMPORT_STATEMENT:
-            request = import_statement(self.syntax, context, hydrator.hydrate_rule)
-        elif kind == SyntaxNodeKind.SELECTIVE_IMPORT_STATEMENT:
-            request = selective_import_statement(
-                self.syntax, context, hydrator.hydrate_rule
-            )
-        elif kind == SyntaxNodeKind.SELF_IMPORT_STATEMENT:
+        if self.syntax.kind == SyntaxNodeKind.SELF_IMPORT_STATEMENT:
             self.output = self_import_statement(
-                self.syntax, context, hydrator.hydrate_rule
+                self.syntax, hydrator.rule_context(), hydrator.hydrate_rule
             )
             return
-        else:
-            return
+        request = self.prepare_request(hydrator)
         if isinstance(request, ImportRequest):
             request.description = self.description
             self.output = hydrator.import_service.execute(request)
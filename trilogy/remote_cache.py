@@ -0,0 +1,268 @@
+"""Local read-through cache for remote file datasources.
+
+Remote parquet/CSV datasources and remote SQLite databases are otherwise read
+from the network on every query (DuckDB) or downloaded whole on every executor
+construction (SQLite). With the cache enabled, the dialect asks
+:meth:`RemoteFileCache.get` for a local copy first. The copy is only served
+after the remote object has been re-validated with a ``HEAD`` request. It is
+served when the GCS generation, the ``ETag``, or the ``Last-Modified`` plus size
+still match what was downloaded. A successful validation is trusted for
+``revalidate_after`` seconds (``REVALIDATE_AFTER_S`` by default), so a run that
+reads the same file in many queries sends one ``HEAD``, not one per query. An
+object changed inside that window is read stale until it expires.
+
+Entries live under ``<staging root>/remote_cache/``. Each entry is the file
+plus a JSON sidecar holding its validators and last-use time. The directory is
+size-bounded and evicts least-recently-used entries. Anything the cache cannot
+handle returns ``None`` and the caller reads the network location as before:
+globs, non-HTTP schemes, objects that need credentials, unreachable hosts, and
+files larger than the per-file cap.
+
+``gs://``/``gcs://`` locations are validated and fetched through the public
+``storage.googleapis.com`` endpoint, so only publicly readable objects are
+cached; authenticated buckets keep using DuckDB's own GCS secret.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from logging import getLogger
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit
+
+from trilogy.staging import StagingConfig, StagingType
+
+logger = getLogger("trilogy.remote_cache")
+
+REMOTE_CACHE_DIR = "remote_cache"
+DEFAULT_MAX_BYTES = 2 * 1024**3
+PROBE_TIMEOUT_S = 10.0
+DOWNLOAD_TIMEOUT_S = 300.0
+REVALIDATE_AFTER_S = 60.0
+_CHUNK = 1024 * 1024
+_GCS_PUBLIC = "https://storage.googleapis.com/"
+_GLOB_CHARS = ("*", "?", "[")
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    file: str
+    size: int
+    etag: str | None = None
+    generation: str | None = None
+    last_modified: str | None = None
+    last_used: float = 0.0
+
+    def matches(self, validators: dict[str, str | None]) -> bool:
+        """Whether the remote object described by ``validators`` is the one
+        this entry holds. The strongest validator both sides carry decides."""
+        if validators.get("generation") and self.generation:
+            return validators["generation"] == self.generation
+        if validators.get("etag") and self.etag:
+            return validators["etag"] == self.etag
+        if validators.get("last_modified") and self.last_modified:
+            size = validators.get("size")
+            return validators["last_modified"] == self.last_modified and (
+                size is None or int(size) == self.size
+            )
+        return False
+
+
+def fetch_url(location: str) -> str | None:
+    """The HTTP(S) URL the cache fetches ``location`` through, or ``None``
+    when the location is not cacheable."""
+    if any(char in location for char in _GLOB_CHARS):
+        return None
+    scheme = urlsplit(location).scheme
+    if scheme in ("gs", "gcs"):
+        return _GCS_PUBLIC + location.split("://", 1)[1]
+    if scheme in ("http", "https"):
+        return location
+    return None
+
+
+def _validators(headers: Any) -> dict[str, str | None]:
+    return {
+        "etag": headers.get("ETag"),
+        "generation": headers.get("x-goog-generation"),
+        "last_modified": headers.get("Last-Modified"),
+        "size": headers.get("Content-Length"),
+    }
+
+
+class RemoteFileCache:
+    """Size-bounded, content-validated local copies of remote files."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_file_bytes: int | None = None,
+        revalidate_after: float = REVALIDATE_AFTER_S,
+    ):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.max_file_bytes = max_bytes if max_file_bytes is None else max_file_bytes
+        self.revalidate_after = revalidate_after
+        self.hits = 0
+        self.misses = 0
+        # url -> monotonic time it was last validated against the remote
+        self._validated: dict[str, float] = {}
+
+    @classmethod
+    def for_staging(
+        cls, staging: StagingConfig, max_bytes: int | None = None
+    ) -> RemoteFileCache | None:
+        """The cache under ``staging``'s root. Returns ``None`` for remote
+        staging, because a cache that lives on the network saves nothing."""
+        if staging.staging_type != StagingType.LOCAL:
+            return None
+        return cls(
+            Path(staging.resolved_root) / REMOTE_CACHE_DIR,
+            max_bytes=max_bytes or DEFAULT_MAX_BYTES,
+        )
+
+    def _key(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode()).hexdigest()[:32]
+        # keep the extension: readers (read_parquet, sqlite) sniff on it
+        suffix = Path(urlsplit(url).path).suffix
+        return digest + suffix
+
+    def _meta_path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def _load(self, key: str) -> CacheEntry | None:
+        try:
+            entry = CacheEntry(**json.loads(self._meta_path(key).read_text()))
+        except (OSError, ValueError, TypeError):
+            return None
+        if not (self.root / entry.file).exists():
+            return None
+        return entry
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        _atomic_write(self._meta_path(key), json.dumps(asdict(entry)).encode())
+
+    def get(self, location: str) -> str | None:
+        """Local path of a validated copy of ``location``, downloading it on
+        a miss. Returns ``None`` to mean "read the network location"."""
+        url = fetch_url(location)
+        if url is None:
+            return None
+        import urllib.error
+        import urllib.request
+
+        key = self._key(url)
+        cached = self._load(key)
+        validated = self._validated.get(url)
+        if (
+            cached is not None
+            and validated is not None
+            and time.monotonic() - validated < self.revalidate_after
+        ):
+            self.hits += 1
+            return self._touch(key, cached)
+        try:
+            with urllib.request.urlopen(
+                urllib.request.Request(url, method="HEAD"), timeout=PROBE_TIMEOUT_S
+            ) as response:
+                validators = _validators(response.headers)
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            logger.debug(f"remote cache probe failed for {location}: {e}")
+            return None
+        if cached is not None and cached.matches(validators):
+            self.hits += 1
+            self._validated[url] = time.monotonic()
+            return self._touch(key, cached)
+        size = validators.get("size")
+        if size is not None and int(size) > self.max_file_bytes:
+            return None
+        self.misses += 1
+        try:
+            entry = self._download(url, key)
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            logger.debug(f"remote cache download failed for {location}: {e}")
+            return None
+        if entry is None:
+            return None
+        self._store(key, entry)
+        self._validated[url] = time.monotonic()
+        self.evict()
+        return str(self.root / entry.file)
+
+    def _touch(self, key: str, entry: CacheEntry) -> str:
+        entry.last_used = time.time()
+        self._store(key, entry)
+        return str(self.root / entry.file)
+
+    def _download(self, url: str, key: str) -> CacheEntry | None:
+        import urllib.request
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, prefix=".partial-")
+        try:
+            with (
+                os.fdopen(fd, "wb") as out,
+                urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT_S) as response,
+            ):
+                # validators from the GET itself, so they describe exactly
+                # the bytes written even if the object changed since HEAD
+                validators = _validators(response.headers)
+                written = 0
+                while chunk := response.read(_CHUNK):
+                    written += len(chunk)
+                    if written > self.max_file_bytes:
+                        return None
+                    out.write(chunk)
+            os.replace(tmp, self.root / key)
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+        return CacheEntry(
+            url=url,
+            file=key,
+            size=written,
+            etag=validators["etag"],
+            generation=validators["generation"],
+            last_modified=validators["last_modified"],
+            last_used=time.time(),
+        )
+
+    def entries(self) -> list[CacheEntry]:
+        if not self.root.is_dir():
+            return []
+        found = (self._load(meta.stem) for meta in self.root.glob("*.json"))
+        return [entry for entry in found if entry is not None]
+
+    def evict(self) -> None:
+        """Drop least-recently-used entries until under ``max_bytes``."""
+        entries = sorted(self.entries(), key=lambda entry: entry.last_used)
+        total = sum(entry.size for entry in entries)
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            for path in (self.root / entry.file, self._meta_path(entry.file)):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            total -= entry.size
+
+
+def _atomic_write(path: Path, payload: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".partial-")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.write(payload)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from datetime import date
 from decimal import Decimal
 from typing import Any, ClassVar
@@ -8,7 +9,8 @@ from trilogy.core.statements.execute import (
     ProcessedChartLayer,
     ProcessedChartStatement,
 )
-from trilogy.rendering.base import BaseRenderer, prettify_label
+from trilogy.dialect.results import ChartColumns
+from trilogy.rendering.base import BaseRenderer, downsample_note, prettify_label
 from trilogy.rendering.rich_types import (
     axis_label_expr,
     currency_symbol,
@@ -57,7 +59,7 @@ class AltairRenderer(BaseRenderer):
     def render(
         self,
         statement: ProcessedChartStatement,
-        layer_data: list[list[dict]],
+        layer_data: Sequence[Sequence[dict]],
     ) -> Any:
         if len(layer_data) != len(statement.layers):
             raise ValueError("Layer data count does not match layer count")
@@ -82,10 +84,14 @@ class AltairRenderer(BaseRenderer):
         if not layer_charts:
             return None
         chart = layer_charts[0] if len(layer_charts) == 1 else alt.layer(*layer_charts)
-        if statement.show_title:
-            title = self._statement_title(statement)
-            if title:
-                chart = chart.properties(title=title)
+        title = self._statement_title(statement) if statement.show_title else None
+        note = downsample_note(layer_data)
+        if note:
+            chart = chart.properties(
+                title=alt.TitleParams(text=title or "", subtitle=note)
+            )
+        elif title:
+            chart = chart.properties(title=title)
         if statement.hide_legend:
             chart = chart.configure_legend(disable=True)
         return chart
@@ -108,7 +114,7 @@ class AltairRenderer(BaseRenderer):
     def to_spec(
         self,
         statement: ProcessedChartStatement,
-        layer_data: list[list[dict]],
+        layer_data: Sequence[Sequence[dict]],
     ) -> dict:
         return self.render(statement, layer_data).to_dict()
 
@@ -137,10 +143,14 @@ class AltairRenderer(BaseRenderer):
     def _render_layer(
         self,
         layer: ProcessedChartLayer,
-        data: list[dict],
+        data: Sequence[dict],
         scales: tuple[ScaleType | None, ScaleType | None] = (None, None),
     ) -> Any:
-        df = self._coerce_temporals(self._coerce_decimals(pd.DataFrame(data)))
+        # columnar layer data builds each column straight from its values
+        frame = pd.DataFrame(
+            data.columns if isinstance(data, ChartColumns) else list(data)
+        )
+        df = self._coerce_temporals(self._coerce_decimals(frame))
         builders = {
             ChartType.BAR: self._bar,
             ChartType.BARH: self._bar,
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any
 
 from trilogy.core.statements.execute import ProcessedChartStatement
+from trilogy.dialect.results import ChartColumns
 
 
 def prettify_label(name: str | None) -> str | None:
@@ -15,12 +17,26 @@ def prettify_label(name: str | None) -> str | None:
     return name.replace("_", " ").title()
 
 
+def downsample_note(layer_data: Sequence[Sequence[dict]]) -> str | None:
+    """A caption saying a layer was reduced in the warehouse before drawing,
+    from the largest reduced layer, or None when every row is drawn."""
+    reduced = [
+        data
+        for data in layer_data
+        if isinstance(data, ChartColumns) and data.downsampled
+    ]
+    if not reduced:
+        return None
+    largest = max(reduced, key=lambda data: data.source_rows or 0)
+    return f"Downsampled: {len(largest):,} of {largest.source_rows:,} rows drawn"
+
+
 class BaseRenderer(ABC):
     @abstractmethod
     def render(
         self,
         statement: ProcessedChartStatement,
-        layer_data: list[list[dict]],
+        layer_data: Sequence[Sequence[dict]],
     ) -> Any:
         """Render chart from processed chart statement and per-layer query results."""
 
@@ -28,6 +44,6 @@ class BaseRenderer(ABC):
     def to_spec(
         self,
         statement: ProcessedChartStatement,
-        layer_data: list[list[dict]],
+        layer_data: Sequence[Sequence[dict]],
     ) -> dict:
         """Generate raw visualization spec (e.g., Vega-Lite JSON)."""
@@ -0,0 +1,127 @@
+"""Process-wide cache of static chart images, keyed by the chart spec.
+
+Saving an Altair chart as SVG or PNG runs vl-convert, which compiles the
+Vega-Lite spec and lays the chart out again on every call. A batch of reports
+re-renders the same charts over and over (shared sections, identical
+dashboards themed the same way), so converted images are kept by the hash of
+the spec plus the output options. The spec is hashed without its inline
+DataFrames, which are fingerprinted separately (vectorized, and once per
+frame) rather than serialized to JSON on every lookup; a chart over changed
+data still keys differently and is converted afresh.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+# formats vl-convert writes as text; everything else is bytes
+TEXT_FORMATS = frozenset({"svg", "html", "json"})
+DEFAULT_MAX_ENTRIES = 256
+# chart attributes holding sub-charts, which carry their own data
+_CHILDREN = ("layer", "hconcat", "vconcat", "concat")
+
+# fingerprint per live DataFrame, by id; dropped when the frame is collected
+_FRAME_DIGESTS: dict[int, str] = {}
+
+
+def _frame_digest(frame: Any) -> str:
+    digest = _FRAME_DIGESTS.get(id(frame))
+    if digest is not None:
+        return digest
+    import pandas as pd
+
+    hasher = hashlib.sha256(repr(list(frame.dtypes.astype(str).items())).encode())
+    try:
+        hasher.update(pd.util.hash_pandas_object(frame, index=False).values.tobytes())
+    except TypeError:
+        # unhashable cells (lists, dicts): fall back to serializing them
+        hasher.update(frame.to_json(orient="split", default_handler=str).encode())
+    digest = hasher.hexdigest()
+    _FRAME_DIGESTS[id(frame)] = digest
+    weakref.finalize(frame, _FRAME_DIGESTS.pop, id(frame), None)
+    return digest
+
+
+def _without_frames(chart: Any, digests: list[str]) -> Any:
+    """A shallow copy of ``chart`` whose DataFrames are swapped for empty ones
+    of the same columns and dtypes (so encoding types infer as before), with
+    the fingerprint of each swapped frame appended to ``digests``."""
+    import pandas as pd
+
+    copy = chart.copy(deep=False)
+    data = getattr(copy, "data", None)
+    if isinstance(data, pd.DataFrame):
+        digests.append(_frame_digest(data))
+        copy.data = data.iloc[:0]
+    for attr in _CHILDREN:
+        children = getattr(copy, attr, None)
+        if isinstance(children, list):
+            setattr(copy, attr, [_without_frames(child, digests) for child in children])
+    return copy
+
+
+class ChartImageCache:
+    """Least-recently-used map from chart spec hash to converted image."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._images: OrderedDict[str, str | bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(chart: Any, format: str, options: dict[str, Any]) -> str:
+        digests: list[str] = []
+        try:
+            spec = _without_frames(chart, digests).to_dict(validate=False)
+        except ImportError:
+            spec = chart.to_dict()
+        payload = json.dumps(
+            [spec, digests, format, options], sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def render(self, chart: Any, format: str, **options: Any) -> str | bytes:
+        """``chart`` converted to ``format``; ``options`` go to ``chart.save``."""
+        key = self.key(chart, format, options)
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return image
+            self.misses += 1
+        # conversion runs outside the lock, so distinct charts convert in parallel
+        buffer: io.StringIO | io.BytesIO = (
+            io.StringIO() if format in TEXT_FORMATS else io.BytesIO()
+        )
+        chart.save(buffer, format=format, **options)
+        image = buffer.getvalue()
+        with self._lock:
+            self._images[key] = image
+            self._images.move_to_end(key)
+            while len(self._images) > self.max_entries:
+                self._images.popitem(last=False)
+        return image
+
+    def save(self, chart: Any, path: str | Path, format: str, **options: Any) -> None:
+        image = self.render(chart, format, **options)
+        if isinstance(image, str):
+            Path(path).write_text(image, encoding="utf-8")
+        else:
+            Path(path).write_bytes(image)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._images.clear()
+
+
+CHART_IMAGES = ChartImageCache()
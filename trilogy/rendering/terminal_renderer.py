@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import Any
 
 from trilogy.core.enums import ChartPlaceKind, ChartType
@@ -6,7 +7,7 @@ from trilogy.core.statements.execute import (
     ProcessedChartLayer,
     ProcessedChartStatement,
 )
-from trilogy.rendering.base import BaseRenderer, prettify_label
+from trilogy.rendering.base import BaseRenderer, downsample_note, prettify_label
 
 try:
     import plotext as plt
@@ -57,7 +58,7 @@ class TerminalRenderer(BaseRenderer):
     def render(
         self,
         statement: ProcessedChartStatement,
-        layer_data: list[list[dict]],
+        layer_data: Sequence[Sequence[dict]],
     ) -> str:
         plt.clear_figure()
         plt.theme("clear")
@@ -89,12 +90,14 @@ class TerminalRenderer(BaseRenderer):
             for placement in statement.placements:
                 self._placement(placement)
 
-        return plt.build()
+        output = plt.build()
+        note = downsample_note(layer_data)
+        return f"{output}\n{note}" if note else output
 
     def to_spec(
         self,
         statement: ProcessedChartStatement,
-        layer_data: list[list[dict]],
+        layer_data: Sequence[Sequence[dict]],
     ) -> dict:
         return {"type": "terminal", "output": self.render(statement, layer_data)}
 
@@ -105,7 +108,7 @@ class TerminalRenderer(BaseRenderer):
         elif placement.kind == ChartPlaceKind.VLINE:
             plt.vertical_line(value)
 
-    def _bar(self, data: list[dict], layer: ProcessedChartLayer) -> None:
+    def _bar(self, data: Sequence[dict], layer: ProcessedChartLayer) -> None:
         x = layer.x_fields[0] if layer.x_fields else None
         y = layer.y_fields[0] if layer.y_fields else None
         if not x or not y:
@@ -114,7 +117,7 @@ class TerminalRenderer(BaseRenderer):
         plt.xlabel(prettify_label(x))
         plt.ylabel(prettify_label(y))
 
-    def _barh(self, data: list[dict], layer: ProcessedChartLayer) -> None:
+    def _barh(self, data: Sequence[dict], layer: ProcessedChartLayer) -> None:
         x = layer.x_fields[0] if layer.x_fields else None
         y = layer.y_fields[0] if layer.y_fields else None
         if not x or not y:
@@ -128,7 +131,7 @@ class TerminalRenderer(BaseRenderer):
         plt.xlabel(prettify_label(x))
         plt.ylabel(prettify_label(y))
 
-    def _line(self, data: list[dict], layer: ProcessedChartLayer) -> None:
+    def _line(self, data: Sequence[dict], layer: ProcessedChartLayer) -> None:
         x = layer.x_fields[0] if layer.x_fields else None
         ys = layer.y_fields or []
         if not x or not ys:
@@ -145,7 +148,7 @@ class TerminalRenderer(BaseRenderer):
         if len(ys) == 1:
             plt.ylabel(prettify_label(ys[0]))
 
-    def _point(self, data: list[dict], layer: ProcessedChartLayer) -> None:
+    def _point(self, data: Sequence[dict], layer: ProcessedChartLayer) -> None:
         x = layer.x_fields[0] if layer.x_fields else None
         y = layer.y_fields[0] if layer.y_fields else None
         if not x or not y:
@@ -160,7 +163,7 @@ class TerminalRenderer(BaseRenderer):
         plt.xlabel(prettify_label(x))
         plt.ylabel(prettify_label(y))
 
-    def _area(self, data: list[dict], layer: ProcessedChartLayer) -> None:
+    def _area(self, data: Sequence[dict], layer: ProcessedChartLayer) -> None:
         x = layer.x_fields[0] if layer.x_fields else None
         y = layer.y_fields[0] if layer.y_fields else None
         if not x or not y:
@@ -177,7 +180,7 @@ class TerminalRenderer(BaseRenderer):
 
     @staticmethod
     def _resolve_axis(
-        data: list[dict],
+        data: Sequence[dict],
         field_name: str,
         layer: ProcessedChartLayer,
     ) -> tuple[list[Any], list[str] | None]:
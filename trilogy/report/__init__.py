@@ -5,26 +5,48 @@ select statements become tables and chart statements become charts. The
 `render_report` entrypoint produces a polished artifact (HTML, PNG, ...).
 """
 
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, wait
 from pathlib import Path
 from typing import Any
 
 from trilogy.rendering.theme import DEFAULT_THEME, Theme, get_theme
 from trilogy.report.backends import get_backend
-from trilogy.report.document import parse_markdown
+from trilogy.report.backends.png import DEFAULT_BROWSERS, BrowserPool, PngBackend
+from trilogy.report.document import RenderedElement, parse_markdown
 from trilogy.report.runner import run_document
 
 
+def _run_report(
+    source: Path,
+    theme: Theme,
+    executor: Any | None,
+    concurrency: int | None,
+) -> list[RenderedElement]:
+    segments = parse_markdown(source.read_text(encoding="utf-8"))
+    return run_document(
+        segments,
+        working_path=source.parent,
+        executor=executor,
+        chart_theme=theme.name,
+        concurrency=concurrency,
+    )
+
+
 def render_report(
     source: str | Path,
     output_format: str = "png",
     output_path: str | Path | None = None,
     theme: str | Theme = DEFAULT_THEME,
     executor: Any | None = None,
+    concurrency: int | None = None,
 ) -> Path:
     """Render a markdown report file to the requested format, returning the output path.
 
     ``executor`` overrides the default in-memory DuckDB engine so a report can
-    run against a configured warehouse (see the CLI's trilogy.toml handling)."""
+    run against a configured warehouse (see the CLI's trilogy.toml handling).
+    ``concurrency`` lets independent selects and charts run at once on
+    warehouses that allow it."""
     source = Path(source)
     resolved_theme = get_theme(theme) if isinstance(theme, str) else theme
     backend = get_backend(output_format)
@@ -33,15 +55,72 @@ def render_report(
         if output_path is not None
         else source.with_suffix("." + backend.extension)
     )
-    segments = parse_markdown(source.read_text(encoding="utf-8"))
-    elements = run_document(
-        segments,
-        working_path=source.parent,
-        executor=executor,
-        chart_theme=resolved_theme.name,
-    )
+    elements = _run_report(source, resolved_theme, executor, concurrency)
     backend.render(elements, target, resolved_theme)
     return target
 
 
-__all__ = ["render_report"]
+def render_reports(
+    sources: Iterable[str | Path],
+    output_format: str = "png",
+    output_dir: str | Path | None = None,
+    theme: str | Theme = DEFAULT_THEME,
+    executor_factory: Callable[[Path], Any | None] | None = None,
+    concurrency: int | None = None,
+    browsers: int = DEFAULT_BROWSERS,
+) -> list[Path]:
+    """Render many markdown reports, returning their output paths in order.
+
+    Reports run one after another, but PNG snapshots go to a shared pool of
+    ``browsers`` headless browsers that stay open for the whole batch, so
+    screenshots of earlier reports overlap with running later ones.
+    ``executor_factory`` builds the executor for each report from its path
+    (None for the default in-memory DuckDB); every report gets its own, so
+    declarations never leak between reports, and it is closed once the
+    report has run. Outputs land next to each
+    source unless ``output_dir`` is given. A failing report does not stop
+    the batch; the first failure is raised once every report has finished."""
+    resolved_theme = get_theme(theme) if isinstance(theme, str) else theme
+    backend = get_backend(output_format)
+    directory = Path(output_dir) if output_dir is not None else None
+    targets: list[Path] = []
+    pending: list[Future[None]] = []
+    errors: list[BaseException] = []
+    pool = BrowserPool(browsers) if isinstance(backend, PngBackend) else None
+    if isinstance(backend, PngBackend):
+        backend.browsers = pool
+    try:
+        for entry in sources:
+            source = Path(entry)
+            target = (
+                directory / f"{source.stem}.{backend.extension}"
+                if directory is not None
+                else source.with_suffix("." + backend.extension)
+            )
+            targets.append(target)
+            executor = None
+            try:
+                executor = executor_factory(source) if executor_factory else None
+                elements = _run_report(source, resolved_theme, executor, concurrency)
+                if isinstance(backend, PngBackend):
+                    pending.append(backend.submit(elements, target, resolved_theme))
+                else:
+                    backend.render(elements, target, resolved_theme)
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                if executor is not None:
+                    executor.close()
+        wait(pending)
+    finally:
+        if pool is not None:
+            pool.close()
+    errors.extend(
+        error for error in (future.exception() for future in pending) if error
+    )
+    if errors:
+        raise errors[0]
+    return targets
+
+
+__all__ = ["render_report", "render_reports"]
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import io
 import json
 from dataclasses import dataclass
 from html import escape
@@ -10,6 +9,7 @@ from pathlib import Path
 from string import Template
 
 from trilogy.core.enums import ChartType
+from trilogy.rendering.image_cache import CHART_IMAGES
 from trilogy.rendering.theme import DEFAULT_THEME, REPORT_LAYOUT, Layout, Theme
 from trilogy.report.backends.base import ReportBackend
 from trilogy.report.charts import style_chart
@@ -240,9 +240,8 @@ def _chart_static(
     styled = style_chart(
         chart, theme, layout, interactive=False, columns=columns, chart_type=chart_type
     )
-    buffer = io.StringIO()
-    styled.save(buffer, format="svg")
-    return f'<div class="report-chart">{buffer.getvalue()}</div>'
+    svg = CHART_IMAGES.render(styled, "svg")
+    return f'<div class="report-chart">{svg!s}</div>'
 
 
 def _webfont_links(theme: Theme) -> str:
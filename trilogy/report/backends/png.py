@@ -1,16 +1,30 @@
-"""PNG backend: render the report HTML and snapshot it with a headless browser."""
+"""PNG backend: render the report HTML and snapshot it with a headless browser.
+
+A single report launches Playwright and Chromium, takes one screenshot and
+shuts both down. Rendering many reports that way spends most of its time
+booting browsers, so batch rendering goes through a ``BrowserPool``: a few
+worker threads that each keep one browser open and take pages off a shared
+queue. Each worker owns its browser because Playwright's sync API is bound to
+the thread that started it.
+"""
 
 from __future__ import annotations
 
+import queue
+import threading
+from concurrent.futures import Future
 from pathlib import Path
+from typing import Any, Self
 
 from trilogy.rendering.theme import DEFAULT_THEME, REPORT_LAYOUT, Theme
 from trilogy.report.backends.base import ReportBackend
 from trilogy.report.backends.html import build_html
 from trilogy.report.document import RenderedElement
 
+DEFAULT_BROWSERS = 2
 
-def _snapshot(html: str, output_path: Path) -> None:
+
+def _sync_playwright() -> Any:
     try:
         from playwright.sync_api import sync_playwright
     except ImportError as exc:
@@ -18,33 +32,171 @@ def _snapshot(html: str, output_path: Path) -> None:
             "PNG output requires playwright. Install pytrilogy[report], "
             "then run 'playwright install chromium'."
         ) from exc
+    return sync_playwright
+
+
+def _launch(playwright: Any) -> Any:
+    try:
+        return playwright.chromium.launch()
+    except Exception as exc:
+        raise RuntimeError(
+            "Could not launch chromium. Run 'playwright install chromium'."
+        ) from exc
 
+
+def _capture(browser: Any, html: str, output_path: Path) -> None:
+    page = browser.new_page(
+        viewport={"width": REPORT_LAYOUT.viewport_width, "height": 900},
+        device_scale_factor=2,
+    )
+    try:
+        page.set_content(html, wait_until="networkidle")
+        page.evaluate("() => document.fonts.ready.then(() => true)")
+        page.screenshot(path=str(output_path), full_page=True)
+    finally:
+        page.close()
+
+
+def _snapshot(html: str, output_path: Path) -> None:
+    sync_playwright = _sync_playwright()
     with sync_playwright() as playwright:
+        browser = _launch(playwright)
         try:
-            browser = playwright.chromium.launch()
-        except Exception as exc:
-            raise RuntimeError(
-                "Could not launch chromium. Run 'playwright install chromium'."
-            ) from exc
-        try:
-            page = browser.new_page(
-                viewport={"width": REPORT_LAYOUT.viewport_width, "height": 900},
-                device_scale_factor=2,
-            )
-            page.set_content(html, wait_until="networkidle")
-            page.evaluate("() => document.fonts.ready.then(() => true)")
-            page.screenshot(path=str(output_path), full_page=True)
+            _capture(browser, html, output_path)
         finally:
             browser.close()
 
 
+_Job = tuple[str, Path, "Future[None]"]
+
+
+class BrowserPool:
+    """Headless browsers kept open across report snapshots.
+
+    Browsers start on demand, up to ``size``, and stay open until ``close``.
+    A worker whose browser fails to launch or dies leaves the queue to the
+    others; only when no worker is left are the queued snapshots failed.
+    Use as a context manager."""
+
+    def __init__(self, size: int = DEFAULT_BROWSERS):
+        self.size = max(1, size)
+        self._jobs: queue.Queue[_Job | None] = queue.Queue()
+        self._workers: list[threading.Thread] = []
+        # workers still serving the queue
+        self._live = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def submit(self, html: str, output_path: Path) -> Future[None]:
+        """Queue a snapshot of ``html`` to ``output_path``."""
+        future: Future[None] = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Browser pool is closed.")
+            if self._live < self.size:
+                worker = threading.Thread(
+                    target=self._work,
+                    name=f"trilogy-browser-{len(self._workers)}",
+                    daemon=True,
+                )
+                self._workers.append(worker)
+                self._live += 1
+                worker.start()
+            self._jobs.put((html, output_path, future))
+        return future
+
+    def snapshot(self, html: str, output_path: Path) -> None:
+        self.submit(html, output_path).result()
+
+    def close(self) -> None:
+        """Finish queued snapshots, then shut every browser down."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            workers = list(self._workers)
+        for _ in workers:
+            self._jobs.put(None)
+        for worker in workers:
+            worker.join()
+
+    def _work(self) -> None:
+        try:
+            sync_playwright = _sync_playwright()
+            with sync_playwright() as playwright:
+                browser = _launch(playwright)
+                try:
+                    self._serve(browser)
+                finally:
+                    browser.close()
+        except Exception as exc:
+            self._retire(exc)
+
+    def _serve(self, browser: Any) -> None:
+        while (job := self._jobs.get()) is not None:
+            html, output_path, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                _capture(browser, html, output_path)
+            except Exception as exc:
+                future.set_exception(exc)
+                if not browser.is_connected():
+                    # only the job in hand fails; the queue is for the others
+                    raise
+            else:
+                future.set_result(None)
+
+    def _retire(self, error: Exception) -> None:
+        """Take this worker out of service. The last one fails the queued
+        jobs rather than leave callers waiting on them."""
+        with self._lock:
+            self._live -= 1
+            if self._live:
+                return
+            while True:
+                try:
+                    job = self._jobs.get_nowait()
+                except queue.Empty:
+                    return
+                if job is not None and job[2].set_running_or_notify_cancel():
+                    job[2].set_exception(error)
+
+
 class PngBackend(ReportBackend):
     extension = "png"
 
+    def __init__(self, browsers: BrowserPool | None = None):
+        # set for batch rendering; a lone report launches its own browser
+        self.browsers = browsers
+
     def render(
         self,
         elements: list[RenderedElement],
         output_path: Path,
         theme: Theme = DEFAULT_THEME,
     ) -> None:
-        _snapshot(build_html(elements, theme=theme, interactive=False), output_path)
+        html = build_html(elements, theme=theme, interactive=False)
+        if self.browsers is not None:
+            self.browsers.snapshot(html, output_path)
+        else:
+            _snapshot(html, output_path)
+
+    def submit(
+        self,
+        elements: list[RenderedElement],
+        output_path: Path,
+        theme: Theme = DEFAULT_THEME,
+    ) -> Future[None]:
+        """Start rendering on the browser pool and return without waiting."""
+        if self.browsers is None:
+            raise RuntimeError("Concurrent PNG rendering needs a browser pool.")
+        return self.browsers.submit(
+            build_html(elements, theme=theme, interactive=False), output_path
+        )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -10,6 +12,7 @@ from trilogy.core.statements.execute import ProcessedQuery
 from trilogy.dialect.enums import Dialects
 from trilogy.dialect.results import ChartResult
 from trilogy.engine import ResultProtocol
+from trilogy.execution.concurrent import PendingRead, is_concurrent_read
 from trilogy.report.document import (
     Chart,
     ErrorBox,
@@ -62,29 +65,79 @@ def _to_element(
     )
 
 
-def run_block(executor: Any, block: TrilogyBlock) -> list[RenderedElement]:
-    """Execute one trilogy block; surface any failure as an inline ErrorBox."""
-    elements: list[RenderedElement] = []
+# An element in document order that may still be waiting on a concurrent read.
+Slot = Callable[[], RenderedElement | None]
+
+
+def _error_box(exc: Exception) -> ErrorBox:
+    return ErrorBox(f"{type(exc).__name__}: {exc}")
+
+
+def _ready(element: RenderedElement | None) -> RenderedElement | None:
+    return element
+
+
+def _settle_read(processed: Any, read: PendingRead) -> RenderedElement | None:
+    try:
+        return _to_element(processed, read.result())
+    except Exception as exc:  # report errors inline rather than aborting the render
+        return _error_box(exc)
+
+
+def _settle(slots: list[Slot]) -> list[RenderedElement]:
+    return [element for slot in slots if (element := slot()) is not None]
+
+
+def _drain(in_flight: list[PendingRead]) -> None:
+    for read in in_flight:
+        read.wait()
+    in_flight.clear()
+
+
+def _block_slots(
+    executor: Any, block: TrilogyBlock, concurrency: int, in_flight: list[PendingRead]
+) -> list[Slot]:
+    """Execute one trilogy block; surface any failure as an inline ErrorBox.
+
+    With ``concurrency`` above 1, selects and charts are only started here
+    and collected when the document settles. Any other statement first waits
+    for every read in flight, so a persist never races the reads before it.
+    A failing read then becomes an ErrorBox in its own place, and the rest of
+    its block still runs."""
+    slots: list[Slot] = []
     try:
         for processed in executor.parse_text_generator(block.code):
+            if concurrency > 1 and is_concurrent_read(processed):
+                read = executor.submit_read(processed, concurrency)
+                in_flight.append(read)
+                slots.append(partial(_settle_read, processed, read))
+                continue
+            _drain(in_flight)
             element = _to_element(processed, executor.execute_statement(processed))
-            if element is not None:
-                elements.append(element)
+            slots.append(partial(_ready, element))
     except Exception as exc:  # report errors inline rather than aborting the render
-        elements.append(ErrorBox(f"{type(exc).__name__}: {exc}"))
-    return elements
+        slots.append(partial(_ready, _error_box(exc)))
+    return slots
 
 
-def _run_segment(executor: Any, segment: Segment) -> list[RenderedElement]:
+def run_block(executor: Any, block: TrilogyBlock) -> list[RenderedElement]:
+    """Execute one trilogy block; surface any failure as an inline ErrorBox."""
+    return _settle(_block_slots(executor, block, 1, []))
+
+
+def _segment_slots(
+    executor: Any, segment: Segment, concurrency: int, in_flight: list[PendingRead]
+) -> list[Slot]:
     if isinstance(segment, TrilogyBlock):
-        return run_block(executor, segment)
+        return _block_slots(executor, segment, concurrency, in_flight)
     if isinstance(segment, RowBlock):
-        children: list[RenderedElement] = []
-        for child in segment.segments:
-            children.extend(_run_segment(executor, child))
-        return [RenderedRow(children)]
-    rendered: list[RenderedElement] = [segment]  # Prose passes through
-    return rendered
+        children = [
+            slot
+            for child in segment.segments
+            for slot in _segment_slots(executor, child, concurrency, in_flight)
+        ]
+        return [lambda: RenderedRow(_settle(children))]
+    return [partial(_ready, segment)]  # Prose passes through
 
 
 def run_document(
@@ -92,6 +145,7 @@ def run_document(
     working_path: Path,
     executor: Any | None = None,
     chart_theme: str | None = None,
+    concurrency: int | None = None,
 ) -> list[RenderedElement]:
     """Run every trilogy block against one shared executor so declarations persist.
 
@@ -99,14 +153,26 @@ def run_document(
     executor (e.g. one wired to the dialect in a trilogy.toml) to run the report
     against a configured warehouse instead. ``chart_theme`` pins the executor's
     chart theme to the report's resolved theme so theme-baked marks (headline
-    text) match the surrounding page."""
+    text) match the surrounding page. ``concurrency`` runs up to that many
+    selects/charts at once where the executor's dialect allows it. An
+    executor built here is closed before returning; a passed one is the
+    caller's to close."""
+    owned = executor is None
     if executor is None:
         executor = Dialects.DUCK_DB.default_executor(working_path=working_path)
-    if chart_theme is not None:
-        executor.chart_theme = chart_theme
-    if not executor.connected:
-        executor.connect()
-    elements: list[RenderedElement] = []
-    for segment in segments:
-        elements.extend(_run_segment(executor, segment))
-    return elements
+    try:
+        if chart_theme is not None:
+            executor.chart_theme = chart_theme
+        if not executor.connected:
+            executor.connect()
+        concurrency = executor.read_concurrency(concurrency)
+        in_flight: list[PendingRead] = []
+        slots = [
+            slot
+            for segment in segments
+            for slot in _segment_slots(executor, segment, concurrency, in_flight)
+        ]
+        return _settle(slots)
+    finally:
+        if owned:
+            executor.close()
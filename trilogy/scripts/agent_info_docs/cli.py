@@ -12,7 +12,7 @@ language syntax use `agent-info query`; for models use `agent-info authoring`.
 - `trilogy file write <path> --run` (or `--run-and-delete`) - write, then execute like `trilogy run <path>` in ONE call; forwards `--param k=v` and `--timeout <seconds>`. `--run-and-delete` also removes the file afterwards (probe workflow: write+execute+cleanup in one call). Prefer these over separate write/run/delete calls.
 - `--timeout <seconds>` cancels a statement in the warehouse once it overruns. A query that overruns a sane cap is almost always a shape mistake (an unintended fan-out), not a big scan, so the cancellation is the diagnosis: rewrite the query rather than raising the cap. Pick the cap from what a CORRECT query costs on this warehouse, not from patience.
 - `trilogy file move|delete|exists ...` - manage workspace paths.
-- `trilogy fmt <file|dir>` - format Trilogy scripts.
+- `trilogy fmt <file|dir>` - format Trilogy scripts. `--check` reports files that would change and exits 1 without writing; `--syntax-only` fixes layout without resolving imports. Clean files are remembered in `.trilogy/fmt-cache.json` and skipped next time.
 - `trilogy unit <file|dir>` - validate with mocked datasources.
 - `trilogy integration <file|dir>` - validate against real data.
 - `trilogy database list` - list physical tables and views.
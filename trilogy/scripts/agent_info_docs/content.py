@@ -116,6 +116,19 @@ object per line, safe to tail): `run_start`, `file_start`/`file_end`,
 terminal `summary`. `--run-id` stamps a correlation id on every record.
 Consumers must ignore unknown record types and fields.
 
+## Cost budgets
+
+On warehouses that bill by bytes scanned (bigquery, snowflake), a `[cost]`
+section dry-runs every statement before it runs. Each estimate is reported as a
+`statement_cost` record and the run total lands on `summary` and in the state
+snapshot as `estimated_bytes`. A statement over `max_statement_bytes`, or one
+that would take the command past `max_run_bytes`, is refused before it runs.
+`dry_run = true` records estimates without a budget. Sizes are bytes or strings
+such as `"50 GB"`. Engines with no estimate reject the section.
+
+`trilogy plan <dir> --cost` estimates every statement the plan would run, per
+script and in total, without running any of them.
+
 ## Environment variables
 
 Every flag has an env-var form, for when the orchestrator controls the process
@@ -545,7 +558,9 @@ theme = "inter"
 
 - `[engine]` — execution dialect and parallelism defaults. Most workspaces
   override only `dialect` (`duckdb`, `postgres`, ...). `parallelism` caps the
-  worker count for multi-script execution.
+  worker count for multi-script execution. `pool_size` caps the warehouse
+  connections `trilogy refresh` shares across its per-script executors
+  (default: enough for every worker; in-memory databases are never shared).
 - `[engine.config]` — dialect-specific connection and behaviour params, passed
   straight to that dialect's config object. See the per-dialect keys below.
 - `[staging]` — `path` for intermediate/temp artifacts (a local directory, or
@@ -557,6 +572,8 @@ theme = "inter"
 - `[agent]` — defaults for `trilogy agent` and AI-assisted features. `provider`
   + `model` are the LLM defaults; `api_key_env` overrides which env var the
   API key is read from (defaults below).
+- `[cost]` — `dry_run`, `max_statement_bytes`, `max_run_bytes`; see
+  cost budgets above.
 - `[report]` — rendering defaults. `theme` names the visual theme applied by
   `trilogy render` and chart `copy into` exports; overridable per invocation
   with `--theme` / `copy (theme='...')`.
@@ -574,6 +591,11 @@ instead; when set here, always reference the environment (see below).
 - `enable_python_datasources` — allow `.py` (Arrow) datasources
 - `enable_gcs` / `enable_spatial` — load the matching DuckDB extension
 - `gcs_cache_bust` — append a cache-busting query param to `gs://` reads
+- `remote_cache` — read remote `http(s)://` / public `gs://` files from a local
+  copy under the staging root, re-validated (ETag / generation /
+  Last-Modified) before every use; `remote_cache_max_mb` bounds the cache
+  (LRU, default 2048), `remote_cache_row_groups` keeps parquet metadata and
+  row groups of uncached remote files in DuckDB's in-memory caches
 
 **bigquery**
 - `project` — GCP project; defaults to the application-default-credentials one
@@ -591,6 +613,11 @@ instead; when set here, always reference the environment (see below).
   attach per-job table definitions; `use_sqlalchemy = true` therefore also
   requires `staging_dataset` to use python datasources. A migration escape
   hatch kept for one release — do not build on it
+- `storage_read_min_rows` — results of at least this many rows are read as
+  Arrow through the BigQuery Storage Read API instead of REST pages (needs
+  `google-cloud-bigquery-storage`). Unset stays on REST. Native engine only
+- `storage_read_streams` — parallel read streams for those results (default
+  4); results with an `ORDER BY` always use one
 
 Staged objects are deleted at executor close in the default mode, but that is
 best-effort and cannot run if the process is killed — put an age-based
@@ -609,7 +636,8 @@ enable_python_datasources = true
 **postgres / mysql / sql_server** — `host`, `port`, `username`, `password`,
 `database`. **snowflake** — `account`, `username`, `password`, `database`,
 `schema`. **presto / trino** — `host`, `port`, `username`, `password`,
-`catalog`, `schema`. **sqlite** — `path`. **clickhouse** — `mode`
+`catalog`, `schema`. **sqlite** — `path`, `remote_cache` (reuse a
+validated local copy of a remote database). **clickhouse** — `mode`
 (`chdb` embedded or `server`), plus `host`/`port`/`username`/`password`/
 `database`/`secure` in server mode, or `chdb_path` in chdb mode.
 
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import re
 import time
+from collections import deque
 from pathlib import Path
 
 from trilogy.ai.models import LLMToolDefinition
@@ -24,10 +25,7 @@ from trilogy.scripts.agent_tools import (
     truncate_middle,
 )
 from trilogy.scripts.display_core import _pretty
-from trilogy.scripts.display_execution import (
-    _column_stats,
-    _slice_for_middle_truncation,
-)
+from trilogy.scripts.display_execution import _ColumnStats
 
 # Leading keywords a read-only exploration/answer statement may start with. The
 # workspace DB is a disposable per-worker copy, so this is a guard against an
@@ -50,6 +48,8 @@ _READONLY_LEADING = frozenset(
 )
 
 _MAX_RESULT_ROWS = 25
+# rows pulled from the engine per fetch while building the preview
+_FETCH_BATCH_ROWS = 10_000
 
 # One executor per process (each agent runs in its own subprocess), built lazily
 # from the workspace trilogy.toml engine config.
@@ -107,33 +107,58 @@ def _readonly_violation(sql: str) -> str | None:
     return None
 
 
+class _ResultPreview:
+    """Head and tail of a result, plus its column stats, fed batch by batch so
+    a large result is summarized without being held."""
+
+    def __init__(self, keys: list[str], cap: int):
+        self.keys = keys
+        self.head_size = cap // 2 + cap % 2
+        self.head: list = []
+        self.tail: deque = deque(maxlen=cap - self.head_size)
+        self.total = 0
+        self.stats = _ColumnStats(keys)
+
+    def update(self, rows: list) -> None:
+        self.total += len(rows)
+        self.stats.update(rows)
+        room = self.head_size - len(self.head)
+        self.head.extend(rows[:room])
+        if self.tail.maxlen:
+            self.tail.extend(rows[max(room, 0) :])
+
+    def render(self) -> str:
+        omitted = self.total - len(self.head) - len(self.tail)
+        shown: list = [list(row) for row in self.head]
+        if omitted:
+            shown.append(f"<redacted {omitted} rows>")
+        shown.extend(list(row) for row in self.tail)
+        payload = {
+            "event": "result",
+            "columns": self.keys,
+            "rows": shown,
+            "row_count": self.total,
+            "displayed": len(self.head) + len(self.tail),
+        }
+        if omitted:
+            payload.update(
+                {
+                    "truncated": True,
+                    "omitted": omitted,
+                    "column_stats": self.stats.result(),
+                    "column_stats_note": (
+                        "column_stats are computed over the full returned result "
+                        f"({self.total} rows)."
+                    ),
+                }
+            )
+        return _pretty(payload)
+
+
 def _format_result(keys: list[str], rows: list) -> str:
-    total = len(rows)
-    head, tail, omitted = _slice_for_middle_truncation(rows, _MAX_RESULT_ROWS)
-    shown: list = [list(row) for row in head]
-    if omitted:
-        shown.append(f"<redacted {omitted} rows>")
-    shown.extend(list(row) for row in tail)
-    payload = {
-        "event": "result",
-        "columns": keys,
-        "rows": shown,
-        "row_count": total,
-        "displayed": len(head) + len(tail),
-    }
-    if omitted:
-        payload.update(
-            {
-                "truncated": True,
-                "omitted": omitted,
-                "column_stats": _column_stats(keys, rows),
-                "column_stats_note": (
-                    "column_stats are computed over the full returned result "
-                    f"({total} rows)."
-                ),
-            }
-        )
-    return _pretty(payload)
+    preview = _ResultPreview(keys, _MAX_RESULT_ROWS)
+    preview.update(rows)
+    return preview.render()
 
 
 def _envelope(exit_code: int, stdout: str, stderr: str) -> str:
@@ -152,11 +177,13 @@ def _execute_sql(state: AgentState, sql: str) -> str:
     start = time.perf_counter()
     try:
         result = _get_engine().execute_raw_sql(statement)
-        rows = result.fetchall()
         try:
             keys = list(result.keys())
         except Exception:
             keys = []
+        preview = _ResultPreview(keys, _MAX_RESULT_ROWS)
+        while rows := result.fetchmany(_FETCH_BATCH_ROWS):
+            preview.update(rows)
     except Exception as exc:
         return _envelope(
             1,
@@ -174,11 +201,11 @@ def _execute_sql(state: AgentState, sql: str) -> str:
             "statements": 1,
             "duration_ms": round((time.perf_counter() - start) * 1000, 3),
             "ok": True,
-            "rows": len(rows),
+            "rows": preview.total,
         }
     )
     out = truncate_json_events(
-        f"{_format_result(keys, rows)}\n{summary}", state.tool_output_limit
+        f"{preview.render()}\n{summary}", state.tool_output_limit
     )
     return _envelope(0, out, "")
 
@@ -545,6 +545,9 @@ def get_dialect_config(
                 "enable_gcs",
                 "enable_spatial",
                 "gcs_cache_bust",
+                "remote_cache",
+                "remote_cache_max_mb",
+                "remote_cache_row_groups",
             ],
             "DuckDB",
         )
@@ -555,7 +558,7 @@ def get_dialect_config(
         conn_dict = validate_required_connection_params(
             conn_dict,
             [],
-            ["path"],
+            ["path", "remote_cache"],
             "SQLite",
         )
         conf = SQLiteConfig(**conn_dict)
@@ -621,6 +624,8 @@ def get_dialect_config(
                 "staging_uri",
                 "enable_python_datasources",
                 "use_sqlalchemy",
+                "storage_read_min_rows",
+                "storage_read_streams",
             ],
             "BigQuery",
         )
@@ -699,6 +704,7 @@ def create_executor(
     config: RuntimeConfig,
     debug_file: str | None = None,
     query_timeout: float | None = None,
+    run_startup: bool = True,
 ) -> Executor:
     # Parse environment parameters from dedicated flag
     namespace = DEFAULT_NAMESPACE
@@ -733,11 +739,14 @@ def create_executor(
     if env_params:
         environment.set_parameters(**env_params)
 
+    from trilogy.execution.connection_pool import shared_engine_factory
     from trilogy.execution.envs import datasource_transform_from_active
 
     exec = Executor(
         dialect=edialect,
-        engine=edialect.default_engine(conf=conf),
+        engine=edialect.default_engine(
+            conf=conf, _engine_factory=shared_engine_factory
+        ),
         environment=environment,
         hooks=(
             [DebuggingHook(output_file=PathlibPath(debug_file))] if debug_file else []
@@ -747,7 +756,10 @@ def create_executor(
         chart_theme=config.report_theme,
         datasource_transform=datasource_transform_from_active(PathlibPath(directory)),
         query_timeout=query_timeout,
+        cost_budget=config.cost,
     )
+    if not run_startup:
+        return exec
     if config.startup_sql:
         for script in config.startup_sql:
             print_info(f"Executing startup SQL script: {script.name}...")
@@ -770,16 +782,27 @@ def create_executor_for_script(
     config: RuntimeConfig,
     debug_file: str | None = None,
     query_timeout: float | None = None,
+    run_startup: bool = True,
 ) -> Executor:
     """
     Create an executor for a specific script node.
 
     Each script gets its own executor with its own environment,
     using the script's parent directory as the working path.
+    ``run_startup=False`` skips the configured startup scripts, for callers
+    that must not execute anything.
     """
     directory = node.path.parent
     return create_executor(
-        param, directory, conn_args, edialect, debug, config, debug_file, query_timeout
+        param,
+        directory,
+        conn_args,
+        edialect,
+        debug,
+        config,
+        debug_file,
+        query_timeout,
+        run_startup=run_startup,
     )
 
 
@@ -1051,6 +1074,15 @@ def execute_script_with_stats(
     exec: Executor, script_path: PathlibPath, run_statements: bool = True
 ) -> ExecutionStats:
     """Parse and optionally execute a script, returning execution stats."""
+    from trilogy.core.profile import script_scope
+
+    with script_scope(str(script_path)):
+        return _execute_script_statements(exec, script_path, run_statements)
+
+
+def _execute_script_statements(
+    exec: Executor, script_path: PathlibPath, run_statements: bool
+) -> ExecutionStats:
     from datetime import datetime
 
     from trilogy.execution.report import emit_statement_end
@@ -1065,7 +1097,7 @@ def execute_script_with_stats(
         start = datetime.now()
         error: Exception | None = None
         try:
-            exec.execute_query(query)
+            exec.execute_statement(query)
         except Exception as e:
             error = e
             raise
@@ -1,9 +1,11 @@
 """Display helpers for single-script execution output."""
 
 import os
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from trilogy.core.profile import Profiler, StatementProfile
     from trilogy.core.statements.execute import ProcessedChartStatement
 
 from click import echo
@@ -296,6 +298,88 @@ def show_execution_summary(
             )
 
 
+def _profile_label(statement: "StatementProfile") -> str:
+    label = f"#{statement.index} {statement.label}"
+    if statement.script:
+        label = f"{os.path.basename(statement.script)} {label}"
+    return label
+
+
+def show_profile_summary(
+    profiler: "Profiler", path: str | None = None, top: int = 10
+) -> None:
+    """Summarize a profiled run: run-wide phase totals, then the slowest
+    statements with their per-phase breakdown."""
+    from datetime import timedelta
+
+    from trilogy.core.profile import PHASES
+
+    slowest = profiler.top(top)
+    if is_json_mode():
+        emit_event(
+            "profile",
+            file=path,
+            parse=round(profiler.parse_seconds, 6),
+            phases={
+                name: round(value, 6) for name, value in profiler.phase_totals().items()
+            },
+            slowest=[statement.to_dict() for statement in slowest],
+        )
+        return
+    totals = profiler.phase_totals()
+    phases = [name for name in PHASES if name in totals] + sorted(
+        name for name in totals if name not in PHASES
+    )
+
+    def fmt(seconds: float) -> str:
+        return format_duration(timedelta(seconds=seconds))
+
+    header = "Profile: " + ", ".join(f"{name} {fmt(totals[name])}" for name in phases)
+    if _core.RICH_AVAILABLE and _core.console is not None:
+        table = Table(title=header, box=box.SIMPLE_HEAD, title_justify="left")
+        table.add_column("Statement")
+        table.add_column("Total", justify="right", style="cyan")
+        for name in phases:
+            table.add_column(name.capitalize(), justify="right")
+        table.add_column("Rows", justify="right")
+        table.add_column("Scanned", justify="right")
+        for statement in slowest:
+            table.add_row(
+                _profile_label(statement),
+                fmt(statement.total),
+                *(
+                    fmt(statement.phases[name]) if name in statement.phases else ""
+                    for name in phases
+                ),
+                "" if statement.rows is None else f"{statement.rows:,}",
+                (
+                    ""
+                    if statement.bytes_scanned is None
+                    else f"{statement.bytes_scanned:,} B"
+                ),
+            )
+        _core.console.print(table)
+    else:
+        print_info(header)
+        for statement in slowest:
+            breakdown = ", ".join(
+                f"{name} {fmt(statement.phases[name])}"
+                for name in phases
+                if name in statement.phases
+            )
+            extra = (
+                ""
+                if statement.rows is None
+                else f", {_pluralize('row', statement.rows)}"
+            )
+            echo(
+                f"  {_profile_label(statement)}: {fmt(statement.total)} "
+                f"({breakdown}{extra})"
+            )
+    if path:
+        print_info(f"Profile trace written to {path}")
+
+
 def show_formatting_result(
     num_queries: int,
     duration: object,
@@ -319,33 +403,82 @@ def show_formatting_result(
     print_success(f"Formatted {num_queries} statements in {format_duration(duration)}")
 
 
+# Distinct values tracked per column; past this the count is reported as a
+# lower bound, so a streamed high-cardinality column stays bounded in memory.
+_DISTINCT_CAP = 10_000
+
+
+class _ColumnStats:
+    """``_column_stats`` accumulated batch by batch, for callers that stream a
+    result rather than hold it: only the distinct values are kept, up to
+    ``_DISTINCT_CAP`` per column."""
+
+    def __init__(self, columns: list):
+        self.columns = columns
+        self.rows = 0
+        self._non_null = [0] * len(columns)
+        self._distinct: list[set | None] = [set() for _ in columns]
+        self._capped = [False] * len(columns)
+        self._min: list[Any] = [None] * len(columns)
+        self._max: list[Any] = [None] * len(columns)
+        self._orderable = [True] * len(columns)
+
+    def update(self, rows: list) -> None:
+        self.rows += len(rows)
+        for i in range(len(self.columns)):
+            non_null = [r[i] for r in rows if r[i] is not None]
+            if not non_null:
+                continue
+            self._non_null[i] += len(non_null)
+            distinct = self._distinct[i]
+            if distinct is not None and not self._capped[i]:
+                try:  # unhashable cells (lists/dicts) — skip rather than crash
+                    distinct.update(non_null)
+                except TypeError:
+                    self._distinct[i] = None
+                else:
+                    if len(distinct) > _DISTINCT_CAP:
+                        self._capped[i] = True
+                        distinct.clear()
+            if self._orderable[i]:
+                try:  # mixed/unorderable types — skip the range
+                    low, high = min(non_null), max(non_null)
+                    if self._min[i] is not None:
+                        low = min(low, self._min[i])
+                        high = max(high, self._max[i])
+                    self._min[i], self._max[i] = low, high
+                except TypeError:
+                    self._orderable[i] = False
+
+    def result(self) -> list[dict]:
+        stats: list[dict] = []
+        for i, col in enumerate(self.columns):
+            entry: dict[str, Any] = {
+                "column": col,
+                "non_null": self._non_null[i],
+                "nulls": self.rows - self._non_null[i],
+            }
+            distinct = self._distinct[i]
+            if self._capped[i]:
+                entry["distinct"] = f">{_DISTINCT_CAP}"
+            elif distinct is not None:
+                entry["distinct"] = len(distinct)
+            if self._non_null[i] and self._orderable[i]:
+                entry["min"] = self._min[i]
+                entry["max"] = self._max[i]
+            stats.append(entry)
+        return stats
+
+
 def _column_stats(columns: list, rows: list) -> list[dict]:
     """Per-column summary over the FULL fetched result. Surfaced only when rows
     are elided, so the agent reads the whole set's shape (non-null / distinct /
     range) instead of inferring it from the truncated head+tail — the q05
     failure mode where a sparse, id-sorted page of nulls was misread as a
     structural "missing data" problem rather than expected sparsity."""
-    n = len(rows)
-    stats: list[dict] = []
-    for i, col in enumerate(columns):
-        non_null = [r[i] for r in rows if r[i] is not None]
-        entry: dict[str, Any] = {
-            "column": col,
-            "non_null": len(non_null),
-            "nulls": n - len(non_null),
-        }
-        try:  # unhashable cells (lists/dicts) — skip rather than crash
-            entry["distinct"] = len(set(non_null))
-        except TypeError:
-            pass
-        if non_null:
-            try:  # mixed/unorderable types — skip the range
-                entry["min"] = min(non_null)
-                entry["max"] = max(non_null)
-            except TypeError:
-                pass
-        stats.append(entry)
-    return stats
+    stats = _ColumnStats(columns)
+    stats.update(rows)
+    return stats.result()
 
 
 _LIMIT_BOUNDED_STATS_NOTE = (
@@ -485,7 +618,7 @@ def show_derived_value_scopes(results: ResultSet) -> None:
 
 
 def print_chart_terminal(
-    layer_data: list[list[dict]], statement: "ProcessedChartStatement"
+    layer_data: Sequence[Sequence[dict]], statement: "ProcessedChartStatement"
 ) -> bool:
     """Render chart to terminal using plotext. Returns True if rendered."""
     if is_json_mode():
@@ -493,7 +626,7 @@ def print_chart_terminal(
         # per-layer data rows so the information is still available.
         emit_event(
             "chart",
-            layers=layer_data,
+            layers=[list(layer) for layer in layer_data],
             # "chart_type" is the first layer's type (mirrors report _chart_type);
             # ChartType is a plain Enum, so emit its .value for clean JSON.
             chart_type=(
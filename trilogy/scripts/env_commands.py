@@ -286,7 +286,10 @@ def _resolve_env_name(manager: EnvironmentManager, name: str | None) -> str:
 
 
 def _current_code_fingerprint(input: str, param: tuple[str, ...], config):
-    from trilogy.execution.model_fingerprint import build_project_fingerprint
+    from trilogy.execution.model_fingerprint import (
+        FingerprintCache,
+        build_project_fingerprint,
+    )
     from trilogy.scripts.environment import parse_env_params
     from trilogy.scripts.state import project_root_for
 
@@ -295,7 +298,12 @@ def _current_code_fingerprint(input: str, param: tuple[str, ...], config):
     anchor = _anchor_dir(input)
     project_root = project_root_for(config, anchor)
     env_params = parse_env_params(param)
-    return build_project_fingerprint(files, project_root, env_params)
+    return build_project_fingerprint(
+        files,
+        project_root,
+        env_params,
+        cache=FingerprintCache.for_project(project_root),
+    )
 
 
 def record_env_fingerprint(
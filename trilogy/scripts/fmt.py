@@ -1,17 +1,33 @@
 """Format command for Trilogy CLI."""
 
+import hashlib
+import json
+import os
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path as PathLib
 
-from click import Path, argument, pass_context
+from click import Path, argument, option, pass_context
+from click.exceptions import Exit
 
+from trilogy.constants import logger
 from trilogy.core.models.environment import Environment
 from trilogy.parsing.render import Renderer
 from trilogy.scripts.common import handle_execution_exception
-from trilogy.scripts.display import print_success, show_formatting_result, with_status
+from trilogy.scripts.display import (
+    print_error,
+    print_success,
+    show_formatting_result,
+    with_status,
+)
 from trilogy.utility import safe_open
 
+#: Relative to the formatted directory (or a single file's parent), beside
+#: serve's ``.trilogy/state``; persist it between CI runs to skip clean files.
+CACHE_SUBPATH = PathLib(".trilogy") / "fmt-cache.json"
+# Entries beyond this are dropped, keeping only those the current run saw.
+MAX_CACHE_ENTRIES = 100_000
+
 
 def render_file(file_path: str) -> tuple[str, str | None, int, str | None]:
     """Parse + render one file. Returns (path, formatted, query_count, error).
@@ -36,14 +52,134 @@ def render_file(file_path: str) -> tuple[str, str | None, int, str | None]:
         return (file_path, None, 0, str(e))
 
 
+def render_file_syntax(file_path: str) -> tuple[str, str | None, int, str | None]:
+    """``render_file`` by layout alone: no hydration, no imports read."""
+    from trilogy.parsing.parse_engine_v2 import parse_syntax
+    from trilogy.parsing.syntax_format import format_syntax
+    from trilogy.parsing.v2.syntax import SyntaxNode
+
+    try:
+        with safe_open(file_path) as f:
+            script = f.read()
+        formatted = format_syntax(script)
+        # parse_syntax is memoized on text, so this reuses format_syntax's parse
+        statements = sum(
+            isinstance(form, SyntaxNode) for form in parse_syntax(script).forms
+        )
+        return (file_path, formatted, statements, None)
+    except Exception as e:
+        return (file_path, None, 0, str(e))
+
+
 def find_preql_files(path: PathLib) -> list[str]:
     """Recursively find all .preql files in a directory."""
     return [str(p) for p in path.rglob("*.preql")]
 
 
+class FormatCache:
+    """Content hashes of files already known to be formatted.
+
+    A file whose key is recorded is skipped without being parsed. The key
+    covers everything formatting depends on: the trilogy version, the mode,
+    the file's text and, for a full render, the text of every file it imports,
+    since the renderer resolves references through them. A file whose imports
+    cannot be resolved gets no key and is always formatted.
+    """
+
+    def __init__(self, path: PathLib, syntax_only: bool) -> None:
+        self.path = path
+        self.syntax_only = syntax_only
+        self.known: set[str] = set()
+        self.seen: set[str] = set()
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            self.known = set(raw.get("clean", []))
+        except (OSError, ValueError, AttributeError) as e:
+            logger.debug("No usable format cache at %s: %s", path, e)
+
+    def key(self, file_path: str, content: str) -> str | None:
+        from trilogy import __version__
+
+        digest = hashlib.sha256()
+        mode = "syntax" if self.syntax_only else "render"
+        digest.update(f"{__version__}\0{mode}\0".encode())
+        digest.update(content.encode("utf-8"))
+        if not self.syntax_only:
+            try:
+                for imported in _imported_files(file_path):
+                    digest.update(b"\0" + str(imported).encode("utf-8") + b"\0")
+                    digest.update(imported.read_bytes())
+            except Exception as e:
+                logger.debug("Not caching %s: %s", file_path, e)
+                return None
+        return digest.hexdigest()
+
+    def is_clean(self, key: str | None) -> bool:
+        if key is None:
+            return False
+        self.seen.add(key)
+        return key in self.known
+
+    def mark_clean(self, key: str | None) -> None:
+        if key is not None:
+            self.seen.add(key)
+            self.known.add(key)
+
+    def save(self) -> None:
+        entries = self.known if len(self.known) <= MAX_CACHE_ENTRIES else self.seen
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({"clean": sorted(entries)}), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.debug("Could not write format cache %s: %s", self.path, e)
+
+
+def _imported_files(file_path: str) -> list[PathLib]:
+    from _preql_import_resolver import PyImportResolver
+
+    from trilogy.scripts.dependency import normalize_path_variants
+
+    root = normalize_path_variants(PathLib(file_path).resolve())
+    result = PyImportResolver().resolve(str(root))
+    return sorted(
+        path
+        for path in (normalize_path_variants(p) for p in result.get("order", []))
+        if path != root
+    )
+
+
+def _read(file_path: str) -> str:
+    with safe_open(file_path) as f:
+        return f.read()
+
+
 @argument("input", type=Path(exists=True))
+@option(
+    "--check",
+    is_flag=True,
+    default=False,
+    help="Report files that would be reformatted, without writing; exit 1 if any.",
+)
+@option(
+    "--syntax-only",
+    is_flag=True,
+    default=False,
+    help=(
+        "Normalize layout (statement lines, indentation, blank lines, trailing "
+        "whitespace) from the syntax tree alone, without resolving imports or "
+        "reprinting statements. Much faster on large repositories."
+    ),
+)
+@option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help=f"Format every file, ignoring and not updating {CACHE_SUBPATH.as_posix()}.",
+)
 @pass_context
-def fmt(ctx, input) -> None:
+def fmt(ctx, input, check: bool, syntax_only: bool, no_cache: bool) -> None:
     """Format a Trilogy script file or directory."""
     start = datetime.now()
     input_path = PathLib(input)
@@ -60,41 +196,80 @@ def fmt(ctx, input) -> None:
         print_success(f"Invalid path: {input}")
         return
 
+    cache_root = input_path if input_path.is_dir() else input_path.parent
+    cache = None if no_cache else FormatCache(cache_root / CACHE_SUBPATH, syntax_only)
+    render = render_file_syntax if syntax_only else render_file
+
     total_files = len(files)
     total_queries = 0
     failed_files = []
+    originals: dict[str, str] = {}
     pending_writes: list[tuple[str, str]] = []
 
     with with_status(f"Formatting {total_files} file(s)"):
         try:
-            if total_files > 1:
+            todo: list[str] = []
+            for file_path in files:
+                content = _read(file_path)
+                if cache is not None and cache.is_clean(cache.key(file_path, content)):
+                    continue
+                originals[file_path] = content
+                todo.append(file_path)
+            skipped = total_files - len(todo)
+
+            results = []
+            if len(todo) > 1 and not syntax_only:
                 # Two-phase: parse+render in parallel against the on-disk
                 # originals (no writes yet, so the parser never reads a
                 # mid-write file), then commit writes serially after every
-                # worker has produced output.
+                # worker has produced output. Syntax-only formatting reads
+                # nothing but the file itself and is cheaper inline than
+                # shipping it to a worker process.
                 with ProcessPoolExecutor() as executor:
-                    futures = {executor.submit(render_file, f): f for f in files}
+                    futures = {executor.submit(render, f): f for f in todo}
                     for future in as_completed(futures):
-                        file_path, formatted, query_count, error = future.result()
-                        if formatted is not None:
-                            total_queries += query_count
-                            pending_writes.append((file_path, formatted))
-                        else:
-                            failed_files.append((file_path, error))
+                        results.append(future.result())
             else:
-                file_path, formatted, query_count, error = render_file(files[0])
+                results = [render(f) for f in todo]
+
+            for file_path, formatted, query_count, error in results:
                 if formatted is not None:
                     total_queries += query_count
-                    pending_writes.append((file_path, formatted))
+                    if formatted != originals[file_path]:
+                        pending_writes.append((file_path, formatted))
                 else:
                     failed_files.append((file_path, error))
 
-            for file_path, formatted in pending_writes:
-                with safe_open(file_path, "w", newline="\n") as f:
-                    f.write(formatted)
+            if not check:
+                for file_path, formatted in pending_writes:
+                    with safe_open(file_path, "w", newline="\n") as f:
+                        f.write(formatted)
+
+            if cache is not None:
+                failed = {file_path for file_path, _ in failed_files}
+                unclean = failed | (
+                    {file_path for file_path, _ in pending_writes} if check else set()
+                )
+                # keyed after writing: a full render's key covers imports that
+                # this same run may have rewritten
+                for file_path in todo:
+                    if file_path not in unclean:
+                        cache.mark_clean(cache.key(file_path, _read(file_path)))
+                cache.save()
 
             duration = datetime.now() - start
-            if total_files == 1:
+            if check:
+                for file_path, error in failed_files:
+                    print_error(f"Failed to format {file_path}: {error}")
+                for file_path, _ in sorted(pending_writes):
+                    print_error(f"Would reformat {file_path}")
+                print_success(
+                    f"Checked {total_files} file(s) in {duration}: "
+                    f"{len(pending_writes)} would be reformatted, "
+                    f"{len(failed_files)} failed, {skipped} unchanged since "
+                    "the last check"
+                )
+            elif total_files == 1:
                 file_path, error = failed_files[0] if failed_files else (files[0], None)
                 show_formatting_result(
                     total_queries, duration, file_path=file_path, error=error
@@ -106,7 +281,11 @@ def fmt(ctx, input) -> None:
                 print_success(
                     f"Formatted {total_files - len(failed_files)}/{total_files} files "
                     f"with {total_queries} statements in {duration}"
+                    + (f" ({skipped} already formatted)" if skipped else "")
                 )
 
         except Exception as e:
             handle_execution_exception(e, debug=ctx.obj["DEBUG"])
+
+    if check and (pending_writes or failed_files):
+        raise Exit(1)
@@ -15,6 +15,7 @@ from trilogy import Executor
 from trilogy.constants import logger
 from trilogy.core import graph as nx
 from trilogy.execution.report import emit_report, exit_code_for
+from trilogy.parsing.v2.import_service import shared_import_scope
 from trilogy.scripts.common import CLIRuntimeParams, ExecutionStats, RefreshParams
 from trilogy.scripts.dependency import (
     DependencyResolver,
@@ -558,6 +559,7 @@ def run_single_script_execution(
     query_timeout: float | None = None,
 ) -> int:
     """Run single script execution. Returns count of assets refreshed (for refresh mode)."""
+    from trilogy.core.profile import script_scope
     from trilogy.scripts.common import create_executor
     from trilogy.scripts.display import show_execution_info
 
@@ -577,16 +579,17 @@ def run_single_script_execution(
             text = raw.read()
 
     try:
-        return _dispatch_single_script_execution(
-            exec,
-            text,
-            base,
-            execution_mode,
-            debug=debug,
-            row_limit=row_limit,
-            refresh_params=refresh_params,
-            show_scopes=show_scopes,
-        )
+        with script_scope(str(base) if isinstance(base, Path) else "inline"):
+            return _dispatch_single_script_execution(
+                exec,
+                text,
+                base,
+                execution_mode,
+                debug=debug,
+                row_limit=row_limit,
+                refresh_params=refresh_params,
+                show_scopes=show_scopes,
+            )
     finally:
         # The parallel path closes its executors in _execute_single; close here
         # too so file-backed engines (e.g. duckdb) release their handles.
@@ -940,7 +943,8 @@ def run_parallel_execution(
         _report_file_end(result)
         tracker.on_complete(result)
 
-    with tracker:
+    # Every script in the run shares one build of each imported module.
+    with tracker, shared_import_scope() as shared_imports:
         summary = parallel_exec.execute(
             root=pathlib_input,
             executor_factory=executor_factory,
@@ -949,6 +953,8 @@ def run_parallel_execution(
             on_script_complete=on_complete,
             graph=execution_plan,
         )
+    if shared_imports.modules:
+        emit_report("shared_imports", modules=shared_imports.report())
 
     # For dry-run refresh, print collected SQL after all scripts complete
     refresh_dry_run = False
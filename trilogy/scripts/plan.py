@@ -10,6 +10,8 @@ from click import Path, argument, option, pass_context
 from click.exceptions import Exit
 
 from trilogy.core import graph as nx
+from trilogy.dialect.enums import Dialects
+from trilogy.execution.config import RuntimeConfig
 from trilogy.scripts.click_utils import report_options
 from trilogy.scripts.common import (
     handle_execution_exception,
@@ -126,6 +128,78 @@ def format_plan_text(
     return nodes, edges, execution_order
 
 
+def estimate_script_cost(
+    path: PathlibPath, dialect: Dialects, config: RuntimeConfig
+) -> list[Any]:
+    """Dry-run every statement ``path`` compiles to, without running any."""
+    from trilogy.core.exceptions import ConfigurationException
+    from trilogy.execution.cost import estimate_statement, resolve_cost_estimator
+    from trilogy.scripts.common import create_executor_for_script
+
+    # startup scripts may be billed or have side effects; a dry run runs none
+    executor = create_executor_for_script(
+        ScriptNode(path=path), (), (), dialect, False, config, run_startup=False
+    )
+    try:
+        estimator = resolve_cost_estimator(executor.connection, dialect)
+        if estimator is None:
+            raise ConfigurationException(
+                f"{dialect.value} cannot estimate a statement's bytes scanned; "
+                "plan --cost needs a billed warehouse such as bigquery or snowflake."
+            )
+        costs = []
+        for sql in executor.generate_sql(path.read_text(encoding="utf-8")):
+            command, params = executor.prepare_sql(sql)
+            costs.append(estimate_statement(estimator, command, params))
+        return costs
+    finally:
+        executor.close()
+
+
+def estimate_plan_cost(
+    levels: list[list[ScriptNode]],
+    root: PathlibPath,
+    dialect: Dialects,
+    config: RuntimeConfig,
+) -> dict[str, Any]:
+    """Per-script dry-run estimates, in execution order, with the run total.
+
+    Each script compiles against the model as it stands, so a statement that
+    reads a table an upstream script has yet to create reports the engine's
+    error in place of an estimate."""
+    scripts = []
+    for level in levels:
+        for node in level:
+            costs = estimate_script_cost(node.path, dialect, config)
+            scripts.append(
+                {
+                    "script": safe_relative_path(node.path, root),
+                    "estimated_bytes": sum(c.estimated_bytes or 0 for c in costs),
+                    "statements": [c.to_dict() for c in costs],
+                }
+            )
+    return {
+        "estimated_bytes": sum(s["estimated_bytes"] for s in scripts),
+        "scripts": scripts,
+    }
+
+
+def format_cost_lines(cost: dict[str, Any]) -> list[str]:
+    from trilogy.execution.cost import format_bytes
+
+    lines = [f"Estimated Bytes Scanned: {format_bytes(cost['estimated_bytes'])}"]
+    for script in cost["scripts"]:
+        lines.append(f"  {script['script']}: {format_bytes(script['estimated_bytes'])}")
+        for index, statement in enumerate(script["statements"], start=1):
+            detail = (
+                f"error: {statement['error']}"
+                if statement["error"]
+                else format_bytes(statement["estimated_bytes"])
+            )
+            lines.append(f"    {index}. {detail} — {statement['sql']}")
+    return lines
+
+
 @argument("input", type=Path(), default=".")
 @option(
     "--output",
@@ -146,6 +220,22 @@ def format_plan_text(
     type=Path(exists=True),
     help="Path to trilogy.toml configuration file",
 )
+@option(
+    "--cost",
+    is_flag=True,
+    default=False,
+    help=(
+        "Dry-run every statement each script compiles to and show the bytes it "
+        "would scan, per statement, per script and in total. Runs nothing; "
+        "needs a warehouse that can estimate (bigquery, snowflake)."
+    ),
+)
+@option(
+    "--dialect",
+    type=str,
+    default=None,
+    help="Dialect to estimate --cost against (defaults to engine.dialect)",
+)
 @report_options
 @pass_context
 def plan(
@@ -154,6 +244,8 @@ def plan(
     output: str | None,
     json_format: bool,
     config: str | None,
+    cost: bool,
+    dialect: str | None,
     report_file: str | None,
     run_id: str | None,
 ):
@@ -168,7 +260,7 @@ def plan(
             target=str(input)[:200],
             config_path=config,
         ):
-            _plan_body(ctx, input, output, json_format, config)
+            _plan_body(ctx, input, output, json_format, config, cost, dialect)
     except Exit:
         raise
     except Exception as e:
@@ -181,6 +273,8 @@ def _plan_body(
     output: str | None,
     json_format: bool,
     config: str | None,
+    cost: bool = False,
+    dialect: str | None = None,
 ) -> None:
     from trilogy.execution.report import emit_report
 
@@ -189,7 +283,19 @@ def _plan_body(
         config_path = PathlibPath(config) if config else None
 
         # Resolve input to validate it exists
-        _ = list(resolve_input_information(input, config_path)[0])
+        files, _, _, _, runtime_config = resolve_input_information(input, config_path)
+        _ = list(files)
+        cost_dialect: Dialects | None = None
+        if cost:
+            cost_dialect = (
+                Dialects(dialect) if dialect else runtime_config.engine_dialect
+            )
+            if cost_dialect is None:
+                print_error(
+                    "plan --cost needs a dialect: pass --dialect or set "
+                    "engine.dialect in the config file."
+                )
+                raise Exit(1)
 
         if not pathlib_input.exists():
             print_error(f"Input path '{input}' does not exist.")
@@ -220,6 +326,12 @@ def _plan_body(
             nodes=graph_json["nodes"],
             edges=graph_json["edges"],
         )
+        plan_cost: dict[str, Any] | None = None
+        if cost_dialect is not None:
+            plan_cost = estimate_plan_cost(
+                get_execution_levels(graph), root, cost_dialect, runtime_config
+            )
+            emit_report("plan_cost", **plan_cost)
 
         if json_format:
             plan_data = graph_json
@@ -230,6 +342,8 @@ def _plan_body(
             ]
             # Add all required files (full dependency tree for bundling)
             plan_data["required_files"] = [str(p) for p in all_imports]
+            if plan_cost is not None:
+                plan_data["cost"] = plan_cost
             json_output = json.dumps(plan_data, indent=2)
 
             if output:
@@ -268,10 +382,16 @@ def _plan_body(
                     lines.append("Required Files:")
                     for import_path in all_imports:
                         lines.append(f"  {import_path}")
+                if plan_cost is not None:
+                    lines.append("")
+                    lines.extend(format_cost_lines(plan_cost))
                 output_path.write_text("\n".join(lines))
                 print_info(f"Plan written to {output_path}")
             else:
                 show_execution_plan(nodes, edges, execution_order, all_imports)
+                if plan_cost is not None:
+                    for line in format_cost_lines(plan_cost):
+                        print_info(line)
 
     except Exit:
         raise
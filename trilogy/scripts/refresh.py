@@ -18,6 +18,7 @@ from trilogy.core import graph as nx
 from trilogy.core.models.datasource import Datasource
 from trilogy.dialect.enums import Dialects
 from trilogy.execution.config import RuntimeConfig
+from trilogy.execution.connection_pool import default_pool_size, shared_engine_scope
 from trilogy.execution.envs import active_env, apply_env_to_environment
 from trilogy.execution.report import (
     emit_asset_refresh,
@@ -161,6 +162,11 @@ def _probe_owner_node(
         executor.close()
 
 
+def engine_pool_size(config: RuntimeConfig, parallelism: int) -> int:
+    """``[engine] pool_size``, else enough connections for every worker."""
+    return config.pool_size or default_pool_size(parallelism)
+
+
 def _merge_watermarks(
     watermarks: list[dict[str, DatasourceWatermark]],
 ) -> dict[str, DatasourceWatermark]:
@@ -526,57 +532,60 @@ def probe_directory_state(
     show_root_concepts(root_addr_to_needed_concepts)
     print_info(f"Probing {total_physical} managed asset(s)...")
 
-    all_root_watermarks: dict[str, DatasourceWatermark] = {}
-    if root_probe_plan:
-        with root_probe_progress(
-            len(root_addr_to_needed_concepts)
-        ) as _root_progress, ThreadPoolExecutor(max_workers=parallelism) as pool:
-            root_futures = {
+    # Both phases open an executor per script; they share pooled connections
+    # with each other and, under `trilogy refresh`, with the refresh itself.
+    with shared_engine_scope(engine_pool_size(config, parallelism)):
+        all_root_watermarks: dict[str, DatasourceWatermark] = {}
+        if root_probe_plan:
+            with root_probe_progress(
+                len(root_addr_to_needed_concepts)
+            ) as _root_progress, ThreadPoolExecutor(max_workers=parallelism) as pool:
+                root_futures = {
+                    pool.submit(
+                        _collect_root_watermarks,
+                        node,
+                        set(root_probe_plan[node]),
+                        address_map,
+                        set().union(*root_probe_plan[node].values()),
+                        cli_params,
+                        edialect,
+                        config,
+                    ): node
+                    for node in root_probe_plan
+                }
+                _root_progress.register_futures(root_futures)
+                for root_future in as_completed(root_futures):
+                    all_root_watermarks.update(root_future.result())
+                    node = root_futures[root_future]
+                    for _ in root_probe_plan[node]:
+                        _root_progress.advance()
+
+        # Phase 2b: probe each managed asset exactly once via its owner script (parallel)
+        # Root watermarks are pre-injected so each root is only queried once across all scripts.
+        initial_watermarks = all_root_watermarks or None
+        plans_by_node: list[tuple[ScriptNode, RefreshPlan]] = []
+        with probe_progress(total_physical) as _progress, ThreadPoolExecutor(
+            max_workers=parallelism
+        ) as pool:
+            futures = {
                 pool.submit(
-                    _collect_root_watermarks,
+                    _probe_owner_node,
                     node,
-                    set(root_probe_plan[node]),
                     address_map,
-                    set().union(*root_probe_plan[node].values()),
+                    addr_to_owner,
                     cli_params,
                     edialect,
                     config,
+                    initial_watermarks,
                 ): node
-                for node in root_probe_plan
+                for node in ordered_nodes
             }
-            _root_progress.register_futures(root_futures)
-            for root_future in as_completed(root_futures):
-                all_root_watermarks.update(root_future.result())
-                node = root_futures[root_future]
-                for _ in root_probe_plan[node]:
-                    _root_progress.advance()
-
-    # Phase 2b: probe each managed asset exactly once via its owner script (parallel)
-    # Root watermarks are pre-injected so each root is only queried once across all scripts.
-    initial_watermarks = all_root_watermarks or None
-    plans_by_node: list[tuple[ScriptNode, RefreshPlan]] = []
-    with probe_progress(total_physical) as _progress, ThreadPoolExecutor(
-        max_workers=parallelism
-    ) as pool:
-        futures = {
-            pool.submit(
-                _probe_owner_node,
-                node,
-                address_map,
-                addr_to_owner,
-                cli_params,
-                edialect,
-                config,
-                initial_watermarks,
-            ): node
-            for node in ordered_nodes
-        }
-        _progress.register_futures(futures)
-        for future in as_completed(futures):
-            owner_node, plan = future.result()
-            plans_by_node.append((owner_node, plan))
-            for _ in owner_to_addrs[owner_node] & probe_addrs:
-                _progress.advance()
+            _progress.register_futures(futures)
+            for future in as_completed(futures):
+                owner_node, plan = future.result()
+                plans_by_node.append((owner_node, plan))
+                for _ in owner_to_addrs[owner_node] & probe_addrs:
+                    _progress.advance()
 
     refreshable_root_addrs = {
         address_map[ds_id]
@@ -916,78 +925,81 @@ def run_refresh_command(cli_params: CLIRuntimeParams) -> ParallelExecutionSummar
     _, _, input_type, input_name, runtime_config = resolve_input_information(
         cli_params.input, cli_params.config_path
     )
-    edialect, _ = merge_runtime_config(cli_params, runtime_config)
+    edialect, parallelism = merge_runtime_config(cli_params, runtime_config)
     config_path_str = (
         str(runtime_config.source_path) if runtime_config.source_path else None
     )
     refresh_params = cli_params.refresh_params or RefreshParams()
 
-    if input_path.is_dir():
-        show_execution_info(
-            input_type,
-            input_name,
-            edialect.value,
-            cli_params.debug,
-            config_path_str,
-            cli_params.debug_file,
-        )
-        approved, phys_graph = _preview_directory_refresh(
-            cli_params, input_path, interactive=refresh_params.interactive
-        )
-        if not approved:
-            raise Exit(2)
-        if not phys_graph:
-            # All assets fresh: a successful no-op, not a failure — the exit
-            # code 2 convention distinguishes "nothing to do" from "refreshed".
-            emit_report(
-                "summary",
-                success=True,
-                exit_code=2,
-                total=0,
-                succeeded=0,
-                failed=0,
-                skipped=0,
-                partial_failure=False,
-                refreshed_assets=0,
+    # One pool for the preview probe and the refresh: every script executor
+    # reuses the same few warehouse connections.
+    with shared_engine_scope(engine_pool_size(runtime_config, parallelism)):
+        if input_path.is_dir():
+            show_execution_info(
+                input_type,
+                input_name,
+                edialect.value,
+                cli_params.debug,
+                config_path_str,
+                cli_params.debug_file,
             )
-            raise Exit(2)
-
-        execution_fn = make_managed_refresh_fn(
-            refresh_params.print_watermarks,
-            False,
-            refresh_params.dry_run,
-            policy=refresh_params.policy(),
-        )
+            approved, phys_graph = _preview_directory_refresh(
+                cli_params, input_path, interactive=refresh_params.interactive
+            )
+            if not approved:
+                raise Exit(2)
+            if not phys_graph:
+                # All assets fresh: a successful no-op, not a failure — the exit
+                # code 2 convention distinguishes "nothing to do" from "refreshed".
+                emit_report(
+                    "summary",
+                    success=True,
+                    exit_code=2,
+                    total=0,
+                    succeeded=0,
+                    failed=0,
+                    skipped=0,
+                    partial_failure=False,
+                    refreshed_assets=0,
+                )
+                raise Exit(2)
 
-        def physical_executor_factory(node: ManagedRefreshNode) -> Executor:
-            from trilogy.scripts.common import create_executor_for_script
+            execution_fn = make_managed_refresh_fn(
+                refresh_params.print_watermarks,
+                False,
+                refresh_params.dry_run,
+                policy=refresh_params.policy(),
+            )
 
-            executor = create_executor_for_script(
-                node.owner_script,
-                cli_params.param,
-                cli_params.conn_args,
-                cli_params.dialect or edialect,
-                cli_params.debug,
-                runtime_config,
-                cli_params.debug_file,
+            def physical_executor_factory(node: ManagedRefreshNode) -> Executor:
+                from trilogy.scripts.common import create_executor_for_script
+
+                executor = create_executor_for_script(
+                    node.owner_script,
+                    cli_params.param,
+                    cli_params.conn_args,
+                    cli_params.dialect or edialect,
+                    cli_params.debug,
+                    runtime_config,
+                    cli_params.debug_file,
+                )
+                with safe_open(node.owner_script.path) as handle:
+                    executor.parse_text(handle.read(), root=node.owner_script.path)
+                return executor
+
+            return run_parallel_execution(
+                cli_params=cli_params,
+                execution_fn=execution_fn,  # type: ignore[arg-type]
+                execution_mode=ExecutionMode.REFRESH,
+                graph=phys_graph,
+                executor_factory_override=physical_executor_factory,
             )
-            with safe_open(node.owner_script.path) as handle:
-                executor.parse_text(handle.read(), root=node.owner_script.path)
-            return executor
 
         return run_parallel_execution(
             cli_params=cli_params,
-            execution_fn=execution_fn,  # type: ignore[arg-type]
             execution_mode=ExecutionMode.REFRESH,
-            graph=phys_graph,
-            executor_factory_override=physical_executor_factory,
         )
 
-    return run_parallel_execution(
-        cli_params=cli_params,
-        execution_mode=ExecutionMode.REFRESH,
-    )
-
 
 @argument("input", type=ClickPath(), default=".")
 @argument("dialect", type=str, required=False)
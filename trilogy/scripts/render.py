@@ -9,7 +9,7 @@ from click.exceptions import Exit
 
 from trilogy.executor import Executor
 from trilogy.rendering.theme import DEFAULT_THEME, THEMES
-from trilogy.report import render_report
+from trilogy.report import render_report, render_reports
 from trilogy.report.backends import available_formats
 
 if TYPE_CHECKING:
@@ -37,7 +37,7 @@ def _report_executor(
     )
 
 
-@argument("input", type=Path(exists=True, dir_okay=False))
+@argument("inputs", nargs=-1, required=True, type=Path(exists=True, dir_okay=False))
 @option(
     "--to",
     "output_format",
@@ -58,7 +58,8 @@ def _report_executor(
     "output",
     type=Path(),
     default=None,
-    help="Output file path. Defaults to the input path with the format's extension.",
+    help="Output file path (a directory when rendering several reports). "
+    "Defaults to the input path with the format's extension.",
 )
 @option(
     "--config",
@@ -69,23 +70,37 @@ def _report_executor(
     "its [engine] dialect targets the report at a configured warehouse instead "
     "of the built-in in-memory DuckDB.",
 )
+@option(
+    "--browsers",
+    type=click.IntRange(min=1),
+    default=2,
+    show_default=True,
+    help="Headless browsers kept open to snapshot PNGs when rendering several "
+    "reports.",
+)
 @pass_context
 def render(
     ctx: click.Context,
-    input: str,
+    inputs: tuple[str, ...],
     output_format: str,
     theme: str | None,
     output: str | None,
     config_path: str | None,
+    browsers: int,
 ) -> None:
-    """Render a Trilogy markdown report to an image or HTML file.
+    """Render Trilogy markdown reports to images or HTML files.
 
     Executes embedded ```trilogy code blocks: chart statements become charts
-    and select statements become tables.
+    and select statements become tables. Several reports render as one batch
+    that shares its headless browsers.
     """
     from trilogy.scripts.common import get_runtime_config
     from trilogy.scripts.display import emit_event, is_json_mode, print_error
 
+    if len(inputs) > 1:
+        _render_batch(ctx, inputs, output_format, theme, output, config_path, browsers)
+        return
+    input = inputs[0]
     report_dir = PathlibPath(input).parent
     config = get_runtime_config(
         report_dir, PathlibPath(config_path) if config_path else None
@@ -102,7 +117,53 @@ def render(
     except Exception as e:  # surface a clean CLI error
         print_error(str(e))
         raise Exit(1)
+    finally:
+        if executor is not None:
+            executor.close()
     if is_json_mode():
         emit_event("rendered", input=input, output=str(result), format=output_format)
     else:
         click.secho(f"Rendered report -> {result}", fg="green")
+
+
+def _render_batch(
+    ctx: click.Context,
+    inputs: tuple[str, ...],
+    output_format: str,
+    theme: str | None,
+    output: str | None,
+    config_path: str | None,
+    browsers: int,
+) -> None:
+    from trilogy.scripts.common import get_runtime_config
+    from trilogy.scripts.display import emit_event, is_json_mode, print_error
+
+    if output is not None:
+        PathlibPath(output).mkdir(parents=True, exist_ok=True)
+    explicit = PathlibPath(config_path) if config_path else None
+    first = get_runtime_config(PathlibPath(inputs[0]).parent, explicit)
+
+    def executor_factory(source: PathlibPath) -> Executor | None:
+        return _report_executor(
+            ctx, source.parent, get_runtime_config(source.parent, explicit)
+        )
+
+    try:
+        results = render_reports(
+            inputs,
+            output_format=output_format,
+            output_dir=output,
+            theme=theme or first.report_theme or DEFAULT_THEME.name,
+            executor_factory=executor_factory,
+            browsers=browsers,
+        )
+    except Exception as e:  # surface a clean CLI error
+        print_error(str(e))
+        raise Exit(1)
+    for input, result in zip(inputs, results):
+        if is_json_mode():
+            emit_event(
+                "rendered", input=input, output=str(result), format=output_format
+            )
+        else:
+            click.secho(f"Rendered report -> {result}", fg="green")
@@ -1,6 +1,8 @@
 """Run command for Trilogy CLI."""
 
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path as PathlibPath
 
 import click
@@ -24,6 +26,8 @@ from trilogy.scripts.common import (
 from trilogy.scripts.dependency import ScriptNode
 from trilogy.scripts.parallel_execution import ExecutionMode, run_parallel_execution
 
+DEFAULT_PROFILE_FILE = "trilogy-profile.json"
+
 
 def execute_script_for_run(
     exec: Executor, node: ScriptNode, quiet: bool = False
@@ -108,6 +112,25 @@ def _format_import(value: str) -> str:
     return f"import {module} as {alias};\n" if alias else f"import {module};\n"
 
 
+@contextmanager
+def _profiled(profile_file: str | None) -> Iterator[None]:
+    """Profile the run when ``--profile`` was given; the trace is written and
+    summarized even when the run fails, since a failing run is often the one
+    being investigated."""
+    if profile_file is None:
+        yield
+        return
+    from trilogy.core.profile import profiling
+    from trilogy.scripts.display import show_profile_summary
+
+    with profiling() as profiler:
+        try:
+            yield
+        finally:
+            profiler.write(profile_file)
+            show_profile_summary(profiler, profile_file)
+
+
 @argument("input", type=Path(), default=".")
 @argument("dialect", type=str, required=False)
 @option("--param", multiple=True, help="Environment parameters as key=value pairs")
@@ -190,6 +213,21 @@ def _format_import(value: str) -> str:
     default=None,
     help="Build into this deployment environment (overrides the activated one)",
 )
+@option(
+    "--profile",
+    "profile_file",
+    type=Path(dir_okay=False),
+    is_flag=False,
+    flag_value=DEFAULT_PROFILE_FILE,
+    default=None,
+    help=(
+        "Time every statement's parse, build, discovery, optimize, render and "
+        "execute phases, plus the rows and bytes scanned the engine reports. "
+        "Writes a Chrome trace (chrome://tracing, Perfetto) to the given path "
+        f"(default: {DEFAULT_PROFILE_FILE}) and summarizes the slowest "
+        "statements when the run ends."
+    ),
+)
 @report_options
 @state_file_option
 @argument("conn_args", nargs=-1, type=UNPROCESSED)
@@ -208,6 +246,7 @@ def run(
     all_rows: bool,
     scope: bool,
     environment: str | None,
+    profile_file: str | None,
     report_file: str | None,
     run_id: str | None,
     state_input: str | None,
@@ -240,70 +279,74 @@ def run(
 
     from trilogy.execution.report import report_run
 
-    try:
-        # Input validation lives INSIDE report_run so a --report-file consumer
-        # gets the guaranteed fallback summary even for config errors (missing
-        # path, misused --import) that die before the file loop.
-        with report_run(
-            "run",
-            report_file,
-            run_id,
-            target=str(input)[:200],
-            dialect=dialect,
-            parallelism=parallelism,
-            config_path=str(config) if config else None,
-        ):
-            cli_params = CLIRuntimeParams(
-                input=_normalize_run_input(input, imports),
-                dialect=dialect_enum,
+    with _profiled(profile_file):
+        try:
+            # Input validation lives INSIDE report_run so a --report-file consumer
+            # gets the guaranteed fallback summary even for config errors (missing
+            # path, misused --import) that die before the file loop.
+            with report_run(
+                "run",
+                report_file,
+                run_id,
+                target=str(input)[:200],
+                dialect=dialect,
                 parallelism=parallelism,
-                param=param,
-                conn_args=conn_args,
-                debug=ctx.obj["DEBUG"],
-                debug_file=ctx.obj.get("DEBUG_FILE"),
-                config_path=PathlibPath(config) if config else None,
-                execution_strategy="eager_bfs",
-                env=env,
-                row_limit=None if all_rows else displayed_rows,
-                show_scopes=scope,
-                timeout=timeout,
-            )
-            from trilogy.execution.envs import env_activation_scope
-            from trilogy.scripts.env_commands import (
-                announce_activation,
-                resolve_activation,
-            )
-            from trilogy.scripts.state import (
-                maybe_write_state_snapshot,
-                state_input_scope,
-            )
+                config_path=str(config) if config else None,
+            ):
+                cli_params = CLIRuntimeParams(
+                    input=_normalize_run_input(input, imports),
+                    dialect=dialect_enum,
+                    parallelism=parallelism,
+                    param=param,
+                    conn_args=conn_args,
+                    debug=ctx.obj["DEBUG"],
+                    debug_file=ctx.obj.get("DEBUG_FILE"),
+                    config_path=PathlibPath(config) if config else None,
+                    execution_strategy="eager_bfs",
+                    env=env,
+                    row_limit=None if all_rows else displayed_rows,
+                    show_scopes=scope,
+                    timeout=timeout,
+                )
+                from trilogy.execution.envs import env_activation_scope
+                from trilogy.scripts.env_commands import (
+                    announce_activation,
+                    resolve_activation,
+                )
+                from trilogy.scripts.state import (
+                    maybe_write_state_snapshot,
+                    state_input_scope,
+                )
 
-            activation = resolve_activation(
-                environment, str(input), cli_params.config_path
-            )
-            announce_activation(activation)
-            with env_activation_scope(activation):
-                try:
-                    with state_input_scope(state_input, cli_params):
-                        run_parallel_execution(
-                            cli_params=cli_params,
-                            execution_fn=execute_script_for_run,
-                            execution_mode=ExecutionMode.RUN,
-                        )
-                    if activation:
-                        from trilogy.scripts.env_commands import (
-                            record_env_fingerprint,
-                        )
+                activation = resolve_activation(
+                    environment, str(input), cli_params.config_path
+                )
+                announce_activation(activation)
+                with env_activation_scope(activation):
+                    try:
+                        with state_input_scope(state_input, cli_params):
+                            run_parallel_execution(
+                                cli_params=cli_params,
+                                execution_fn=execute_script_for_run,
+                                execution_mode=ExecutionMode.RUN,
+                            )
+                        if activation:
+                            from trilogy.scripts.env_commands import (
+                                record_env_fingerprint,
+                            )
 
-                        record_env_fingerprint(
-                            activation, str(input), param, cli_params.config_path
+                            record_env_fingerprint(
+                                activation, str(input), param, cli_params.config_path
+                            )
+                    finally:
+                        # Snapshot regardless of outcome; never alters the exit code.
+                        maybe_write_state_snapshot(
+                            cli_params,
+                            state_file,
+                            state_partition,
+                            state_max_partitions,
                         )
-                finally:
-                    # Snapshot regardless of outcome; never alters the exit code.
-                    maybe_write_state_snapshot(
-                        cli_params, state_file, state_partition, state_max_partitions
-                    )
-    except Exit:
-        raise
-    except Exception as e:
-        handle_execution_exception(e, debug=ctx.obj["DEBUG"])
+        except Exit:
+            raise
+        except Exception as e:
+            handle_execution_exception(e, debug=ctx.obj["DEBUG"])
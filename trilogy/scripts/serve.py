@@ -5,12 +5,16 @@ import secrets
 import shutil
 import sys
 import tempfile
+import threading
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path as PathlibPath
 from urllib.parse import quote, urlparse
 
 from click import Path, argument, option, pass_context
 
+from trilogy.constants import logger
 from trilogy.dialect.config import DialectConfig
 from trilogy.dialect.enums import Dialects
 from trilogy.execution.config import DEFAULT_STUDIO_URL, load_config_file
@@ -30,6 +34,14 @@ from trilogy.utility import utc_now_iso
 
 TOKEN_BYTES = 16  # 128-bit random token
 
+# State probes parse the model and query the warehouse; a few at a time is
+# plenty, and a burst of them must not starve the default executor.
+DEFAULT_STATE_WORKERS = 4
+# Quiet period after the last file change before refresh-ahead re-probes, so a
+# burst of saves (or a branch checkout) costs one probe per target, not one per
+# write.
+REFRESH_AHEAD_DELAY = 2.0
+
 
 def check_fastapi_available() -> bool:
     """Check if FastAPI and uvicorn are available."""
@@ -84,11 +96,15 @@ def _build_cmd(
     return cmd
 
 
-def _get_file_listing(directory_path: PathlibPath):  # type: ignore[return]
+def _get_file_listing(  # type: ignore[return]
+    directory_path: PathlibPath, files: list[PathlibPath] | None = None
+):
     from trilogy.scripts.serve_helpers.models import DirectoryListing, FileListResponse
 
     dirs: dict[str, list[str]] = defaultdict(list)
-    for f in find_all_model_files(directory_path):
+    if files is None:
+        files = find_all_model_files(directory_path)
+    for f in files:
         rel = f.relative_to(directory_path)
         parent = str(rel.parent).replace("\\", "/")
         if parent == ".":
@@ -236,6 +252,8 @@ def create_app(
     startup_scripts: list[PathlibPath] | None = None,
     enable_state_cache: bool = True,
     studio_bundle: StudioBundle | None = None,
+    state_workers: int = DEFAULT_STATE_WORKERS,
+    refresh_ahead: bool = True,
 ):
     # Normalize once so every closure (including the state probe) sees the
     # same representation. Avoids Windows short-name vs full-name mismatches
@@ -249,13 +267,16 @@ def create_app(
     from fastapi.security import APIKeyHeader
 
     from trilogy.scripts.serve_helpers import (
+        CachedSnapshot,
         ConnectionSpec,
         FileCreateRequest,
         FileListResponse,
         FileWriteRequest,
         JobRequest,
         JobStatus,
+        ModelFileIndex,
         ModelImport,
+        SingleFlight,
         StateSnapshotCache,
         StoreIndex,
         build_connection_spec,
@@ -263,7 +284,6 @@ def create_app(
         compute_state_snapshot_sync,
         create_job,
         find_model_by_name,
-        fingerprint_directory,
         generate_model_index,
         get_job,
         relative_target,
@@ -272,7 +292,81 @@ def create_app(
 
     state_cache = StateSnapshotCache(directory_path) if enable_state_cache else None
 
-    def _job_state_options(cache_key: str) -> tuple[list[str], PathlibPath | None]:
+    # Every caller asking for the same target while its probe runs shares that
+    # probe, keyed on the fingerprint so an edit mid-probe starts a new one.
+    state_pool = ThreadPoolExecutor(
+        max_workers=state_workers, thread_name_prefix="trilogy-serve-state"
+    )
+    state_flights = SingleFlight(state_pool)
+    # cache key -> (target, fingerprint last served), for refresh-ahead
+    served_targets: dict[str, tuple[PathlibPath, str]] = {}
+    refresh_timer: list[threading.Timer] = []
+    refresh_lock = threading.Lock()
+
+    def _probe_and_store(
+        target_path: PathlibPath, cache_key: str, fingerprint: str
+    ) -> CachedSnapshot:
+        snapshot = compute_state_snapshot_sync(
+            target_path, engine, config_path, directory_path
+        )
+        computed_at = utc_now_iso()
+        if state_cache is not None:
+            state_cache.put(cache_key, snapshot, fingerprint, computed_at)
+        return CachedSnapshot(snapshot=snapshot, computed_at=computed_at)
+
+    def _probe(target_path: PathlibPath, cache_key: str, fingerprint: str) -> Future:
+        return state_flights.submit(
+            (cache_key, fingerprint),
+            partial(_probe_and_store, target_path, cache_key, fingerprint),
+        )
+
+    def _refresh_ahead() -> None:
+        """Re-probe every served target whose fingerprint moved.
+
+        Runs once the tree has been quiet for ``REFRESH_AHEAD_DELAY``, so the
+        studio's next ``/state`` after an edit is a cache hit. Only targets this
+        process has served are refreshed: it is a warehouse query, not a crawl.
+        A request arriving mid-probe joins it through the single flight."""
+        for cache_key, (target_path, served) in list(served_targets.items()):
+            if not target_path.exists():
+                served_targets.pop(cache_key, None)
+                continue
+            fingerprint = file_index.fingerprint(target_path)
+            if fingerprint == served or state_cache is None:
+                continue
+            if state_cache.get(cache_key, fingerprint) is not None:
+                continue
+            served_targets[cache_key] = (target_path, fingerprint)
+            _probe(target_path, cache_key, fingerprint).add_done_callback(
+                partial(_log_refresh_failure, cache_key)
+            )
+
+    def _log_refresh_failure(cache_key: str, future: Future) -> None:
+        if not future.cancelled() and future.exception() is not None:
+            logger.info("Refresh-ahead of %s failed: %s", cache_key, future.exception())
+
+    def _schedule_refresh_ahead(changed: set[PathlibPath]) -> None:
+        # An index nobody watches only changes when a request reads it, and
+        # that request is already about to probe.
+        if not file_index.watching or not served_targets:
+            return
+        with refresh_lock:
+            for timer in refresh_timer:
+                timer.cancel()
+            timer = threading.Timer(REFRESH_AHEAD_DELAY, _refresh_ahead)
+            timer.daemon = True
+            refresh_timer[:] = [timer]
+            timer.start()
+
+    def _stop_state_work() -> None:
+        with refresh_lock:
+            for timer in refresh_timer:
+                timer.cancel()
+        state_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _job_state_options(
+        target_path: PathlibPath, cache_key: str
+    ) -> tuple[list[str], PathlibPath | None]:
         """State-store flags for a job, and the file to adopt when it finishes.
 
         The cache doubles as the job's state store, in both directions:
@@ -290,7 +384,7 @@ def create_app(
             return [], None
         options: list[str] = []
         seed = state_cache.state_input_path(
-            cache_key, fingerprint_directory(directory_path)
+            cache_key, file_index.fingerprint(target_path)
         )
         if seed is not None:
             options.extend(["--state-input", str(seed)])
@@ -299,7 +393,9 @@ def create_app(
         options.extend(["--state-file", written])
         return options, PathlibPath(written)
 
-    def _finish_job(cache_key: str, written: PathlibPath | None) -> None:
+    def _finish_job(
+        target_path: PathlibPath, cache_key: str, written: PathlibPath | None
+    ) -> None:
         """Refresh the cache from a finished job.
 
         Only the job's own target gets a new snapshot — that is the only one it
@@ -315,7 +411,7 @@ def create_app(
         if written is None:
             return
         if written.exists():
-            state_cache.adopt(cache_key, written, fingerprint_directory(directory_path))
+            state_cache.adopt(cache_key, written, file_index.fingerprint(target_path))
         written.unlink(missing_ok=True)
 
     url_host = "localhost" if host == "0.0.0.0" else host
@@ -354,7 +450,7 @@ def create_app(
 
     @router.get("/")
     async def root():
-        file_count = len(find_all_model_files(directory_path))
+        file_count = len(file_index.files())
         return {
             "message": "Trilogy Model Server",
             "description": f"Serving model '{directory_path.name}' with {file_count} files from {directory_path}",
@@ -393,6 +489,17 @@ def create_app(
             continue
         resolved_startup_scripts.append(rel.as_posix())
 
+    # Kept current from change events once the app starts; see file_index.
+    file_index = ModelFileIndex(
+        directory_path,
+        always_included=[directory_path / rel for rel in resolved_startup_scripts],
+    )
+    app.router.on_startup.append(file_index.start)
+    app.router.on_shutdown.append(file_index.stop)
+    app.router.on_shutdown.append(_stop_state_work)
+    if state_cache is not None and refresh_ahead:
+        file_index.add_listener(_schedule_refresh_ahead)
+
     @router.get("/index.json", response_model=StoreIndex)
     async def get_index() -> StoreIndex:
         return StoreIndex(
@@ -405,7 +512,9 @@ def create_app(
 
     @router.get("/models/{model_name}.json", response_model=ModelImport)
     async def get_model(model_name: str) -> ModelImport:
-        model = find_model_by_name(model_name, directory_path, base_url, engine)
+        model = find_model_by_name(
+            model_name, directory_path, base_url, engine, index=file_index
+        )
         if model is None:
             raise HTTPException(status_code=404, detail="Model not found")
         return model
@@ -427,6 +536,7 @@ def create_app(
             raise HTTPException(status_code=409, detail="File already exists")
         target_path.parent.mkdir(parents=True, exist_ok=True)
         target_path.write_text(request.content, encoding="utf-8")
+        file_index.notify([target_path])
         return {"path": request.path}
 
     @router.put("/files/{path:path}")
@@ -438,6 +548,7 @@ def create_app(
 
             raise HTTPException(status_code=404, detail="File not found")
         target_path.write_text(request.content, encoding="utf-8")
+        file_index.notify([target_path])
         return {"path": path}
 
     @router.delete("/files/{path:path}", status_code=204)
@@ -449,13 +560,14 @@ def create_app(
 
             raise HTTPException(status_code=404, detail="File not found")
         target_path.unlink()
+        file_index.notify([target_path])
 
     # --- New endpoints ---
 
     @router.get("/files", response_model=FileListResponse)
     async def list_files() -> FileListResponse:
         """List all trilogy/sql/csv files grouped by directory."""
-        return _get_file_listing(directory_path)
+        return _get_file_listing(directory_path, file_index.files())
 
     @router.post("/run", response_model=JobStatus)
     async def run_target(
@@ -465,14 +577,14 @@ def create_app(
         target_path = _validate_target(request.target, directory_path)
         job = create_job()
         cache_key = relative_target(target_path, directory_path)
-        options, written = _job_state_options(cache_key)
+        options, written = _job_state_options(target_path, cache_key)
         cmd = _build_cmd("run", target_path, config_path, engine, options)
         background_tasks.add_task(
             run_subprocess,
             job,
             cmd,
             str(directory_path),
-            lambda: _finish_job(cache_key, written),
+            lambda: _finish_job(target_path, cache_key, written),
         )
         return JobStatus(job_id=job.job_id, status=job.status, output=job.output, error=job.error)  # type: ignore[arg-type]
 
@@ -484,14 +596,14 @@ def create_app(
         target_path = _validate_target(request.target, directory_path)
         job = create_job()
         cache_key = relative_target(target_path, directory_path)
-        options, written = _job_state_options(cache_key)
+        options, written = _job_state_options(target_path, cache_key)
         cmd = _build_cmd("refresh", target_path, config_path, engine, options)
         background_tasks.add_task(
             run_subprocess,
             job,
             cmd,
             str(directory_path),
-            lambda: _finish_job(cache_key, written),
+            lambda: _finish_job(target_path, cache_key, written),
         )
         return JobStatus(job_id=job.job_id, status=job.status, output=job.output, error=job.error)  # type: ignore[arg-type]
 
@@ -537,7 +649,8 @@ def create_app(
         **Served from an on-disk cache by default.** Computing this re-parses
         the target, builds an executor and re-probes the warehouse — seconds per
         call, and real money on a billed warehouse — so a cached snapshot is
-        reused until a model file changes or a run/refresh job finishes. The
+        reused until a file the target imports changes or a run/refresh job
+        finishes. The
         cache lives in ``.trilogy/state`` under the served directory and so
         survives a server restart.
 
@@ -552,6 +665,11 @@ def create_app(
 
         - ``X-Trilogy-Cached``: ``true`` / ``false``
         - ``X-Trilogy-Computed-At``: when the returned probe actually ran
+
+        Concurrent misses for one target share a single probe, run on a small
+        dedicated pool. Once a target has been served, an edit to anything it
+        imports triggers a background re-probe after a short quiet period, so
+        the next call is a hit rather than a wait.
         """
         import asyncio
 
@@ -562,7 +680,8 @@ def create_app(
 
         fingerprint = ""
         if state_cache is not None:
-            fingerprint = fingerprint_directory(directory_path)
+            fingerprint = file_index.fingerprint(target_path)
+            served_targets[cache_key] = (target_path, fingerprint)
             if not refresh:
                 hit = state_cache.get(cache_key, fingerprint)
                 if hit is not None:
@@ -570,15 +689,11 @@ def create_app(
                     response.headers["X-Trilogy-Computed-At"] = hit.computed_at
                     return hit.snapshot
 
-        loop = asyncio.get_event_loop()
         try:
-            snapshot = await loop.run_in_executor(
-                None,
-                compute_state_snapshot_sync,
-                target_path,
-                engine,
-                config_path,
-                directory_path,
+            # shielded: a client that disconnects must not cancel the probe
+            # other callers are waiting on
+            result = await asyncio.shield(
+                asyncio.wrap_future(_probe(target_path, cache_key, fingerprint))
             )
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
@@ -594,12 +709,9 @@ def create_app(
             raise HTTPException(
                 status_code=500, detail=f"State computation failed: {e}"
             )
-        computed_at = utc_now_iso()
-        if state_cache is not None:
-            state_cache.put(cache_key, snapshot, fingerprint, computed_at)
         response.headers["X-Trilogy-Cached"] = "false"
-        response.headers["X-Trilogy-Computed-At"] = computed_at
-        return snapshot
+        response.headers["X-Trilogy-Computed-At"] = result.computed_at
+        return result.snapshot
 
     app.include_router(router)
 
@@ -626,9 +738,7 @@ def create_app(
     print(f"Serving model '{directory_path.name}' from: {directory_path}")
     print(f"Engine: {engine}")
     print(f"Access the index at: http://{host}:{port}/index.json")
-    print(
-        f"Found {len(find_all_model_files(directory_path))} model files (.preql, .sql, .csv, .py)"
-    )
+    print(f"Found {len(file_index.files())} model files (.preql, .sql, .csv, .py)")
     return app
 
 
@@ -866,14 +976,11 @@ def serve(
         print("=" * 80 + "\n")
 
         if not no_browser:
-            import threading
             import webbrowser
 
             threading.Timer(1.0, webbrowser.open, args=[studio_link]).start()
 
     if timeout is not None:
-        import threading
-
         config = uvicorn.Config(app, host=host, port=port)
         server = uvicorn.Server(config)
 
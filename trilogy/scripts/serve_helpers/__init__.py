@@ -18,6 +18,7 @@ from trilogy.scripts.serve_helpers.file_discovery import (
     get_relative_model_name,
     get_safe_model_name,
 )
+from trilogy.scripts.serve_helpers.file_index import ModelFileIndex
 from trilogy.scripts.serve_helpers.index_generation import (
     find_model_by_name,
     generate_model_index,
@@ -44,10 +45,10 @@ from trilogy.scripts.serve_helpers.models import (
     StoreIndex,
     StoreModelIndex,
 )
+from trilogy.scripts.serve_helpers.single_flight import SingleFlight
 from trilogy.scripts.serve_helpers.state_cache import (
     CachedSnapshot,
     StateSnapshotCache,
-    fingerprint_directory,
 )
 from trilogy.scripts.serve_helpers.state_computation import (
     compute_state_snapshot_sync,
@@ -81,7 +82,9 @@ __all__ = [
     "Job",
     "JobRequest",
     "JobStatus",
+    "ModelFileIndex",
     "ModelImport",
+    "SingleFlight",
     "StateSnapshotCache",
     "StoreConnectionType",
     "StoreIndex",
@@ -106,7 +109,6 @@ __all__ = [
     "find_python_files",
     "find_sql_files",
     "find_trilogy_files",
-    "fingerprint_directory",
     "generate_model_index",
     "get_job",
     "get_relative_model_name",
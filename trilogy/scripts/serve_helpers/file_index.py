@@ -0,0 +1,363 @@
+"""In-memory index of the served directory, kept current from change events.
+
+Without it every ``GET /state`` walks and stats the whole served tree to
+fingerprint it, and every model listing re-globs and re-reads files for their
+descriptions. That is fine for a dozen scripts and hundreds of milliseconds per
+request for a few thousand. The index does the walk once, then applies
+filesystem change notifications as they arrive, so a request only reads memory.
+
+Notifications come from ``watchfiles`` when it is installed. Without it, a
+background thread re-stats the tree every ``poll_interval`` seconds instead:
+the walk still happens, but off the request path. Either way there is a short
+window after an outside edit before the index sees it. The server's own file
+endpoints close that window for studio edits by calling :meth:`notify` before
+they return. An index that was never started keeps no such window: it rescans
+on every read.
+
+**Fingerprints are per target.** A target's cached state depends on the files
+it imports, not on every file that happens to share its directory, so
+:meth:`ModelFileIndex.fingerprint` covers only the target's import closure, as
+resolved by the Rust import resolver. Closures are resolved once and reused
+until one of their own files changes. A new file drops every closure, since it
+may be the import an existing file was missing. Files that cannot be reached
+through an import still count toward every target: startup scripts, and the
+``.csv``/``.py`` files that datasources read by address. A target the resolver
+cannot handle falls back to the whole tree, which is the old behaviour.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from trilogy.constants import logger
+from trilogy.scripts.serve_helpers.file_discovery import (
+    extract_description_from_file,
+    find_all_model_files,
+)
+
+LOGGER_PREFIX = "[FILE INDEX]"
+
+MODEL_SUFFIXES = frozenset({".preql", ".sql", ".csv", ".py"})
+#: Model files a datasource reads by address rather than by import.
+DATA_SUFFIXES = frozenset({".csv", ".py"})
+#: Non-model files at the root that feed the model listing.
+TRACKED_ROOT_FILES = ("README.md", "trilogy.toml")
+
+DEFAULT_POLL_INTERVAL = 2.0
+
+T = TypeVar("T")
+
+# (size, mtime_ns). Stat rather than content: fingerprints are recomputed on
+# every state cache read, and re-probing a warehouse because an editor rewrote
+# identical bytes is the expensive mistake, not the cheap one.
+FileStat = tuple[int, int]
+
+
+def _stat(path: Path) -> FileStat | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def resolve_import_closure(path: Path) -> set[Path]:
+    """``path`` and every file it imports, transitively."""
+    from _preql_import_resolver import PyImportResolver
+
+    from trilogy.scripts.dependency import normalize_path_variants
+
+    result = PyImportResolver().resolve(str(path))
+    return {normalize_path_variants(p) for p in result.get("order", [])} | {path}
+
+
+class ModelFileIndex:
+    """File stats, descriptions and import closures for a served directory.
+
+    Thread-safe: the watcher thread applies changes while request handlers
+    read, all under one lock.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        always_included: Iterable[Path] = (),
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        self.directory = directory
+        # Part of every target's fingerprint (startup scripts).
+        self.always_included = {Path(p) for p in always_included}
+        self.poll_interval = poll_interval
+        self._lock = threading.RLock()
+        self._stats: dict[Path, FileStat] = {}
+        self._root_stats: dict[str, FileStat | None] = {}
+        self._descriptions: dict[Path, str] = {}
+        self._closures: dict[Path, frozenset[Path]] = {}
+        self._memo: dict[str, tuple[int, Any]] = {}
+        self._listeners: list[Callable[[set[Path]], None]] = []
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        #: Bumped on every applied change; cheap staleness check for callers.
+        self.version = 0
+        self.rescan()
+
+    # --- maintenance ---
+
+    def rescan(self) -> set[Path]:
+        """Walk the tree and apply whatever changed; returns the changed paths."""
+        current: dict[Path, FileStat] = {}
+        for path in find_all_model_files(self.directory):
+            stat = _stat(path)
+            if stat is not None:
+                current[path] = stat
+        root_stats = {name: _stat(self.directory / name) for name in TRACKED_ROOT_FILES}
+        with self._lock:
+            changed = {
+                path
+                for path in current.keys() | self._stats.keys()
+                if current.get(path) != self._stats.get(path)
+            }
+            root_changed = {
+                self.directory / name
+                for name, stat in root_stats.items()
+                if stat != self._root_stats.get(name)
+            }
+            self._root_stats = root_stats
+            if changed:
+                self._apply(changed, current)
+            elif root_changed:
+                self.version += 1
+        self._announce(changed | root_changed)
+        return changed
+
+    def notify(self, paths: Iterable[Path]) -> None:
+        """Re-stat ``paths`` after a change the caller knows about.
+
+        Non-model paths are ignored, except for a tracked root file and for a
+        path that is no longer a file, which may have been a directory full of
+        model files; that costs a rescan."""
+        model_paths: set[Path] = set()
+        for raw in paths:
+            path = Path(raw)
+            if path.parent == self.directory and path.name in TRACKED_ROOT_FILES:
+                with self._lock:
+                    self._root_stats[path.name] = _stat(path)
+                    self.version += 1
+                self._announce({path})
+            elif path.suffix in MODEL_SUFFIXES:
+                model_paths.add(path)
+            elif not path.is_file() and not path.suffix:
+                self.rescan()
+        if not model_paths:
+            return
+        current = {path: _stat(path) for path in model_paths}
+        with self._lock:
+            changed = {
+                path for path, stat in current.items() if stat != self._stats.get(path)
+            }
+            if changed:
+                self._apply(
+                    changed,
+                    {path: stat for path, stat in current.items() if stat is not None},
+                )
+        self._announce(changed)
+
+    def _apply(self, changed: set[Path], current: dict[Path, FileStat]) -> None:
+        added = any(path not in self._stats for path in changed)
+        for path in changed:
+            stat = current.get(path)
+            if stat is None:
+                self._stats.pop(path, None)
+            else:
+                self._stats[path] = stat
+            self._descriptions.pop(path, None)
+        if added:
+            # the new file may be an import that previously failed to resolve
+            self._closures.clear()
+        else:
+            self._closures = {
+                target: closure
+                for target, closure in self._closures.items()
+                if not changed & closure
+            }
+        self.version += 1
+        logger.debug("%s %d file(s) changed", LOGGER_PREFIX, len(changed))
+
+    def add_listener(self, listener: Callable[[set[Path]], None]) -> None:
+        """Call ``listener`` with the changed paths after each applied change.
+
+        Runs on whichever thread applied it, outside the index lock."""
+        self._listeners.append(listener)
+
+    def _announce(self, changed: set[Path]) -> None:
+        if not changed:
+            return
+        for listener in self._listeners:
+            try:
+                listener(changed)
+            except Exception as e:
+                logger.warning("%s change listener failed: %s", LOGGER_PREFIX, e)
+
+    # --- watching ---
+
+    def start(self) -> None:
+        """Keep the index current in the background until :meth:`stop`."""
+        if self._thread is not None:
+            return
+        try:
+            import watchfiles  # noqa: F401
+
+            target = self._watch
+        except ImportError:
+            target = self._poll
+        self._thread = threading.Thread(
+            target=target, name="trilogy-serve-file-index", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _watch(self) -> None:
+        from watchfiles import watch
+
+        try:
+            for changes in watch(self.directory, stop_event=self._stop):
+                self.notify(Path(path) for _, path in changes)
+        except Exception as e:
+            # e.g. an inotify watch limit; polling still works
+            logger.warning(
+                "%s watcher failed, falling back to polling: %s", LOGGER_PREFIX, e
+            )
+            self._poll()
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.rescan()
+            except Exception as e:
+                logger.warning("%s rescan failed: %s", LOGGER_PREFIX, e)
+
+    # --- reads ---
+
+    @property
+    def watching(self) -> bool:
+        return self._thread is not None
+
+    def _sync(self) -> None:
+        # Nothing is applying changes, so each read pays for a walk: the cost
+        # the index exists to avoid, but never a stale answer.
+        if not self.watching:
+            self.rescan()
+
+    def files(self, suffixes: Iterable[str] | None = None) -> list[Path]:
+        """Indexed model files, sorted by path."""
+        self._sync()
+        return self._files(suffixes)
+
+    def _files(self, suffixes: Iterable[str] | None = None) -> list[Path]:
+        with self._lock:
+            paths = list(self._stats)
+        if suffixes is not None:
+            wanted = set(suffixes)
+            paths = [path for path in paths if path.suffix in wanted]
+        return sorted(paths)
+
+    def description(self, path: Path) -> str:
+        """``extract_description_from_file``, re-read only after ``path`` changes."""
+        with self._lock:
+            cached = self._descriptions.get(path)
+        if cached is not None:
+            return cached
+        description = extract_description_from_file(path)
+        with self._lock:
+            if path in self._stats:
+                self._descriptions[path] = description
+        return description
+
+    def cached(self, key: str, compute: Callable[[], T]) -> T:
+        """``compute()``, reused until the next change the index applies."""
+        self._sync()
+        with self._lock:
+            version = self.version
+            hit = self._memo.get(key)
+        if hit is not None and hit[0] == version:
+            return hit[1]
+        value = compute()
+        with self._lock:
+            self._memo[key] = (version, value)
+        return value
+
+    def closure(self, target: Path) -> frozenset[Path]:
+        """Files whose content can change ``target``'s state."""
+        self._sync()
+        return self._closure(target)
+
+    def _closure(self, target: Path) -> frozenset[Path]:
+        with self._lock:
+            cached = self._closures.get(target)
+            version = self.version
+        if cached is not None:
+            return cached
+        closure = self._resolve_closure(target)
+        with self._lock:
+            # a change landed while resolving; do not cache a stale closure
+            if self.version == version:
+                self._closures[target] = closure
+        return closure
+
+    def _resolve_closure(self, target: Path) -> frozenset[Path]:
+        files = self._files()
+        if target.is_dir():
+            roots = [path for path in files if path.is_relative_to(target)]
+        else:
+            roots = [target]
+        closure: set[Path] = set(self.always_included)
+        closure.update(path for path in files if path.suffix in DATA_SUFFIXES)
+        try:
+            for root in roots:
+                if root.suffix == ".preql":
+                    closure |= resolve_import_closure(root)
+                else:
+                    closure.add(root)
+        except Exception as e:
+            logger.debug(
+                "%s could not resolve imports of %s, using the whole tree: %s",
+                LOGGER_PREFIX,
+                target,
+                e,
+            )
+            closure.update(files)
+        return frozenset(closure)
+
+    def fingerprint(self, target: Path | None = None) -> str:
+        """Digest of the stats of ``target``'s closure, or of the whole tree.
+
+        A closure file missing from the index (deleted, or outside the served
+        directory) is stat'ed directly; its absence is itself part of the
+        digest."""
+        self._sync()
+        paths = self._closure(target) if target is not None else set(self._files())
+        parts: list[str] = []
+        with self._lock:
+            stats = {path: self._stats.get(path) for path in paths}
+        for path in sorted(paths):
+            stat = stats[path] or _stat(path)
+            if stat is None:
+                parts.append(f"{self._label(path)}:missing")
+            else:
+                parts.append(f"{self._label(path)}:{stat[0]}:{stat[1]}")
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def _label(self, path: Path) -> str:
+        try:
+            return path.relative_to(self.directory).as_posix()
+        except ValueError:
+            return path.as_posix()
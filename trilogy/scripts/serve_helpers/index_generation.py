@@ -1,5 +1,6 @@
 """Index and model generation utilities for the serve command."""
 
+from collections.abc import Callable
 from pathlib import Path
 
 from trilogy.constants import logger
@@ -13,6 +14,7 @@ from trilogy.scripts.serve_helpers.file_discovery import (
     get_relative_model_name,
     get_safe_model_name,
 )
+from trilogy.scripts.serve_helpers.file_index import ModelFileIndex
 from trilogy.scripts.serve_helpers.models import (
     ImportFile,
     ModelImport,
@@ -21,7 +23,11 @@ from trilogy.scripts.serve_helpers.models import (
 from trilogy.utility import safe_open
 
 
-def _get_model_description(directory_path: Path, trilogy_files: list[Path]) -> str:
+def _get_model_description(
+    directory_path: Path,
+    trilogy_files: list[Path],
+    describe: Callable[[Path], str] = extract_description_from_file,
+) -> str:
     """Get model description from README.md, first file, or default.
 
     Priority order:
@@ -32,6 +38,7 @@ def _get_model_description(directory_path: Path, trilogy_files: list[Path]) -> s
     Args:
         directory_path: Root directory of the model
         trilogy_files: List of trilogy files in the directory
+        describe: Reads a single file's description
 
     Returns:
         Description string for the model
@@ -64,7 +71,7 @@ def _get_model_description(directory_path: Path, trilogy_files: list[Path]) -> s
 
     # Fall back to first file's description
     if trilogy_files:
-        return extract_description_from_file(trilogy_files[0])
+        return describe(trilogy_files[0])
 
     # Default description
     return f"Trilogy model: {directory_path.name}"
@@ -90,7 +97,11 @@ def generate_model_index(
 
 
 def find_model_by_name(
-    model_name: str, directory_path: Path, base_url: str, engine: str
+    model_name: str,
+    directory_path: Path,
+    base_url: str,
+    engine: str,
+    index: ModelFileIndex | None = None,
 ) -> ModelImport | None:
     """Find and construct a ModelImport representing the directory as a single model.
 
@@ -99,6 +110,8 @@ def find_model_by_name(
         directory_path: Root directory containing trilogy files
         base_url: Base URL for the server
         engine: Engine type (e.g., "duckdb", "generic")
+        index: Live file index of ``directory_path``; when given, the model is
+            built from it and reused until a file changes
 
     Returns:
         ModelImport object if the model_name matches the directory, None otherwise
@@ -108,6 +121,21 @@ def find_model_by_name(
     if model_name != expected_name:
         return None
 
+    if index is not None:
+        return index.cached(
+            f"model:{base_url}:{engine}",
+            lambda: _build_model(directory_path, base_url, engine, index),
+        )
+    return _build_model(directory_path, base_url, engine)
+
+
+def _build_model(
+    directory_path: Path,
+    base_url: str,
+    engine: str,
+    index: ModelFileIndex | None = None,
+) -> ModelImport:
+
     # Check for trilogy.toml config
     config_path = directory_path / TRILOGY_CONFIG_NAME
     setup_scripts = []
@@ -118,14 +146,21 @@ def find_model_by_name(
         except Exception as e:
             logger.debug("Failed to load config at %s: %s", config_path, e)
 
-    # Find all trilogy files (preql and sql)
-    trilogy_files = find_trilogy_files(directory_path)
-
-    # Find CSV files separately
-    csv_files = find_csv_files(directory_path)
-
-    # Generate description
-    description = _get_model_description(directory_path, trilogy_files)
+    if index is not None:
+        trilogy_files = index.files((".preql", ".sql"))
+        csv_files = index.files((".csv",))
+        python_files = index.files((".py",))
+        description = _get_model_description(
+            directory_path, trilogy_files, index.description
+        )
+    else:
+        # Find all trilogy files (preql and sql)
+        trilogy_files = find_trilogy_files(directory_path)
+        # Find CSV files separately
+        csv_files = find_csv_files(directory_path)
+        python_files = find_python_files(directory_path)
+        # Generate description
+        description = _get_model_description(directory_path, trilogy_files)
 
     components = []
 
@@ -179,7 +214,6 @@ def find_model_by_name(
             )
         )
 
-    python_files = find_python_files(directory_path)
     for python_file in python_files:
         file_model_name = get_relative_model_name(python_file, directory_path)
 
@@ -0,0 +1,54 @@
+"""Coalesce concurrent calls for the same expensive result.
+
+When the studio opens a project, every tab and sidebar widget asks for
+``/state`` of the same target at once. On a cache miss each would parse the
+model and probe the warehouse on its own, N probes for one answer. A
+:class:`SingleFlight` runs the first caller's computation on its pool and hands
+every caller that arrives before it finishes the same future.
+
+Futures are ``concurrent.futures`` rather than asyncio ones so that request
+handlers (through ``asyncio.wrap_future``) and background threads (refresh-ahead)
+can join the same flight.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Executor, Future
+from typing import Any
+
+
+class SingleFlight:
+    """At most one in-flight computation per key."""
+
+    def __init__(self, pool: Executor) -> None:
+        self.pool = pool
+        # Reentrant: a future that is already done runs its done-callback
+        # inline, inside submit's critical section.
+        self._lock = threading.RLock()
+        self._inflight: dict[Hashable, Future] = {}
+
+    def submit(self, key: Hashable, fn: Callable[[], Any]) -> Future:
+        """The in-flight future for ``key``, starting ``fn`` if there is none.
+
+        A finished flight is forgotten, so a later call computes afresh; caching
+        the result is the caller's business."""
+        with self._lock:
+            future = self._inflight.get(key)
+            # done but not yet forgotten: its callback is still on the way
+            if future is None or future.done():
+                future = self.pool.submit(fn)
+                self._inflight[key] = future
+                future.add_done_callback(lambda done: self._forget(key, done))
+            return future
+
+    def in_flight(self, key: Hashable) -> bool:
+        with self._lock:
+            future = self._inflight.get(key)
+            return future is not None and not future.done()
+
+    def _forget(self, key: Hashable, future: Future) -> None:
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
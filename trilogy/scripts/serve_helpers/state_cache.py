@@ -34,7 +34,6 @@ from pathlib import Path
 from trilogy.constants import logger
 from trilogy.execution.state.persistence import read_state_snapshot
 from trilogy.execution.state.snapshot import StateSnapshot
-from trilogy.scripts.serve_helpers.file_discovery import find_all_model_files
 from trilogy.utility import utc_now_iso
 
 #: Relative to the served directory. Kept inside the project so restarting the
@@ -54,29 +53,6 @@ class CachedSnapshot:
     computed_at: str
 
 
-def fingerprint_directory(directory: Path) -> str:
-    """A digest of every model file's size and mtime under ``directory``.
-
-    Stat rather than content: this recomputes on every cache read, and re-probing
-    a warehouse because an editor rewrote identical bytes is the expensive
-    mistake, not the cheap one. Scoped to the whole served directory rather than
-    the target's own imports because a target's state depends on whatever it
-    imports, and resolving that here would mean parsing — which is part of the
-    cost being avoided.
-    """
-    parts: list[str] = []
-    for path in sorted(find_all_model_files(directory)):
-        try:
-            stat = path.stat()
-        except OSError:
-            # Raced with a delete: leaving it out is itself a fingerprint change.
-            continue
-        parts.append(
-            f"{path.relative_to(directory).as_posix()}:{stat.st_size}:{stat.st_mtime_ns}"
-        )
-    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
-
-
 def _atomic_write(path: Path, content: str) -> None:
     """Write via a temp file in the same directory, then rename.
 
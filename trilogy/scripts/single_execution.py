@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from trilogy import Executor
+from trilogy.core.profile import record_rows
 from trilogy.core.statements.execute import (
     PROCESSED_STATEMENT_TYPES,
     ProcessedQuery,
@@ -108,6 +109,8 @@ def execute_single_statement(
             if raw_results
             else None
         )
+        if results is not None and len(results.rows) < fetch_size:
+            record_rows(query, len(results.rows))
         if results is not None and isinstance(query, ProcessedQuery):
             results.derived_value_scopes = query.derived_value_scopes
         # When the result hit its own LIMIT (a biased prefix) and the dialect
@@ -34,7 +34,7 @@ objects to answer "did the semantics change, and which datasources need
 rebuild"; it requires a parse, and it deliberately ignores changes that cannot
 affect a build. This one is provenance of bytes: it notices a comment edit,
 because a comment edit is a different bundle, and it never parses anything.
-Nor is it ``serve_helpers.state_cache.fingerprint_directory``, which hashes
+Nor is it ``serve_helpers.file_index.ModelFileIndex.fingerprint``, which hashes
 size and mtime rather than content on purpose — it runs on every cache read
 and must stay cheaper than the probe it guards.
 """
@@ -450,10 +450,16 @@ def maybe_write_state_snapshot(
     if not path_str:
         return
     try:
+        from trilogy.execution.cost import active_run_cost
+
+        # read before probing: the probe's own statements are not the run's
+        run_cost = active_run_cost()
+        estimated = run_cost.total_bytes if run_cost and run_cost.statements else None
         sink = get_report_sink()
         snapshot = compute_state_snapshot(
             cli_params, run_id=sink.run_id if sink else None
         )
+        snapshot.estimated_bytes = estimated
         partitions = resolve_state_partitions(state_partition)
         if not partitions and cli_params.refresh_params:
             partitions = selector_partition_ids(
@@ -487,6 +493,13 @@ def _show_snapshot(snapshot: StateSnapshot) -> None:
         f"Assets: {s.total} total, {s.managed} managed — "
         f"{s.fresh} fresh, {s.stale} stale, {s.unknown} unknown"
     )
+    if snapshot.estimated_bytes is not None:
+        from trilogy.execution.cost import format_bytes
+
+        print_info(
+            f"Estimated bytes scanned by the run: "
+            f"{format_bytes(snapshot.estimated_bytes)}"
+        )
     for asset in snapshot.assets:
         marker = {"fresh": "✓", "stale": "✗", "unknown": "?"}[asset.status]
         print_info(f"  {marker} {asset.address} [{asset.status}]")
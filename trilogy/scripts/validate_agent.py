@@ -28,7 +28,7 @@ from pathlib import Path
 from typing import Literal
 
 from trilogy.core.enums import QueryComparison
-from trilogy.core.validation.rows import rows_equal
+from trilogy.core.validation.rows import rows_mismatch
 
 ANSWER_FILENAME = "answer.preql"
 MOCK_DB_FILENAME = "mock_data.duckdb"
@@ -494,10 +494,14 @@ def score_workspace(
             )
     finally:
         executor.close()
-    passed = rows_equal(candidate, expected, comparison)
+    mismatch = rows_mismatch(candidate, expected, comparison)
     return RepetitionResult(
-        status="pass" if passed else "fail",
-        detail="" if passed else "result set differs from expected answer",
+        status="pass" if mismatch is None else "fail",
+        detail=(
+            ""
+            if mismatch is None
+            else f"result set differs from expected answer: {mismatch.describe()}"
+        ),
         candidate_rows=len(candidate),
         expected_rows=len(expected),
     )